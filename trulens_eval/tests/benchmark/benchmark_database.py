@@ -0,0 +1,166 @@
+"""
+Benchmark of the deferred evaluator's polling queries on a large database.
+
+Fills a sqlite database with `ROWS` feedback results of which only
+`PENDING_FRACTION` are not yet done, as is typical of a long running deployment,
+and times the two queries the deferred evaluator issues on every iteration
+([get_feedback][trulens_eval.database.sqlalchemy.SQLAlchemyDB.get_feedback] of
+unfinished results and
+[get_feedback_count_by_status][trulens_eval.database.sqlalchemy.SQLAlchemyDB.get_feedback_count_by_status]).
+The same queries are then timed after downgrading to the schema revision prior
+to the secondary indexes for comparison.
+
+Run with:
+
+```bash
+python -m tests.benchmark.benchmark_database [rows]
+```
+
+Filling the database with the default 10M rows takes a few minutes and about
+2GB of disk in a temporary directory.
+"""
+
+import logging
+from pathlib import Path
+import sqlite3
+import sys
+from tempfile import TemporaryDirectory
+from timeit import default_timer as timer
+from typing import Callable
+
+from trulens_eval.database.migrations import downgrade_db
+from trulens_eval.database.sqlalchemy import SQLAlchemyDB
+from trulens_eval.schema.app import AppDefinition
+from trulens_eval.schema.base import Perf
+from trulens_eval.schema.feedback import FeedbackResultStatus
+from trulens_eval.utils.pyschema import Class
+
+ROWS = 10_000_000
+"""Number of feedback result rows."""
+
+PENDING_FRACTION = 0.001
+"""Fraction of feedback results that are not done."""
+
+RECORDS = 1000
+"""Number of records the feedback results are spread over."""
+
+CHUNK = 100_000
+"""Rows inserted per executemany."""
+
+REPEATS = 5
+"""Number of runs per query. The best is reported."""
+
+LIMIT = 32
+"""Number of unfinished feedback results the evaluator asks for."""
+
+PREFIX = "trulens_"
+
+
+def best_of(func: Callable, *args, **kwargs) -> float:
+    """Best wall time (seconds) of `REPEATS` runs of `func`."""
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = timer()
+        func(*args, **kwargs)
+        best = min(best, timer() - start)
+
+    return best
+
+
+def fill(path: Path, rows: int) -> None:
+    """Insert `RECORDS` records and `rows` feedback results into the sqlite
+    database at `path` bypassing the ORM for speed."""
+
+    conn = sqlite3.connect(path)
+
+    perf_json = Perf.min().model_dump_json()
+
+    conn.executemany(
+        f"INSERT INTO {PREFIX}records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (
+                f"record_{i}", "benchmark_database", "\"in\"", "\"out\"",
+                "{}", "-", float(i), "{}", perf_json
+            ) for i in range(RECORDS)
+        )
+    )
+
+    pending_every = int(1 / PENDING_FRACTION)
+    pending = [
+        FeedbackResultStatus.NONE.value, FeedbackResultStatus.RUNNING.value,
+        FeedbackResultStatus.FAILED.value
+    ]
+
+    def row(i: int):
+        status = pending[i % len(pending)] if i % pending_every == 0 \
+            else FeedbackResultStatus.DONE.value
+        return (
+            f"feedback_result_{i}", f"record_{i % RECORDS}", "feedback_def",
+            float(i), status, None, "{\"calls\": []}", 0.5, "benchmark", "{}",
+            None
+        )
+
+    for start in range(0, rows, CHUNK):
+        conn.executemany(
+            f"INSERT INTO {PREFIX}feedbacks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (row(i) for i in range(start, min(rows, start + CHUNK)))
+        )
+        conn.commit()
+        print(f"\r  {min(rows, start + CHUNK):,} rows", end="", flush=True)
+
+    print()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def measure(db: SQLAlchemyDB) -> None:
+    poll = best_of(
+        db.get_feedback,
+        status=[
+            FeedbackResultStatus.NONE, FeedbackResultStatus.FAILED,
+            FeedbackResultStatus.RUNNING
+        ],
+        limit=LIMIT,
+        shuffle=True
+    )
+    count = best_of(db.get_feedback_count_by_status)
+
+    print(f"  get_feedback (unfinished): {poll*1e3:>10.1f}ms")
+    print(f"  get_feedback_count_by_status: {count*1e3:>7.1f}ms")
+
+
+def main():
+    logging.getLogger("trulens_eval").setLevel(logging.ERROR)
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / "benchmark.sqlite"
+        db = SQLAlchemyDB.from_db_url(f"sqlite:///{path}", table_prefix=PREFIX)
+        db.migrate_database()
+
+        db.insert_app(
+            AppDefinition(
+                app_id="benchmark_database",
+                root_class=Class.of_class(object),
+                app={}
+            )
+        )
+
+        print(f"Filling database with {rows:,} feedback results:")
+        start = timer()
+        fill(path, rows)
+        print(f"  took {timer() - start:.1f}s")
+
+        print("With secondary indexes:")
+        measure(db)
+
+        downgrade_db(db.engine, revision="1", prefix=PREFIX)
+
+        print("Without secondary indexes:")
+        measure(db)
+
+
+if __name__ == "__main__":
+    main()
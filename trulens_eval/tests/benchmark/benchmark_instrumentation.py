@@ -0,0 +1,118 @@
+"""
+Benchmark of the per-call overhead of instrumented methods.
+
+Measures the time added to each call of an instrumented method nested under a
+recorded root call when the python call stack is at various depths. The cost
+of looking up the caller's contexts and stacks by walking the call stack (which
+instrumented methods did before those were propagated via context variables and
+still do with `FRAME_WALK_FALLBACK`) is reported alongside for comparison.
+
+Run with:
+
+```bash
+python -m tests.benchmark.benchmark_instrumentation
+```
+"""
+
+import logging
+from timeit import default_timer as timer
+from typing import Callable
+
+from trulens_eval.schema.feedback import FeedbackMode
+from trulens_eval.tru_custom_app import instrument
+from trulens_eval.tru_custom_app import TruCustomApp
+from trulens_eval.utils.python import get_first_local_in_call_stack
+
+DEPTHS = [10, 50, 200]
+"""Python call stack depths at which instrumented calls are made."""
+
+CALLS = 200
+"""Number of nested instrumented calls per root call."""
+
+REPEATS = 5
+"""Number of root calls per measurement. The best is reported."""
+
+
+def at_depth(depth: int, func: Callable, *args, **kwargs):
+    """Call `func` with `depth` additional frames on the call stack."""
+
+    if depth <= 0:
+        return func(*args, **kwargs)
+
+    return at_depth(depth - 1, func, *args, **kwargs)
+
+
+class BenchApp:
+
+    @instrument
+    def leaf(self, x: int) -> int:
+        return x + 1
+
+    def leaves(self, calls: int) -> int:
+        total = 0
+        for i in range(calls):
+            total += self.leaf(i)
+        return total
+
+    @instrument
+    def root(self, depth: int, calls: int) -> int:
+        return at_depth(depth, self.leaves, calls)
+
+
+def best_of(func: Callable, *args, **kwargs) -> float:
+    """Best wall time (seconds) of `REPEATS` runs of `func`."""
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = timer()
+        func(*args, **kwargs)
+        best = min(best, timer() - start)
+
+    return best
+
+
+def legacy_lookups(calls: int) -> None:
+    """The two call stack walks each instrumented call used to perform."""
+
+    for _ in range(calls):
+        for key in ["contexts", "stacks"]:
+            get_first_local_in_call_stack(
+                key=key, func=lambda f: False, offset=1
+            )
+
+
+def main():
+    # Main input/output guessing warns about the int arguments of BenchApp.root .
+    logging.getLogger("trulens_eval").setLevel(logging.ERROR)
+
+    app = BenchApp()
+    recorder = TruCustomApp(
+        app, app_id="benchmark_instrumentation", feedback_mode=FeedbackMode.NONE
+    )
+
+    print(
+        f"{'depth':>6} {'uninstrumented':>16} {'instrumented':>14} "
+        f"{'overhead':>10} {'stack walk':>12}"
+    )
+
+    for depth in DEPTHS:
+        # Uninstrumented: outside of any recording context the wrapper only
+        # checks for contexts and calls the wrapped method.
+        raw = best_of(app.root, depth, CALLS) / CALLS
+
+        def recorded():
+            with recorder:
+                app.root(depth, CALLS)
+
+        instrumented = best_of(recorded) / CALLS
+
+        walk = best_of(at_depth, depth, legacy_lookups, CALLS) / CALLS
+
+        print(
+            f"{depth:>6} {raw*1e6:>14.1f}us {instrumented*1e6:>12.1f}us "
+            f"{(instrumented-raw)*1e6:>8.1f}us {walk*1e6:>10.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
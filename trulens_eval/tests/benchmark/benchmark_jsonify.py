@@ -0,0 +1,113 @@
+"""
+Benchmark of [jsonify][trulens_eval.utils.json.jsonify] on a large langchain
+app and on large call results.
+
+Builds a sequential chain of `CHAINS` LLM chains, each with its own prompt,
+fake LLM and memory, and measures:
+
+- jsonifying the app as done when it is registered (`TruChain` creation),
+- jsonifying the app's components with the app's instrumentation settings,
+- jsonifying a retriever result of `DOCUMENTS` documents with metadata as done
+  for the returns of every recorded call.
+
+Run with:
+
+```bash
+python -m tests.benchmark.benchmark_jsonify
+```
+"""
+
+import logging
+from timeit import default_timer as timer
+from typing import Callable
+
+from langchain.chains import LLMChain
+from langchain.chains import SequentialChain
+from langchain.memory import ConversationBufferMemory
+from langchain.prompts import PromptTemplate
+from langchain.schema import Document
+from langchain_community.llms import FakeListLLM
+
+from trulens_eval.schema.feedback import FeedbackMode
+from trulens_eval.tru_chain import TruChain
+from trulens_eval.utils.json import jsonify
+
+CHAINS = 100
+"""Number of chains in the benchmark app."""
+
+DOCUMENTS = 1000
+"""Number of documents in the benchmark call result."""
+
+REPEATS = 5
+"""Number of runs per measurement. The best is reported."""
+
+
+def best_of(func: Callable, *args, **kwargs) -> float:
+    """Best wall time (seconds) of `REPEATS` runs of `func`."""
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = timer()
+        func(*args, **kwargs)
+        best = min(best, timer() - start)
+
+    return best
+
+
+def make_chain(chains: int) -> SequentialChain:
+    """A sequential chain of `chains` chains each passing on its output."""
+
+    steps = []
+    for i in range(chains):
+        steps.append(
+            LLMChain(
+                llm=FakeListLLM(responses=[f"response {i}"]),
+                prompt=PromptTemplate.from_template(
+                    f"Step {i} of the pipeline. Rewrite: {{text{i}}}"
+                ),
+                memory=ConversationBufferMemory(
+                    memory_key=f"history{i}", input_key=f"text{i}"
+                ),
+                output_key=f"text{i+1}"
+            )
+        )
+
+    return SequentialChain(
+        chains=steps, input_variables=["text0"], output_variables=[f"text{chains}"]
+    )
+
+
+def make_documents(documents: int):
+    return [
+        Document(
+            page_content=f"Content of document {i}. " * 10,
+            metadata={
+                "source": f"doc_{i}.txt",
+                "page": i,
+                "tags": ["benchmark", f"tag_{i % 10}"],
+                "scores": {"bm25": i / 10, "dense": 1 - i / documents}
+            }
+        ) for i in range(documents)
+    ]
+
+
+def main():
+    logging.getLogger("trulens_eval").setLevel(logging.ERROR)
+
+    chain = make_chain(CHAINS)
+    tru_chain = TruChain(
+        chain, app_id="benchmark_jsonify", feedback_mode=FeedbackMode.NONE
+    )
+    documents = make_documents(DOCUMENTS)
+
+    app = best_of(jsonify, tru_chain)
+    components = best_of(jsonify, chain, instrument=tru_chain.instrument)
+    rets = best_of(jsonify, documents)
+
+    print(f"jsonify app of {CHAINS} chains: {app*1e3:>18.1f}ms")
+    print(f"jsonify its components: {components*1e3:>23.1f}ms")
+    print(f"jsonify {DOCUMENTS} documents: {rets*1e3:>24.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark of selector lookups into records with many calls.
+
+Records a root call of an instrumented app making `CALLS` calls to each of two
+instrumented components and times:
+
+- laying out the record's calls as the app, as done once per record before
+  selecting feedback function inputs,
+- looking up `Select.RecordCalls...` selectors in the layout with compiled
+  lenses (as [Lens.get][trulens_eval.utils.serial.Lens.get] does) and with the
+  recursive evaluation lenses used before for comparison.
+
+Run with:
+
+```bash
+python -m tests.benchmark.benchmark_lens
+```
+"""
+
+import logging
+from timeit import default_timer as timer
+from typing import Any, Callable, Iterable, List
+
+from trulens_eval.schema.feedback import FeedbackMode
+from trulens_eval.schema.feedback import Select
+from trulens_eval.tru_custom_app import instrument
+from trulens_eval.tru_custom_app import TruCustomApp
+from trulens_eval.utils.serial import Collect
+from trulens_eval.utils.serial import Lens
+
+CALLS = 1000
+"""Number of calls to each component per record."""
+
+REPEATS = 5
+"""Number of runs per measurement. The best is reported."""
+
+LOOKUPS = 100
+"""Number of lookups of each selector per run."""
+
+
+class Retriever:
+
+    @instrument
+    def retrieve(self, query: str) -> List[str]:
+        return [f"context {i} for {query}" for i in range(3)]
+
+
+class Generator:
+
+    @instrument
+    def generate(self, query: str, contexts: List[str]) -> str:
+        return f"answer to {query} using {len(contexts)} contexts"
+
+
+class BenchApp:
+
+    def __init__(self):
+        self.retriever = Retriever()
+        self.generator = Generator()
+
+    @instrument
+    def respond_to_query(self, query: str) -> str:
+        answer = ""
+        for i in range(CALLS):
+            contexts = self.retriever.retrieve(f"{query} {i}")
+            answer = self.generator.generate(query, contexts)
+        return answer
+
+
+SELECTORS = {
+    "last retrieval query":
+        Select.RecordCalls.retriever.retrieve[-1].args.query,
+    "all retrieved contexts":
+        Select.RecordCalls.retriever.retrieve[:].rets[:],
+    "all answers, collected":
+        Select.RecordCalls.generator.generate[:].rets.collect(),
+}
+
+
+def recursive_get(lens: Lens, obj: Any) -> Iterable[Any]:
+    """Lens lookup as implemented before compiled lenses."""
+
+    if len(lens.path) == 0:
+        yield obj
+        return
+
+    last_step = lens.path[-1]
+    start = Lens(path=lens.path[0:-1])
+
+    start_items = recursive_get(start, obj)
+
+    if isinstance(last_step, Collect):
+        yield list(start_items)
+
+    else:
+        for start_selection in start_items:
+            for last_selection in last_step.get(start_selection):
+                yield last_selection
+
+
+def best_of(func: Callable, *args, **kwargs) -> float:
+    """Best wall time (seconds) of `REPEATS` runs of `func`."""
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = timer()
+        func(*args, **kwargs)
+        best = min(best, timer() - start)
+
+    return best
+
+
+def lookups(get: Callable[[Lens, Any], Iterable[Any]], lens: Lens, obj: Any):
+    for _ in range(LOOKUPS):
+        for _ in get(lens, obj):
+            pass
+
+
+def main():
+    logging.getLogger("trulens_eval").setLevel(logging.ERROR)
+
+    app = BenchApp()
+    recorder = TruCustomApp(
+        app, app_id="benchmark_lens", feedback_mode=FeedbackMode.NONE
+    )
+
+    with recorder as recording:
+        app.respond_to_query("what is a lens")
+
+    record = recording.get()
+
+    layout_time = best_of(record.layout_calls_as_app)
+    print(
+        f"layout of {len(record.calls)} calls: {layout_time*1e3:>27.1f}ms"
+    )
+
+    layout = record.layout_calls_as_app()
+
+    print(f"{'selector':>24} {'compiled':>12} {'recursive':>12}")
+
+    for name, lens in SELECTORS.items():
+        compiled = best_of(
+            lookups, lambda lens, obj: lens.get(obj), lens, layout
+        ) / LOOKUPS
+        recursive = best_of(lookups, recursive_get, lens, layout) / LOOKUPS
+
+        print(f"{name:>24} {compiled*1e6:>10.1f}us {recursive*1e6:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,10 @@ running.
     - `copy_database`
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import datetime
+from datetime import timedelta
 import json
 from pathlib import Path
 import shutil
@@ -45,10 +48,12 @@ from trulens_eval.database.migrations import DbRevisions
 from trulens_eval.database.migrations import downgrade_db
 from trulens_eval.database.migrations import get_revision_history
 from trulens_eval.database.migrations import upgrade_db
-from trulens_eval.database.sqlalchemy import AppsExtractor
 from trulens_eval.database.sqlalchemy import SQLAlchemyDB
 from trulens_eval.database.utils import copy_database
 from trulens_eval.database.utils import is_legacy_sqlite
+from trulens_eval.schema.feedback import FeedbackResult
+from trulens_eval.schema.feedback import FeedbackResultStatus
+from trulens_eval.utils.json import LazyJSON
 
 
 class TestDBSpecifications(TestCase):
@@ -140,6 +145,295 @@ class TestDBSpecifications(TestCase):
 
                         _test_db_consistency(self, db_post)
 
+    def test_background_writes(self):
+        """Test that writes queued by the background writer are visible to
+        reads and after a flush."""
+
+        db_types = ["sqlite_file"]#, "postgres", "mysql"
+
+        for db_type in db_types:
+            with self.subTest(msg=f"background writes for {db_type}"):
+                with clean_db(db_type, background_writes=True) as db:
+                    db.migrate_database()
+
+                    _, app, rec = _populate_data(db)
+
+                    # Reads flush the queue first.
+                    df, feedback_cols = db.get_records_and_feedback(
+                        [app.app_id]
+                    )
+                    self.assertEqual(list(df.record_id), [rec.record_id])
+                    self.assertEqual(feedback_cols, ["length"])
+
+                    # Updates of the same rows are upserted.
+                    for _ in range(3):
+                        db.insert_record(rec)
+                    db.flush()
+
+                    with db.session.begin() as session:
+                        for orm_class in [db.orm.FeedbackDefinition, db.orm.Record, db.orm.FeedbackResult]:
+                            self.assertEqual(
+                                len(session.query(orm_class).all()),
+                                1,
+                                f"Expected exactly one {orm_class}."
+                            )
+
+                    db._stop_writer()
+
+    def test_get_feedback_lazy_json(self):
+        """Test that JSON columns of get_feedback are decoded on access and
+        shared among rows of the same app."""
+
+        with clean_db("sqlite_file") as db:
+            db.migrate_database()
+
+            fb, app, rec = _populate_data(db)
+            _populate_data(db)
+
+            df = db.get_feedback()
+            self.assertEqual(len(df), 2)
+
+            row = df.iloc[0]
+            self.assertIsInstance(row.record_json, LazyJSON)
+            self.assertEqual(row.feedback_json["feedback_definition_id"], "mock")
+            self.assertEqual(row.app_json.value["app_id"], app.app_id)
+            self.assertIsInstance(row.calls_json.value, list)
+
+            # Both rows are of the same app and feedback definition.
+            self.assertIs(df.iloc[0].app_json, df.iloc[1].app_json)
+            self.assertIs(df.iloc[0].feedback_json, df.iloc[1].feedback_json)
+
+    def test_iter_records_and_feedback(self):
+        """Test that chunked iteration produces the same rows as the
+        non-chunked getters."""
+
+        with clean_db("sqlite_file") as db:
+            db.migrate_database()
+
+            for _ in range(5):
+                _populate_data(db)
+
+            df, _ = db.get_records_and_feedback([])
+            chunks = list(db.iter_records([], batch_size=2))
+            self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+            self.assertEqual(
+                [rid for chunk in chunks for rid in chunk.record_id],
+                list(df.record_id)
+            )
+
+            df = db.get_feedback()
+            chunks = list(db.iter_feedback(batch_size=2))
+            self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+            self.assertEqual(
+                sorted(rid for chunk in chunks for rid in chunk.feedback_result_id),
+                sorted(df.feedback_result_id)
+            )
+
+
+    def test_get_records_and_feedback_filters(self):
+        """Test time filtering, paging and column projection of
+        get_records_and_feedback."""
+
+        with clean_db("sqlite_file") as db:
+            db.migrate_database()
+
+            for _ in range(5):
+                _populate_data(db)
+
+            df, feedback_cols = db.get_records_and_feedback([])
+            self.assertEqual(len(df), 5)
+            self.assertEqual(feedback_cols, ["length"])
+            record_ids = list(df.record_id)
+            ts = [datetime.fromisoformat(t) for t in df.ts]
+            self.assertEqual(ts, sorted(ts))
+
+            # Time range includes `since` and excludes `until`.
+            eps = timedelta(microseconds=1)
+            df_range, _ = db.get_records_and_feedback(
+                [], since=ts[1] - eps, until=ts[3] - eps
+            )
+            self.assertEqual(list(df_range.record_id), record_ids[1:3])
+
+            df_since, _ = db.get_records_and_feedback([], since=ts[3] - eps)
+            self.assertEqual(list(df_since.record_id), record_ids[3:])
+
+            # Pages are taken in time order.
+            pages = [
+                list(
+                    db.get_records_and_feedback([], offset=offset,
+                                                limit=2)[0].record_id
+                ) for offset in range(0, 5, 2)
+            ]
+            self.assertEqual(pages, [record_ids[0:2], record_ids[2:4],
+                                     record_ids[4:]])
+
+            df_paged, _ = db.get_records_and_feedback(
+                [], since=ts[1] - eps, offset=1, limit=2
+            )
+            self.assertEqual(list(df_paged.record_id), record_ids[2:4])
+
+            # Only the requested columns and the feedback scores are produced,
+            # with the same values as without a projection.
+            df_cols, feedback_cols = db.get_records_and_feedback(
+                [], columns=["record_id", "type", "latency"]
+            )
+            self.assertEqual(
+                list(df_cols.columns), ["type", "record_id", "length", "latency"]
+            )
+            self.assertEqual(feedback_cols, ["length"])
+            pd.testing.assert_frame_equal(
+                df_cols, df[list(df_cols.columns)]
+            )
+
+            with self.assertRaises(ValueError):
+                db.get_records_and_feedback([], columns=["record_id", "nope"])
+
+    def test_claim_feedback(self):
+        """Test that feedback results are leased to one evaluator at a time
+        and can be claimed again once their lease expires."""
+
+        with clean_db("sqlite_file") as db:
+            db.migrate_database()
+
+            _, _, rec = _populate_data(db)
+
+            pending = {
+                db.insert_feedback(
+                    FeedbackResult(
+                        feedback_definition_id="mock",
+                        record_id=rec.record_id,
+                        name="mock"
+                    )
+                ) for _ in range(20)
+            }
+
+            # Another evaluator connected to the same database.
+            other = SQLAlchemyDB(engine_params=db.engine_params)
+
+            def claim(_db: SQLAlchemyDB):
+                return list(
+                    _db.claim_feedback(
+                        limit=5,
+                        lease_seconds=60,
+                        retry_failed_seconds=60,
+                        shuffle=True
+                    ).feedback_result_id
+                )
+
+            with ThreadPoolExecutor(4) as pool:
+                claims = [
+                    fid for ids in pool.map(claim, [db, other] * 4)
+                    for fid in ids
+                ]
+
+            # Claims are exclusive and cover all pending feedback results.
+            self.assertEqual(len(claims), len(set(claims)))
+            self.assertEqual(set(claims), pending)
+
+            self.assertEqual(
+                db.get_feedback_count_by_status()[FeedbackResultStatus.RUNNING],
+                20
+            )
+            self.assertEqual(claim(db), [])
+
+            self.assertEqual(db.renew_feedback_leases(list(pending)), 20)
+
+            # Expired leases can be claimed again.
+            reclaimed = db.claim_feedback(
+                limit=None, lease_seconds=0, retry_failed_seconds=60
+            )
+            self.assertEqual(set(reclaimed.feedback_result_id), pending)
+
+
+    def test_evaluate_deferred_missing_definition(self):
+        """Test that deferred runs of feedback without a definition in the
+        database are marked failed instead of being claimed again."""
+
+        with clean_db("sqlite_file") as db:
+            db.migrate_database()
+
+            _, _, rec = _populate_data(db)
+
+            feedback_result_id = db.insert_feedback(
+                FeedbackResult(
+                    feedback_definition_id="missing",
+                    record_id=rec.record_id,
+                    name="missing"
+                )
+            )
+
+            tru = Tru()
+            tru.db = db
+
+            futures = Feedback.evaluate_deferred(tru=tru)
+            self.assertEqual(len(futures), 1)
+            self.assertIsNone(futures[0][1].result())
+
+            df = db.get_feedback(feedback_result_id=feedback_result_id)
+            self.assertEqual(df.status[0], FeedbackResultStatus.FAILED)
+            self.assertIn("missing", df.error[0])
+
+            # Failed runs are only retried later.
+            self.assertEqual(
+                len(
+                    db.claim_feedback(
+                        limit=None, lease_seconds=0, retry_failed_seconds=60
+                    )
+                ), 0
+            )
+
+    def test_wait_for_feedback(self):
+        """Test that evaluators are woken up by feedback results to evaluate
+        inserted through the same database instance or another connection."""
+
+        with clean_db("sqlite_file") as db:
+            db.migrate_database()
+
+            _, _, rec = _populate_data(db)
+
+            def pending():
+                return FeedbackResult(
+                    feedback_definition_id="mock",
+                    record_id=rec.record_id,
+                    name="mock"
+                )
+
+            self.assertFalse(db.wait_for_feedback(timeout=0.1))
+
+            db.insert_feedback(pending())
+            self.assertTrue(db.wait_for_feedback(timeout=0))
+            self.assertFalse(db.wait_for_feedback(timeout=0.1))
+
+            # Another evaluator connected to the same database.
+            other = SQLAlchemyDB(engine_params=db.engine_params)
+            other.insert_feedback(pending())
+            self.assertTrue(db.wait_for_feedback(timeout=1))
+            self.assertFalse(db.wait_for_feedback(timeout=0.1))
+
+            # Claims, lease renewals and results written through the same
+            # instance do not wake it up.
+            claimed = list(
+                db.claim_feedback(
+                    limit=None, lease_seconds=60, retry_failed_seconds=60
+                ).feedback_result_id
+            )
+            self.assertEqual(len(claimed), 2)
+            db.renew_feedback_leases(claimed)
+            for feedback_result_id in claimed:
+                db.insert_feedback(
+                    pending().update(
+                        feedback_result_id=feedback_result_id,
+                        status=FeedbackResultStatus.DONE,
+                        result=1.0
+                    )
+                )
+            self.assertFalse(db.wait_for_feedback(timeout=0.1))
+
+            # But a commit of another connection made before them is noticed.
+            other.insert_feedback(pending())
+            db.renew_feedback_leases(claimed)
+            self.assertTrue(db.wait_for_feedback(timeout=0))
+
 
 class TestDbV2Migration(TestCase):
     """Migrations from legacy sqlite db to sqlalchemy-managed databases of
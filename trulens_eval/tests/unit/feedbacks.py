@@ -28,6 +28,9 @@ class CustomProvider(Provider):
     def method(self, t1: str) -> float:
         return 0.4 + self.attr
 
+    async def amethod(self, t1: str) -> float:
+        return 0.4 + self.attr
+
 
 class CustomClassNoArgs():
     # This one is ok as it has no init arguments so we can deserialize it just
@@ -0,0 +1,123 @@
+"""
+Tests for resolution of the endpoints whose costs are tracked.
+"""
+
+import os
+from typing import ClassVar
+from unittest import main
+from unittest import mock
+from unittest import TestCase
+
+from trulens_eval.feedback.provider.endpoint.base import Endpoint
+from trulens_eval.feedback.provider.endpoint.base import EndpointCallback
+from trulens_eval.utils.python import safe_hasattr
+from trulens_eval.utils.python import SingletonPerName
+
+KEY_VAR = "TRULENS_TEST_ENDPOINT_KEY"
+
+
+class KeyedEndpoint(Endpoint):
+    """Endpoint that can only be created if its key is in the environment."""
+
+    attempts: ClassVar[int] = 0
+    """Number of attempts to create the endpoint."""
+
+    def __init__(self, **kwargs):
+        if safe_hasattr(self, "rpm"):
+            # already initialized via the SingletonPerName mechanism
+            return
+
+        KeyedEndpoint.attempts += 1
+
+        if KEY_VAR not in os.environ:
+            raise ValueError(f"{KEY_VAR} is not set.")
+
+        super().__init__(
+            name="KeyedEndpoint", callback_class=EndpointCallback, **kwargs
+        )
+
+
+class TestAvailableEndpoints(TestCase):
+
+    def setUp(self):
+        Endpoint.reset_available_endpoints()
+        KeyedEndpoint.attempts = 0
+
+        self.setups = mock.patch.object(
+            Endpoint, "ENDPOINT_SETUPS", [
+                Endpoint.EndpointSetup(
+                    arg_flag="with_keyed",
+                    module_name=__name__,
+                    class_name="KeyedEndpoint"
+                ),
+                Endpoint.EndpointSetup(
+                    arg_flag="with_missing",
+                    module_name="trulens_eval.not_a_module",
+                    class_name="MissingEndpoint"
+                )
+            ]
+        )
+        self.setups.start()
+
+        self.environ = mock.patch.dict(os.environ)
+        self.environ.start()
+        os.environ.pop(KEY_VAR, None)
+
+    def tearDown(self):
+        self.environ.stop()
+        self.setups.stop()
+
+        Endpoint.reset_available_endpoints()
+        SingletonPerName.delete_singleton_by_name("KeyedEndpoint")
+
+    def test_unavailable_not_retried(self):
+        self.assertEqual(Endpoint.available_endpoints(), [])
+        self.assertEqual(KeyedEndpoint.attempts, 1)
+
+        # Nothing changed so neither endpoint is attempted again.
+        self.assertEqual(Endpoint.available_endpoints(), [])
+        self.assertEqual(KeyedEndpoint.attempts, 1)
+        self.assertIsNone(Endpoint._unavailable_endpoints["with_missing"])
+
+        # Excluded endpoints are not attempted.
+        os.environ[KEY_VAR] = "key"
+        self.assertEqual(Endpoint.available_endpoints(with_keyed=False), [])
+        self.assertEqual(KeyedEndpoint.attempts, 1)
+
+    def test_resolved_once(self):
+        os.environ[KEY_VAR] = "key"
+
+        endpoints = Endpoint.available_endpoints()
+        self.assertEqual(len(endpoints), 1)
+        self.assertIsInstance(endpoints[0], KeyedEndpoint)
+
+        self.assertIs(Endpoint.available_endpoints()[0], endpoints[0])
+        self.assertEqual(KeyedEndpoint.attempts, 1)
+
+    def test_retried_after_environment_changes(self):
+        self.assertEqual(Endpoint.available_endpoints(), [])
+        self.assertEqual(KeyedEndpoint.attempts, 1)
+
+        os.environ[KEY_VAR] = "key"
+
+        endpoints = Endpoint.available_endpoints()
+        self.assertEqual(len(endpoints), 1)
+        self.assertEqual(KeyedEndpoint.attempts, 2)
+        self.assertNotIn("with_keyed", Endpoint._unavailable_endpoints)
+
+    def test_invalidated_when_singleton_deleted(self):
+        os.environ[KEY_VAR] = "key"
+
+        first = Endpoint.available_endpoints()[0]
+        first.delete_singleton()
+
+        second = Endpoint.available_endpoints()[0]
+        self.assertIsNot(second, first)
+        self.assertEqual(KeyedEndpoint.attempts, 2)
+
+        self.assertIs(Endpoint.available_endpoints()[0], second)
+        self.assertEqual(KeyedEndpoint.attempts, 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 Tests for Feedback class. 
 """
 
+import asyncio
 from unittest import main
 from unittest import TestCase
 
@@ -15,6 +16,7 @@ from tests.unit.feedbacks import make_nonglobal_feedbacks
 from trulens_eval import Feedback
 from trulens_eval import Tru
 from trulens_eval import TruCustomApp
+from trulens_eval.feedback.feedback import PreparedSource
 from trulens_eval.keys import check_keys
 from trulens_eval.schema.feedback import FeedbackMode
 from trulens_eval.tru_basic_app import TruBasicApp
@@ -22,6 +24,62 @@ from trulens_eval.tru_custom_app import TruCustomApp
 from trulens_eval.utils.json import jsonify
 
 
+class TestFeedbackAsync(TestCase):
+
+    def setUp(self):
+        self.app = TruBasicApp(text_to_text=lambda t: f"returning {t}")
+        _, self.record = self.app.with_record(self.app.app, t="hello")
+
+    def test_arun(self):
+        provider = CustomProvider(attr=0.37)
+
+        for imp, aimp in [
+            (custom_feedback_function, custom_feedback_function),
+            (provider.method, provider.amethod),
+        ]:
+            with self.subTest(imp=imp):
+                f = Feedback(imp).on_default()
+
+                # Async counterparts of methods are used if present.
+                self.assertEqual(f._async_imp(), aimp)
+
+                res = asyncio.run(f.arun(record=self.record, app=self.app))
+                expected = f.run(record=self.record, app=self.app)
+
+                self.assertEqual(res.status, expected.status)
+                self.assertEqual(res.result, expected.result)
+
+
+class TestPreparedSource(TestCase):
+
+    def setUp(self):
+        self.app = TruBasicApp(text_to_text=lambda t: f"returning {t}")
+        _, self.record = self.app.with_record(self.app.app, t="hello")
+
+    def test_shared(self):
+        prepared_source = PreparedSource(app=self.app, record=self.record)
+
+        f = Feedback(custom_feedback_function).on_default()
+
+        for _ in range(2):
+            res = f.run(prepared_source=prepared_source)
+            expected = f.run(record=self.record, app=self.app)
+
+            self.assertEqual(res.status, expected.status)
+            self.assertEqual(res.result, expected.result)
+
+        # Laid out once and shared with later runs.
+        self.assertIs(
+            prepared_source.source_data()["__record__"],
+            prepared_source.record_layout
+        )
+
+        self.assertEqual(
+            jsonify(prepared_source.record_layout),
+            jsonify(self.record.layout_calls_as_app())
+        )
+
+
 class TestFeedbackConstructors(TestCase):
 
     def setUp(self):
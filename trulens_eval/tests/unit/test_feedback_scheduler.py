@@ -0,0 +1,67 @@
+"""
+Tests for bounded scheduling of feedback evaluations.
+"""
+
+import threading
+from unittest import main
+from unittest import TestCase
+
+from trulens_eval.feedback.scheduler import FeedbackScheduler
+from trulens_eval.schema.feedback import FeedbackOverflow
+
+
+class TestFeedbackScheduler(TestCase):
+
+    def test_drop(self):
+        scheduler = FeedbackScheduler(
+            max_in_flight=4, overflow=FeedbackOverflow.DROP
+        )
+
+        self.assertTrue(scheduler.admit(3))
+        self.assertFalse(scheduler.admit(3))
+        self.assertEqual(scheduler.stats.n_dropped, 3)
+
+        scheduler.release(3)
+        self.assertTrue(scheduler.admit(3))
+
+        # Batches larger than the bound are admitted when nothing is in flight.
+        scheduler.release(3)
+        self.assertTrue(scheduler.admit(5))
+
+        self.assertEqual(scheduler.stats.n_admitted, 11)
+        self.assertEqual(scheduler.stats.peak_in_flight, 5)
+
+    def test_defer(self):
+        scheduler = FeedbackScheduler(
+            max_in_flight=1, overflow=FeedbackOverflow.DEFER
+        )
+
+        self.assertTrue(scheduler.admit(1))
+        self.assertFalse(scheduler.admit(1))
+        self.assertEqual(scheduler.stats.n_deferred, 1)
+        self.assertEqual(scheduler.stats.n_dropped, 0)
+
+    def test_block(self):
+        scheduler = FeedbackScheduler(
+            max_in_flight=2, overflow=FeedbackOverflow.BLOCK
+        )
+
+        self.assertTrue(scheduler.admit(2))
+
+        # Times out while nothing is released.
+        self.assertFalse(scheduler.admit(1, timeout=0.01))
+        self.assertEqual(scheduler.stats.n_dropped, 1)
+
+        releaser = threading.Timer(0.1, scheduler.release)
+        releaser.start()
+
+        self.assertTrue(scheduler.admit(1))
+        releaser.join()
+
+        self.assertEqual(scheduler.stats.in_flight, 2)
+        self.assertEqual(scheduler.stats.n_waited, 2)
+        self.assertGreater(scheduler.stats.max_wait, 0.05)
+
+
+if __name__ == '__main__':
+    main()
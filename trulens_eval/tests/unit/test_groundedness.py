@@ -0,0 +1,230 @@
+"""
+Tests for the concurrent and batched LLM groundedness measures.
+"""
+
+import asyncio
+import re
+from threading import Lock
+import time
+from typing import List, Sequence
+from unittest import main
+from unittest import mock
+from unittest import TestCase
+
+from trulens_eval.feedback import groundedness as mod_groundedness
+from trulens_eval.feedback.groundedness import Groundedness
+from trulens_eval.feedback.provider.base import LLMProvider
+from trulens_eval.feedback.provider.endpoint.base import DummyEndpoint
+
+N_STATEMENTS = 5
+
+STATEMENTS: List[str] = [f"Sentence {i}." for i in range(N_STATEMENTS)]
+
+EXPECTED_SCORES = {f"statement_{i}": i / 10 for i in range(N_STATEMENTS)}
+
+LOCK = Lock()
+
+
+def reason_of(hypothesis: str) -> str:
+    """Response for a statement sentence whose score is the number in it."""
+
+    score = re.search(r"\d+", hypothesis).group(0)
+    return (
+        f"Statement Sentence: {hypothesis}\n"
+        f"Supporting Evidence: NOTHING FOUND\n"
+        f"Score: {score}\n"
+    )
+
+
+class FakeGroundednessProvider(LLMProvider):
+    """Provider responding to groundedness requests without an LLM.
+
+    Requests for earlier statement sentences take longer so that concurrent
+    requests finish out of order.
+    """
+
+    split_batches: bool = True
+    """Whether batched responses can be split into parts for each sentence."""
+
+    n_single: int = 0
+    n_batch: int = 0
+    n_active: int = 0
+    max_active: int = 0
+
+    def _start(self, batch: bool) -> None:
+        with LOCK:
+            if batch:
+                self.n_batch += 1
+            else:
+                self.n_single += 1
+            self.n_active += 1
+            self.max_active = max(self.max_active, self.n_active)
+
+    def _end(self) -> None:
+        with LOCK:
+            self.n_active -= 1
+
+    @staticmethod
+    def _delay(hypotheses: Sequence[str]) -> float:
+        first = int(re.search(r"\d+", hypotheses[0]).group(0))
+        return 0.01 * (N_STATEMENTS - first)
+
+    def _batch_response(self, hypotheses: Sequence[str]) -> str:
+        response = "".join(reason_of(hypothesis) for hypothesis in hypotheses)
+        if not self.split_batches:
+            response = response.replace("Statement Sentence:", "Sentence:")
+        return response
+
+    def _groundedness_doc_in_out(self, premise: str, hypothesis: str) -> str:
+        self._start(batch=False)
+        time.sleep(self._delay([hypothesis]))
+        self._end()
+        return reason_of(hypothesis)
+
+    def _groundedness_doc_in_out_batch(
+        self, premise: str, hypotheses: Sequence[str]
+    ) -> str:
+        self._start(batch=True)
+        time.sleep(self._delay(hypotheses))
+        self._end()
+        return self._batch_response(hypotheses)
+
+    async def _agroundedness_doc_in_out(
+        self, premise: str, hypothesis: str
+    ) -> str:
+        self._start(batch=False)
+        await asyncio.sleep(self._delay([hypothesis]))
+        self._end()
+        return reason_of(hypothesis)
+
+    async def _agroundedness_doc_in_out_batch(
+        self, premise: str, hypotheses: Sequence[str]
+    ) -> str:
+        self._start(batch=True)
+        await asyncio.sleep(self._delay(hypotheses))
+        self._end()
+        return self._batch_response(hypotheses)
+
+
+class TestGroundedness(TestCase):
+
+    def setUp(self):
+        # Sentences are given one per line so no tokenizer models are needed.
+        self.patches = [
+            mock.patch("nltk.download"),
+            mock.patch.object(
+                mod_groundedness, "sent_tokenize",
+                lambda text: text.split("\n")
+            )
+        ]
+        for patch in self.patches:
+            patch.start()
+
+        self.endpoint = DummyEndpoint(name="groundedness_test")
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def groundedness(self, **kwargs):
+        provider = FakeGroundednessProvider(
+            model_engine="fake", endpoint=self.endpoint, **kwargs
+        )
+        return provider, Groundedness(groundedness_provider=provider)
+
+    def measure(self, grounded: Groundedness, asynchronous: bool = False):
+        statement = "\n".join(STATEMENTS)
+
+        if asynchronous:
+            return asyncio.run(
+                grounded.agroundedness_measure_with_cot_reasons(
+                    source="source", statement=statement
+                )
+            )
+
+        return grounded.groundedness_measure_with_cot_reasons(
+            source="source", statement=statement
+        )
+
+    def test_concurrent_in_order(self):
+        for asynchronous in [False, True]:
+            with self.subTest(asynchronous=asynchronous):
+                provider, grounded = self.groundedness()
+
+                scores, reasons = self.measure(grounded, asynchronous)
+
+                self.assertEqual(scores, EXPECTED_SCORES)
+                self.assertEqual(provider.n_single, N_STATEMENTS)
+                self.assertEqual(provider.n_batch, 0)
+                self.assertGreater(provider.max_active, 1)
+
+                # Reasons are in the order of the statement sentences.
+                positions = [
+                    reasons["reasons"].index(f"STATEMENT {i}:\n" + reason_of(s))
+                    for i, s in enumerate(STATEMENTS)
+                ]
+                self.assertEqual(positions, sorted(positions))
+
+    def test_sequential(self):
+        provider, grounded = self.groundedness()
+
+        with mock.patch.object(Groundedness, "MAX_WORKERS", 1):
+            scores, _ = self.measure(grounded)
+
+        self.assertEqual(scores, EXPECTED_SCORES)
+        self.assertEqual(provider.max_active, 1)
+
+    def test_batches(self):
+        _, grounded = self.groundedness()
+        grounded.statements_per_request = 2
+
+        self.assertEqual(
+            grounded._batches(STATEMENTS),
+            [STATEMENTS[0:2], STATEMENTS[2:4], STATEMENTS[4:]]
+        )
+
+        grounded.statements_per_request = 0
+        self.assertEqual(
+            grounded._batches(STATEMENTS), [[s] for s in STATEMENTS]
+        )
+
+    def test_split_reasons(self):
+        response = "".join(reason_of(s) for s in STATEMENTS[:3])
+
+        self.assertEqual(
+            Groundedness._split_reasons(response, 3),
+            [reason_of(s) for s in STATEMENTS[:3]]
+        )
+        self.assertIsNone(Groundedness._split_reasons(response, 2))
+        self.assertIsNone(Groundedness._split_reasons("Score: 10", 1))
+
+    def test_batched(self):
+        for asynchronous in [False, True]:
+            with self.subTest(asynchronous=asynchronous):
+                provider, grounded = self.groundedness()
+                grounded.statements_per_request = 2
+
+                scores, _ = self.measure(grounded, asynchronous)
+
+                self.assertEqual(scores, EXPECTED_SCORES)
+                # Two batches of two and the last sentence alone.
+                self.assertEqual(provider.n_batch, 2)
+                self.assertEqual(provider.n_single, 1)
+
+    def test_batch_fallback(self):
+        for asynchronous in [False, True]:
+            with self.subTest(asynchronous=asynchronous):
+                provider, grounded = self.groundedness(split_batches=False)
+                grounded.statements_per_request = 2
+
+                scores, _ = self.measure(grounded, asynchronous)
+
+                # Sentences of batches that could not be split are checked one
+                # at a time.
+                self.assertEqual(scores, EXPECTED_SCORES)
+                self.assertEqual(provider.n_batch, 2)
+                self.assertEqual(provider.n_single, N_STATEMENTS)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Tests for creation of record, feedback result, and feedback definition ids.
+"""
+
+import datetime
+from unittest import main
+from unittest import TestCase
+
+from trulens_eval.schema.base import IDMode
+from trulens_eval.schema.feedback import FeedbackResult
+from trulens_eval.schema.record import Record
+from trulens_eval.utils.json import uuid7
+
+
+class TestIDs(TestCase):
+
+    def test_uuid7(self):
+        ids = [uuid7() for _ in range(10000)]
+
+        for id_ in ids[:10]:
+            self.assertEqual(id_.version, 7)
+
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(
+            [id_.hex for id_ in ids], sorted(id_.hex for id_ in ids)
+        )
+
+    def test_time_ordered(self):
+        records = [Record(app_id="app") for _ in range(100)]
+        record_ids = [record.record_id for record in records]
+
+        self.assertTrue(record_ids[0].startswith("record_"))
+        self.assertEqual(record_ids, sorted(record_ids))
+        self.assertEqual(len(set(record_ids)), len(record_ids))
+
+        result = FeedbackResult(record_id=record_ids[0], name="feedback")
+        self.assertTrue(result.feedback_result_id.startswith("feedback_result_"))
+
+        # Given ids are kept.
+        self.assertEqual(
+            Record(app_id="app", record_id="given").record_id, "given"
+        )
+
+    def test_content_hash(self):
+        try:
+            Record.ID_MODE = IDMode.CONTENT_HASH
+
+            ts = datetime.datetime(2024, 1, 1)
+            record = Record(app_id="app", ts=ts)
+            self.assertTrue(record.record_id.startswith("record_hash_"))
+            self.assertEqual(
+                record.record_id,
+                Record(app_id="app", ts=ts).record_id
+            )
+
+        finally:
+            Record.ID_MODE = IDMode.TIME_ORDERED
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Tests for jsonify capture limits.
+"""
+
+from unittest import main
+from unittest import TestCase
+
+from trulens_eval.utils.json import CaptureLimits
+from trulens_eval.utils.json import jsonify
+from trulens_eval.utils.pyschema import TRUNCATED
+
+
+class Document:
+
+    def __init__(self, content: str):
+        self.content = content
+
+
+class TestCaptureLimits(TestCase):
+
+    def test_no_limits(self):
+        obj = dict(text="x" * 100, items=list(range(100)))
+
+        self.assertEqual(jsonify(obj), obj)
+        self.assertEqual(jsonify(obj, limits=CaptureLimits()), obj)
+
+    def test_strings(self):
+        limits = CaptureLimits(max_str_len=4)
+
+        self.assertEqual(jsonify("abcd", limits=limits), "abcd")
+        self.assertEqual(
+            jsonify(["abcdef"], limits=limits), ["abcd... (2 more characters)"]
+        )
+
+    def test_items(self):
+        limits = CaptureLimits(max_items=2)
+
+        self.assertEqual(
+            jsonify([1, 2, 3, 4], limits=limits),
+            [1, 2, {TRUNCATED: dict(reason="items", omitted=2)}]
+        )
+        self.assertEqual(
+            jsonify(dict(a=1, b=2, c=3), limits=limits),
+            dict(a=1, b=2, **{TRUNCATED: dict(reason="items", omitted=1)})
+        )
+
+    def test_depth(self):
+        limits = CaptureLimits(max_depth=2)
+
+        self.assertEqual(
+            jsonify(dict(a=dict(b=dict(c=1)), d=1), limits=limits),
+            dict(
+                a=dict(b={TRUNCATED: dict(reason="depth", cls="dict")}), d=1
+            )
+        )
+
+    def test_arrays(self):
+        limits = CaptureLimits(drop_arrays=True)
+        embedding = [0.5] * 100
+
+        self.assertEqual(
+            jsonify(dict(embedding=embedding, box=[1, 2]), limits=limits),
+            dict(
+                embedding={
+                    TRUNCATED: dict(reason="array", cls="list", shape=[100])
+                },
+                box=[1, 2]
+            )
+        )
+
+    def test_serializers(self):
+        limits = CaptureLimits(
+            max_str_len=4, serializers={Document: lambda doc: doc.content}
+        )
+
+        self.assertEqual(
+            jsonify([Document("abcdef")], limits=limits),
+            ["abcd... (2 more characters)"]
+        )
+
+
+if __name__ == '__main__':
+    main()
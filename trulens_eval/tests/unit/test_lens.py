@@ -196,6 +196,47 @@ class TestLens(TestCase):
 
         # Collect cannot be set.
 
+    def testSetInPlace(self):
+        lens = Lens()['outerkey'].seqkey[2]
+
+        with self.subTest("copy"):
+            obj1 = lens.set(self.obj1, 4)
+            self.assertIsNot(obj1, self.obj1)
+            self.assertEqual(self.obj1['outerkey'].seqkey[2], 3)
+
+        with self.subTest("in place"):
+            obj1 = lens.set(self.obj1, 4, in_place=True)
+            self.assertIs(obj1, self.obj1)
+            self.assertEqual(self.obj1['outerkey'].seqkey[2], 4)
+
+        with self.subTest("missing"):
+            obj = dict()
+            obj1 = Lens().a.b[1].set(obj, 42, in_place=True)
+            self.assertIs(obj1, obj)
+            self.assertEqual(obj, dict(a=dict(b=[None, 42])))
+
+    def testCompiled(self):
+        # Compiled once per path.
+        self.assertIs(
+            Lens().outerkey.seqkey.compiled(),
+            Lens().of_string("outerkey.seqkey").compiled()
+        )
+
+        # Lookups fall back to the general steps for objects other than
+        # dicts and lists.
+        self.assertEqual(
+            list(Lens().outerkey.strkey.get(self.obj1)), ["hello"]
+        )
+        self.assertEqual(
+            list(Lens().outerkey.seqkey[-1].get(self.obj1)), [5]
+        )
+        self.assertEqual(
+            list(Lens().outerkey.seqkey[1:3].collect().get(self.obj1)), [[2, 3]]
+        )
+
+        with self.assertRaises(KeyError):
+            list(Lens().outerkey.missing.get(self.obj1))
+
 
 if __name__ == '__main__':
     main()
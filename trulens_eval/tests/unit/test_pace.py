@@ -0,0 +1,153 @@
+"""
+Tests for rate limiting of API requests.
+"""
+
+from unittest import main
+from unittest import mock
+from unittest import TestCase
+
+from trulens_eval.feedback.provider.endpoint.base import Endpoint
+from trulens_eval.feedback.provider.endpoint.base import rate_limit_of_error
+from trulens_eval.feedback.provider.endpoint.base import retry_after_of_headers
+from trulens_eval.utils.pace import Pace
+from trulens_eval.utils.pace import RateLimiter
+
+
+class RateLimitError(Exception):
+    """Error similar to the ones raised by openai for 429 responses."""
+
+    status_code = 429
+
+    def __init__(self, headers):
+        super().__init__("rate limited")
+
+        self.response = type("Response", (), dict(headers=headers))
+
+
+class TestRateLimiter(TestCase):
+
+    def test_budgets(self):
+        limiter = RateLimiter(rpm=3, tpm=600)
+
+        # Burst up to the budgets is allowed.
+        for _ in range(3):
+            self.assertEqual(limiter._reserve(tokens=100), 0.0)
+
+        # Then requests wait for the requests bucket to refill at 3/60 per
+        # second.
+        self.assertAlmostEqual(limiter._reserve(tokens=100), 20.0, places=1)
+
+        limiter = RateLimiter(rpm=60, tpm=600)
+        self.assertEqual(limiter._reserve(tokens=500), 0.0)
+
+        # 400 more tokens needed at 10 per second.
+        self.assertAlmostEqual(limiter._reserve(tokens=500), 40.0, places=1)
+
+    def test_settle(self):
+        limiter = RateLimiter(rpm=60, tpm=600)
+        limiter.observe("source", 1000)
+
+        limiter._reserve(tokens=500)
+        limiter._reserve(tokens=500)
+
+        # Usage not yet counted keeps the estimate.
+        limiter.settle("source", observed=1000, estimated=500)
+        self.assertAlmostEqual(limiter.tokens.level, -400, places=0)
+
+        # Both requests only used 100 tokens each.
+        limiter.settle("source", observed=1200, estimated=500)
+        self.assertAlmostEqual(limiter.tokens.level, 400, places=0)
+
+    def test_rate_limited(self):
+        limiter = RateLimiter(rpm=60)
+
+        self.assertAlmostEqual(limiter.rate_limited(5.0), 5.0, delta=0.5)
+        self.assertAlmostEqual(limiter._reserve(tokens=0), 6.0, delta=0.6)
+
+        # Without retry delay, backoff grows with failures.
+        limiter = RateLimiter(rpm=60)
+        delay = limiter.rate_limited()
+        self.assertLessEqual(delay, RateLimiter.BASE_BACKOFF_SECONDS)
+
+        # Failures while already blocked do not grow the backoff.
+        self.assertAlmostEqual(limiter.rate_limited(), delay, places=1)
+        self.assertEqual(limiter.failures, 1)
+
+        limiter.succeeded()
+        self.assertEqual(limiter.failures, 0)
+
+    def test_shared(self):
+        try:
+            first = RateLimiter.shared("key", rpm=60)
+            second = RateLimiter.shared("key", rpm=30, tpm=1000)
+
+            self.assertIs(first, second)
+            self.assertEqual(first.rpm, 30)
+            self.assertEqual(first.tpm, 1000)
+
+            self.assertIsNot(first, RateLimiter.shared("other key", rpm=60))
+
+        finally:
+            RateLimiter.reset_shared()
+
+    def test_rate_limit_of_error(self):
+        self.assertEqual(
+            rate_limit_of_error(RateLimitError({"retry-after-ms": "1500"})),
+            (True, 1.5)
+        )
+        self.assertEqual(
+            rate_limit_of_error(RateLimitError({})), (True, None)
+        )
+        self.assertEqual(rate_limit_of_error(ValueError()), (False, None))
+
+        # boto3 throttling
+        error = Exception()
+        error.response = {"Error": {"Code": "ThrottlingException"}}
+        self.assertEqual(rate_limit_of_error(error), (True, None))
+
+        self.assertEqual(retry_after_of_headers({"Retry-After": "2"}), 2.0)
+        self.assertEqual(
+            retry_after_of_headers(
+                {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+            ), 0.0
+        )
+
+
+class TestEndpointPacing(TestCase):
+
+    def tearDown(self):
+        for name in ["test_rpm", "test_pace", "test_post"]:
+            Endpoint.delete_singleton_by_name(name)
+        RateLimiter.reset_shared()
+
+    def test_rpm(self):
+        endpoint = Endpoint(name="test_rpm", rpm=30)
+
+        self.assertEqual(endpoint.rpm, 30)
+        self.assertEqual(endpoint.limiter.rpm, 30)
+
+    def test_pace(self):
+        # A given pace is deprecated but still sets the limiter's rpm.
+        with self.assertWarns(DeprecationWarning):
+            endpoint = Endpoint(
+                name="test_pace", pace=Pace(seconds_per_period=60.0, rpm=12)
+            )
+
+        self.assertAlmostEqual(endpoint.rpm, 12)
+        self.assertAlmostEqual(endpoint.limiter.rpm, 12)
+
+    def test_post_rate_limited(self):
+        endpoint = Endpoint(name="test_post", rpm=6000, retries=2)
+
+        response = mock.Mock(status_code=429, headers={"retry-after-ms": "0"})
+
+        with mock.patch("requests.post", return_value=response) as post:
+            with self.assertRaises(RuntimeError):
+                endpoint.post("http://localhost", payload={})
+
+        # Rate limited requests are retried a bounded number of times.
+        self.assertEqual(post.call_count, 3)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+import os
+import tempfile
+from typing import Dict
+from unittest import main
+from unittest import TestCase
+
+import pydantic
+
+from tests.unit.test import optional_test
+
+from trulens_eval.feedback.provider.base import LLMProvider
+from trulens_eval.feedback.provider.cache import bypass_response_cache
+from trulens_eval.feedback.provider.cache import ResponseCache
+from trulens_eval.feedback.provider.endpoint.base import DummyEndpoint
+from trulens_eval.feedback.provider.endpoint.base import Endpoint
+
+
+class CountingProvider(LLMProvider):
+    """Provider responding with a fixed score and counting its requests."""
+
+    n_requests: int = 0
+
+    def _create_chat_completion(self, prompt=None, messages=None, **kwargs):
+        self.n_requests += 1
+        return "Score: 7"
+
+
+class SettingsProvider(CountingProvider):
+    """Provider with settings of its own that override request arguments, like
+    the completion args of LiteLLM."""
+
+    completion_args: Dict = pydantic.Field(default_factory=dict)
+
+    def _effective_request(self, kwargs: Dict) -> Dict:
+        return dict(kwargs, **self.completion_args)
+
+
+class TestResponseCache(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "responses.sqlite")
+
+        self.endpoint = DummyEndpoint(
+            name="response_cache_test",
+            error_prob=0.0,
+            freeze_prob=0.0,
+            overloaded_prob=0.0,
+            loading_prob=0.0,
+            alloc=0
+        )
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def provider(self, **kwargs):
+        return CountingProvider(
+            model_engine="fake", endpoint=self.endpoint, **kwargs
+        )
+
+    def test_hits(self):
+        provider = self.provider(
+            response_cache=ResponseCache(path=self.path)
+        )
+
+        def score():
+            return provider.generate_score(system_prompt="Rate this.")
+
+        (first, second), callbacks = Endpoint._track_costs(
+            lambda: (score(), score()), with_endpoints=[self.endpoint]
+        )
+
+        self.assertEqual(first, second)
+        self.assertEqual(provider.n_requests, 1)
+        self.assertEqual(callbacks[0].cost.n_cache_misses, 1)
+        self.assertEqual(callbacks[0].cost.n_cache_hits, 1)
+
+        # Cache persists across providers using the same file.
+        other = self.provider(response_cache=ResponseCache(path=self.path))
+        other.generate_score(system_prompt="Rate this.")
+        self.assertEqual(other.n_requests, 0)
+
+        # But is keyed by model.
+        other.model_engine = "other"
+        other.generate_score(system_prompt="Rate this.")
+        self.assertEqual(other.n_requests, 1)
+
+    def test_not_cached(self):
+        provider = self.provider(
+            response_cache=ResponseCache(path=self.path)
+        )
+
+        # Nonzero temperature.
+        for _ in range(2):
+            provider.generate_score(system_prompt="Rate.", temperature=0.5)
+        self.assertEqual(provider.n_requests, 2)
+
+        # Temperature left to the default of the API, which providers do
+        # unless they declare otherwise.
+        for _ in range(2):
+            provider._chat_completion_in_pace(prompt="Rate.")
+        self.assertEqual(provider.n_requests, 4)
+
+        # Bypassed.
+        with bypass_response_cache():
+            for _ in range(2):
+                provider.generate_score(system_prompt="Rate.")
+        self.assertEqual(provider.n_requests, 6)
+        self.assertEqual(len(provider.response_cache), 0)
+
+        # No cache.
+        provider = self.provider()
+        for _ in range(2):
+            provider.generate_score(system_prompt="Rate.")
+        self.assertEqual(provider.n_requests, 2)
+
+    def test_provider_settings(self):
+        cache = ResponseCache(path=self.path)
+
+        def provider(**completion_args):
+            return SettingsProvider(
+                model_engine="fake",
+                endpoint=self.endpoint,
+                response_cache=cache,
+                completion_args=completion_args
+            )
+
+        # Provider-level temperature overrides the one of the request.
+        hot = provider(temperature=0.7)
+        for _ in range(2):
+            hot.generate_score(system_prompt="Rate.", temperature=0.0)
+        self.assertEqual(hot.n_requests, 2)
+
+        # Without a temperature, the API's default is assumed to be nonzero.
+        default = provider()
+        for _ in range(2):
+            default._chat_completion_in_pace(prompt="Rate.")
+        self.assertEqual(default.n_requests, 2)
+        self.assertEqual(len(cache), 0)
+
+        cold = provider(temperature=0.0, api_base="http://a")
+        for _ in range(2):
+            cold._chat_completion_in_pace(prompt="Rate.")
+        self.assertEqual(cold.n_requests, 1)
+
+        # Other provider-level settings are part of the key.
+        other = provider(temperature=0.0, api_base="http://b")
+        other._chat_completion_in_pace(prompt="Rate.")
+        self.assertEqual(other.n_requests, 1)
+
+    @optional_test
+    def test_litellm_settings(self):
+        from trulens_eval.feedback.provider.litellm import LiteLLM
+
+        cache = ResponseCache(path=self.path)
+        request = dict(messages=[{"role": "system", "content": "Rate."}])
+
+        provider = LiteLLM(
+            completion_kwargs=dict(temperature=0.7), response_cache=cache
+        )
+        self.assertIsNone(
+            provider._response_cache_key(dict(request, temperature=0.0))
+        )
+
+        provider = LiteLLM(response_cache=cache)
+        self.assertIsNone(provider._response_cache_key(request))
+        key = provider._response_cache_key(dict(request, temperature=0.0))
+        self.assertIsNotNone(key)
+
+        other = LiteLLM(
+            completion_kwargs=dict(api_base="http://localhost:4000"),
+            response_cache=cache
+        )
+        self.assertNotEqual(
+            other._response_cache_key(dict(request, temperature=0.0)), key
+        )
+
+    def test_eviction(self):
+        cache = ResponseCache(path=self.path, max_entries=2, evict_every=1)
+
+        for key in ["a", "b", "c"]:
+            cache.put(key, key)
+            # Use "a" so that "b" is the least recently used.
+            cache.get("a")
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), "a")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "c")
+
+
+if __name__ == '__main__':
+    main()
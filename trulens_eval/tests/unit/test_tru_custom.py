@@ -2,6 +2,7 @@
 Tests for TruCustomApp.
 """
 
+import asyncio
 from unittest import main
 
 from examples.expositional.end2end_apps.custom_app.custom_app import CustomApp
@@ -9,9 +10,39 @@ from tests.unit.test import JSONTestCase
 
 from trulens_eval import Tru
 from trulens_eval import TruCustomApp
+from trulens_eval.app import RecordSampling
+from trulens_eval.tru_custom_app import instrument
 from trulens_eval.tru_custom_app import TruCustomApp
 
 
+class FailingApp:
+
+    @instrument
+    def respond_to_query(self, input: str) -> str:
+        if input == "fail":
+            raise ValueError("failed")
+
+        return self.generate(input)
+
+    @instrument
+    def generate(self, input: str) -> str:
+        return f"answer to {input}"
+
+
+class AsyncFailingApp:
+
+    @instrument
+    async def respond_to_query(self, input: str) -> str:
+        if input == "fail":
+            raise ValueError("failed")
+
+        return await self.generate(input)
+
+    @instrument
+    async def generate(self, input: str) -> str:
+        return f"answer to {input}"
+
+
 class TestTruCustomApp(JSONTestCase):
 
     @staticmethod
@@ -89,6 +120,94 @@ class TestTruCustomApp(JSONTestCase):
 
         self.assertEqual(recording2[0].meta, "meta2")
 
+    def test_sampling(self):
+        app = FailingApp()
+        ta_recorder = TruCustomApp(
+            app, app_id="custom_app_sampled", record_sample_rate=0.0
+        )
+
+        with ta_recorder as recording:
+            for _ in range(3):
+                self.assertEqual(app.respond_to_query("q"), "answer to q")
+
+        self.assertEqual(len(recording.records), 0)
+
+        stats = ta_recorder.sampling_stats
+        self.assertEqual(stats.n_calls, 3)
+        self.assertEqual(stats.n_unsampled, 3)
+
+        # Errors are recorded even if not sampled, with only the root call.
+        with ta_recorder as recording:
+            with self.assertRaises(ValueError):
+                app.respond_to_query("fail")
+
+        self.assertEqual(len(recording.records), 1)
+        self.assertEqual(len(recording[0].calls), 1)
+        self.assertEqual(stats.n_outliers_recorded, 1)
+
+        # Explicitly requested records are always made.
+        _, record = ta_recorder.with_record(app.respond_to_query, "q")
+        self.assertEqual(len(record.calls), 2)
+        self.assertEqual(stats.n_recorded, 1)
+
+        # Per-path rates override the default.
+        ta_recorder.record_sampling = RecordSampling(
+            rate=0.0, path_rates={"app.respond_to_query": 1.0}
+        )
+        with ta_recorder as recording:
+            app.respond_to_query("q")
+
+        self.assertEqual(len(recording.records), 1)
+
+    def test_sampling_mixed(self):
+        app = FailingApp()
+        ta_recorder = TruCustomApp(
+            app, app_id="custom_app_sampled_mixed", record_sample_rate=0.0
+        )
+
+        # Errors of a root call sampled by only one of the recording contexts,
+        # here the one explicitly requested, are recorded by both.
+        with ta_recorder as recording:
+            with self.assertRaises(ValueError):
+                ta_recorder.with_record(app.respond_to_query, "fail")
+
+        self.assertEqual(len(recording.records), 1)
+        self.assertEqual(len(recording[0].calls), 1)
+
+        stats = ta_recorder.sampling_stats
+        self.assertEqual(stats.n_calls, 2)
+        self.assertEqual(stats.n_unsampled, 1)
+        self.assertEqual(stats.n_unsampled_errors, 1)
+        self.assertEqual(stats.n_outliers_recorded, 1)
+
+    def test_sampling_async(self):
+        app = AsyncFailingApp()
+        ta_recorder = TruCustomApp(
+            app, app_id="custom_app_sampled_async", record_sample_rate=0.0
+        )
+
+        with ta_recorder as recording:
+            self.assertEqual(
+                asyncio.run(app.respond_to_query("q")), "answer to q"
+            )
+
+        self.assertEqual(len(recording.records), 0)
+
+        # Errors raised while awaiting are recorded even if not sampled.
+        with ta_recorder as recording:
+            with self.assertRaises(ValueError):
+                asyncio.run(app.respond_to_query("fail"))
+
+        self.assertEqual(len(recording.records), 1)
+        self.assertEqual(len(recording[0].calls), 1)
+        self.assertEqual(recording[0].calls[0].error, "failed")
+
+        stats = ta_recorder.sampling_stats
+        self.assertEqual(stats.n_calls, 2)
+        self.assertEqual(stats.n_unsampled, 2)
+        self.assertEqual(stats.n_unsampled_errors, 1)
+        self.assertEqual(stats.n_outliers_recorded, 1)
+
 
 if __name__ == '__main__':
     main()
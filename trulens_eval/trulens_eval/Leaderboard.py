@@ -42,7 +42,12 @@ def leaderboard():
     st.write(
         "Average feedback values displayed in the range from 0 (worst) to 1 (best)."
     )
-    df, feedback_col_names = lms.get_records_and_feedback([])
+    df, feedback_col_names = lms.get_records_and_feedback(
+        [],
+        columns=[
+            "app_id", "app_json", "latency", "total_tokens", "total_cost"
+        ]
+    )
     feedback_defs = lms.get_feedback_defs()
     feedback_directions = {
         (
@@ -8,7 +8,9 @@ import inspect
 from inspect import BoundArguments
 from inspect import Signature
 import logging
+import os
 from pprint import PrettyPrinter
+import random
 import threading
 from threading import Lock
 from typing import (Any, Awaitable, Callable, ClassVar, Dict, Hashable,
@@ -20,14 +22,17 @@ import pydantic
 from trulens_eval import app as mod_app
 from trulens_eval import feedback as mod_feedback
 from trulens_eval import instruments as mod_instruments
+from trulens_eval.feedback.scheduler import FeedbackScheduler
 from trulens_eval.schema import app as mod_app_schema
 from trulens_eval.schema import base as mod_base_schema
 from trulens_eval.schema import feedback as mod_feedback_schema
 from trulens_eval.schema import record as mod_record_schema
+from trulens_eval.schema import types as mod_types_schema
 from trulens_eval.utils import pyschema
 from trulens_eval.utils.asynchro import CallableMaybeAwaitable
 from trulens_eval.utils.asynchro import desync
 from trulens_eval.utils.asynchro import sync
+from trulens_eval.utils.json import CaptureLimits
 from trulens_eval.utils.json import json_str_of_obj
 from trulens_eval.utils.json import jsonify
 from trulens_eval.utils.pyschema import Class
@@ -47,6 +52,7 @@ from trulens_eval.utils.serial import JSON
 from trulens_eval.utils.serial import JSON_BASES
 from trulens_eval.utils.serial import JSON_BASES_T
 from trulens_eval.utils.serial import Lens
+from trulens_eval.utils.serial import SerialModel
 
 logger = logging.getLogger(__name__)
 
@@ -315,6 +321,163 @@ def instrumented_component_views(
             yield q, ComponentView.of_json(json=o)
 
 
+class RecordSampling(SerialModel):
+    """Policy deciding which root calls of an app are recorded.
+
+    The decision is made when a root call (the first instrumented method in a
+    call stack) starts. Calls that are not sampled run without recording: their
+    arguments and results are not jsonized, their costs are not tracked and
+    nothing is written to the database. Only
+    [SamplingStats][trulens_eval.app.SamplingStats] are updated.
+
+    Unsampled calls that fail or are slow can still be recorded as records
+    containing only the root call.
+
+    Example:
+        ```python
+        # Record 1% of requests, all requests to `app.admin_query` and any
+        # request that fails or takes longer than 5 seconds.
+        truapp = TruChain(
+            app,
+            record_sampling=RecordSampling(
+                rate=0.01,
+                path_rates={"app.admin_query": 1.0},
+                always_record_slower_than=5.0
+            )
+        )
+        ```
+    """
+
+    rate: float = 1.0
+    """Fraction of root calls that are recorded."""
+
+    path_rates: Dict[str, float] = pydantic.Field(default_factory=dict)
+    """Sample rates for root calls of the methods at or under the given paths,
+    overriding `rate`.
+    
+    Keys are paths to methods or components in the app as in
+    `"app.retriever.get_relevant_documents"` or `"app.retriever"`. The longest
+    matching path applies.
+    """
+
+    always_record_errors: bool = True
+    """Record root calls that raise an error even if not sampled."""
+
+    always_record_slower_than: Optional[float] = None
+    """Record root calls that take longer than this many seconds even if not
+    sampled."""
+
+    _parsed_rates: Optional[List[Tuple[Lens, float]]] = pydantic.PrivateAttr(
+        None
+    )
+    """Parsed `path_rates`, longest path first."""
+
+    def _rates(self) -> List[Tuple[Lens, float]]:
+        if self._parsed_rates is None:
+            self._parsed_rates = sorted(
+                (
+                    (Lens.of_string(path), rate)
+                    for path, rate in self.path_rates.items()
+                ),
+                key=lambda path_rate: -len(path_rate[0])
+            )
+
+        return self._parsed_rates
+
+    def rate_of(self, method_path: Optional[Lens] = None) -> float:
+        """Sample rate of root calls to the method at the given path."""
+
+        if method_path is None or len(self.path_rates) == 0:
+            return self.rate
+
+        for path, rate in self._rates():
+            if path.is_prefix_of(method_path):
+                return rate
+
+        return self.rate
+
+    def sample(self, method_path: Optional[Lens] = None) -> bool:
+        """Decide whether to record a root call to the method at the given
+        path."""
+
+        rate = self.rate_of(method_path)
+
+        if rate >= 1.0:
+            return True
+
+        return random.random() < rate
+
+    def is_outlier(self, error: Any, perf: mod_base_schema.Perf) -> bool:
+        """Whether a root call that was not sampled should still be recorded."""
+
+        if error is not None and self.always_record_errors:
+            return True
+
+        if self.always_record_slower_than is not None:
+            return perf.latency.total_seconds() > self.always_record_slower_than
+
+        return False
+
+
+class SamplingStats():
+    """Aggregate counts of the root calls of an app, including those not
+    recorded due to its [RecordSampling][trulens_eval.app.RecordSampling]."""
+
+    def __init__(self):
+        self.lock: Lock = Lock()
+
+        self.n_calls: int = 0
+        """Number of root calls."""
+
+        self.n_recorded: int = 0
+        """Number of root calls sampled for recording."""
+
+        self.n_unsampled: int = 0
+        """Number of root calls not sampled."""
+
+        self.n_unsampled_errors: int = 0
+        """Number of root calls not sampled that raised an error."""
+
+        self.n_outliers_recorded: int = 0
+        """Number of root calls not sampled but recorded for failing or being
+        slow."""
+
+        self.unsampled_latency: float = 0.0
+        """Total latency in seconds of the root calls not sampled."""
+
+    def add(
+        self,
+        sampled: bool,
+        error: Any = None,
+        perf: Optional[mod_base_schema.Perf] = None,
+        outlier: bool = False
+    ) -> None:
+        """Count a root call."""
+
+        with self.lock:
+            self.n_calls += 1
+
+            if sampled:
+                self.n_recorded += 1
+                return
+
+            self.n_unsampled += 1
+            if error is not None:
+                self.n_unsampled_errors += 1
+            if perf is not None:
+                self.unsampled_latency += perf.latency.total_seconds()
+            if outlier:
+                self.n_outliers_recorded += 1
+
+    def __repr__(self):
+        return (
+            f"SamplingStats(n_calls={self.n_calls}, n_recorded={self.n_recorded}, "
+            f"n_unsampled={self.n_unsampled}, n_unsampled_errors={self.n_unsampled_errors}, "
+            f"n_outliers_recorded={self.n_outliers_recorded}, "
+            f"unsampled_latency={self.unsampled_latency:.3f}s)"
+        )
+
+
 class RecordingContext():
     """Manager of the creation of records from record calls.
     
@@ -365,6 +528,10 @@ class RecordingContext():
         self.record_metadata = record_metadata
         """Metadata to attach to all records produced in this context."""
 
+        self.always_record: bool = False
+        """Record every root call in this context regardless of the app's
+        [record_sampling][trulens_eval.app.App.record_sampling]."""
+
     def __iter__(self):
         return iter(self.records)
 
@@ -527,10 +694,76 @@ class App(mod_app_schema.AppDefinition, mod_instruments.WithInstrumentCallbacks,
     before it is produced.
     """
 
+    record_sampling: RecordSampling = pydantic.Field(
+        exclude=True, default_factory=RecordSampling
+    )
+    """Policy deciding which root calls are recorded.
+    
+    Root calls made through
+    [with_record][trulens_eval.app.App.with_record] are always recorded. Can be
+    specified with the `record_sample_rate` shorthand to the constructor for
+    uniform sampling.
+    """
+
+    sampling_stats: SamplingStats = pydantic.Field(
+        exclude=True, default_factory=SamplingStats
+    )
+    """Counts of root calls, recorded or not."""
+
+    max_pending_feedbacks: Optional[int] = pydantic.Field(None, exclude=True)
+    """Maximum number of feedback evaluations in flight in
+    [WITH_APP_THREAD][trulens_eval.schema.feedback.FeedbackMode.WITH_APP_THREAD]
+    mode.
+    
+    Unbounded if None. Otherwise the feedbacks of records produced while this
+    many are in flight are handled according to
+    [feedback_overflow][trulens_eval.app.App.feedback_overflow].
+    """
+
+    feedback_overflow: mod_feedback_schema.FeedbackOverflow = pydantic.Field(
+        mod_feedback_schema.FeedbackOverflow.BLOCK, exclude=True
+    )
+    """What to do with the feedbacks of records produced while
+    [max_pending_feedbacks][trulens_eval.app.App.max_pending_feedbacks] are in
+    flight.
+    
+    Note that deferred feedbacks are only evaluated if a deferred feedback
+    evaluator is running. See
+    [Tru.start_evaluator][trulens_eval.tru.Tru.start_evaluator].
+    """
+
+    feedback_scheduler: Optional[FeedbackScheduler] = pydantic.Field(
+        None, exclude=True
+    )
+    """Admission control for feedback evaluations if
+    [max_pending_feedbacks][trulens_eval.app.App.max_pending_feedbacks] is
+    given. Its `stats` include the number of evaluations in flight and the time
+    spent waiting for them."""
+
+    capture_limits: Optional[CaptureLimits] = pydantic.Field(
+        None, exclude=True
+    )
+    """Limits on how much of the arguments and results of instrumented methods
+    are captured in records.
+    
+    By default they are captured in full. Set limits to keep large retrieved
+    documents, embeddings or raw responses out of records:
+
+    ```python
+    truapp = TruChain(
+        app,
+        capture_limits=CaptureLimits(
+            max_str_len=2048, max_items=32, drop_arrays=True
+        )
+    )
+    ```
+    """
+
     def __init__(
         self,
         tru: Optional[Tru] = None,
         feedbacks: Optional[Iterable[mod_feedback.Feedback]] = None,
+        record_sample_rate: Optional[float] = None,
         **kwargs
     ):
         if feedbacks is not None:
@@ -538,6 +771,17 @@ class App(mod_app_schema.AppDefinition, mod_instruments.WithInstrumentCallbacks,
         else:
             feedbacks = []
 
+        if record_sample_rate is not None:
+            if 'record_sampling' in kwargs:
+                raise ValueError(
+                    "Only one of `record_sample_rate` and `record_sampling` can be given."
+                )
+            if not 0.0 <= record_sample_rate <= 1.0:
+                raise ValueError(
+                    f"`record_sample_rate` must be between 0 and 1 but got {record_sample_rate}."
+                )
+            kwargs['record_sampling'] = RecordSampling(rate=record_sample_rate)
+
         # for us:
         kwargs['tru'] = tru
         kwargs['feedbacks'] = feedbacks
@@ -558,6 +802,12 @@ class App(mod_app_schema.AppDefinition, mod_instruments.WithInstrumentCallbacks,
             pass
 
         if self.feedback_mode == mod_feedback_schema.FeedbackMode.WITH_APP_THREAD:
+            if self.max_pending_feedbacks is not None:
+                self.feedback_scheduler = FeedbackScheduler(
+                    max_in_flight=self.max_pending_feedbacks,
+                    overflow=self.feedback_overflow
+                )
+
             self._start_manage_pending_feedback_results()
 
         self._tru_post_init()
@@ -1043,6 +1293,114 @@ class App(mod_app_schema.AppDefinition, mod_instruments.WithInstrumentCallbacks,
             yield ctx
             ctx = ctx.token.old_value
 
+    # WithInstrumentCallbacks requirement
+    def capture_value(self, value: Any) -> JSON:
+        """Called to jsonify arguments and results of instrumented methods
+        subject to [capture_limits][trulens_eval.app.App.capture_limits].
+
+        See
+        [WithInstrumentCallbacks.capture_value][trulens_eval.instruments.WithInstrumentCallbacks.capture_value].
+        """
+
+        return jsonify(value, limits=self.capture_limits)
+
+    # WithInstrumentCallbacks requirement
+    def sample_record(
+        self, ctx: RecordingContext, func: Callable, path: Lens
+    ) -> bool:
+        """Called at the start of root calls to decide whether to record them.
+
+        See
+        [WithInstrumentCallbacks.sample_record][trulens_eval.instruments.WithInstrumentCallbacks.sample_record].
+        """
+
+        if ctx.always_record:
+            sampled = True
+
+        else:
+            method_path = None
+            if len(self.record_sampling.path_rates) > 0:
+                method_path = path[getattr(func, "__name__", "__call__")]
+
+            sampled = self.record_sampling.sample(method_path)
+
+        if sampled:
+            self.sampling_stats.add(sampled=True)
+
+        return sampled
+
+    # WithInstrumentCallbacks requirement
+    def on_unsampled_record(
+        self,
+        ctx: RecordingContext,
+        func: Callable,
+        sig: Signature,
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+        frame: Callable[[], mod_record_schema.RecordAppCallMethod],
+        ret: Any,
+        error: Any,
+        perf: Perf
+    ) -> None:
+        """Called at the end of root calls that were not sampled.
+
+        Updates [sampling_stats][trulens_eval.app.App.sampling_stats] and
+        records the call if it is an outlier according to
+        [record_sampling][trulens_eval.app.App.record_sampling].
+
+        See
+        [WithInstrumentCallbacks.on_unsampled_record][trulens_eval.instruments.WithInstrumentCallbacks.on_unsampled_record].
+        """
+
+        outlier = self.record_sampling.is_outlier(error=error, perf=perf)
+
+        self.sampling_stats.add(
+            sampled=False, error=error, perf=perf, outlier=outlier
+        )
+
+        if not outlier:
+            return
+
+        try:
+            bindings = sig.bind(*args, **kwargs)
+        except TypeError as e:
+            logger.warning("Cannot bind arguments of %s: %s", func, e)
+            return
+
+        ctx.add_call(
+            mod_record_schema.RecordAppCall(
+                stack=[frame()],
+                args={
+                    k: self.capture_value(v)
+                    for k, v in bindings.arguments.items()
+                    if k != "self"
+                },
+                rets=self.capture_value(ret) if error is None else None,
+                error=str(error) if error is not None else None,
+                perf=perf,
+                pid=os.getpid(),
+                tid=threading.get_native_id()
+            )
+        )
+
+        try:
+            self.on_add_record(
+                ctx=ctx,
+                func=func,
+                sig=sig,
+                bindings=bindings,
+                ret=ret,
+                error=error,
+                perf=perf,
+                cost=mod_base_schema.Cost()
+            )
+
+        except BaseException as e:
+            # on_add_record re-raises the error of the call which the
+            # instrumented method raises itself.
+            if e is not error:
+                raise e
+
     # WithInstrumentCallbacks requirement
     def on_add_record(
         self,
@@ -1171,7 +1529,10 @@ you use the `%s` wrapper to make sure `%s` does get instrumented. `%s` method
         or the `App` as a context mananger instead.
         """
 
-        awaitable, _ = self.with_record(func, *args, **kwargs)
+        self._check_instrumented(func)
+
+        with self:
+            awaitable = func(*args, **kwargs)
 
         if not isinstance(awaitable, Awaitable):
             raise TypeError(
@@ -1189,7 +1550,10 @@ you use the `%s` wrapper to make sure `%s` does get instrumented. `%s` method
         or the `App` as a context mananger instead.
         """
 
-        res, _ = self.with_record(func, *args, **kwargs)
+        self._check_instrumented(func)
+
+        with self:
+            res = func(*args, **kwargs)
 
         return res
 
@@ -1203,12 +1567,16 @@ you use the `%s` wrapper to make sure `%s` does get instrumented. `%s` method
         """
         Call the given `func` with the given `*args` and `**kwargs`, producing
         its results as well as a record of the execution.
+
+        The execution is recorded regardless of
+        [record_sampling][trulens_eval.app.App.record_sampling].
         """
 
         self._check_instrumented(func)
 
         with self as ctx:
             ctx.record_metadata = record_metadata
+            ctx.always_record = True
             ret = func(*args, **kwargs)
 
         assert len(ctx.records) > 0, (
@@ -1324,17 +1692,17 @@ you use the `%s` wrapper to make sure `%s` does get instrumented. `%s` method
 
         # Add empty (to run) feedback to db.
         if feedback_mode == mod_feedback_schema.FeedbackMode.DEFERRED:
-            for f in self.feedbacks:
-                self.db.insert_feedback(
-                    mod_feedback_schema.FeedbackResult(
-                        name=f.name,
-                        record_id=record_id,
-                        feedback_definition_id=f.feedback_definition_id
-                    )
-                )
+            self._defer_feedbacks(record_id=record_id)
 
             return None
 
+        elif feedback_mode == mod_feedback_schema.FeedbackMode.WITH_APP_THREAD \
+                and self.feedback_scheduler is not None:
+
+            return self._submit_scheduled_feedbacks(
+                record=record, record_id=record_id
+            )
+
         elif feedback_mode in [mod_feedback_schema.FeedbackMode.WITH_APP,
                                mod_feedback_schema.FeedbackMode.WITH_APP_THREAD]:
 
@@ -1345,6 +1713,52 @@ you use the `%s` wrapper to make sure `%s` does get instrumented. `%s` method
                 on_done=self._add_future_feedback
             )
 
+    def _defer_feedbacks(self, record_id: mod_types_schema.RecordID) -> None:
+        """Add empty feedback results for the given record to the database to
+        be evaluated by the deferred feedback evaluator."""
+
+        for f in self.feedbacks:
+            self.db.insert_feedback(
+                mod_feedback_schema.FeedbackResult(
+                    name=f.name,
+                    record_id=record_id,
+                    feedback_definition_id=f.feedback_definition_id
+                )
+            )
+
+    def _submit_scheduled_feedbacks(
+        self, record: mod_record_schema.Record,
+        record_id: mod_types_schema.RecordID
+    ) -> Optional[List[Tuple[mod_feedback.Feedback, Future[mod_feedback_schema.FeedbackResult]]]]:
+        """Submit the feedbacks of the given record if admitted by the
+        [feedback_scheduler][trulens_eval.app.App.feedback_scheduler] or
+        handle them according to its overflow policy otherwise."""
+
+        scheduler = self.feedback_scheduler
+
+        if not scheduler.admit(len(self.feedbacks)):
+            if scheduler.overflow == mod_feedback_schema.FeedbackOverflow.DEFER:
+                self._defer_feedbacks(record_id=record_id)
+
+            return None
+
+        try:
+            feedbacks_and_futures = self.tru._submit_feedback_functions(
+                record=record,
+                feedback_functions=self.feedbacks,
+                app=self,
+                on_done=self._add_future_feedback
+            )
+
+        except BaseException as e:
+            scheduler.release(len(self.feedbacks))
+            raise e
+
+        for _, fut in feedbacks_and_futures:
+            fut.add_done_callback(lambda _: scheduler.release())
+
+        return feedbacks_and_futures
+
     def _handle_error(self, record: mod_record_schema.Record, error: Exception):
         if self.db is None:
             return
@@ -1,10 +1,14 @@
 import abc
 from datetime import datetime
+from enum import Enum
 import logging
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import threading
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple, Union)
 
 from merkle_json import MerkleJson
 import pandas as pd
+from pydantic import PrivateAttr
 
 from trulens_eval import __version__
 from trulens_eval import app as mod_app
@@ -13,7 +17,9 @@ from trulens_eval.schema import app as mod_app_schema
 from trulens_eval.schema import feedback as mod_feedback_schema
 from trulens_eval.schema import record as mod_record_schema
 from trulens_eval.schema import types as mod_types_schema
+from trulens_eval.utils import imports as mod_imports_utils
 from trulens_eval.utils.json import json_str_of_obj
+from trulens_eval.utils.json import LazyJSON
 from trulens_eval.utils.serial import JSON
 from trulens_eval.utils.serial import JSONized
 from trulens_eval.utils.serial import SerialModel
@@ -40,6 +46,40 @@ The sqlalchemy url for this default local sqlite database is `sqlite:///default.
 DEFAULT_DATABASE_REDACT_KEYS: bool = False
 """Default value for option to redact secrets before writing out data to database."""
 
+DEFAULT_ITER_BATCH_SIZE: int = 1000
+"""Default number of rows per chunk produced by `iter_records` and
+`iter_feedback`."""
+
+
+def frame_to_record_batch(df: pd.DataFrame) -> 'pyarrow.RecordBatch':
+    """Convert a dataframe produced by a [DB][trulens_eval.database.base.DB]
+    into an Arrow record batch.
+
+    Values that are not scalars (lists, dicts, models,
+    [LazyJSON][trulens_eval.utils.json.LazyJSON]) are written as JSON text as
+    their structure varies from row to row. Enums are written as their values.
+    """
+
+    with mod_imports_utils.OptionalImports(
+            messages=mod_imports_utils.REQUIREMENT_PYARROW):
+        import pyarrow
+
+    def _scalar(val):
+        if val is None or isinstance(val, (str, int, float, bool)):
+            return val
+        if isinstance(val, LazyJSON):
+            return val.raw
+        if isinstance(val, Enum):
+            return val.value
+        return json_str_of_obj(val)
+
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].map(_scalar)
+
+    return pyarrow.RecordBatch.from_pandas(df, preserve_index=False)
+
 
 class DB(SerialModel, abc.ABC):
     """Abstract definition of databases used by trulens_eval.
@@ -57,6 +97,12 @@ class DB(SerialModel, abc.ABC):
     May be useful in some databases where trulens is not the only app.
     """
 
+    _feedback_added: threading.Event = PrivateAttr(
+        default_factory=threading.Event
+    )
+    """Set once feedback results that need evaluation were inserted through
+    this instance. Implementations set it after the insertion is committed."""
+
     def _json_str_of_obj(self, obj: Any) -> str:
         return json_str_of_obj(obj, redact_keys=self.redact_keys)
 
@@ -88,6 +134,38 @@ class DB(SerialModel, abc.ABC):
         """
         raise NotImplementedError()
 
+    def wait_for_feedback(self, timeout: float) -> bool:
+        """Block until feedback results that need evaluation may have been
+        added or `timeout` seconds have passed.
+
+        Lets deferred evaluators pick up new feedback results as soon as they
+        are added instead of polling for them. This default implementation is
+        only woken up by feedback results inserted through this instance, i.e.
+        when the app and the evaluator share a [Tru][trulens_eval.tru.Tru].
+        Implementations may also notice insertions from other processes.
+
+        Returns:
+            Whether feedback results may have been added since the last call.
+                May be spuriously `True`.
+        """
+
+        if self._feedback_added.wait(timeout):
+            self._feedback_added.clear()
+            return True
+
+        return False
+
+    def flush(self) -> None:
+        """Block until all writes queued so far have been written out.
+
+        Databases that write synchronously need not override this. Ones that
+        defer writes to a background writer must make all previously inserted
+        records, feedback definitions, and feedback results visible to
+        subsequent reads once this returns.
+        """
+
+        pass
+
     @abc.abstractmethod
     def insert_record(
         self,
@@ -210,6 +288,13 @@ class DB(SerialModel, abc.ABC):
             limit: limit the number of rows returned.
 
             shuffle: shuffle the rows before returning them.
+
+        Returns:
+            A dataframe with a row per matching feedback result. The
+                `record_json`, `app_json`, `feedback_json`, `perf_json` and
+                `calls_json` columns may hold
+                [LazyJSON][trulens_eval.utils.json.LazyJSON] values which are
+                only decoded when accessed.
         """
 
         raise NotImplementedError()
@@ -240,6 +325,63 @@ class DB(SerialModel, abc.ABC):
 
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def claim_feedback(
+        self,
+        limit: Optional[int],
+        lease_seconds: float,
+        retry_failed_seconds: float,
+        shuffle: bool = False
+    ) -> pd.DataFrame:
+        """Lease up to `limit` feedback results that need evaluation.
+
+        A feedback result can be claimed if its status is
+        [NONE][trulens_eval.schema.feedback.FeedbackResultStatus.NONE], if it is
+        [RUNNING][trulens_eval.schema.feedback.FeedbackResultStatus.RUNNING] but
+        its lease was not renewed for `lease_seconds`, or if it
+        [FAILED][trulens_eval.schema.feedback.FeedbackResultStatus.FAILED] more
+        than `retry_failed_seconds` ago. Claiming sets its status to `RUNNING`
+        and `last_ts` to now. Claims are atomic: concurrent callers, in any
+        process or host, never claim the same feedback result.
+
+        Args:
+            limit: Maximum number of feedback results to claim. All claimable
+                ones are claimed if not given.
+
+            lease_seconds: Time after which the lease of a running feedback
+                result expires unless renewed by
+                [renew_feedback_leases][trulens_eval.database.base.DB.renew_feedback_leases].
+
+            retry_failed_seconds: Time after which a failed feedback result is
+                retried.
+
+            shuffle: Claim feedback results in random order instead of
+                database order.
+
+        Returns:
+            The claimed feedback results in the format of
+                [get_feedback][trulens_eval.database.base.DB.get_feedback]
+                except that `status` and `last_ts` are what they were before
+                the claim.
+        """
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def renew_feedback_leases(
+        self, feedback_result_ids: Sequence[mod_types_schema.FeedbackResultID]
+    ) -> int:
+        """Renew the leases of the given claimed feedback results by setting
+        their `last_ts` to now.
+
+        Only feedback results still `RUNNING` are renewed.
+
+        Returns:
+            The number of renewed leases.
+        """
+
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def get_app(self, app_id: mod_types_schema.AppID) -> Optional[JSONized[mod_app.App]]:
         """Get the app with the given id from the database.
@@ -261,13 +403,32 @@ class DB(SerialModel, abc.ABC):
     @abc.abstractmethod
     def get_records_and_feedback(
         self,
-        app_ids: Optional[List[mod_types_schema.AppID]] = None
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None
     ) -> Tuple[pd.DataFrame, Sequence[str]]:
         """Get records fom the database.
         
         Args:
             app_ids: If given, retrieve only the records for the given apps.
                 Otherwise all apps are retrieved.
+
+            since: If given, retrieve only records with `ts` at or after this
+                time.
+
+            until: If given, retrieve only records with `ts` before this time.
+
+            offset: Index of the first record to return in the order of `ts`.
+
+            limit: Limit the number of records returned.
+
+            columns: If given, include only these app and record columns along
+                with the feedback result columns. Feedback calls columns are
+                also left out. Skipping large columns like `record_json` saves
+                on both transfer and memory.
         
         Returns:
             A dataframe with the records.
@@ -275,3 +436,94 @@ class DB(SerialModel, abc.ABC):
             A list of column names that contain feedback results.
         """
         raise NotImplementedError()
+
+    def iter_records(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = DEFAULT_ITER_BATCH_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        as_arrow: bool = False
+    ) -> Iterator[Union[pd.DataFrame, 'pyarrow.RecordBatch']]:
+        """Iterate over records and their feedback results in chunks of at
+        most `batch_size` records ordered by `ts`.
+
+        Each chunk has the content of
+        [get_records_and_feedback][trulens_eval.database.base.DB.get_records_and_feedback]
+        for its records. Note that feedback columns are only present in chunks
+        that have results for them.
+
+        This default implementation pages with `offset` and `limit`.
+        Implementations should override it with something that does not
+        degrade with the offset.
+
+        Args:
+            app_ids: If given, retrieve only the records for the given apps.
+
+            since: If given, retrieve only records with `ts` at or after this
+                time.
+
+            until: If given, retrieve only records with `ts` before this time.
+
+            batch_size: Maximum number of records per chunk.
+
+            columns: Column projection. See
+                [get_records_and_feedback][trulens_eval.database.base.DB.get_records_and_feedback].
+
+            as_arrow: Produce [pyarrow.RecordBatch][] chunks instead of
+                dataframes. Requires `pyarrow`.
+        """
+
+        offset = 0
+        while True:
+            df, _ = self.get_records_and_feedback(
+                app_ids=app_ids,
+                since=since,
+                until=until,
+                offset=offset,
+                limit=batch_size,
+                columns=columns
+            )
+            if len(df) == 0:
+                return
+
+            yield frame_to_record_batch(df) if as_arrow else df
+
+            offset += len(df)
+
+    def iter_feedback(
+        self,
+        record_id: Optional[mod_types_schema.RecordID] = None,
+        feedback_definition_id: Optional[mod_types_schema.FeedbackDefinitionID] = None,
+        status: Optional[Union[mod_feedback_schema.FeedbackResultStatus,
+                               Sequence[mod_feedback_schema.FeedbackResultStatus]]] = None,
+        last_ts_before: Optional[datetime] = None,
+        batch_size: int = DEFAULT_ITER_BATCH_SIZE,
+        as_arrow: bool = False
+    ) -> Iterator[Union[pd.DataFrame, 'pyarrow.RecordBatch']]:
+        """Iterate over feedback results in chunks of at most `batch_size`
+        rows.
+
+        See [get_feedback][trulens_eval.database.base.DB.get_feedback] for the
+        filters and the content of the chunks and
+        [iter_records][trulens_eval.database.base.DB.iter_records] for
+        `batch_size` and `as_arrow`.
+        """
+
+        offset = 0
+        while True:
+            df = self.get_feedback(
+                record_id=record_id,
+                feedback_definition_id=feedback_definition_id,
+                status=status,
+                last_ts_before=last_ts_before,
+                offset=offset,
+                limit=batch_size
+            )
+            if len(df) == 0:
+                return
+
+            yield frame_to_record_batch(df) if as_arrow else df
+
+            offset += len(df)
@@ -68,7 +68,10 @@ def upgrade(config) -> None:
 
 
 def downgrade(config) -> None:
-    prefix = config.get_main_option("trulens.prefix")
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
 
     # ### commands auto generated by Alembic - please adjust! ###
     op.drop_table(prefix + 'records')
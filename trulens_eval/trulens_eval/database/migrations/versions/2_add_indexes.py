@@ -0,0 +1,67 @@
+"""Add secondary indexes for frequently filtered columns.
+
+Revision ID: 2
+Revises: 1
+Create Date: 2026-10-18 10:12:05.117311
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '2'
+down_revision = '1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    # Deferred evaluator polling: status filter, retry cutoffs on last_ts.
+    op.create_index(
+        f"ix_{prefix}feedbacks_status_last_ts",
+        prefix + 'feedbacks', ['status', 'last_ts'],
+        unique=False
+    )
+    # Feedback results of a record.
+    op.create_index(
+        f"ix_{prefix}feedbacks_record_id",
+        prefix + 'feedbacks', ['record_id'],
+        unique=False
+    )
+    # Feedback results of a feedback definition.
+    op.create_index(
+        f"ix_{prefix}feedbacks_feedback_definition_id",
+        prefix + 'feedbacks', ['feedback_definition_id'],
+        unique=False
+    )
+    # Records of an app in time order.
+    op.create_index(
+        f"ix_{prefix}records_app_id_ts",
+        prefix + 'records', ['app_id', 'ts'],
+        unique=False
+    )
+
+
+def downgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    op.drop_index(
+        f"ix_{prefix}records_app_id_ts", table_name=prefix + 'records'
+    )
+    op.drop_index(
+        f"ix_{prefix}feedbacks_feedback_definition_id",
+        table_name=prefix + 'feedbacks'
+    )
+    op.drop_index(
+        f"ix_{prefix}feedbacks_record_id", table_name=prefix + 'feedbacks'
+    )
+    op.drop_index(
+        f"ix_{prefix}feedbacks_status_last_ts", table_name=prefix + 'feedbacks'
+    )
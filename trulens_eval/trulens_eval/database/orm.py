@@ -9,6 +9,7 @@ from sqlalchemy import Column
 from sqlalchemy import Engine
 from sqlalchemy import event
 from sqlalchemy import Float
+from sqlalchemy import Index
 from sqlalchemy import Text
 from sqlalchemy import VARCHAR
 from sqlalchemy.ext.declarative import declared_attr
@@ -216,6 +217,15 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
             cost_json = Column(TYPE_JSON, nullable=False)
             perf_json = Column(TYPE_JSON, nullable=False)
 
+            @declared_attr.directive
+            def __table_args__(cls):
+                # Keep in sync with migration revision 2.
+                return (
+                    Index(
+                        f"ix_{cls.__tablename__}_app_id_ts", "app_id", "ts"
+                    ),
+                )
+
             app = relationship(
                'AppDefinition',
                 backref=backref('records', cascade="all,delete"),
@@ -277,6 +287,21 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
             cost_json = Column(TYPE_JSON, nullable=False)
             multi_result = Column(TYPE_JSON)
 
+            @declared_attr.directive
+            def __table_args__(cls):
+                # Keep in sync with migration revision 2.
+                return (
+                    Index(
+                        f"ix_{cls.__tablename__}_status_last_ts", "status",
+                        "last_ts"
+                    ),
+                    Index(f"ix_{cls.__tablename__}_record_id", "record_id"),
+                    Index(
+                        f"ix_{cls.__tablename__}_feedback_definition_id",
+                        "feedback_definition_id"
+                    ),
+                )
+
             record = relationship(
                 'Record',
                 backref=backref('feedback_results', cascade="all,delete"),
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import atexit
 from datetime import datetime
 import json
 import logging
-from sqlite3 import OperationalError
-from typing import (Any, ClassVar, Dict, Iterable, List, Optional, Sequence,
-                    Tuple, Type, Union)
+import queue
+import threading
+import time
+from typing import (Any, ClassVar, Dict, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple, Type, Union)
 import warnings
 
 import numpy as np
 import pandas as pd
 from pydantic import Field
+from pydantic import PrivateAttr
+from sqlalchemy import and_
 from sqlalchemy import create_engine
 from sqlalchemy import Engine
+from sqlalchemy import event
 from sqlalchemy import func
+from sqlalchemy import or_
 from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text as sql_text
 
@@ -38,8 +47,10 @@ from trulens_eval.schema import feedback as mod_feedback_schema
 from trulens_eval.schema import record as mod_record_schema
 from trulens_eval.schema import types as mod_types_schema
 from trulens_eval.utils import text
+from trulens_eval.utils.json import LazyJSON
 from trulens_eval.utils.pyschema import Class
 from trulens_eval.utils.python import locals_except
+from trulens_eval.utils.python import Queue
 from trulens_eval.utils.serial import JSON
 from trulens_eval.utils.serial import JSONized
 from trulens_eval.utils.text import UNICODE_CHECK
@@ -49,11 +60,33 @@ from trulens_eval.utils.text import UNICODE_STOP
 
 logger = logging.getLogger(__name__)
 
+_STOP_WRITER = object()
+"""Placed on the write queue to stop the background writer after it has
+written everything queued before it."""
+
 
 class SQLAlchemyDB(DB):
     """Database implemented using sqlalchemy.
     
     See abstract class [DB][trulens_eval.database.base.DB] for method reference.
+
+    Background writes:
+        If `background_writes` is set, records, feedback definitions and
+        feedback results are not written by the inserting thread. They are
+        instead placed on a bounded queue and written by a background thread in
+        batches of up to
+        [write_batch_size][trulens_eval.database.sqlalchemy.SQLAlchemyDB.write_batch_size]
+        rows, each batch as a single upsert transaction. A batch is written as
+        soon as it is full or
+        [write_flush_interval][trulens_eval.database.sqlalchemy.SQLAlchemyDB.write_flush_interval]
+        seconds after its first row was queued, whichever comes first. Inserts
+        block when the queue is full. All read methods first
+        [flush][trulens_eval.database.sqlalchemy.SQLAlchemyDB.flush] the queue
+        so that they observe earlier inserts. The queue is also drained at
+        interpreter exit.
+
+        Can be enabled from [Tru][trulens_eval.tru.Tru] via
+        `database_args=dict(background_writes=True)`.
     """
 
     table_prefix: str = mod_db.DEFAULT_DATABASE_PREFIX
@@ -84,6 +117,57 @@ class SQLAlchemyDB(DB):
     [ORM][trulens_eval.database.orm.ORM] upon initialization.
     """
 
+    background_writes: bool = False
+    """Write records, feedback definitions and feedback results in batches from
+    a background thread instead of in the inserting thread."""
+
+    write_batch_size: int = 256
+    """Maximum number of rows written in one background write transaction."""
+
+    write_flush_interval: float = 0.5
+    """Maximum time (in seconds) a queued row waits before its batch is written
+    by the background writer."""
+
+    write_queue_size: int = 8192
+    """Maximum number of rows waiting to be written by the background writer.
+
+    Inserts block once this many rows are queued until the writer catches up.
+    """
+
+    CLAIM_CANDIDATES_FACTOR: ClassVar[int] = 4
+    """Number of candidates read per feedback result to claim in
+    [claim_feedback][trulens_eval.database.sqlalchemy.SQLAlchemyDB.claim_feedback].
+
+    Candidates may be claimed by concurrent evaluators in the meantime.
+    """
+
+    NOTIFY_POLL_INTERVAL: ClassVar[float] = 0.25
+    """How often (in seconds)
+    [wait_for_feedback][trulens_eval.database.sqlalchemy.SQLAlchemyDB.wait_for_feedback]
+    checks for insertions by other processes."""
+
+    _notify_conn: Optional[Any] = None
+    """Connection dedicated to noticing insertions by other processes. Opened
+    on first use of `wait_for_feedback`."""
+
+    _data_version: Optional[int] = None
+    """Last seen sqlite `data_version` of `_notify_conn`, including after
+    commits made through this instance."""
+
+    _other_committed: bool = False
+    """Whether another connection committed to the sqlite database since
+    `_data_version` was last seen, noticed before a commit of this instance."""
+
+    _notify_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    """Lock for `_notify_conn` and the sqlite data version, used by the
+    waiting thread and by threads committing through this instance."""
+
+    _write_queue: Optional[Queue] = None
+    """Queue of ORM objects and flush/stop markers for the background writer."""
+
+    _writer_thread: Optional[threading.Thread] = None
+    """Background writer thread if `background_writes` is enabled."""
+
     def __init__(
         self,
         redact_keys: bool = mod_db.DEFAULT_DATABASE_REDACT_KEYS,
@@ -105,10 +189,358 @@ class SQLAlchemyDB(DB):
                 )
             )
 
+            if self.background_writes:
+                # Each thread gets its own in-memory database so the writer
+                # thread would write to a database nobody else can read.
+                logger.warning(
+                    "Background writes are not supported for in-memory SQLite. "
+                    "Writing synchronously instead."
+                )
+                self.background_writes = False
+
+        if self.background_writes:
+            self._start_writer()
+
     def _reload_engine(self):
         self.engine = create_engine(**self.engine_params)
         self.session = sessionmaker(self.engine, **self.session_params)
 
+        # Commits made through this instance, i.e. the claims, lease renewals
+        # and results of its evaluator, are not changes of other connections.
+        event.listen(self.session, "before_commit", self._before_own_commit)
+        event.listen(self.session, "after_commit", self._after_own_commit)
+
+    def _start_writer(self):
+        self._write_queue = Queue(maxsize=self.write_queue_size)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name=f"{self.table_prefix}db_writer",
+            daemon=True
+        )
+        self._writer_thread.start()
+
+        atexit.register(self._stop_writer)
+
+    def _stop_writer(self):
+        """Write out everything queued and stop the background writer."""
+
+        if self._writer_thread is None:
+            return
+
+        if self._writer_thread.is_alive():
+            self._write_queue.put(_STOP_WRITER)
+            self._writer_thread.join()
+
+        self._writer_thread = None
+
+    def _writer_loop(self):
+        """Main loop of the background writer thread.
+
+        Collects queued ORM objects into batches and writes each batch in one
+        transaction. Flush markers ([threading.Event][]) are set once
+        everything queued before them has been written.
+        """
+
+        q = self._write_queue
+
+        while True:
+            batch = []
+            flushed: List[threading.Event] = []
+            stop = False
+
+            item = q.get()
+            taken = 1
+            deadline = time.monotonic() + self.write_flush_interval
+
+            while True:
+                if item is _STOP_WRITER:
+                    stop = True
+                    break
+
+                if isinstance(item, threading.Event):
+                    flushed.append(item)
+                    break
+
+                batch.append(item)
+                if len(batch) >= self.write_batch_size:
+                    break
+
+                try:
+                    item = q.get(timeout=max(0.0, deadline - time.monotonic()))
+                    taken += 1
+                except queue.Empty:
+                    break
+
+            if len(batch) > 0:
+                self._write_batch(batch)
+
+            for event in flushed:
+                event.set()
+
+            for _ in range(taken):
+                q.task_done()
+
+            if stop:
+                return
+
+    def _enqueue_write(self, _obj: mod_orm.T) -> None:
+        """Queue the given ORM object for writing or write it right away if
+        there is no background writer."""
+
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            # Blocks if the queue is full which slows down producers to the
+            # rate the writer can sustain.
+            self._write_queue.put(_obj)
+        else:
+            self._write_batch([_obj])
+
+    def _write_batch(self, batch: Sequence[mod_orm.T]) -> None:
+        """Upsert the given ORM objects in one transaction.
+
+        Only the last object for each primary key is written. If the batch
+        fails as a whole, its objects are retried one per transaction so that a
+        single bad row does not lose the rest.
+        """
+
+        # Write feedback definitions and records before the feedback results
+        # that refer to them.
+        by_class: Dict[type, Dict[Any, mod_orm.T]] = {
+            self.orm.FeedbackDefinition: {},
+            self.orm.Record: {},
+            self.orm.FeedbackResult: {}
+        }
+        for _obj in batch:
+            table = _obj.__table__
+            key = tuple(getattr(_obj, c.key) for c in table.primary_key.columns)
+            by_class[type(_obj)][key] = _obj
+
+        pending = self._needs_evaluation(
+            by_class[self.orm.FeedbackResult].values()
+        )
+
+        try:
+            with self.session.begin() as session:
+                for orm_class, objs in by_class.items():
+                    if len(objs) > 0:
+                        self._upsert(session, orm_class, list(objs.values()))
+
+                if pending:
+                    self._notify_feedback_added(session)
+
+            logger.info("%s wrote batch of %d rows", UNICODE_CHECK, len(batch))
+
+        except Exception as e:
+            logger.warning(
+                "Batch write of %d rows failed, retrying rows one by one: %s",
+                len(batch), e
+            )
+
+            for objs in by_class.values():
+                for _obj in objs.values():
+                    try:
+                        with self.session.begin() as session:
+                            session.merge(_obj)
+                    except Exception as e:
+                        logger.error(
+                            "%s failed to write %s: %s", UNICODE_STOP,
+                            type(_obj).__name__, e
+                        )
+
+        if pending:
+            self._feedback_added.set()
+
+    def _needs_evaluation(self, objs: Iterable[mod_orm.T]) -> bool:
+        """Whether any of the given feedback result ORM objects is waiting for
+        a deferred evaluator."""
+
+        return any(
+            _obj.status == mod_feedback_schema.FeedbackResultStatus.NONE.value
+            for _obj in objs
+        )
+
+    def _notify_feedback_added(self, session) -> None:
+        """Notify evaluators in other processes that feedback results to
+        evaluate are being inserted in the transaction of `session`.
+
+        Only postgres notifications are sent. They are delivered when the
+        transaction commits. Other evaluators in this process are woken by
+        `_feedback_added` instead.
+        """
+
+        if self.engine.dialect.name == "postgresql":
+            session.execute(
+                select(func.pg_notify(self._notify_channel, ""))
+            )
+
+    @property
+    def _notify_channel(self) -> str:
+        """Postgres notification channel for feedback results to evaluate."""
+
+        return f"{self.table_prefix}feedbacks"
+
+    def wait_for_feedback(self, timeout: float) -> bool:
+        """See [DB.wait_for_feedback][trulens_eval.database.base.DB.wait_for_feedback].
+
+        Also notices feedback results inserted by other processes or hosts. On
+        postgres (with the `psycopg2` driver) the evaluator listens to
+        notifications sent by each insertion. On sqlite files it watches the
+        `data_version` of the database which changes whenever another
+        connection commits. Other databases are only woken up by insertions in
+        this process.
+
+        Should only be called from one thread.
+        """
+
+        deadline = time.monotonic() + timeout
+
+        while True:
+            # Check other connections first so that their notification of an
+            # insertion made in this process is consumed along with it.
+            notified = self._poll_notifications()
+
+            if self._feedback_added.is_set():
+                self._feedback_added.clear()
+                notified = True
+
+            if notified:
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            self._feedback_added.wait(min(remaining, self.NOTIFY_POLL_INTERVAL))
+
+    def _poll_notifications(self) -> bool:
+        """Check without blocking whether another connection notified of or
+        may have inserted feedback results to evaluate."""
+
+        dialect = self.engine.dialect
+
+        if self._notify_conn is None:
+            if dialect.name == "sqlite" and not is_memory_sqlite(self.engine):
+                with self._notify_lock:
+                    self._notify_conn = self.engine.raw_connection()
+                    self._data_version = self._sqlite_data_version()
+
+            elif dialect.name == "postgresql" and dialect.driver == "psycopg2":
+                self._notify_conn = self.engine.raw_connection()
+                conn = self._notify_conn.driver_connection
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self._notify_channel}"')
+
+            else:
+                return False
+
+        if dialect.name == "sqlite":
+            with self._notify_lock:
+                data_version = self._sqlite_data_version()
+                changed = self._other_committed or \
+                    data_version != self._data_version
+                self._data_version = data_version
+                self._other_committed = False
+            return changed
+
+        conn = self._notify_conn.driver_connection
+        conn.poll()
+        if len(conn.notifies) > 0:
+            conn.notifies.clear()
+            return True
+
+        return False
+
+    def _watches_sqlite(self) -> bool:
+        """Whether `_notify_conn` watches the sqlite data version."""
+
+        return self._notify_conn is not None and \
+            self.engine.dialect.name == "sqlite"
+
+    def _before_own_commit(self, session) -> None:
+        """Notice commits of other connections not yet polled, which the data
+        version seen after this commit would hide."""
+
+        with self._notify_lock:
+            if self._watches_sqlite() and \
+                    self._sqlite_data_version() != self._data_version:
+                self._other_committed = True
+
+    def _after_own_commit(self, session) -> None:
+        """See the data version after a commit of this instance so that it
+        does not wake up `wait_for_feedback`. Commits of other connections in
+        between the two hooks are only noticed at the next poll after another
+        change, or when the evaluator polls on its own."""
+
+        with self._notify_lock:
+            if self._watches_sqlite():
+                self._data_version = self._sqlite_data_version()
+
+    def _sqlite_data_version(self) -> int:
+        cursor = self._notify_conn.cursor()
+        try:
+            cursor.execute("PRAGMA data_version")
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+    def _upsert(
+        self, session, orm_class: Type[mod_orm.T], objs: List[mod_orm.T]
+    ) -> None:
+        """Upsert the given objects of one ORM class using the dialect's bulk
+        upsert statement if available, falling back to per-object merges."""
+
+        table = orm_class.__table__
+        dialect = self.engine.dialect.name
+
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect in ["mysql", "mariadb"]:
+            from sqlalchemy.dialects.mysql import insert
+        else:
+            for _obj in objs:
+                session.merge(_obj)
+            return
+
+        rows = [{c.name: getattr(_obj, c.key)
+                 for c in table.columns}
+                for _obj in objs]
+
+        stmt = insert(table)
+        if dialect in ["mysql", "mariadb"]:
+            stmt = stmt.on_duplicate_key_update(
+                {
+                    c.name: stmt.inserted[c.name]
+                    for c in table.columns
+                    if not c.primary_key
+                }
+            )
+        else:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[c.name for c in table.primary_key.columns],
+                set_={
+                    c.name: stmt.excluded[c.name]
+                    for c in table.columns
+                    if not c.primary_key
+                }
+            )
+
+        session.execute(stmt, rows)
+
+    def flush(self) -> None:
+        """See [DB.flush][trulens_eval.database.base.DB.flush]."""
+
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            return
+
+        if self._write_queue.unfinished_tasks == 0:
+            return
+
+        done = threading.Event()
+        self._write_queue.put(done)
+        done.wait()
+
     @classmethod
     def from_tru_args(
         cls,
@@ -294,6 +726,8 @@ class SQLAlchemyDB(DB):
     def reset_database(self):
         """See [DB.reset_database][trulens_eval.database.base.DB.reset_database]."""
 
+        self.flush()
+
         #meta = MetaData()
         meta = self.orm.metadata  #
         meta.reflect(bind=self.engine)
@@ -306,20 +740,23 @@ class SQLAlchemyDB(DB):
         # TODO: thread safety
 
         _rec = self.orm.Record.parse(record, redact_keys=self.redact_keys)
+
+        if self.background_writes:
+            self._enqueue_write(_rec)
+            return _rec.record_id
+
         with self.session.begin() as session:
-            if session.query(self.orm.Record
-                            ).filter_by(record_id=record.record_id).first():
-                session.merge(_rec)  # update existing
-            else:
-                session.merge(_rec)  # add new record # .add was not thread safe
+            session.merge(_rec)  # .add was not thread safe
 
-            logger.info("{UNICODE_CHECK} added record %s", _rec.record_id)
+            logger.info("%s added record %s", UNICODE_CHECK, _rec.record_id)
 
             return _rec.record_id
 
     def get_app(self, app_id: mod_types_schema.AppID) -> Optional[JSONized[mod_app.App]]:
         """See [DB.get_app][trulens_eval.database.base.DB.get_app]."""
 
+        self.flush()
+
         with self.session.begin() as session:
             if _app := session.query(self.orm.AppDefinition
                                     ).filter_by(app_id=app_id).first():
@@ -328,6 +765,8 @@ class SQLAlchemyDB(DB):
     def get_apps(self) -> Iterable[JSON]:
         """See [DB.get_apps][trulens_eval.database.base.DB.get_apps]."""
 
+        self.flush()
+
         with self.session.begin() as session:
             for _app in session.query(self.orm.AppDefinition):
                 yield json.loads(_app.app_json)
@@ -374,6 +813,13 @@ class SQLAlchemyDB(DB):
 
         # TODO: thread safety
 
+        if self.background_writes:
+            _fb_def = self.orm.FeedbackDefinition.parse(
+                feedback_definition, redact_keys=self.redact_keys
+            )
+            self._enqueue_write(_fb_def)
+            return _fb_def.feedback_definition_id
+
         with self.session.begin() as session:
             if _fb_def := session.query(self.orm.FeedbackDefinition) \
                     .filter_by(feedback_definition_id=feedback_definition.feedback_definition_id) \
@@ -397,6 +843,8 @@ class SQLAlchemyDB(DB):
     ) -> pd.DataFrame:
         """See [DB.get_feedback_defs][trulens_eval.database.base.DB.get_feedback_defs]."""
 
+        self.flush()
+
         with self.session.begin() as session:
             q = select(self.orm.FeedbackDefinition)
             if feedback_definition_id:
@@ -420,14 +868,18 @@ class SQLAlchemyDB(DB):
         _feedback_result = self.orm.FeedbackResult.parse(
             feedback_result, redact_keys=self.redact_keys
         )
+
+        if self.background_writes:
+            self._enqueue_write(_feedback_result)
+            return _feedback_result.feedback_result_id
+
+        pending = self._needs_evaluation([_feedback_result])
+
         with self.session.begin() as session:
-            if session.query(self.orm.FeedbackResult) \
-                    .filter_by(feedback_result_id=feedback_result.feedback_result_id).first():
-                session.merge(_feedback_result)  # update existing
-            else:
-                session.merge(
-                    _feedback_result
-                )  # insert new result # .add was not thread safe
+            session.merge(_feedback_result)  # .add was not thread safe
+
+            if pending:
+                self._notify_feedback_added(session)
 
             status = mod_feedback_schema.FeedbackResultStatus(_feedback_result.status)
 
@@ -447,7 +899,10 @@ class SQLAlchemyDB(DB):
                 status.name, _feedback_result.feedback_result_id
             )
 
-            return _feedback_result.feedback_result_id
+        if pending:
+            self._feedback_added.set()
+
+        return _feedback_result.feedback_result_id
 
     def _feedback_query(
         self,
@@ -512,6 +967,8 @@ class SQLAlchemyDB(DB):
     ) -> Dict[mod_feedback_schema.FeedbackResultStatus, int]:
         """See [DB.get_feedback_count_by_status][trulens_eval.database.base.DB.get_feedback_count_by_status]."""
 
+        self.flush()
+
         with self.session.begin() as session:
             q = self._feedback_query(
                 count=True, **locals_except("self", "session")
@@ -536,39 +993,453 @@ class SQLAlchemyDB(DB):
     ) -> pd.DataFrame:
         """See [DB.get_feedback][trulens_eval.database.base.DB.get_feedback]."""
 
+        self.flush()
+
         with self.session.begin() as session:
             q = self._feedback_query(**locals_except("self", "session"))
 
-            results = (row[0] for row in session.execute(q))
+            results = (
+                row[0] for row in session.execute(self._with_related(q))
+            )
 
             return _extract_feedback_results(results)
 
+    def iter_feedback(
+        self,
+        record_id: Optional[mod_types_schema.RecordID] = None,
+        feedback_definition_id: Optional[mod_types_schema.FeedbackDefinitionID] = None,
+        status: Optional[Union[mod_feedback_schema.FeedbackResultStatus,
+                               Sequence[mod_feedback_schema.FeedbackResultStatus]]] = None,
+        last_ts_before: Optional[datetime] = None,
+        batch_size: int = mod_db.DEFAULT_ITER_BATCH_SIZE,
+        as_arrow: bool = False
+    ) -> Iterator[Union[pd.DataFrame, 'pyarrow.RecordBatch']]:
+        """See [DB.iter_feedback][trulens_eval.database.base.DB.iter_feedback].
+
+        Pages by the `feedback_result_id` of the last result of the previous
+        chunk.
+        """
+
+        self.flush()
+
+        _res = self.orm.FeedbackResult
+
+        after = None
+        while True:
+            q = self._feedback_query(
+                record_id=record_id,
+                feedback_definition_id=feedback_definition_id,
+                status=status,
+                last_ts_before=last_ts_before
+            )
+            if after is not None:
+                q = q.where(_res.feedback_result_id > after)
+            q = q.order_by(_res.feedback_result_id).limit(batch_size)
+
+            with self.session.begin() as session:
+                df = _extract_feedback_results(
+                    row[0] for row in session.execute(self._with_related(q))
+                )
+
+            if len(df) == 0:
+                return
+
+            yield mod_db.frame_to_record_batch(df) if as_arrow else df
+
+            if len(df) < batch_size:
+                return
+
+            after = df["feedback_result_id"].iloc[-1]
+
+    def _with_related(self, q):
+        """Load the records, apps and feedback definitions related to the
+        feedback results of query `q` in a few batched queries instead of one
+        query per feedback result."""
+
+        return q.options(
+            selectinload(self.orm.FeedbackResult.record
+                        ).selectinload(self.orm.Record.app),
+            selectinload(self.orm.FeedbackResult.feedback_definition)
+        )
+
+    def claim_feedback(
+        self,
+        limit: Optional[int],
+        lease_seconds: float,
+        retry_failed_seconds: float,
+        shuffle: bool = False
+    ) -> pd.DataFrame:
+        """See [DB.claim_feedback][trulens_eval.database.base.DB.claim_feedback].
+
+        Each candidate is claimed with a compare-and-set update conditioned on
+        the `status` and `last_ts` it was read with so that of several
+        concurrent claimers only one succeeds. Losers move on to the next
+        candidate. More candidates than `limit` are read for this reason.
+        Fewer than `limit` feedback results may be claimed under contention
+        even if more are claimable.
+        """
+
+        self.flush()
+
+        _res = self.orm.FeedbackResult
+        status = mod_feedback_schema.FeedbackResultStatus
+
+        now = datetime.now().timestamp()
+
+        q = select(_res.feedback_result_id, _res.status, _res.last_ts).where(
+            or_(
+                _res.status == status.NONE.value,
+                and_(
+                    _res.status == status.RUNNING.value,
+                    _res.last_ts < now - lease_seconds
+                ),
+                and_(
+                    _res.status == status.FAILED.value,
+                    _res.last_ts < now - retry_failed_seconds
+                )
+            )
+        )
+        if limit is not None:
+            q = q.limit(limit * self.CLAIM_CANDIDATES_FACTOR)
+        if shuffle:
+            q = q.order_by(func.random())
+
+        with self.session.begin() as session:
+            candidates = session.execute(q).all()
+
+        claimed = []
+        for feedback_result_id, old_status, old_last_ts in candidates:
+            if limit is not None and len(claimed) >= limit:
+                break
+
+            # One transaction per claim so that concurrent claimers never wait
+            # on each other's row locks in opposite orders.
+            try:
+                with self.session.begin() as session:
+                    result = session.execute(
+                        update(_res).where(
+                            _res.feedback_result_id == feedback_result_id,
+                            _res.status == old_status,
+                            _res.last_ts == old_last_ts
+                        ).values(status=status.RUNNING.value, last_ts=now)
+                    )
+            except OperationalError as e:
+                # SQLite reports contention with other writers as errors
+                # instead of waiting. Leave the row for the next claim.
+                logger.debug("Could not claim %s: %s", feedback_result_id, e)
+                continue
+
+            if result.rowcount == 1:
+                claimed.append(feedback_result_id)
+
+        if len(claimed) == 0:
+            return _extract_feedback_results([])
+
+        with self.session.begin() as session:
+            q = select(_res).where(_res.feedback_result_id.in_(claimed))
+
+            df = _extract_feedback_results(
+                row[0] for row in session.execute(self._with_related(q))
+            )
+
+        # Report the state the results were claimed from.
+        prior = {
+            feedback_result_id: (old_status, old_last_ts)
+            for feedback_result_id, old_status, old_last_ts in candidates
+        }
+        df["status"] = [
+            status(prior[fid][0]) for fid in df["feedback_result_id"]
+        ]
+        df["last_ts"] = [prior[fid][1] for fid in df["feedback_result_id"]]
+
+        return df
+
+    def renew_feedback_leases(
+        self, feedback_result_ids: Sequence[mod_types_schema.FeedbackResultID]
+    ) -> int:
+        """See [DB.renew_feedback_leases][trulens_eval.database.base.DB.renew_feedback_leases]."""
+
+        if len(feedback_result_ids) == 0:
+            return 0
+
+        self.flush()
+
+        _res = self.orm.FeedbackResult
+
+        with self.session.begin() as session:
+            result = session.execute(
+                update(_res).where(
+                    _res.feedback_result_id.in_(feedback_result_ids),
+                    _res.status ==
+                    mod_feedback_schema.FeedbackResultStatus.RUNNING.value
+                ).values(last_ts=datetime.now().timestamp())
+            )
+
+            return result.rowcount
+
     def get_records_and_feedback(
         self,
-        app_ids: Optional[List[str]] = None
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None
     ) -> Tuple[pd.DataFrame, Sequence[str]]:
-        """See [DB.get_records_and_feedback][trulens_eval.database.base.DB.get_records_and_feedback]."""
+        """See [DB.get_records_and_feedback][trulens_eval.database.base.DB.get_records_and_feedback].
+
+        Issues one query for the selected records, one for their feedback
+        results and one for their apps. Feedback results are pivoted into
+        columns with pandas instead of walking ORM relationships.
+        """
+
+        self.flush()
+
+        df, feedback_columns, _ = self._get_records_and_feedback(
+            app_ids=app_ids,
+            since=since,
+            until=until,
+            offset=offset,
+            limit=limit,
+            columns=columns
+        )
+
+        return df, feedback_columns
+
+    def iter_records(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = mod_db.DEFAULT_ITER_BATCH_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        as_arrow: bool = False
+    ) -> Iterator[Union[pd.DataFrame, 'pyarrow.RecordBatch']]:
+        """See [DB.iter_records][trulens_eval.database.base.DB.iter_records].
+
+        Pages by `(ts, record_id)` of the last record of the previous chunk
+        so each chunk is a bounded query using the record indexes no matter how
+        far into the results it is. No transaction is held open while the
+        caller consumes a chunk.
+        """
+
+        self.flush()
+
+        after = None
+        while True:
+            df, _, after = self._get_records_and_feedback(
+                app_ids=app_ids,
+                since=since,
+                until=until,
+                limit=batch_size,
+                columns=columns,
+                after=after
+            )
+            if len(df) == 0:
+                return
+
+            yield mod_db.frame_to_record_batch(df) if as_arrow else df
+
+            if len(df) < batch_size:
+                return
+
+    def _get_records_and_feedback(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        after: Optional[Tuple[float, mod_types_schema.RecordID]] = None
+    ) -> Tuple[pd.DataFrame, Sequence[str],
+               Optional[Tuple[float, mod_types_schema.RecordID]]]:
+        """Implementation of `get_records_and_feedback` and `iter_records`.
+
+        Args:
+            after: Retrieve only records after the given `(ts, record_id)` in
+                the order of the results.
+
+        Returns:
+            The dataframe and feedback columns of `get_records_and_feedback`
+                and the `(ts, record_id)` of the last record in it if any.
+        """
+
+        # Feedback call columns are only included if no projection is given as
+        # their names depend on the feedback results found.
+        include_calls = columns is None
+
+        if columns is None:
+            columns = RECORDS_AND_FEEDBACK_COLUMNS
+        elif len(unknown := set(columns) - set(RECORDS_AND_FEEDBACK_COLUMNS)) > 0:
+            raise ValueError(
+                f"Unknown columns {unknown}. "
+                f"Expected a subset of {RECORDS_AND_FEEDBACK_COLUMNS}."
+            )
+
+        # Record columns needed to produce the requested ones.
+        needed = set(columns) | {"record_id", "app_id", "ts"}
+        if "latency" in needed:
+            needed.add("perf_json")
+        if "total_tokens" in needed or "total_cost" in needed:
+            needed.add("cost_json")
+        rec_cols = ["app_id"] + [
+            col for col in RECORD_COLUMNS if col in needed
+        ]
+
+        _rec = self.orm.Record
+        _res = self.orm.FeedbackResult
+
+        stmt = select(*(getattr(_rec, col) for col in rec_cols))
+        if app_ids:
+            stmt = stmt.where(_rec.app_id.in_(app_ids))
+        if since is not None:
+            stmt = stmt.where(_rec.ts >= since.timestamp())
+        if until is not None:
+            stmt = stmt.where(_rec.ts < until.timestamp())
+        if after is not None:
+            after_ts, after_record_id = after
+            stmt = stmt.where(
+                or_(
+                    _rec.ts > after_ts,
+                    and_(_rec.ts == after_ts, _rec.record_id > after_record_id)
+                )
+            )
+        stmt = stmt.order_by(_rec.ts, _rec.record_id)
+        if offset is not None:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        # Joining with a derived table instead of `IN (subquery)` as the latter
+        # cannot have a LIMIT in some dialects (mysql).
+        selected = stmt.with_only_columns(_rec.record_id).subquery()
+
+        res_cols = [_res.record_id, _res.name, _res.result, _res.multi_result]
+        if include_calls:
+            res_cols.append(_res.calls_json)
+        res_stmt = select(*res_cols).join(
+            selected, _res.record_id == selected.c.record_id
+        )
 
         with self.session.begin() as session:
-            stmt = select(self.orm.AppDefinition)
-            if app_ids:
-                stmt = stmt.where(self.orm.AppDefinition.app_id.in_(app_ids))
-            apps = (row[0] for row in session.execute(stmt))
-            return AppsExtractor().get_df_and_cols(apps)
+            result = session.execute(stmt)
+            df = pd.DataFrame(result.all(), columns=list(result.keys()))
+
+            result = session.execute(res_stmt)
+            df_results = pd.DataFrame(result.all(), columns=list(result.keys()))
+
+            if "app_json" in columns or "type" in columns:
+                app_stmt = select(
+                    self.orm.AppDefinition.app_id,
+                    self.orm.AppDefinition.app_json
+                ).where(
+                    self.orm.AppDefinition.app_id.in_(
+                        df["app_id"].unique().tolist()
+                    )
+                )
+                df_apps = pd.DataFrame(
+                    session.execute(app_stmt).all(),
+                    columns=["app_id", "app_json"]
+                )
+            else:
+                df_apps = None
+
+        if df_apps is not None:
+            # Previous DBs did not contain entire app so we cannot deserialize
+            # AppDefinition here unless we fix prior DBs in migration. Because
+            # of this, loading just the `root_class` here, once per app.
+            df_apps["type"] = [
+                str(Class.model_validate(json.loads(app_json).get("root_class")))
+                for app_json in df_apps["app_json"]
+            ]
+            df = df.merge(df_apps, on="app_id", how="left")
+
+        last = (df["ts"].iloc[-1], df["record_id"].iloc[-1]) \
+            if len(df) > 0 else None
+
+        df["ts"] = [datetime.fromtimestamp(ts).isoformat() for ts in df["ts"]]
+
+        df_scores, df_calls = _pivot_feedback_results(
+            df_results, include_calls=include_calls
+        )
+        feedback_columns = list(df_scores.columns)
+
+        df = df.join(df_scores, on="record_id").join(df_calls, on="record_id")
+        df.reset_index(drop=True, inplace=True)
+
+        if "latency" in columns:
+            df["latency"] = _extract_latency(df["perf_json"])
+        if "total_tokens" in columns or "total_cost" in columns:
+            df = pd.concat([df, _extract_tokens_and_cost(df["cost_json"])],
+                           axis=1)
+
+        return df[[col for col in APP_COLUMNS + RECORD_COLUMNS
+                   if col in columns] + feedback_columns +
+                  list(df_calls.columns) +
+                  [col for col in EXTRA_COLUMNS if col in columns]
+                 ], feedback_columns, last
 
 
 # Use this Perf for missing Perfs.
 # TODO: Migrate the database instead.
 no_perf = mod_base_schema.Perf.min().model_dump()
 
+APP_COLUMNS: List[str] = ["app_id", "app_json", "type"]
+"""App columns of the dataframe produced by `get_records_and_feedback`."""
+
+RECORD_COLUMNS: List[str] = [
+    "record_id", "input", "output", "tags", "record_json", "cost_json",
+    "perf_json", "ts"
+]
+"""Record columns of the dataframe produced by `get_records_and_feedback`."""
+
+EXTRA_COLUMNS: List[str] = ["latency", "total_tokens", "total_cost"]
+"""Columns derived from record columns in `get_records_and_feedback`."""
+
+RECORDS_AND_FEEDBACK_COLUMNS: List[str] = \
+    APP_COLUMNS + RECORD_COLUMNS + EXTRA_COLUMNS
+"""All non-feedback columns of the dataframe produced by
+`get_records_and_feedback`."""
+
 
 def _extract_feedback_results(
     results: Iterable[orm.FeedbackResult]
 ) -> pd.DataFrame:
+    """Produce the dataframe of
+    [get_feedback][trulens_eval.database.sqlalchemy.SQLAlchemyDB.get_feedback].
+
+    JSON columns hold [LazyJSON][trulens_eval.utils.json.LazyJSON] values that
+    are decoded only when accessed. The app and feedback definition JSONs are
+    shared among all rows with the same `app_id` and
+    `feedback_definition_id`, respectively, so each is decoded at most once.
+    """
+
+    apps: Dict[mod_types_schema.AppID, Tuple[LazyJSON, str]] = {}
+    feedback_defs: Dict[mod_types_schema.FeedbackDefinitionID, LazyJSON] = {}
+
+    def _app(_app: orm.AppDefinition) -> Tuple[LazyJSON, str]:
+        if _app.app_id not in apps:
+            app_json = LazyJSON(_app.app_json)
+            # Only the root class is needed here, not the whole AppDefinition.
+            _type = Class.model_validate(app_json.get("root_class"))
+            apps[_app.app_id] = (app_json, _type)
+
+        return apps[_app.app_id]
+
+    def _feedback_def(_fb_def: Optional[orm.FeedbackDefinition]) -> Optional[LazyJSON]:
+        if _fb_def is None:
+            return None
+
+        if _fb_def.feedback_definition_id not in feedback_defs:
+            feedback_defs[_fb_def.feedback_definition_id] = LazyJSON(
+                _fb_def.feedback_json
+            )
+
+        return feedback_defs[_fb_def.feedback_definition_id]
 
     def _extract(_result: self.orm.FeedbackResult):
-        app_json = json.loads(_result.record.app.app_json)
-        _type = mod_app_schema.AppDefinition.model_validate(app_json).root_class
+        app_json, _type = _app(_result.record.app)
 
         return (
             _result.record_id,
@@ -581,12 +1452,11 @@ def _extract_feedback_results(
             _result.result,
             _result.multi_result,
             _result.cost_json,  # why is cost_json not parsed?
-            json.loads(_result.record.perf_json)
+            LazyJSON(_result.record.perf_json)
             if _result.record.perf_json != MIGRATION_UNKNOWN_STR else no_perf,
-            json.loads(_result.calls_json)["calls"],
-            json.loads(_result.feedback_definition.feedback_json)
-            if _result.feedback_definition is not None else None,
-            json.loads(_result.record.record_json),
+            LazyJSON(_result.calls_json, key="calls"),
+            _feedback_def(_result.feedback_definition),
+            LazyJSON(_result.record.record_json),
             app_json,
             _type,
         )
@@ -618,10 +1488,14 @@ def _extract_feedback_results(
 
 
 def _extract_latency(
-    series: Iterable[Union[str, dict, mod_base_schema.Perf]]
+    series: Iterable[Union[str, dict, LazyJSON, mod_base_schema.Perf]]
 ) -> pd.Series:
 
-    def _extract(perf_json: Union[str, dict, mod_base_schema.Perf]) -> int:
+    def _extract(
+        perf_json: Union[str, dict, LazyJSON, mod_base_schema.Perf]
+    ) -> int:
+        perf_json = LazyJSON.decode(perf_json)
+
         if perf_json == MIGRATION_UNKNOWN_STR:
             return np.nan
 
@@ -659,106 +1533,76 @@ def _extract_tokens_and_cost(cost_json: pd.Series) -> pd.DataFrame:
     )
 
 
-class AppsExtractor:
-    app_cols = ["app_id", "app_json", "type"]
-    rec_cols = [
-        "record_id", "input", "output", "tags", "record_json", "cost_json",
-        "perf_json", "ts"
-    ]
-    extra_cols = ["latency", "total_tokens", "total_cost"]
-    all_cols = app_cols + rec_cols + extra_cols
+def _pivot_feedback_results(
+    df_results: pd.DataFrame,
+    include_calls: bool = True
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Pivot feedback result rows into per-record columns.
 
-    def __init__(self):
-        self.feedback_columns = set()
+    Args:
+        df_results: Feedback result rows with columns `record_id`, `name`,
+            `result`, `multi_result` and, if `include_calls`, `calls_json`.
 
-    def get_df_and_cols(
-        self, apps: Iterable[orm.AppDefinition]
-    ) -> Tuple[pd.DataFrame, Sequence[str]]:
-        df = pd.concat(self.extract_apps(apps))
-        df["latency"] = _extract_latency(df["perf_json"])
-        df.reset_index(
-            drop=True, inplace=True
-        )  # prevent index mismatch on the horizontal concat that follows
-        df = pd.concat([df, _extract_tokens_and_cost(df["cost_json"])], axis=1)
-        return df, list(self.feedback_columns)
-
-    def extract_apps(
-        self, apps: Iterable[orm.AppDefinition]
-    ) -> Iterable[pd.DataFrame]:
-        yield pd.DataFrame(
-            [], columns=self.app_cols + self.rec_cols
-        )  # prevent empty iterator
-        for _app in apps:
-            try:
-                if _recs := _app.records:
-                    df = pd.DataFrame(data=self.extract_records(_recs))
-
-                    for col in self.app_cols:
-                        if col == "type":
-                            # Previous DBs did not contain entire app so we cannot
-                            # deserialize AppDefinition here unless we fix prior DBs
-                            # in migration. Because of this, loading just the
-                            # `root_class` here.
-                            df[col] = str(
-                                Class.model_validate(
-                                    json.loads(_app.app_json).get('root_class')
-                                )
-                            )
-                        else:
-                            df[col] = getattr(_app, col)
+        include_calls: Whether to produce the feedback calls columns.
 
-                    yield df
-            except OperationalError as e:
-                print(
-                    "Error encountered while attempting to retrieve an app. This issue may stem from a corrupted database."
+    Returns:
+        A dataframe indexed by record id with the mean result of each feedback
+            name. Multi-results produce a column per key named
+            `{name}:::{key}`.
+
+        A dataframe indexed by record id with the concatenated calls of each
+            feedback name in a column named `{name}_calls`. Empty if
+            `include_calls` is not set.
+    """
+
+    scores = df_results[["record_id", "name", "result"]]
+
+    multi_mask = df_results["multi_result"].notna()
+    if multi_mask.any():
+        multi = df_results.loc[multi_mask, "multi_result"].map(json.loads)
+        multi = multi[multi.notna()]
+
+        # Results that have a multi-result do not contribute their `result`.
+        scores = scores.drop(index=multi.index)
+
+        scores = pd.concat(
+            [
+                scores,
+                pd.DataFrame(
+                    [
+                        (
+                            df_results.at[i, "record_id"],
+                            f"{df_results.at[i, 'name']}{mod_db.MULTI_CALL_NAME_DELIMITER}{key}",
+                            val
+                        )
+                        for i, multi_result in multi.items()
+                        for key, val in multi_result.items()
+                        if val is not None
+                    ],
+                    columns=["record_id", "name", "result"]
                 )
-                print(f"Error details: {e}")
+            ]
+        )
 
-    def extract_records(self,
-                        records: Iterable[orm.Record]) -> Iterable[pd.Series]:
-        for _rec in records:
-            calls = defaultdict(list)
-            values = defaultdict(list)
+    # Avoid getting Nones into the means.
+    scores = scores[scores["result"].notna()]
+    df_scores = scores.astype({"result": float}).groupby(
+        ["record_id", "name"]
+    )["result"].mean().unstack()
+    df_scores.columns.name = None
 
-            try:
-                for _res in _rec.feedback_results:
-                    calls[_res.name].append(
-                        json.loads(_res.calls_json)["calls"]
-                    )
-                    if _res.multi_result is not None and (multi_result :=
-                                                          json.loads(
-                                                              _res.multi_result
-                                                          )) is not None:
-                        for key, val in multi_result.items():
-                            if val is not None:  # avoid getting Nones into np.mean
-                                name = f"{_res.name}:::{key}"
-                                values[name] = val
-                                self.feedback_columns.add(name)
-                    elif _res.result is not None:  # avoid getting Nones into np.mean
-                        values[_res.name].append(_res.result)
-                        self.feedback_columns.add(_res.name)
-
-                row = {
-                    **{
-                        k: np.mean(v) for k, v in values.items()
-                    },
-                    **{
-                        k + "_calls": flatten(v) for k, v in calls.items()
-                    },
-                }
+    if not include_calls or len(df_results) == 0:
+        return df_scores, pd.DataFrame(index=df_scores.index[:0])
 
-                for col in self.rec_cols:
-                    row[col] = datetime.fromtimestamp(
-                        _rec.ts
-                    ).isoformat() if col == "ts" else getattr(_rec, col)
+    calls = df_results[["record_id", "name"]].assign(
+        calls=[json.loads(c)["calls"] for c in df_results["calls_json"]]
+    )
+    df_calls = calls.groupby(["record_id", "name"])["calls"].apply(
+        flatten
+    ).unstack()
+    df_calls.columns = [f"{name}_calls" for name in df_calls.columns]
 
-                yield row
-            except Exception as e:
-                # Handling unexpected errors, possibly due to database issues.
-                print(
-                    "Error encountered while attempting to retrieve feedback results. This issue may stem from a corrupted database."
-                )
-                print(f"Error details: {e}")
+    return df_scores, df_calls
 
 
 def flatten(nested: Iterable[Iterable[Any]]) -> List[Any]:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
 import inspect
 from inspect import Signature
 from inspect import signature
@@ -8,6 +8,7 @@ import itertools
 import json
 import logging
 from pprint import pformat
+import threading
 import traceback
 from typing import (Any, Callable, Dict, Iterable, List, Optional, Tuple,
                     TypeVar, Union)
@@ -28,6 +29,7 @@ from trulens_eval.schema import base as mod_base_schema
 from trulens_eval.schema import feedback as mod_feedback_schema
 from trulens_eval.schema import record as mod_record_schema
 from trulens_eval.schema import types as mod_types_schema
+from trulens_eval.utils import asynchro as mod_asynchro_utils
 from trulens_eval.utils import json as mod_json_utils
 from trulens_eval.utils import pyschema as mod_pyschema
 from trulens_eval.utils import python as mod_python_utils
@@ -70,6 +72,81 @@ class InvalidSelector(Exception):
         return f"InvalidSelector({self.selector})"
 
 
+class PreparedSource:
+    """
+    The data that feedback functions select their inputs from for one record.
+
+    The jsonized app and the record's calls laid out as the app (see
+    [layout_calls_as_app][trulens_eval.schema.record.Record.layout_calls_as_app])
+    are computed once, on first use, and shared by all feedback functions run
+    with this object as their `prepared_source`.
+    """
+
+    def __init__(
+        self,
+        app: Optional[Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON]] = None,
+        record: Optional[mod_record_schema.Record] = None
+    ):
+        self.app = app
+        self.record = record
+
+        self._app_json: Optional[mod_serial_utils.JSON] = None
+        self._record_layout: Optional[munch.Munch] = None
+
+        # Feedback functions sharing this may run in different threads.
+        self._lock = threading.Lock()
+
+    @property
+    def app_json(self) -> Optional[mod_serial_utils.JSON]:
+        """The app, jsonized if it is not already."""
+
+        if not isinstance(self.app, mod_app_schema.AppDefinition):
+            return self.app
+
+        with self._lock:
+            if self._app_json is None:
+                self._app_json = mod_json_utils.jsonify(self.app)
+
+            return self._app_json
+
+    @property
+    def record_layout(self) -> Optional[munch.Munch]:
+        """The record's calls laid out as the app."""
+
+        if self.record is None:
+            return None
+
+        with self._lock:
+            if self._record_layout is None:
+                self._record_layout = self.record.layout_calls_as_app()
+
+            return self._record_layout
+
+    def source_data(
+        self, source_data: Optional[Dict] = None, **kwargs: dict
+    ) -> Dict:
+        """
+        Combine the app, the record and `source_data` into the data to select
+        feedback function inputs from. Any `kwargs` are merged into
+        `source_data`.
+        """
+
+        if source_data is None:
+            source_data = {}
+        else:
+            source_data = dict(source_data)  # copy
+
+        source_data.update(kwargs)
+
+        if self.app is not None:
+            source_data["__app__"] = self.app_json
+
+        if self.record is not None:
+            source_data["__record__"] = self.record_layout
+
+        return source_data
+
+
 def rag_triad(
     provider: mod_base_provider.LLMProvider,
     question: Optional[mod_serial_utils.Lens] = None,
@@ -336,10 +413,18 @@ class Feedback(mod_feedback_schema.FeedbackDefinition):
     def evaluate_deferred(
         tru: Tru,
         limit: Optional[int] = None,
-        shuffle: bool = False
+        shuffle: bool = False,
+        asynchronous: bool = False
     ) -> List[Tuple[pandas.Series, mod_python_utils.Future[mod_feedback_schema.FeedbackResult]]]:
         """Evaluates feedback functions that were specified to be deferred.
-        
+
+        The feedback results to evaluate are first leased with
+        [claim_feedback][trulens_eval.database.base.DB.claim_feedback] so that
+        concurrent evaluators never evaluate the same one. The leases need to be
+        renewed with
+        [renew_feedback_leases][trulens_eval.database.base.DB.renew_feedback_leases]
+        while the evaluations are running.
+
         Returns a list of tuples with the DB row containing the Feedback and
         initial [FeedbackResult][trulens_eval.schema.feedback.FeedbackResult] as
         well as the Future which will contain the actual result.
@@ -348,82 +433,132 @@ class Feedback(mod_feedback_schema.FeedbackDefinition):
             limit: The maximum number of evals to start.
 
             shuffle: Shuffle the order of the feedbacks to evaluate.
+
+            asynchronous: Evaluate with
+                [arun_and_log][trulens_eval.feedback.feedback.Feedback.arun_and_log]
+                on the
+                [background_loop][trulens_eval.utils.asynchro.background_loop]
+                instead of with threads.
         
         Constants that govern behaviour:
 
-        - Tru.RETRY_RUNNING_SECONDS: How long to time before restarting a feedback
-          that was started but never failed (or failed without recording that
-          fact).
+        - Tru.DEFERRED_LEASE_SECONDS: How long to wait before restarting a
+          feedback that was started but whose lease was not renewed, for example
+          because its evaluator died.
 
         - Tru.RETRY_FAILED_SECONDS: How long to wait to retry a failed feedback.
         """
 
         db = tru.db
 
-        def prepare_feedback(row) -> Optional[mod_feedback_schema.FeedbackResultStatus]:
-            record_json = row.record_json
-            record = mod_record_schema.Record.model_validate(record_json)
+        # Sources prepared for each record so that feedbacks claimed for the
+        # same record share them.
+        prepared_sources: Dict[mod_types_schema.RecordID, PreparedSource] = {}
+        prepared_sources_lock = threading.Lock()
+
+        def prepared_source_of_row(row) -> PreparedSource:
+            with prepared_sources_lock:
+                if row.record_id in prepared_sources:
+                    return prepared_sources[row.record_id]
+
+            # JSON columns may be lazily decoded.
+            record_json = mod_json_utils.LazyJSON.decode(row.record_json)
+            prepared_source = PreparedSource(
+                app=mod_json_utils.LazyJSON.decode(row.app_json),
+                record=mod_record_schema.Record.model_validate(record_json)
+            )
 
-            app_json = row.app_json
+            # Another thread may have prepared the same record meanwhile; keep
+            # the first one.
+            with prepared_sources_lock:
+                return prepared_sources.setdefault(
+                    row.record_id, prepared_source
+                )
 
+        def prepare_feedback(
+            row
+        ) -> Optional[Tuple[Feedback, PreparedSource]]:
             if row.get("feedback_json") is None:
                 logger.warning(
                     "Cannot evaluate feedback without `feedback_json`. "
                     "This might have come from an old database. \n%s", row
                 )
-                return None
 
-            feedback = Feedback.model_validate(row.feedback_json)
+                # Mark the claimed run failed so that it is not claimed again
+                # every time its lease expires.
+                db.insert_feedback(
+                    mod_feedback_schema.FeedbackResult(
+                        feedback_definition_id=row.feedback_definition_id,
+                        feedback_result_id=row.feedback_result_id,
+                        record_id=row.record_id,
+                        name=row.fname,
+                        status=mod_feedback_schema.FeedbackResultStatus.FAILED,
+                        error=(
+                            "Cannot evaluate feedback without its definition "
+                            f"{row.feedback_definition_id} in the database."
+                        )
+                    )
+                )
+                return None
 
-            return feedback.run_and_log(
-                record=record,
-                app=app_json,
-                tru=tru,
-                feedback_result_id=row.feedback_result_id
+            feedback = Feedback.model_validate(
+                mod_json_utils.LazyJSON.decode(row.feedback_json)
             )
 
-        # Get the different status feedbacks except those marked DONE.
-        feedbacks_not_done = db.get_feedback(
-            status=[
-                mod_feedback_schema.FeedbackResultStatus.NONE, mod_feedback_schema.FeedbackResultStatus.FAILED,
-                mod_feedback_schema.FeedbackResultStatus.RUNNING
-            ],
-            limit=limit,
-            shuffle=shuffle,
-        )
+            return feedback, prepared_source_of_row(row)
 
-        tp = mod_threading_utils.TP()
+        def run_feedback(row) -> Optional[mod_feedback_schema.FeedbackResult]:
+            prepared = prepare_feedback(row)
+            if prepared is None:
+                return None
 
-        futures: List[Tuple[pandas.Series, mod_python_utils.Future[mod_feedback_schema.FeedbackResult]]] = []
+            feedback, prepared_source = prepared
 
-        for _, row in feedbacks_not_done.iterrows():
-            now = datetime.now().timestamp()
-            elapsed = now - row.last_ts
+            return feedback.run_and_log(
+                record=prepared_source.record,
+                app=prepared_source.app,
+                tru=tru,
+                feedback_result_id=row.feedback_result_id,
+                prepared_source=prepared_source
+            )
 
-            # TODO: figure out useful things to print.
-            # feedback_ident = (
-            #     f"[last seen {humanize.naturaldelta(elapsed)} ago] "
-            #    f"{row.fname} for app {row.app_json['app_id']}"
-            # )
+        async def arun_feedback(row) -> Optional[mod_feedback_schema.FeedbackResult]:
+            prepared = prepare_feedback(row)
+            if prepared is None:
+                return None
 
-            if row.status == mod_feedback_schema.FeedbackResultStatus.NONE:
-                futures.append((row, tp.submit(prepare_feedback, row)))
+            feedback, prepared_source = prepared
 
-            elif row.status == mod_feedback_schema.FeedbackResultStatus.RUNNING:
+            return await feedback.arun_and_log(
+                record=prepared_source.record,
+                app=prepared_source.app,
+                tru=tru,
+                feedback_result_id=row.feedback_result_id,
+                prepared_source=prepared_source
+            )
 
-                if elapsed > tru.RETRY_RUNNING_SECONDS:
-                    futures.append((row, tp.submit(prepare_feedback, row)))
+        # Lease the feedbacks that are not done and not being run by another
+        # evaluator.
+        feedbacks_claimed = db.claim_feedback(
+            limit=limit,
+            lease_seconds=tru.DEFERRED_LEASE_SECONDS,
+            retry_failed_seconds=tru.RETRY_FAILED_SECONDS,
+            shuffle=shuffle
+        )
 
-                else:
-                    pass
+        futures: List[Tuple[pandas.Series, mod_python_utils.Future[mod_feedback_schema.FeedbackResult]]] = []
 
-            elif row.status == mod_feedback_schema.FeedbackResultStatus.FAILED:
+        if asynchronous:
+            for _, row in feedbacks_claimed.iterrows():
+                futures.append(
+                    (row, mod_asynchro_utils.run_in_background(arun_feedback(row)))
+                )
 
-                if elapsed > tru.RETRY_FAILED_SECONDS:
-                    futures.append((row, tp.submit(prepare_feedback, row)))
+        else:
+            tp = mod_threading_utils.TP()
 
-                else:
-                    pass
+            for _, row in feedbacks_claimed.iterrows():
+                futures.append((row, tp.submit(run_feedback, row)))
 
         return futures
 
@@ -743,6 +878,7 @@ Feedback function signature:
         app: Optional[Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON]] = None,
         record: Optional[mod_record_schema.Record] = None,
         source_data: Optional[Dict] = None,
+        prepared_source: Optional[PreparedSource] = None,
         **kwargs: Dict[str, Any]
     ) -> mod_feedback_schema.FeedbackResult:
         """
@@ -759,6 +895,10 @@ Feedback function signature:
             source_data: Additional data to select from when extracting feedback
                 function arguments.
 
+            prepared_source: The app and record prepared for selection,
+                possibly shared with other feedback functions run on the same
+                record. Takes the place of `app` and `record` if given.
+
             **kwargs: Any additional keyword arguments are used to set or override
                 selected feedback function inputs.
             
@@ -766,14 +906,172 @@ Feedback function signature:
             A FeedbackResult object with the result of the feedback function.
         """
 
-        if isinstance(app, mod_app_schema.AppDefinition):
-            app_json = mod_json_utils.jsonify(app)
-        else:
-            app_json = app
+        feedback_result, input_combinations = self._prepare_run(
+            app=app,
+            record=record,
+            source_data=source_data,
+            prepared_source=prepared_source,
+            **kwargs
+        )
+        if input_combinations is None:
+            return feedback_result
 
-        result_vals = []
+        try:
+            # Total cost, will accumulate.
+            cost = mod_base_schema.Cost()
 
-        feedback_calls = []
+            result_vals = []
+            feedback_calls = []
+
+            for ins in input_combinations:
+                try:
+                    result_and_meta, part_cost = mod_base_endpoint.Endpoint.track_all_costs_tally(
+                        self.imp, **ins
+                    )
+
+                    cost += part_cost
+                except Exception as e:
+                    raise RuntimeError(
+                        f"Evaluation of {self.name} failed on inputs: \n{pformat(ins)[0:128]}."
+                    ) from e
+
+                result_val, feedback_call = self._feedback_call(
+                    ins, result_and_meta
+                )
+
+                result_vals.append(result_val)
+                feedback_calls.append(feedback_call)
+
+            return self._finish_result(
+                feedback_result,
+                result_vals=result_vals,
+                feedback_calls=feedback_calls,
+                cost=cost
+            )
+
+        except:
+            return self._failed_result(feedback_result)
+
+    async def arun(
+        self,
+        app: Optional[Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON]] = None,
+        record: Optional[mod_record_schema.Record] = None,
+        source_data: Optional[Dict] = None,
+        prepared_source: Optional[PreparedSource] = None,
+        **kwargs: Dict[str, Any]
+    ) -> mod_feedback_schema.FeedbackResult:
+        """
+        Async version of [run][trulens_eval.feedback.feedback.Feedback.run].
+
+        The implementation is called on all input combinations concurrently.
+        Implementations which are methods with an async counterpart named
+        with an "a" prefix, like
+        [acontext_relevance][trulens_eval.feedback.provider.base.LLMProvider.acontext_relevance]
+        for
+        [context_relevance][trulens_eval.feedback.provider.base.LLMProvider.context_relevance],
+        are awaited through the counterpart and do not occupy a thread. Other
+        implementations are run in threads.
+        """
+
+        feedback_result, input_combinations = self._prepare_run(
+            app=app,
+            record=record,
+            source_data=source_data,
+            prepared_source=prepared_source,
+            **kwargs
+        )
+        if input_combinations is None:
+            return feedback_result
+
+        aimp = self._async_imp()
+
+        async def call(ins: Dict[str, Any]):
+            try:
+                return await mod_base_endpoint.Endpoint.atrack_all_costs_tally(
+                    aimp, **ins
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Evaluation of {self.name} failed on inputs: \n{pformat(ins)[0:128]}."
+                ) from e
+
+        try:
+            # Wait for all calls even if one fails so none are left running.
+            results = await asyncio.gather(
+                *(call(ins) for ins in input_combinations),
+                return_exceptions=True
+            )
+
+            cost = mod_base_schema.Cost()
+
+            result_vals = []
+            feedback_calls = []
+
+            for ins, result in zip(input_combinations, results):
+                if isinstance(result, BaseException):
+                    raise result
+
+                result_and_meta, part_cost = result
+                cost += part_cost
+
+                result_val, feedback_call = self._feedback_call(
+                    ins, result_and_meta
+                )
+
+                result_vals.append(result_val)
+                feedback_calls.append(feedback_call)
+
+            return self._finish_result(
+                feedback_result,
+                result_vals=result_vals,
+                feedback_calls=feedback_calls,
+                cost=cost
+            )
+
+        except:
+            return self._failed_result(feedback_result)
+
+    def _async_imp(self) -> mod_asynchro_utils.CallableMaybeAwaitable:
+        """The async counterpart of the implementation if it has one.
+        
+        Otherwise the implementation itself.
+        """
+
+        if mod_python_utils.is_really_coroutinefunction(self.imp):
+            return self.imp
+
+        if inspect.ismethod(self.imp):
+            aimp = getattr(self.imp.__self__, "a" + self.imp.__name__, None)
+            if aimp is not None and \
+                    mod_python_utils.is_really_coroutinefunction(aimp):
+                return aimp
+
+        return self.imp
+
+    def _prepare_run(
+        self,
+        app: Optional[Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON]] = None,
+        record: Optional[mod_record_schema.Record] = None,
+        source_data: Optional[Dict] = None,
+        prepared_source: Optional[PreparedSource] = None,
+        **kwargs: Dict[str, Any]
+    ) -> Tuple[mod_feedback_schema.FeedbackResult, Optional[List[Dict[str, Any]]]]:
+        """
+        Create the result of a run of this feedback function and select the
+        inputs to the implementation calls.
+
+        Returns the result and the inputs. The inputs are `None` if the run is
+        to be skipped in which case the result is final.
+
+        Raises:
+            InvalidSelector: If a selector names something that does not exist
+                and `if_missing` is `ERROR`.
+        """
+
+        if prepared_source is None:
+            prepared_source = PreparedSource(app=app, record=record)
+
+        record = prepared_source.record
 
         feedback_result = mod_feedback_schema.FeedbackResult(
             feedback_definition_id=self.feedback_definition_id,
@@ -782,9 +1080,7 @@ Feedback function signature:
             if self.supplied_name is not None else self.name
         )
 
-        source_data = self._construct_source_data(
-            app=app_json, record=record, source_data=source_data
-        )
+        source_data = prepared_source.source_data(source_data)
 
         if self.if_exists is not None:
             if not self.if_exists.exists(source_data):
@@ -793,7 +1089,7 @@ Feedback function signature:
                     self.if_exists
                 )
                 feedback_result.status = mod_feedback_schema.FeedbackResultStatus.SKIPPED
-                return feedback_result
+                return feedback_result, None
 
         # Separate try block for extracting inputs from records/apps in case a
         # user specified something that does not exist. We want to fail and give
@@ -821,132 +1117,146 @@ Feedback function signature:
                     "Feedback %s cannot run as %s does not exist in record or app.",
                     self.name, e.selector
                 )
-                return feedback_result
+                return feedback_result, None
 
             if self.if_missing == mod_feedback_schema.FeedbackOnMissingParameters.IGNORE:
                 feedback_result.status = mod_feedback_schema.FeedbackResultStatus.SKIPPED
-                return feedback_result
+                return feedback_result, None
 
             feedback_result.status = mod_feedback_schema.FeedbackResultStatus.FAILED
             raise ValueError(
                 f"Unknown value for `if_missing` {self.if_missing}."
             ) from e
 
-        try:
-            # Total cost, will accumulate.
-            cost = mod_base_schema.Cost()
-            multi_result = None
+        return feedback_result, input_combinations
 
-            for ins in input_combinations:
-                try:
-                    result_and_meta, part_cost = mod_base_endpoint.Endpoint.track_all_costs_tally(
-                        self.imp, **ins
-                    )
+    def _feedback_call(
+        self, ins: Dict[str, Any], result_and_meta: Any
+    ) -> Tuple[Union[float, Dict[str, float]], mod_feedback_schema.FeedbackCall]:
+        """
+        Check the output of an implementation call on inputs `ins` and create
+        its [FeedbackCall][trulens_eval.schema.feedback.FeedbackCall].
 
-                    cost += part_cost
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Evaluation of {self.name} failed on inputs: \n{pformat(ins)[0:128]}."
-                    ) from e
+        Returns the result value and the call.
+        """
 
-                if isinstance(result_and_meta, Tuple):
-                    # If output is a tuple of two, we assume it is the float/multifloat and the metadata.
-                    assert len(result_and_meta) == 2, (
-                        "Feedback functions must return either a single float, "
-                        "a float-valued dict, or these in combination with a dictionary as a tuple."
-                    )
-                    result_val, meta = result_and_meta
+        if isinstance(result_and_meta, Tuple):
+            # If output is a tuple of two, we assume it is the float/multifloat and the metadata.
+            assert len(result_and_meta) == 2, (
+                "Feedback functions must return either a single float, "
+                "a float-valued dict, or these in combination with a dictionary as a tuple."
+            )
+            result_val, meta = result_and_meta
 
-                    assert isinstance(
-                        meta, dict
-                    ), f"Feedback metadata output must be a dictionary but was {type(meta)}."
-                else:
-                    # Otherwise it is just the float. We create empty metadata dict.
-                    result_val = result_and_meta
-                    meta = dict()
-
-                if isinstance(result_val, dict):
-                    for val in result_val.values():
-                        assert isinstance(val, float), (
-                            f"Feedback function output with multivalue must be "
-                            f"a dict with float values but encountered {type(val)}."
-                        )
-                    feedback_call = mod_feedback_schema.FeedbackCall(
-                        args=ins,
-                        ret=np.mean(list(result_val.values())),
-                        meta=meta
-                    )
+            assert isinstance(
+                meta, dict
+            ), f"Feedback metadata output must be a dictionary but was {type(meta)}."
+        else:
+            # Otherwise it is just the float. We create empty metadata dict.
+            result_val = result_and_meta
+            meta = dict()
+
+        if isinstance(result_val, dict):
+            for val in result_val.values():
+                assert isinstance(val, float), (
+                    f"Feedback function output with multivalue must be "
+                    f"a dict with float values but encountered {type(val)}."
+                )
+            feedback_call = mod_feedback_schema.FeedbackCall(
+                args=ins,
+                ret=np.mean(list(result_val.values())),
+                meta=meta
+            )
 
-                else:
-                    assert isinstance(
-                        result_val, float
-                    ), f"Feedback function output must be a float or dict but was {type(result_val)}."
-                    feedback_call = mod_feedback_schema.FeedbackCall(
-                        args=ins, ret=result_val, meta=meta
-                    )
+        else:
+            assert isinstance(
+                result_val, float
+            ), f"Feedback function output must be a float or dict but was {type(result_val)}."
+            feedback_call = mod_feedback_schema.FeedbackCall(
+                args=ins, ret=result_val, meta=meta
+            )
 
-                result_vals.append(result_val)
-                feedback_calls.append(feedback_call)
+        return result_val, feedback_call
 
-            if len(result_vals) == 0:
-                warnings.warn(
-                    f"Feedback function {self.supplied_name if self.supplied_name is not None else self.name} with aggregation {self.agg} had no inputs.",
-                    UserWarning,
-                    stacklevel=1
-                )
-                result = np.nan
+    def _finish_result(
+        self,
+        feedback_result: mod_feedback_schema.FeedbackResult,
+        result_vals: List[Union[float, Dict[str, float]]],
+        feedback_calls: List[mod_feedback_schema.FeedbackCall],
+        cost: mod_base_schema.Cost
+    ) -> mod_feedback_schema.FeedbackResult:
+        """
+        Aggregate the results of the implementation calls into the given
+        feedback result.
+        """
+
+        multi_result = None
+
+        if len(result_vals) == 0:
+            warnings.warn(
+                f"Feedback function {self.supplied_name if self.supplied_name is not None else self.name} with aggregation {self.agg} had no inputs.",
+                UserWarning,
+                stacklevel=1
+            )
+            result = np.nan
 
+        else:
+            if isinstance(result_vals[0], float):
+                result_vals = np.array(result_vals)
+                result = self.agg(result_vals)
             else:
-                if isinstance(result_vals[0], float):
-                    result_vals = np.array(result_vals)
+                try:
+                    # Operates on list of dict; Can be a dict output
+                    # (maintain multi) or a float output (convert to single)
                     result = self.agg(result_vals)
-                else:
-                    try:
-                        # Operates on list of dict; Can be a dict output
-                        # (maintain multi) or a float output (convert to single)
-                        result = self.agg(result_vals)
-                    except:
-                        # Alternatively, operate the agg per key
-                        result = {}
-                        for feedback_output in result_vals:
-                            for key in feedback_output:
-                                if key not in result:
-                                    result[key] = []
-                                result[key].append(feedback_output[key])
-                        for key in result:
-                            result[key] = self.agg(result[key])
-
-                    if isinstance(result, dict):
-                        multi_result = result
-                        result = np.nan
-
-            feedback_result.update(
-                result=result,
-                status=mod_feedback_schema.FeedbackResultStatus.DONE,
-                cost=cost,
-                calls=feedback_calls,
-                multi_result=json.dumps(multi_result)
-            )
+                except:
+                    # Alternatively, operate the agg per key
+                    result = {}
+                    for feedback_output in result_vals:
+                        for key in feedback_output:
+                            if key not in result:
+                                result[key] = []
+                            result[key].append(feedback_output[key])
+                    for key in result:
+                        result[key] = self.agg(result[key])
+
+                if isinstance(result, dict):
+                    multi_result = result
+                    result = np.nan
+
+        feedback_result.update(
+            result=result,
+            status=mod_feedback_schema.FeedbackResultStatus.DONE,
+            cost=cost,
+            calls=feedback_calls,
+            multi_result=json.dumps(multi_result)
+        )
 
-            return feedback_result
+        return feedback_result
 
-        except:
-            # Convert traceback to a UTF-8 string, replacing errors to avoid encoding issues
-            exc_tb = traceback.format_exc().encode(
-                'utf-8', errors='replace'
-            ).decode('utf-8')
-            logger.warning(f"Feedback Function exception caught: %s", exc_tb)
-            feedback_result.update(
-                error=exc_tb, status=mod_feedback_schema.FeedbackResultStatus.FAILED
-            )
-            return feedback_result
+    def _failed_result(
+        self, feedback_result: mod_feedback_schema.FeedbackResult
+    ) -> mod_feedback_schema.FeedbackResult:
+        """Mark the given feedback result as failed with the exception being
+        handled."""
+
+        # Convert traceback to a UTF-8 string, replacing errors to avoid encoding issues
+        exc_tb = traceback.format_exc().encode(
+            'utf-8', errors='replace'
+        ).decode('utf-8')
+        logger.warning(f"Feedback Function exception caught: %s", exc_tb)
+        feedback_result.update(
+            error=exc_tb, status=mod_feedback_schema.FeedbackResultStatus.FAILED
+        )
+        return feedback_result
 
     def run_and_log(
         self,
         record: mod_record_schema.Record,
         tru: 'Tru',
         app: Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON] = None,
-        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None
+        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
+        prepared_source: Optional[PreparedSource] = None
     ) -> Optional[mod_feedback_schema.FeedbackResult]:
 
         record_id = record.record_id
@@ -974,7 +1284,7 @@ Feedback function signature:
             )
 
             feedback_result = self.run(
-                app=app, record=record
+                app=app, record=record, prepared_source=prepared_source
             ).update(feedback_result_id=feedback_result_id)
 
         except Exception:
@@ -995,6 +1305,65 @@ Feedback function signature:
 
         return feedback_result
 
+    async def arun_and_log(
+        self,
+        record: mod_record_schema.Record,
+        tru: 'Tru',
+        app: Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON] = None,
+        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
+        prepared_source: Optional[PreparedSource] = None
+    ) -> Optional[mod_feedback_schema.FeedbackResult]:
+        """
+        Async version of
+        [run_and_log][trulens_eval.feedback.feedback.Feedback.run_and_log].
+        Database writes are done in threads.
+        """
+
+        record_id = record.record_id
+
+        db = tru.db
+
+        # Placeholder result to indicate a run.
+        feedback_result = mod_feedback_schema.FeedbackResult(
+            feedback_definition_id=self.feedback_definition_id,
+            feedback_result_id=feedback_result_id,
+            record_id=record_id,
+            name=self.supplied_name
+            if self.supplied_name is not None else self.name
+        )
+
+        if feedback_result_id is None:
+            feedback_result_id = feedback_result.feedback_result_id
+
+        try:
+            await asyncio.to_thread(
+                db.insert_feedback,
+                feedback_result.update(
+                    status=mod_feedback_schema.FeedbackResultStatus.RUNNING  # in progress
+                )
+            )
+
+            feedback_result = (await self.arun(
+                app=app, record=record, prepared_source=prepared_source
+            )).update(feedback_result_id=feedback_result_id)
+
+        except Exception:
+            # Convert traceback to a UTF-8 string, replacing errors to avoid encoding issues
+            exc_tb = traceback.format_exc().encode(
+                'utf-8', errors='replace'
+            ).decode('utf-8')
+            await asyncio.to_thread(
+                db.insert_feedback,
+                feedback_result.update(
+                    error=exc_tb, status=mod_feedback_schema.FeedbackResultStatus.FAILED
+                )
+            )
+            return
+
+        await asyncio.to_thread(db.insert_feedback, feedback_result)
+
+        return feedback_result
+
     @property
     def name(self) -> str:
         """Name of the feedback function.
@@ -1093,20 +1462,9 @@ Feedback function signature:
             A dictionary with the combined data.
         """
 
-        if source_data is None:
-            source_data = {}
-        else:
-            source_data = dict(source_data)  # copy
-
-        source_data.update(kwargs)
-
-        if app is not None:
-            source_data["__app__"] = app
-
-        if record is not None:
-            source_data["__record__"] = record.layout_calls_as_app()
-
-        return source_data
+        return PreparedSource(app=app, record=record).source_data(
+            source_data, **kwargs
+        )
 
     def extract_selection(
         self,
@@ -1,5 +1,8 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import (Callable, ClassVar, Dict, List, Optional, Sequence, Tuple,
+                    TypeVar)
 
 import nltk
 from nltk.tokenize import sent_tokenize
@@ -10,6 +13,7 @@ from trulens_eval.feedback import prompts
 from trulens_eval.feedback.provider.base import LLMProvider
 from trulens_eval.feedback.provider.base import Provider
 from trulens_eval.feedback.provider.hugs import Huggingface
+from trulens_eval.utils import threading as mod_threading_utils
 from trulens_eval.utils.generated import re_0_10_rating
 from trulens_eval.utils.imports import OptionalImports
 from trulens_eval.utils.imports import REQUIREMENT_BEDROCK
@@ -31,6 +35,9 @@ with OptionalImports(messages=REQUIREMENT_LITELLM):
 
 logger = logging.getLogger(__name__)
 
+A = TypeVar("A")
+T = TypeVar("T")
+
 
 class Groundedness(WithClassInfo, SerialModel):
     """
@@ -64,10 +71,29 @@ class Groundedness(WithClassInfo, SerialModel):
             should be [OpenAI][trulens_eval.feedback.provider.openai.OpenAI] LLM
             or [HuggingFace][trulens_eval.feedback.provider.hugs.Huggingface]
             NLI. Defaults to `OpenAI`.
+
+        statements_per_request: Number of statement sentences checked in each
+            LLM request by
+            [groundedness_measure_with_cot_reasons][trulens_eval.feedback.groundedness.Groundedness.groundedness_measure_with_cot_reasons].
+            Defaults to one request per sentence.
+    """
+
+    MAX_WORKERS: ClassVar[int] = 8
+    """Maximum number of statement sentences checked concurrently.
+    
+    Requests are additionally kept within the rate limits of the provider's
+    endpoint.
     """
 
     groundedness_provider: Provider
 
+    statements_per_request: int = 1
+    """Number of statement sentences checked in each LLM request.
+    
+    Checking several sentences at once reduces the number of requests and the
+    tokens spent on repeating the source but may reduce accuracy.
+    """
+
     def __init__(
         self, groundedness_provider: Optional[Provider] = None, **kwargs
     ):
@@ -109,28 +135,176 @@ class Groundedness(WithClassInfo, SerialModel):
         Returns:
             A measure between 0 and 1, where 1 means each sentence is grounded in the source.
         """
-        groundedness_scores = {}
         if not isinstance(self.groundedness_provider, LLMProvider):
             raise AssertionError(
                 "Only LLM providers are supported for groundedness_measure_with_cot_reasons."
             )
-        else:
-            hypotheses = sent_tokenize(statement)
-            reasons_str = ""
-            for i, hypothesis in enumerate(tqdm(
-                    hypotheses, desc="Groundedness per statement in source")):
-                reason = self.groundedness_provider._groundedness_doc_in_out(
+
+        hypotheses = sent_tokenize(statement)
+        batches = self._batches(hypotheses)
+
+        reasons = self._map_statements(
+            lambda batch: self._reasons_of_batch(source, batch),
+            batches,
+            desc="Groundedness per statement in source"
+        )
+
+        return self._scores_and_reasons(
+            [reason for batch_reasons in reasons for reason in batch_reasons]
+        )
+
+    async def agroundedness_measure_with_cot_reasons(
+        self, source: str, statement: str
+    ) -> Tuple[float, dict]:
+        """
+        Async version of
+        [groundedness_measure_with_cot_reasons][trulens_eval.feedback.groundedness.Groundedness.groundedness_measure_with_cot_reasons].
+        """
+        if not isinstance(self.groundedness_provider, LLMProvider):
+            raise AssertionError(
+                "Only LLM providers are supported for groundedness_measure_with_cot_reasons."
+            )
+
+        hypotheses = sent_tokenize(statement)
+        batches = self._batches(hypotheses)
+
+        reasons = await asyncio.gather(
+            *(self._areasons_of_batch(source, batch) for batch in batches)
+        )
+
+        return self._scores_and_reasons(
+            [reason for batch_reasons in reasons for reason in batch_reasons]
+        )
+
+    def _batches(self, hypotheses: List[str]) -> List[List[str]]:
+        """Split the given statement sentences into groups to be checked in one
+        request each."""
+
+        size = max(1, self.statements_per_request)
+
+        return [
+            hypotheses[i:i + size] for i in range(0, len(hypotheses), size)
+        ]
+
+    def _map_statements(
+        self, func: Callable[[A], T], items: Sequence[A], desc: str
+    ) -> List[T]:
+        """
+        Apply `func` to each of `items` concurrently, returning the results in
+        the order of `items`.
+        """
+
+        if len(items) <= 1 or self.MAX_WORKERS <= 1:
+            return [func(item) for item in tqdm(items, desc=desc)]
+
+        # A pool of our own instead of TP as this may already be running in a
+        # TP task (i.e. deferred evaluation) which must not wait on tasks
+        # behind it in the same pool.
+        with mod_threading_utils.ThreadPoolExecutor(
+                max_workers=min(self.MAX_WORKERS, len(items)),
+                thread_name_prefix="Groundedness") as executor:
+            return list(
+                tqdm(executor.map(func, items), total=len(items), desc=desc)
+            )
+
+    @staticmethod
+    def _split_reasons(response: str, count: int) -> Optional[List[str]]:
+        """
+        Split the response to a request checking `count` statement sentences
+        into the parts for each sentence. Returns None if the response does not
+        have the expected number of parts.
+        """
+
+        parts = [
+            part for part in re.split(r"(?=Statement Sentence:)", response)
+            if "Statement Sentence:" in part
+        ]
+
+        if len(parts) != count:
+            return None
+
+        return parts
+
+    def _reasons_of_batch(self, source: str, hypotheses: List[str]) -> List[str]:
+        """LLM responses checking each of the given statement sentences."""
+
+        if len(hypotheses) == 1:
+            return [
+                self.groundedness_provider._groundedness_doc_in_out(
+                    premise=source, hypothesis=hypotheses[0]
+                )
+            ]
+
+        response = self.groundedness_provider._groundedness_doc_in_out_batch(
+            premise=source, hypotheses=hypotheses
+        )
+        reasons = self._split_reasons(response, len(hypotheses))
+
+        if reasons is None:
+            logger.warning(
+                "Could not match response to %s statement sentences. "
+                "Checking them one at a time instead.", len(hypotheses)
+            )
+            reasons = [
+                self.groundedness_provider._groundedness_doc_in_out(
                     premise=source, hypothesis=hypothesis
+                ) for hypothesis in hypotheses
+            ]
+
+        return reasons
+
+    async def _areasons_of_batch(self, source: str,
+                                 hypotheses: List[str]) -> List[str]:
+        """
+        Async version of
+        [_reasons_of_batch][trulens_eval.feedback.groundedness.Groundedness._reasons_of_batch].
+        """
+
+        if len(hypotheses) == 1:
+            return [
+                await self.groundedness_provider._agroundedness_doc_in_out(
+                    premise=source, hypothesis=hypotheses[0]
                 )
-                score_line = next(
-                    (line for line in reason.split('\n') if "Score" in line),
-                    None
+            ]
+
+        response = await self.groundedness_provider._agroundedness_doc_in_out_batch(
+            premise=source, hypotheses=hypotheses
+        )
+        reasons = self._split_reasons(response, len(hypotheses))
+
+        if reasons is None:
+            logger.warning(
+                "Could not match response to %s statement sentences. "
+                "Checking them one at a time instead.", len(hypotheses)
+            )
+            reasons = await asyncio.gather(
+                *(
+                    self.groundedness_provider._agroundedness_doc_in_out(
+                        premise=source, hypothesis=hypothesis
+                    ) for hypothesis in hypotheses
                 )
-                if score_line:
-                    groundedness_scores[f"statement_{i}"
-                                       ] = re_0_10_rating(score_line) / 10
-                    reasons_str += f"\nSTATEMENT {i}:\n{reason}\n\n"
-            return groundedness_scores, {"reasons": reasons_str}
+            )
+
+        return reasons
+
+    @staticmethod
+    def _scores_and_reasons(reasons: List[str]) -> Tuple[Dict, dict]:
+        """Scores and reasons output of the groundedness measures from the LLM
+        responses for each statement sentence."""
+
+        groundedness_scores = {}
+        reasons_str = ""
+
+        for i, reason in enumerate(reasons):
+            score_line = next(
+                (line for line in reason.split('\n') if "Score" in line), None
+            )
+            if score_line:
+                groundedness_scores[f"statement_{i}"
+                                   ] = re_0_10_rating(score_line) / 10
+                reasons_str += f"\nSTATEMENT {i}:\n{reason}\n\n"
+
+        return groundedness_scores, {"reasons": reasons_str}
 
     def groundedness_measure_with_nli(self, source: str,
                                       statement: str) -> Tuple[float, dict]:
@@ -172,11 +346,13 @@ class Groundedness(WithClassInfo, SerialModel):
             if isinstance(source, list):
                 source = ' '.join(map(str, source))
             hypotheses = sent_tokenize(statement)
-            for i, hypothesis in enumerate(tqdm(
-                    hypotheses, desc="Groundendess per statement in source")):
-                score = self.groundedness_provider._doc_groundedness(
-                    premise=source, hypothesis=hypothesis
-                )
+            scores = self._map_statements(
+                lambda hypothesis: self.groundedness_provider.
+                _doc_groundedness(premise=source, hypothesis=hypothesis),
+                hypotheses,
+                desc="Groundendess per statement in source"
+            )
+            for i, (hypothesis, score) in enumerate(zip(hypotheses, scores)):
                 reason = reason + str.format(
                     prompts.GROUNDEDNESS_REASON_TEMPLATE,
                     statement_sentence=hypothesis,
@@ -241,17 +417,23 @@ class Groundedness(WithClassInfo, SerialModel):
         else:
             reason = ""
             hypotheses = sent_tokenize(statement)
-            for i, hypothesis in enumerate(tqdm(
-                    hypotheses, desc="Groundedness per statement in source")):
-                score = self.groundedness_provider._groundedness_doc_in_out(
-                    premise=source, hypothesis=hypothesis
-                )
+
+            def summarized_groundedness(hypothesis: str) -> Tuple[str, float]:
                 supporting_premise = self.groundedness_provider._find_relevant_string(
                     source, hypothesis
                 )
                 score = self.groundedness_provider._summarized_groundedness(
                     premise=supporting_premise, hypothesis=hypothesis
                 )
+                return supporting_premise, score
+
+            results = self._map_statements(
+                summarized_groundedness,
+                hypotheses,
+                desc="Groundedness per statement in source"
+            )
+            for i, (hypothesis, (supporting_premise, score)) in enumerate(
+                    zip(hypotheses, results)):
                 reason = reason + str.format(
                     prompts.GROUNDEDNESS_REASON_TEMPLATE,
                     statement_sentence=hypothesis,
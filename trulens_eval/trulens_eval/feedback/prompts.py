@@ -22,6 +22,11 @@ Supporting Evidence: {supporting_evidence}
 Score: {score} 
 """
 
+GROUNDEDNESS_BATCH_TEMPLATE = """
+The hypothesis has {count} statement sentences, one per line. Answer with the
+template below once for each of them, in the order given:
+"""
+
 LLM_GROUNDEDNESS_FULL_PROMPT = """Give me the INFORMATION OVERLAP of this SOURCE and STATEMENT.
 SOURCE: {premise}
 STATEMENT: {hypothesis}
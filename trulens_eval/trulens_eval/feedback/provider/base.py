@@ -1,8 +1,10 @@
+import asyncio
 import logging
-from typing import ClassVar, Dict, Optional, Sequence, Tuple
+from typing import ClassVar, Dict, List, Optional, Sequence, Tuple
 import warnings
 
 from trulens_eval.feedback import prompts
+from trulens_eval.feedback.provider import cache as mod_cache
 from trulens_eval.feedback.provider.endpoint import base as mod_endpoint
 from trulens_eval.utils import generated as mod_generated_utils
 from trulens_eval.utils.pyschema import WithClassInfo
@@ -92,11 +94,26 @@ class LLMProvider(Provider):
 
 """
 
+    DEFAULT_TEMPERATURE: ClassVar[Optional[float]] = None
+    """Temperature of chat completion requests that do not set one.
+    
+    None if it is left to the API's default which is then assumed to be
+    nonzero. Providers that send temperature 0 unless told otherwise set this
+    to 0.
+    """
+
     # NOTE(piotrm): "model_" prefix for attributes is "protected" by pydantic v2
     # by default. Need the below adjustment but this means we don't get any
     # warnings if we try to override some internal pydantic name.
     model_engine: str
 
+    response_cache: Optional[mod_cache.ResponseCache] = None
+    """Cache of responses to requests made at temperature 0.
+    
+    Requests are not cached if None. See
+    [ResponseCache][trulens_eval.feedback.provider.cache.ResponseCache].
+    """
+
     model_config: ClassVar[dict] = dict(protected_namespaces=())
 
     def __init__(self, *args, **kwargs):
@@ -124,11 +141,123 @@ class LLMProvider(Provider):
         raise NotImplementedError()
 
 
+    async def _acreate_chat_completion(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        **kwargs
+    ) -> str:
+        """
+        Async version of `_create_chat_completion`.
+
+        Providers with async clients override this. By default the synchronous
+        version is run in a thread.
+
+        Returns:
+            str: Completion model response.
+        """
+
+        return await asyncio.to_thread(
+            self._create_chat_completion,
+            prompt=prompt,
+            messages=messages,
+            **kwargs
+        )
+
+    def _response_cache_model(self) -> str:
+        """Name of the model responding to requests for the purposes of
+        response caching."""
+
+        return self.model_engine
+
+    def _effective_request(self, kwargs: Dict) -> Dict:
+        """
+        Arguments of the chat completion request made for the given `kwargs`
+        once provider-level settings are included, for the purposes of
+        response caching.
+
+        Providers with settings that change responses (i.e. temperature or API
+        base) override this.
+        """
+
+        return dict(kwargs)
+
+    def _response_cache_key(self, kwargs: Dict) -> Optional[str]:
+        """
+        Key of the response to a chat completion request with the given `kwargs`
+        in the response cache or None if it is not to be cached.
+
+        Only requests made at temperature 0 are cached. Requests not setting a
+        temperature use
+        [DEFAULT_TEMPERATURE][trulens_eval.feedback.provider.base.LLMProvider.DEFAULT_TEMPERATURE].
+        """
+
+        if self.response_cache is None or not mod_cache.ResponseCache.enabled():
+            return None
+
+        request = self._effective_request(kwargs)
+
+        if request.get("temperature", self.DEFAULT_TEMPERATURE) != 0.0:
+            return None
+
+        return mod_cache.ResponseCache.key(
+            provider=type(self).__name__,
+            model=self._response_cache_model(),
+            request=request
+        )
+
+    def _chat_completion_in_pace(self, **kwargs) -> str:
+        """
+        Run `_create_chat_completion` with the given `kwargs` at the pace of the
+        endpoint unless the response is already in the response cache.
+        """
+        assert self.endpoint is not None, "Endpoint is not set."
+
+        key = self._response_cache_key(kwargs)
+
+        if key is not None:
+            response = self.response_cache.get(key)
+            self.endpoint.handle_cache(hit=response is not None)
+            if response is not None:
+                return response
+
+        response = self.endpoint.run_in_pace(
+            func=self._create_chat_completion, **kwargs
+        )
+
+        if key is not None:
+            self.response_cache.put(key, response)
+
+        return response
+
+    async def _achat_completion_in_pace(self, **kwargs) -> str:
+        """
+        Async version of
+        [_chat_completion_in_pace][trulens_eval.feedback.provider.base.LLMProvider._chat_completion_in_pace].
+        """
+        assert self.endpoint is not None, "Endpoint is not set."
+
+        key = self._response_cache_key(kwargs)
+
+        if key is not None:
+            response = await asyncio.to_thread(self.response_cache.get, key)
+            self.endpoint.handle_cache(hit=response is not None)
+            if response is not None:
+                return response
+
+        response = await self.endpoint.arun_in_pace(
+            func=self._acreate_chat_completion, **kwargs
+        )
+
+        if key is not None:
+            await asyncio.to_thread(self.response_cache.put, key, response)
+
+        return response
+
     def _find_relevant_string(self, full_source: str, hypothesis: str) -> str:
         assert self.endpoint is not None, "Endpoint is not set."
 
-        return self.endpoint.run_in_pace(
-            func=self._create_chat_completion,
+        return self._chat_completion_in_pace(
             prompt=str.format(
                 prompts.SYSTEM_FIND_SUPPORTING,
                 prompt=full_source,
@@ -157,6 +286,35 @@ class LLMProvider(Provider):
             )
         )
 
+    def _groundedness_messages(
+        self, premise: str, hypotheses: Sequence[str]
+    ) -> List[Dict]:
+        """
+        Messages for an LLM request checking the given `hypotheses` against
+        the entire `premise`. Responses follow
+        [GROUNDEDNESS_REASON_TEMPLATE][trulens_eval.feedback.prompts.GROUNDEDNESS_REASON_TEMPLATE]
+        once per hypothesis.
+        """
+
+        if len(hypotheses) == 1:
+            hypothesis = hypotheses[0]
+            template = prompts.GROUNDEDNESS_REASON_TEMPLATE
+        else:
+            hypothesis = "\n".join(hypotheses)
+            template = str.format(
+                prompts.GROUNDEDNESS_BATCH_TEMPLATE, count=len(hypotheses)
+            ) + prompts.GROUNDEDNESS_REASON_TEMPLATE
+
+        system_prompt = prompts.LLM_GROUNDEDNESS_SYSTEM
+        llm_messages = [{"role": "system", "content": system_prompt}]
+        user_prompt = prompts.LLM_GROUNDEDNESS_USER.format(
+            premise="""{}""".format(premise),
+            hypothesis="""{}""".format(hypothesis)
+        ) + template
+        llm_messages.append({"role": "user", "content": user_prompt})
+
+        return llm_messages
+
     def _groundedness_doc_in_out(self, premise: str, hypothesis: str) -> str:
         """
         An LLM prompt using the entire document for premise and entire statement
@@ -172,15 +330,51 @@ class LLMProvider(Provider):
         """
         assert self.endpoint is not None, "Endpoint is not set."
 
-        system_prompt = prompts.LLM_GROUNDEDNESS_SYSTEM
-        llm_messages = [{"role": "system", "content": system_prompt}]
-        user_prompt = prompts.LLM_GROUNDEDNESS_USER.format(
-            premise="""{}""".format(premise),
-            hypothesis="""{}""".format(hypothesis)
-        ) + prompts.GROUNDEDNESS_REASON_TEMPLATE
-        llm_messages.append({"role": "user", "content": user_prompt})
-        return self.endpoint.run_in_pace(
-            func=self._create_chat_completion, messages=llm_messages
+        return self._chat_completion_in_pace(
+            messages=self._groundedness_messages(premise, [hypothesis])
+        )
+
+    async def _agroundedness_doc_in_out(
+        self, premise: str, hypothesis: str
+    ) -> str:
+        """
+        Async version of
+        [_groundedness_doc_in_out][trulens_eval.feedback.provider.base.LLMProvider._groundedness_doc_in_out].
+        """
+        assert self.endpoint is not None, "Endpoint is not set."
+
+        return await self._achat_completion_in_pace(
+            messages=self._groundedness_messages(premise, [hypothesis])
+        )
+
+    def _groundedness_doc_in_out_batch(
+        self, premise: str, hypotheses: Sequence[str]
+    ) -> str:
+        """
+        Like
+        [_groundedness_doc_in_out][trulens_eval.feedback.provider.base.LLMProvider._groundedness_doc_in_out]
+        but checks several hypotheses in one request.
+
+        Returns:
+            An LLM response using a scorecard template for each hypothesis.
+        """
+        assert self.endpoint is not None, "Endpoint is not set."
+
+        return self._chat_completion_in_pace(
+            messages=self._groundedness_messages(premise, hypotheses)
+        )
+
+    async def _agroundedness_doc_in_out_batch(
+        self, premise: str, hypotheses: Sequence[str]
+    ) -> str:
+        """
+        Async version of
+        [_groundedness_doc_in_out_batch][trulens_eval.feedback.provider.base.LLMProvider._groundedness_doc_in_out_batch].
+        """
+        assert self.endpoint is not None, "Endpoint is not set."
+
+        return await self._achat_completion_in_pace(
+            messages=self._groundedness_messages(premise, hypotheses)
         )
 
     def generate_score(
@@ -211,8 +405,7 @@ class LLMProvider(Provider):
         if user_prompt is not None:
             llm_messages.append({"role": "user", "content": user_prompt})
 
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion,
+        response = self._chat_completion_in_pace(
             messages=llm_messages,
             temperature=temperature
         )
@@ -248,11 +441,69 @@ class LLMProvider(Provider):
         llm_messages = [{"role": "system", "content": system_prompt}]
         if user_prompt is not None:
             llm_messages.append({"role": "user", "content": user_prompt})
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion,
+        response = self._chat_completion_in_pace(
+            messages=llm_messages,
+            temperature=temperature
+        )
+
+        return self._score_and_reasons_of_response(response, normalize=normalize)
+
+    async def agenerate_score(
+        self,
+        system_prompt: str,
+        user_prompt: Optional[str] = None,
+        normalize: float = 10.0,
+        temperature: float = 0.0,
+    ) -> float:
+        """
+        Async version of
+        [generate_score][trulens_eval.feedback.provider.base.LLMProvider.generate_score].
+        """
+        assert self.endpoint is not None, "Endpoint is not set."
+
+        llm_messages = [{"role": "system", "content": system_prompt}]
+        if user_prompt is not None:
+            llm_messages.append({"role": "user", "content": user_prompt})
+
+        response = await self._achat_completion_in_pace(
+            messages=llm_messages,
+            temperature=temperature
+        )
+
+        return mod_generated_utils.re_0_10_rating(response) / normalize
+
+    async def agenerate_score_and_reasons(
+        self,
+        system_prompt: str,
+        user_prompt: Optional[str] = None,
+        normalize: float = 10.0,
+        temperature: float = 0.0
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [generate_score_and_reasons][trulens_eval.feedback.provider.base.LLMProvider.generate_score_and_reasons].
+        """
+        assert self.endpoint is not None, "Endpoint is not set."
+
+        llm_messages = [{"role": "system", "content": system_prompt}]
+        if user_prompt is not None:
+            llm_messages.append({"role": "user", "content": user_prompt})
+
+        response = await self._achat_completion_in_pace(
             messages=llm_messages,
             temperature=temperature
         )
+
+        return self._score_and_reasons_of_response(response, normalize=normalize)
+
+    def _score_and_reasons_of_response(
+        self, response: str, normalize: float = 10.0
+    ) -> Tuple[float, Dict]:
+        """
+        Extract the score and reasons from an LLM response to a chain of thought
+        prompt.
+        """
+
         if "Supporting Evidence" in response:
             score = -1
             supporting_evidence = None
@@ -414,6 +665,45 @@ class LLMProvider(Provider):
 
         return self.context_relevance_with_cot_reasons(question, context)
 
+    async def acontext_relevance(
+        self, question: str, context: str, temperature: float = 0.0
+    ) -> float:
+        """
+        Async version of
+        [context_relevance][trulens_eval.feedback.provider.base.LLMProvider.context_relevance].
+        """
+
+        return await self.agenerate_score(
+            system_prompt=prompts.CONTEXT_RELEVANCE_SYSTEM,
+            user_prompt=str.format(
+                prompts.CONTEXT_RELEVANCE_USER,
+                question=question,
+                context=context
+            ),
+            temperature=temperature
+        )
+
+    async def acontext_relevance_with_cot_reasons(
+        self, question: str, context: str, temperature: float = 0.0
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [context_relevance_with_cot_reasons][trulens_eval.feedback.provider.base.LLMProvider.context_relevance_with_cot_reasons].
+        """
+        system_prompt = prompts.CONTEXT_RELEVANCE_SYSTEM
+        user_prompt = str.format(
+            prompts.CONTEXT_RELEVANCE_USER, question=question, context=context
+        )
+        user_prompt = user_prompt.replace(
+            "RELEVANCE:", prompts.COT_REASONS_TEMPLATE
+        )
+
+        return await self.agenerate_score_and_reasons(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature
+        )
+
     def relevance(self, prompt: str, response: str) -> float:
         """
         Uses chat completion model. A function that completes a
@@ -500,6 +790,34 @@ class LLMProvider(Provider):
         )
         return self.generate_score_and_reasons(system_prompt, user_prompt)
 
+    async def arelevance(self, prompt: str, response: str) -> float:
+        """
+        Async version of
+        [relevance][trulens_eval.feedback.provider.base.LLMProvider.relevance].
+        """
+        return await self.agenerate_score(
+            system_prompt=prompts.ANSWER_RELEVANCE_SYSTEM,
+            user_prompt=str.format(
+                prompts.ANSWER_RELEVANCE_USER, prompt=prompt, response=response
+            )
+        )
+
+    async def arelevance_with_cot_reasons(self, prompt: str,
+                                          response: str) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [relevance_with_cot_reasons][trulens_eval.feedback.provider.base.LLMProvider.relevance_with_cot_reasons].
+        """
+        system_prompt = prompts.ANSWER_RELEVANCE_SYSTEM
+
+        user_prompt = str.format(
+            prompts.ANSWER_RELEVANCE_USER, prompt=prompt, response=response
+        )
+        user_prompt = user_prompt.replace(
+            "RELEVANCE:", prompts.COT_REASONS_TEMPLATE
+        )
+        return await self.agenerate_score_and_reasons(system_prompt, user_prompt)
+
     def sentiment(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -1152,8 +1470,7 @@ class LLMProvider(Provider):
 
         assert self.endpoint is not None, "Endpoint is not set."
 
-        return self.endpoint.run_in_pace(
-            func=self._create_chat_completion,
+        return self._chat_completion_in_pace(
             prompt=(prompts.AGREEMENT_SYSTEM % (prompt, check_response)) +
             response
         )
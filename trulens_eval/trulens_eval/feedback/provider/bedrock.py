@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import ClassVar, Dict, Optional, Sequence, Tuple, Union
 
@@ -33,6 +34,9 @@ class Bedrock(LLMProvider):
 
     DEFAULT_MODEL_ID: ClassVar[str] = "amazon.titan-text-express-v1"
 
+    # Requests are always made at temperature 0.
+    DEFAULT_TEMPERATURE: ClassVar[Optional[float]] = 0.0
+
     # LLMProvider requirement which we do not use:
     model_engine: str = "Bedrock"
 
@@ -190,6 +194,33 @@ class Bedrock(LLMProvider):
 
         return response_body
 
+    # overwrite base to distinguish bedrock models in the response cache
+    def _response_cache_model(self) -> str:
+        return self.model_id
+
+    # overwrite base as requests are always made at temperature 0 whatever the
+    # arguments
+    def _effective_request(self, kwargs: Dict) -> Dict:
+        return dict(kwargs, temperature=0.0)
+
+    # overwrite base as boto3 has no asyncio interface; requests are made in a
+    # thread instead
+    async def _acreate_chat_completion(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        temperature: float = 0.0,
+        **kwargs
+    ) -> str:
+        if temperature != 0.0:
+            logger.warning(
+                "The `temperature` argument is ignored for Bedrock provider."
+            )
+
+        return await asyncio.to_thread(
+            self._create_chat_completion, prompt=prompt, messages=messages
+        )
+
     # overwrite base to use prompt instead of messages
     def generate_score(
         self,
@@ -221,9 +252,7 @@ class Bedrock(LLMProvider):
         if user_prompt is not None:
             llm_messages.append({"role": "user", "content": user_prompt})
 
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion, messages=llm_messages
-        )
+        response = self._chat_completion_in_pace(messages=llm_messages)
 
         return re_0_10_rating(response) / normalize
 
@@ -260,9 +289,14 @@ class Bedrock(LLMProvider):
         if user_prompt is not None:
             llm_messages.append({"role": "user", "content": user_prompt})
 
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion, messages=llm_messages
-        )
+        response = self._chat_completion_in_pace(messages=llm_messages)
+
+        return self._score_and_reasons_of_response(response, normalize=normalize)
+
+    # overwrite base to parse the responses of bedrock models
+    def _score_and_reasons_of_response(
+        self, response: str, normalize: float = 10.0
+    ) -> Union[float, Tuple[float, Dict]]:
         if "Supporting Evidence" in response:
             score = 0.0
             supporting_evidence = None
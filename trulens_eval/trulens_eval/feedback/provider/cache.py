@@ -0,0 +1,249 @@
+"""
+# Persistent cache of LLM responses
+
+Feedback functions that ask an LLM for a judgement at temperature 0 are
+expected to produce the same response for the same request. Re-running the same
+feedback definitions over a fixed set of records, or retrying deferred feedback,
+would otherwise re-issue identical requests.
+
+[ResponseCache][trulens_eval.feedback.provider.cache.ResponseCache] stores
+responses in an sqlite database keyed by a hash of everything that determines
+the response. Set it as the `response_cache` of an
+[LLMProvider][trulens_eval.feedback.provider.base.LLMProvider] to use it:
+
+```python
+from trulens_eval.feedback.provider.cache import ResponseCache
+from trulens_eval.feedback.provider.openai import OpenAI
+
+provider = OpenAI(response_cache=ResponseCache(path="responses.sqlite"))
+```
+
+Use [bypass_response_cache][trulens_eval.feedback.provider.cache.bypass_response_cache]
+to make requests without looking at or updating any cache.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple
+
+from pydantic import Field
+
+from trulens_eval.utils.serial import SerialModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESPONSE_CACHE_FILE: str = "responses.sqlite"
+"""Filename for the default response cache database."""
+
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES: int = 100_000
+"""Default number of responses kept before the least recently used ones are
+evicted."""
+
+_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "bypass_response_cache", default=False
+)
+"""Whether response caches are bypassed in the current context."""
+
+
+@contextmanager
+def bypass_response_cache() -> Iterator[None]:
+    """
+    Context manager within which LLM requests neither read from nor write to any
+    response cache.
+
+    !!! example
+
+        ```python
+        with bypass_response_cache():
+            provider.relevance(prompt, response)
+        ```
+    """
+
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+class ResponseCache(SerialModel):
+    """
+    Content-addressed cache of LLM responses stored in sqlite.
+
+    Only requests made at temperature 0 are cached. Entries are evicted in least
+    recently used order once there are more than
+    [max_entries][trulens_eval.feedback.provider.cache.ResponseCache.max_entries]
+    of them. The database may be shared by several processes.
+    """
+
+    path: str = DEFAULT_RESPONSE_CACHE_FILE
+    """Path of the sqlite database file."""
+
+    max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES
+    """Maximum number of responses kept."""
+
+    evict_every: int = Field(100, exclude=True)
+    """Check for eviction every this many stores."""
+
+    _connections: ClassVar[Dict[str, Tuple[sqlite3.Connection,
+                                           threading.Lock]]] = {}
+    """Connections shared by caches of the same file in this process, and the
+    locks serializing their use."""
+
+    _connections_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    _stores: ClassVar[Dict[str, int]] = {}
+    """Number of stores into each file by this process since the last eviction
+    check."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # Make sure the database can be opened.
+        self._connection()
+
+    def _connection(self) -> Tuple[sqlite3.Connection, threading.Lock]:
+        """The connection to this cache's database and its lock."""
+
+        path = os.path.abspath(self.path)
+
+        with ResponseCache._connections_lock:
+            if path in ResponseCache._connections:
+                return ResponseCache._connections[path]
+
+            conn = sqlite3.connect(
+                path, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "response TEXT NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_used "
+                "ON responses (last_used)"
+            )
+
+            ResponseCache._connections[path] = (conn, threading.Lock())
+            ResponseCache._stores[path] = 0
+
+            return ResponseCache._connections[path]
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether caches are used in the current context. See
+        [bypass_response_cache][trulens_eval.feedback.provider.cache.bypass_response_cache]."""
+
+        return not _bypass.get()
+
+    @staticmethod
+    def key(provider: str, model: str, request: Dict[str, Any]) -> str:
+        """
+        Cache key for a request made with the given arguments by the named
+        provider class to the given model.
+
+        Args:
+            provider: Name of the provider class making the request.
+
+            model: Model the request is made to.
+
+            request: Arguments of the request including messages or prompt and
+                temperature.
+        """
+
+        content = json.dumps(
+            dict(provider=provider, model=model, request=request),
+            sort_keys=True,
+            default=str
+        )
+
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the cached response for `key` or None if there is none."""
+
+        conn, lock = self._connection()
+
+        with lock:
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                (time.time(), key)
+            )
+
+        return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """Store `response` for `key`, evicting least recently used responses
+        if needed."""
+
+        if not isinstance(response, str):
+            return
+
+        path = os.path.abspath(self.path)
+        conn, lock = self._connection()
+
+        with lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, last_used) "
+                "VALUES (?, ?, ?)", (key, response, time.time())
+            )
+
+            ResponseCache._stores[path] += 1
+            if ResponseCache._stores[path] < self.evict_every:
+                return
+
+            ResponseCache._stores[path] = 0
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete the least recently used responses beyond
+        [max_entries][trulens_eval.feedback.provider.cache.ResponseCache.max_entries]."""
+
+        (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        excess = count - self.max_entries
+
+        if excess <= 0:
+            return
+
+        logger.debug("Evicting %s cached response(s).", excess)
+
+        conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY last_used ASC LIMIT ?)",
+            (excess,)
+        )
+
+    def __len__(self) -> int:
+        conn, lock = self._connection()
+
+        with lock:
+            (count,) = conn.execute("SELECT COUNT(*) FROM responses"
+                                   ).fetchone()
+
+        return count
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+
+        conn, lock = self._connection()
+
+        with lock:
+            conn.execute("DELETE FROM responses")
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
+import contextvars
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 import functools
+import hashlib
 import inspect
 import logging
+import os
 from pprint import PrettyPrinter
 import random
 import sys
+import time
 from time import sleep
 from types import ModuleType
 from typing import (Any, Awaitable, Callable, ClassVar, Dict, List, Optional,
                     Sequence, Tuple, Type, TypeVar)
+import warnings
 
 from pydantic import Field
+from pydantic import PrivateAttr
 import requests
 
 from trulens_eval.schema import base as mod_base_schema
@@ -23,7 +31,7 @@ from trulens_eval.utils.pyschema import safe_getattr
 from trulens_eval.utils.pyschema import WithClassInfo
 from trulens_eval.utils.python import callable_name
 from trulens_eval.utils.python import class_name
-from trulens_eval.utils.python import get_first_local_in_call_stack
+from trulens_eval.utils.python import get_first_local_in_call_context
 from trulens_eval.utils.python import is_really_coroutinefunction
 from trulens_eval.utils.python import locals_except
 from trulens_eval.utils.python import module_name
@@ -48,6 +56,119 @@ INSTRUMENT = "__tru_instrument"
 DEFAULT_RPM = 60
 """Default requests per minute for endpoints."""
 
+_tracked_endpoints: contextvars.ContextVar[
+    Dict[Type[EndpointCallback], List[Tuple[Endpoint, EndpointCallback]]]
+] = contextvars.ContextVar("tracked_endpoints")
+"""Endpoints and their callbacks expecting to be notified of wrapped API calls
+in the current context.
+
+Set by [_track_costs][trulens_eval.feedback.provider.endpoint.base.Endpoint._track_costs]
+and read by the wrappers created by
+[wrap_function][trulens_eval.feedback.provider.endpoint.base.Endpoint.wrap_function].
+"""
+
+
+def _environ() -> Dict:
+    """The process environment as a dict that is cheap to compare."""
+
+    # The underlying dict of os.environ compares much faster than the mapping
+    # itself which goes through python-level item access.
+    return getattr(os.environ, "_data", os.environ)
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """Get the `name` header from `headers` in any letter case."""
+
+    if headers is None:
+        return None
+
+    try:
+        # httpx and requests headers are case-insensitive already.
+        value = headers.get(name)
+        if value is None and isinstance(headers, Dict):
+            value = {k.lower(): v for k, v in headers.items()}.get(name)
+        return value
+
+    except Exception:
+        return None
+
+
+def retry_after_of_headers(headers: Any) -> Optional[float]:
+    """
+    Seconds to wait before retrying as indicated by the given response headers,
+    or None if they do not say.
+
+    Reads `retry-after-ms` (used by openai) and `retry-after` given in seconds
+    or as an HTTP date.
+    """
+
+    value = _header(headers, "retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000.0)
+        except ValueError:
+            pass
+
+    value = _header(headers, "retry-after")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        at = parsedate_to_datetime(value)
+        return max(0.0, at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def api_key_fingerprint(api_key: str) -> str:
+    """Short hash of an API key for telling keys apart without storing them."""
+
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def rate_limit_of_error(error: Exception) -> Tuple[bool, Optional[float]]:
+    """
+    Determine whether the given API error is a rate limit response and if so,
+    how many seconds to wait before retrying if the response says.
+
+    Recognizes HTTP 429 responses as raised by openai, litellm and requests, and
+    throttling errors raised by boto3.
+    """
+
+    try:
+        response = getattr(error, "response", None)
+    except Exception:
+        response = None
+
+    if isinstance(response, Dict):
+        # botocore ClientError
+        code = response.get("Error", {}).get("Code")
+        metadata = response.get("ResponseMetadata", {})
+        if code in ["ThrottlingException", "TooManyRequestsException"
+                   ] or metadata.get("HTTPStatusCode") == 429:
+            return True, retry_after_of_headers(metadata.get("HTTPHeaders"))
+
+        return False, None
+
+    status = getattr(error, "status_code", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+
+    if status != 429 and type(error).__name__ not in ["RateLimitError",
+                                                      "ThrottlingException"]:
+        return False, None
+
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        headers = getattr(error, "headers", None)
+
+    return True, retry_after_of_headers(headers)
+
 
 class EndpointCallback(SerialModel):
     """
@@ -81,6 +202,13 @@ class EndpointCallback(SerialModel):
         """Called after each classification response."""
         self.handle(response)
 
+    def handle_cache(self, hit: bool) -> None:
+        """Called after looking up a request in a response cache."""
+        if hit:
+            self.cost.n_cache_hits += 1
+        else:
+            self.cost.n_cache_misses += 1
+
 
 class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
     """API usage, pacing, and utilities for API endpoints."""
@@ -121,6 +249,25 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         )
     ]
 
+    _resolved_endpoints: ClassVar[Dict[str, Endpoint]] = {}
+    """Endpoints created for
+    [ENDPOINT_SETUPS][trulens_eval.feedback.provider.endpoint.base.Endpoint.ENDPOINT_SETUPS],
+    keyed by their `arg_flag`.
+    
+    Reused as long as they remain the singletons of their class.
+    """
+
+    _unavailable_endpoints: ClassVar[Dict[str, Optional[Dict]]] = {}
+    """Endpoints of
+    [ENDPOINT_SETUPS][trulens_eval.feedback.provider.endpoint.base.Endpoint.ENDPOINT_SETUPS]
+    that could not be used, keyed by their `arg_flag`.
+    
+    Value is `None` if the endpoint's module or class could not be imported.
+    These are not retried. Otherwise the endpoint could not be created,
+    likely due to missing keys, and the value is the environment at the time.
+    These are retried once the environment changes.
+    """
+
     instrumented_methods: ClassVar[Dict[Any, List[Tuple[Callable, Callable, Type[Endpoint]]]]] \
         = defaultdict(list)
     """Mapping of classe/module-methods that have been instrumented for cost
@@ -150,12 +297,25 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
     post_headers: Dict[str, str] = Field(default_factory=dict, exclude=True)
     """Optional post headers for post requests if done by this class."""
 
+    tpm: Optional[float] = None
+    """Tokens per minute. Tokens are not limited if None."""
+
     pace: mod_pace.Pace = Field(
         default_factory=lambda:
         mod_pace.Pace(marks_per_second=DEFAULT_RPM / 60.0, seconds_per_period=60.0),
         exclude=True
     )
-    """Pacing instance to maintain a desired rpm."""
+    """Pacing instance to maintain a desired rpm.
+    
+    Requests are now paced by
+    [limiter][trulens_eval.feedback.provider.endpoint.base.Endpoint.limiter]
+    instead. A pace given to the constructor only sets `rpm` if that is not
+    given.
+    """
+
+    _limiter: Optional[mod_pace.RateLimiter] = PrivateAttr(None)
+    """Rate limiter, created on first use. See
+    [limiter][trulens_eval.feedback.provider.endpoint.base.Endpoint.limiter]."""
 
     global_callback: EndpointCallback = Field(
         exclude=True
@@ -205,14 +365,26 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
             #    "Endpoint has to be extended by class that can set `callback_class`."
             #)
 
+        pace = kwargs.pop('pace', None)
+        if pace is not None:
+            warnings.warn(
+                "The `pace` argument of endpoints is deprecated. "
+                "Use `rpm` instead.", DeprecationWarning
+            )
+            if rpm is None:
+                # Requests are paced by the limiter so the pace given is only
+                # used for its rate.
+                rpm = pace.marks_per_second * 60.0
+
         if rpm is None:
             rpm = DEFAULT_RPM
 
         kwargs['name'] = name
+        kwargs['rpm'] = rpm
         kwargs['callback_class'] = callback_class
         kwargs['global_callback'] = callback_class(endpoint=self)
         kwargs['callback_name'] = f"callback_{name}"
-        kwargs['pace'] = mod_pace.Pace(
+        kwargs['pace'] = pace or mod_pace.Pace(
             seconds_per_period=60.0,  # 1 minute
             marks_per_second=rpm / 60.0
         )
@@ -224,14 +396,104 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         # Extending class should call _instrument_module on the appropriate
         # modules and methods names.
 
-    def pace_me(self) -> float:
+    @property
+    def limiter(self) -> mod_pace.RateLimiter:
+        """Rate limiter for requests to this endpoint.
+        
+        Shared with all endpoints using the same API key (see
+        [_limiter_key][trulens_eval.feedback.provider.endpoint.base.Endpoint._limiter_key])
+        as rate limits are applied by APIs per key.
+        """
+
+        if self._limiter is None:
+            limiter = mod_pace.RateLimiter.shared(
+                key=self._limiter_key(), rpm=self.rpm, tpm=self.tpm
+            )
+            limiter.observe(self.name, self.global_callback.cost.n_tokens)
+            self._limiter = limiter
+
+        return self._limiter
+
+    def _limiter_key(self) -> str:
+        """Key identifying the rate limits that apply to this endpoint.
+        
+        Subclasses should override this to identify the API key in use.
         """
-        Block until we can make a request to this endpoint to keep pace with
-        maximum rpm. Returns time in seconds since last call to this method
-        returned.
+
+        return self.name
+
+    def _estimate_tokens(self, kwargs: Dict[str, Any]) -> float:
+        """
+        Estimate the tokens a request made with the given `kwargs` will use.
+
+        Prompt tokens are estimated from the size of the `prompt` or `messages`
+        arguments if given and completion tokens from the average of prior
+        requests as tracked by the global callback.
         """
 
-        return self.pace.mark()
+        if self.tpm is None:
+            return 0.0
+
+        cost = self.global_callback.cost
+        n_requests = max(1, cost.n_successful_requests)
+
+        chars = 0
+        prompt = kwargs.get("prompt")
+        if isinstance(prompt, str):
+            chars += len(prompt)
+
+        messages = kwargs.get("messages")
+        if isinstance(messages, Sequence):
+            for message in messages:
+                if isinstance(message, Dict):
+                    chars += len(str(message.get("content", "")))
+
+        if chars == 0:
+            return cost.n_tokens / n_requests
+
+        # Roughly 4 characters per token for English text.
+        return chars / 4.0 + cost.n_completion_tokens / n_requests
+
+    def _settle_tokens(self, estimated: float) -> None:
+        """Correct the tokens estimated for a finished request with the usage
+        tracked by the global callback."""
+
+        self.limiter.settle(
+            source=self.name,
+            observed=self.global_callback.cost.n_tokens,
+            estimated=estimated
+        )
+
+    def pace_me(self, tokens: float = 0.0) -> float:
+        """
+        Block until we can make a request of `tokens` tokens to this endpoint
+        to keep within its rpm and tpm. Returns time in seconds waited.
+        """
+
+        return self.limiter.acquire(tokens)
+
+    def handle_cache(self, hit: bool) -> None:
+        """
+        Notify the global callback and the callbacks tracking costs in the
+        current context of a response cache lookup for a request to this
+        endpoint.
+        """
+
+        self.global_callback.handle_cache(hit)
+
+        endpoints: Optional[Dict[Type[EndpointCallback], Sequence[Tuple[Endpoint, EndpointCallback]]]] = \
+            get_first_local_in_call_context(
+                _tracked_endpoints,
+                key="endpoints",
+                func=self.__find_tracker,
+                offset=0
+            )
+
+        if endpoints is None:
+            return
+
+        for _, callback in endpoints.get(self.callback_class, []):
+            callback.handle_cache(hit)
 
     def post(
         self,
@@ -239,10 +501,30 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         payload: JSON,
         timeout: float = DEFAULT_NETWORK_TIMEOUT
     ) -> Any:
-        self.pace_me()
-        ret = requests.post(
-            url, json=payload, timeout=timeout, headers=self.post_headers
-        )
+        for _ in range(self.retries + 1):
+            self.pace_me()
+            ret = requests.post(
+                url, json=payload, timeout=timeout, headers=self.post_headers
+            )
+
+            if ret.status_code != 429:
+                break
+
+            delay = self.limiter.rate_limited(
+                retry_after_of_headers(ret.headers)
+            )
+            logger.warning(
+                "%s request was rate limited. Blocking requests for %.1f second(s).",
+                self.name, delay
+            )
+
+        else:
+            raise RuntimeError(
+                f"Endpoint {self.name} request was rate limited "
+                f"{self.retries+1} time(s)."
+            )
+
+        self.limiter.succeeded()
 
         j = ret.json()
 
@@ -275,10 +557,32 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         else:
             return j
 
+    def _retry_delay(self, error: Exception, retry_delay: float) -> float:
+        """
+        Handle a failed request. Returns the seconds to sleep before retrying
+        or 0.0 if the request was rate limited in which case the shared
+        limiter blocks the retry and other requests instead.
+        """
+
+        limited, retry_after = rate_limit_of_error(error)
+
+        if limited:
+            delay = self.limiter.rate_limited(retry_after)
+            logger.warning(
+                "%s request was rate limited. Blocking requests for %.1f second(s).",
+                self.name, delay
+            )
+            return 0.0
+
+        # Jitter so that requests failing together do not retry together.
+        return random.uniform(retry_delay / 2.0, retry_delay)
+
     def run_in_pace(self, func: Callable[[A], B], *args, **kwargs) -> B:
         """
         Run the given `func` on the given `args` and `kwargs` at pace with the
-        endpoint-specified rpm. Failures will be retried `self.retries` times.
+        endpoint-specified rpm and tpm. Failures will be retried `self.retries`
+        times. Rate limit responses block requests to all endpoints sharing the
+        same limiter until the API accepts requests again.
         """
 
         retries = self.retries + 1
@@ -286,10 +590,65 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
 
         errors = []
 
+        tokens = self._estimate_tokens(kwargs)
+
         while retries > 0:
             try:
-                self.pace_me()
+                self.pace_me(tokens)
                 ret = func(*args, **kwargs)
+                self.limiter.succeeded()
+                self._settle_tokens(tokens)
+                return ret
+
+            except Exception as e:
+                retries -= 1
+                logger.error(
+                    "%s request failed %s=%s. Retries remaining=%s.", self.name,
+                    type(e), e, retries
+                )
+                errors.append(e)
+                self.limiter.refund(tokens)
+                delay = self._retry_delay(e, retry_delay)
+                if retries > 0:
+                    sleep(delay)
+                    retry_delay *= 2
+
+        raise RuntimeError(
+            f"Endpoint {self.name} request failed {self.retries+1} time(s): \n\t"
+            + ("\n\t".join(map(str, errors)))
+        )
+
+    async def apace_me(self, tokens: float = 0.0) -> float:
+        """
+        Async version of
+        [pace_me][trulens_eval.feedback.provider.endpoint.base.Endpoint.pace_me].
+        Waits for a turn without blocking the event loop.
+        """
+
+        return await self.limiter.aacquire(tokens)
+
+    async def arun_in_pace(
+        self, func: Callable[[A], Awaitable[B]], *args, **kwargs
+    ) -> B:
+        """
+        Async version of
+        [run_in_pace][trulens_eval.feedback.provider.endpoint.base.Endpoint.run_in_pace]
+        for coroutine functions `func`.
+        """
+
+        retries = self.retries + 1
+        retry_delay = 2.0
+
+        errors = []
+
+        tokens = self._estimate_tokens(kwargs)
+
+        while retries > 0:
+            try:
+                await self.apace_me(tokens)
+                ret = await func(*args, **kwargs)
+                self.limiter.succeeded()
+                self._settle_tokens(tokens)
                 return ret
 
             except Exception as e:
@@ -299,8 +658,10 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
                     type(e), e, retries
                 )
                 errors.append(e)
+                self.limiter.refund(tokens)
+                delay = self._retry_delay(e, retry_delay)
                 if retries > 0:
-                    sleep(retry_delay)
+                    await asyncio.sleep(delay)
                     retry_delay *= 2
 
         raise RuntimeError(
@@ -444,37 +805,115 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         execution of thunk.
         """
 
+        endpoints = Endpoint.available_endpoints(
+            with_openai=with_openai,
+            with_hugs=with_hugs,
+            with_litellm=with_litellm,
+            with_bedrock=with_bedrock
+        )
+
+        return Endpoint._track_costs(
+            __func, *args, with_endpoints=endpoints, **kwargs
+        )
+
+    @staticmethod
+    def available_endpoints(**flags: bool) -> List[Endpoint]:
+        """
+        Get the endpoints of
+        [ENDPOINT_SETUPS][trulens_eval.feedback.provider.endpoint.base.Endpoint.ENDPOINT_SETUPS]
+        that can be created.
+
+        Endpoints are resolved once and reused afterwards. Endpoints that could
+        not be imported are not retried and those that could not be created
+        (usually due to missing keys) are retried only after the environment
+        changes.
+
+        Args:
+            **flags: Setting an endpoint's `arg_flag` (i.e. `with_openai`) to
+                `False` excludes it.
+        """
+
         endpoints = []
 
-        for endpoint in Endpoint.ENDPOINT_SETUPS:
-            if locals().get(endpoint.arg_flag):
-                try:
-                    mod = __import__(
-                        endpoint.module_name, fromlist=[endpoint.class_name]
-                    )
-                    cls = safe_getattr(mod, endpoint.class_name)
-                except Exception:
-                    # If endpoint uses optional packages, will get either module
-                    # not found error, or we will have a dummy which will fail
-                    # at getattr. Skip either way.
+        # Environment is only looked at if there are endpoints to retry.
+        environ = None
+
+        for setup in Endpoint.ENDPOINT_SETUPS:
+            if not flags.get(setup.arg_flag, True):
+                continue
+
+            endpoint = Endpoint._resolved_endpoints.get(setup.arg_flag)
+            if endpoint is not None and \
+                    id(endpoint) in SingletonPerName._id_to_name_map:
+                endpoints.append(endpoint)
+                continue
+
+            if setup.arg_flag in Endpoint._unavailable_endpoints:
+                failed_environ = Endpoint._unavailable_endpoints[setup.arg_flag]
+                if failed_environ is None:
                     continue
 
-                try:
-                    e = cls()
-                    endpoints.append(e)
+                if environ is None:
+                    environ = _environ()
 
-                except Exception as e:
-                    logger.debug(
-                        "Could not initialize endpoint %s. "
-                        "Possibly missing key(s). "
-                        "trulens_eval will not track costs/usage of this endpoint. %s",
-                        cls.__name__,
-                        e,
-                    )
+                if failed_environ == environ:
+                    continue
 
-        return Endpoint._track_costs(
-            __func, *args, with_endpoints=endpoints, **kwargs
-        )
+            endpoint = Endpoint._resolve_endpoint(setup)
+            if endpoint is not None:
+                endpoints.append(endpoint)
+
+        return endpoints
+
+    @staticmethod
+    def _resolve_endpoint(setup: EndpointSetup) -> Optional[Endpoint]:
+        """
+        Import and create the endpoint of the given setup, recording the result
+        for
+        [available_endpoints][trulens_eval.feedback.provider.endpoint.base.Endpoint.available_endpoints].
+        """
+
+        Endpoint._resolved_endpoints.pop(setup.arg_flag, None)
+
+        try:
+            mod = __import__(setup.module_name, fromlist=[setup.class_name])
+            cls = safe_getattr(mod, setup.class_name)
+        except Exception:
+            # If endpoint uses optional packages, will get either module
+            # not found error, or we will have a dummy which will fail
+            # at getattr. Skip either way.
+            Endpoint._unavailable_endpoints[setup.arg_flag] = None
+            return None
+
+        try:
+            endpoint = cls()
+
+        except Exception as e:
+            logger.debug(
+                "Could not initialize endpoint %s. "
+                "Possibly missing key(s). "
+                "trulens_eval will not track costs/usage of this endpoint. %s",
+                cls.__name__,
+                e,
+            )
+            Endpoint._unavailable_endpoints[setup.arg_flag] = dict(_environ())
+            return None
+
+        Endpoint._unavailable_endpoints.pop(setup.arg_flag, None)
+        Endpoint._resolved_endpoints[setup.arg_flag] = endpoint
+
+        return endpoint
+
+    @staticmethod
+    def reset_available_endpoints() -> None:
+        """
+        Forget the endpoints resolved by
+        [available_endpoints][trulens_eval.feedback.provider.endpoint.base.Endpoint.available_endpoints]
+        so that they are resolved again on next use.
+        """
+
+        Endpoint._resolved_endpoints.clear()
+        Endpoint._unavailable_endpoints.clear()
 
     @staticmethod
     def track_all_costs_tally(
@@ -509,6 +948,82 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
 
         return result, costs
 
+    @staticmethod
+    async def atrack_all_costs_tally(
+        __func: mod_asynchro_utils.CallableMaybeAwaitable[A, T],
+        *args,
+        with_openai: bool = True,
+        with_hugs: bool = True,
+        with_litellm: bool = True,
+        with_bedrock: bool = True,
+        **kwargs
+    ) -> Tuple[T, mod_base_schema.Cost]:
+        """
+        Async version of
+        [track_all_costs_tally][trulens_eval.feedback.provider.endpoint.base.Endpoint.track_all_costs_tally].
+        Coroutine functions are awaited while their costs are tracked and other
+        functions are run in a thread.
+        """
+
+        endpoints = Endpoint.available_endpoints(
+            with_openai=with_openai,
+            with_hugs=with_hugs,
+            with_litellm=with_litellm,
+            with_bedrock=with_bedrock
+        )
+
+        result, cbs = await Endpoint._atrack_costs(
+            __func, *args, with_endpoints=endpoints, **kwargs
+        )
+
+        if len(cbs) == 0:
+            # Otherwise sum returns "0" below.
+            costs = mod_base_schema.Cost()
+        else:
+            costs = sum(cb.cost for cb in cbs)
+
+        return result, costs
+
+    @staticmethod
+    async def _atrack_costs(
+        __func: mod_asynchro_utils.CallableMaybeAwaitable[A, T],
+        *args,
+        with_endpoints: Optional[List[Endpoint]] = None,
+        **kwargs
+    ) -> Tuple[T, Sequence[EndpointCallback]]:
+        """
+        Async version of
+        [_track_costs][trulens_eval.feedback.provider.endpoint.base.Endpoint._track_costs].
+
+        Endpoints are only looked up through the context variable as the frames
+        of awaiting coroutines are not on the call stack of wrapped calls.
+        """
+
+        endpoints = _tracked_endpoints.get(None)
+        endpoints = {} if endpoints is None else dict(endpoints)
+
+        callbacks = []
+
+        for endpoint in with_endpoints or []:
+            callback_class = endpoint.callback_class
+            callback = callback_class(endpoint=endpoint)
+
+            endpoints[callback_class] = endpoints.get(callback_class, []) + [
+                (endpoint, callback)
+            ]
+
+            callbacks.append(callback)
+
+        # Each task has its own copy of the context so this does not leak into
+        # other tasks running concurrently.
+        token = _tracked_endpoints.set(endpoints)
+        try:
+            result: T = await mod_asynchro_utils.desync(__func, *args, **kwargs)
+        finally:
+            _tracked_endpoints.reset(token)
+
+        return result, callbacks
+
     @staticmethod
     def _track_costs(
         __func: mod_asynchro_utils.CallableMaybeAwaitable[A, T],
@@ -523,7 +1038,8 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
 
         # Check to see if this call is within another _track_costs call:
         endpoints: Dict[Type[EndpointCallback], List[Tuple[Endpoint, EndpointCallback]]] = \
-            get_first_local_in_call_stack(
+            get_first_local_in_call_context(
+                _tracked_endpoints,
                 key="endpoints",
                 func=Endpoint.__find_tracker,
                 offset=1
@@ -541,9 +1057,6 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
             # this frame returns, the outer frame will have its own endpoints
             # again and any wrapped method will get that smaller set of
             # endpoints.
-
-            # TODO: check if deep copy is needed given we are storing lists in
-            # the values and don't want to affect the existing ones here.
             endpoints = dict(endpoints)
 
         # Collect any new endpoints requested of us.
@@ -559,17 +1072,22 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
             callback_class = endpoint.callback_class
             callback = callback_class(endpoint=endpoint)
 
-            if callback_class not in endpoints:
-                endpoints[callback_class] = []
-
             # And add them to the endpoints dict. This will be retrieved from
-            # locals of this frame later in the wrapped methods.
-            endpoints[callback_class].append((endpoint, callback))
+            # the context variable set below (or locals of this frame) later in
+            # the wrapped methods. Making a new list so the outer call's list
+            # is not affected.
+            endpoints[callback_class] = endpoints.get(callback_class, []) + [
+                (endpoint, callback)
+            ]
 
             callbacks.append(callback)
 
         # Call the function.
-        result: T = __func(*args, **kwargs)
+        token = _tracked_endpoints.set(endpoints)
+        try:
+            result: T = __func(*args, **kwargs)
+        finally:
+            _tracked_endpoints.reset(token)
 
         # Return result and only the callbacks created here. Outer thunks might
         # return others.
@@ -676,7 +1194,8 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
             # callback tracking the tally. See Endpoint._track_costs for
             # definition.
             endpoints: Dict[Type[EndpointCallback], Sequence[Tuple[Endpoint, EndpointCallback]]] = \
-                get_first_local_in_call_stack(
+                get_first_local_in_call_context(
+                    _tracked_endpoints,
                     key="endpoints",
                     func=self.__find_tracker,
                     offset=0
@@ -1,10 +1,12 @@
 import inspect
 import logging
+import os
 import pprint
 from typing import Any, Callable, ClassVar, Optional
 
 import pydantic
 
+from trulens_eval.feedback.provider.endpoint.base import api_key_fingerprint
 from trulens_eval.feedback.provider.endpoint.base import Endpoint
 from trulens_eval.feedback.provider.endpoint.base import EndpointCallback
 from trulens_eval.utils.imports import OptionalImports
@@ -51,7 +53,10 @@ class LiteLLMCallback(EndpointCallback):
                 ("n_prompt_tokens", "prompt_tokens"),
                 ("n_completion_tokens", "completion_tokens"),
             ]:
-                setattr(self.cost, cost_field, usage.get(litellm_field, 0))
+                setattr(
+                    self.cost, cost_field,
+                    getattr(self.cost, cost_field) + usage.get(litellm_field, 0)
+                )
 
         if self.endpoint.litellm_provider not in ["openai"]:
             # The total cost does not seem to be properly tracked except by
@@ -90,6 +95,7 @@ class LiteLLMEndpoint(Endpoint):
 
         import litellm
         self._instrument_module_members(litellm, "completion")
+        self._instrument_module_members(litellm, "acompletion")
 
     def __new__(cls, litellm_provider: str = "openai", **kwargs):
         # Problem here if someone uses litellm with different providers. Only a
@@ -98,6 +104,15 @@ class LiteLLMEndpoint(Endpoint):
 
         return super(Endpoint, cls).__new__(cls, name="litellm")
 
+    def _limiter_key(self) -> str:
+        if self.litellm_provider == "openai":
+            # Share limits with the openai endpoint if using the same key.
+            api_key = os.environ.get("OPENAI_API_KEY")
+            if api_key is not None:
+                return f"openai:{api_key_fingerprint(api_key)}"
+
+        return f"{self.name}:{self.litellm_provider}"
+
     def handle_wrapped_call(
         self, func: Callable, bindings: inspect.BoundArguments, response: Any,
         callback: Optional[EndpointCallback]
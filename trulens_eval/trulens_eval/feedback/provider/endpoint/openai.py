@@ -30,6 +30,7 @@ from langchain.schema import Generation
 from langchain.schema import LLMResult
 import pydantic
 
+from trulens_eval.feedback.provider.endpoint.base import api_key_fingerprint
 from trulens_eval.feedback.provider.endpoint.base import Endpoint
 from trulens_eval.feedback.provider.endpoint.base import EndpointCallback
 from trulens_eval.utils.imports import OptionalImports
@@ -78,6 +79,11 @@ class OpenAIClient(SerialModel):
     client_kwargs: dict
     """Serialized representation constructor arguments."""
 
+    async_client: Optional[Union[oai.AsyncOpenAI, oai.AsyncAzureOpenAI]] = \
+        pydantic.Field(None, exclude=True)
+    """Async counterpart of `client` if it has been created by
+    [aclient][trulens_eval.feedback.provider.endpoint.openai.OpenAIClient.aclient]."""
+
     def __init__(
         self,
         client: Optional[Union[oai.OpenAI, oai.AzureOpenAI]] = None,
@@ -145,6 +151,44 @@ class OpenAIClient(SerialModel):
             client=client, client_cls=client_cls, client_kwargs=client_kwargs
         )
 
+    @property
+    def aclient(self) -> Optional[Union[oai.AsyncOpenAI, oai.AsyncAzureOpenAI]]:
+        """An async client with the same configuration as `client`.
+
+        Created on first access. Is `None` if `client` is not an
+        `openai.OpenAI` or `openai.AzureOpenAI` client.
+        """
+
+        if self.async_client is not None:
+            return self.async_client
+
+        client = self.client
+
+        kwargs = dict(
+            api_key=client.api_key,
+            organization=client.organization,
+            base_url=client.base_url,
+            timeout=client.timeout,
+            max_retries=client.max_retries,
+            default_headers=client._custom_headers,
+            default_query=client._custom_query
+        )
+        if safe_hasattr(client, "project"):
+            kwargs['project'] = client.project
+
+        if isinstance(client, oai.AzureOpenAI):
+            self.async_client = oai.AsyncAzureOpenAI(
+                api_version=client._api_version,
+                azure_ad_token=client._azure_ad_token,
+                azure_ad_token_provider=client._azure_ad_token_provider,
+                **kwargs
+            )
+
+        elif isinstance(client, oai.OpenAI):
+            self.async_client = oai.AsyncOpenAI(**kwargs)
+
+        return self.async_client
+
     def __getattr__(self, k):
         # Pass through attribute lookups to `self.client`, the openai.OpenAI
         # instance.
@@ -221,6 +265,7 @@ class OpenAIEndpoint(Endpoint):
         client: Optional[Union[oai.OpenAI, oai.AzureOpenAI,
                                OpenAIClient]] = None,
         rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
         pace: Optional[Pace] = None,
         **kwargs: dict
     ):
@@ -237,6 +282,7 @@ class OpenAIEndpoint(Endpoint):
         self_kwargs = {
             'name': name,  # for SingletonPerName
             'rpm': rpm,
+            'tpm': tpm,
             'pace': pace,
             **kwargs
         }
@@ -280,6 +326,13 @@ class OpenAIEndpoint(Endpoint):
     def __new__(cls, *args, **kwargs):
         return super(Endpoint, cls).__new__(cls, name="openai")
 
+    def _limiter_key(self) -> str:
+        api_key = safe_getattr(self.client.client, "api_key")
+        if not isinstance(api_key, str):
+            return self.name
+
+        return f"openai:{api_key_fingerprint(api_key)}"
+
     def handle_wrapped_call(
         self,
         func: Callable,
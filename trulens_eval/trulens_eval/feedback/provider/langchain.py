@@ -47,6 +47,16 @@ class Langchain(LLMProvider):
 
         super().__init__(**self_kwargs)
 
+    # overwrite base to include the parameters of the chain such as its model
+    # and temperature
+    def _effective_request(self, kwargs: Dict) -> Dict:
+        try:
+            params = dict(self.endpoint.chain._identifying_params)
+        except Exception:
+            params = {}
+
+        return dict(params, **kwargs)
+
     def _create_chat_completion(
         self,
         prompt: Optional[str] = None,
@@ -94,12 +94,13 @@ provider = LiteLLM(
             **self_kwargs
         )  # need to include pydantic.BaseModel.__init__
 
-    def _create_chat_completion(
+    def _completion_args(
         self,
         prompt: Optional[str] = None,
         messages: Optional[Sequence[Dict]] = None,
         **kwargs
-    ) -> str:
+    ) -> Dict:
+        """Arguments to a litellm completion call."""
 
         completion_args = kwargs
         completion_args['model'] = self.model_engine
@@ -119,8 +120,42 @@ provider = LiteLLM(
         else:
             raise ValueError("`prompt` or `messages` must be specified.")
 
+        return completion_args
+
+    # overwrite base to include the completion args given to this provider
+    def _effective_request(self, kwargs: Dict) -> Dict:
+        return self._completion_args(**kwargs)
+
+    def _create_chat_completion(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        **kwargs
+    ) -> str:
+
+        completion_args = self._completion_args(
+            prompt=prompt, messages=messages, **kwargs
+        )
+
         comp = completion(**completion_args)
 
         assert isinstance(comp, object)
 
         return comp["choices"][0]["message"]["content"]
+
+    async def _acreate_chat_completion(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        **kwargs
+    ) -> str:
+
+        completion_args = self._completion_args(
+            prompt=prompt, messages=messages, **kwargs
+        )
+
+        comp = await litellm.acompletion(**completion_args)
+
+        assert isinstance(comp, object)
+
+        return comp["choices"][0]["message"]["content"]
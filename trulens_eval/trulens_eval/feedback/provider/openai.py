@@ -38,6 +38,11 @@ class OpenAI(LLMProvider):
         model_engine: The OpenAI completion model. Defaults to
             `gpt-3.5-turbo`
 
+        rpm: Requests per minute budget of the API key.
+
+        tpm: Tokens per minute budget of the API key. Tokens are not limited
+            if not given.
+
         **kwargs: Additional arguments to pass to the
             [OpenAIEndpoint][trulens_eval.feedback.provider.endpoint.openai.OpenAIEndpoint]
             which are then passed to
@@ -47,6 +52,9 @@ class OpenAI(LLMProvider):
 
     DEFAULT_MODEL_ENGINE: ClassVar[str] = "gpt-3.5-turbo"
 
+    # Requests not setting a temperature are made at temperature 0.
+    DEFAULT_TEMPERATURE: ClassVar[Optional[float]] = 0.0
+
     # Endpoint cannot presently be serialized but is constructed in __init__
     # below so it is ok.
     endpoint: Endpoint = pydantic.Field(exclude=True)
@@ -57,6 +65,7 @@ class OpenAI(LLMProvider):
         endpoint=None,
         pace: Optional[Pace] = None,
         rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
         model_engine: Optional[str] = None,
         **kwargs: dict
     ):
@@ -74,13 +83,20 @@ class OpenAI(LLMProvider):
         self_kwargs['model_engine'] = model_engine
 
         self_kwargs['endpoint'] = OpenAIEndpoint(
-            *args, pace=pace, rpm=rpm, **kwargs
+            *args, pace=pace, rpm=rpm, tpm=tpm, **kwargs
         )
 
         super().__init__(
             **self_kwargs
         )  # need to include pydantic.BaseModel.__init__
 
+    # overwrite base to distinguish APIs served at other bases in the response
+    # cache
+    def _effective_request(self, kwargs: Dict) -> Dict:
+        base_url = getattr(self.endpoint.client.client, "base_url", None)
+
+        return dict(kwargs, base_url=str(base_url))
+
     # LLMProvider requirement
     def _create_chat_completion(
         self,
@@ -115,6 +131,39 @@ class OpenAI(LLMProvider):
 
         return completion.choices[0].message.content
 
+    async def _acreate_chat_completion(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        **kwargs
+    ) -> str:
+        aclient = self.endpoint.client.aclient
+        if aclient is None:
+            return await super()._acreate_chat_completion(
+                prompt=prompt, messages=messages, **kwargs
+            )
+
+        if 'model' not in kwargs:
+            kwargs['model'] = self.model_engine
+
+        if 'temperature' not in kwargs:
+            kwargs['temperature'] = 0.0
+
+        if 'seed' not in kwargs:
+            kwargs['seed'] = 123
+
+        if messages is None:
+            if prompt is None:
+                raise ValueError("`prompt` or `messages` must be specified.")
+
+            messages = [{"role": "system", "content": prompt}]
+
+        completion = await aclient.chat.completions.create(
+            messages=messages, **kwargs
+        )
+
+        return completion.choices[0].message.content
+
     def _moderation(self, text: str):
         # See https://platform.openai.com/docs/guides/moderation/overview .
         moderation_response = self.endpoint.run_in_pace(
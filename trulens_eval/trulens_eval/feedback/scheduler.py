@@ -0,0 +1,183 @@
+"""
+# Bounded scheduling of feedback evaluations
+
+In [FeedbackMode.WITH_APP_THREAD][trulens_eval.schema.feedback.FeedbackMode.WITH_APP_THREAD],
+every record produced by an app has its feedback functions submitted for
+evaluation in the background. Under bursty load, records and feedback futures
+may pile up faster than they are evaluated.
+[FeedbackScheduler][trulens_eval.feedback.scheduler.FeedbackScheduler] bounds
+the number of feedback evaluations in flight and decides what happens to the
+feedbacks of records produced when that bound is reached according to a
+[FeedbackOverflow][trulens_eval.schema.feedback.FeedbackOverflow] policy.
+
+Apps make one if given `max_pending_feedbacks`:
+
+```python
+truapp = TruChain(
+    app,
+    feedbacks=[...],
+    feedback_mode=FeedbackMode.WITH_APP_THREAD,
+    max_pending_feedbacks=256,
+    feedback_overflow=FeedbackOverflow.DEFER
+)
+
+...
+
+print(truapp.feedback_scheduler.stats)
+```
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from trulens_eval.schema import feedback as mod_feedback_schema
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerStats():
+    """Counts and timings of a
+    [FeedbackScheduler][trulens_eval.feedback.scheduler.FeedbackScheduler]."""
+
+    def __init__(self):
+        self.n_admitted: int = 0
+        """Number of feedback evaluations admitted."""
+
+        self.n_dropped: int = 0
+        """Number of feedback evaluations dropped due to overflow."""
+
+        self.n_deferred: int = 0
+        """Number of feedback evaluations deferred due to overflow."""
+
+        self.in_flight: int = 0
+        """Number of feedback evaluations admitted but not yet done."""
+
+        self.peak_in_flight: int = 0
+        """Largest number of feedback evaluations in flight at once."""
+
+        self.n_waited: int = 0
+        """Number of admissions that had to wait for evaluations to finish."""
+
+        self.total_wait: float = 0.0
+        """Total time in seconds spent waiting for admission."""
+
+        self.max_wait: float = 0.0
+        """Longest time in seconds spent waiting for an admission."""
+
+    def __repr__(self):
+        return (
+            f"SchedulerStats(in_flight={self.in_flight}, peak_in_flight={self.peak_in_flight}, "
+            f"n_admitted={self.n_admitted}, n_dropped={self.n_dropped}, n_deferred={self.n_deferred}, "
+            f"n_waited={self.n_waited}, total_wait={self.total_wait:.3f}s, max_wait={self.max_wait:.3f}s)"
+        )
+
+
+class FeedbackScheduler():
+    """Admission control for feedback evaluations.
+
+    Callers ask to [admit][trulens_eval.feedback.scheduler.FeedbackScheduler.admit]
+    the feedback evaluations of a record before submitting them and
+    [release][trulens_eval.feedback.scheduler.FeedbackScheduler.release] each
+    one once it is done.
+
+    Args:
+        max_in_flight: Maximum number of feedback evaluations in flight.
+
+        overflow: What to do with the feedback evaluations of a record that do
+            not fit.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        overflow: mod_feedback_schema.FeedbackOverflow = mod_feedback_schema.
+        FeedbackOverflow.BLOCK
+    ):
+        if max_in_flight < 1:
+            raise ValueError(
+                f"`max_in_flight` must be positive but got {max_in_flight}."
+            )
+
+        self.max_in_flight: int = max_in_flight
+        self.overflow: mod_feedback_schema.FeedbackOverflow = mod_feedback_schema.FeedbackOverflow(
+            overflow
+        )
+
+        self.stats: SchedulerStats = SchedulerStats()
+
+        self._cond: threading.Condition = threading.Condition()
+
+    def _fits(self, n: int) -> bool:
+        # Batches larger than the bound are admitted alone.
+        in_flight = self.stats.in_flight
+        return in_flight == 0 or in_flight + n <= self.max_in_flight
+
+    def admit(self, n: int, timeout: Optional[float] = None) -> bool:
+        """
+        Admit `n` feedback evaluations of one record.
+
+        With the [BLOCK][trulens_eval.schema.feedback.FeedbackOverflow.BLOCK]
+        policy, waits until they fit. Otherwise returns immediately.
+
+        Args:
+            n: Number of feedback evaluations.
+
+            timeout: Longest time to wait with the `BLOCK` policy. Waits
+                indefinitely if None.
+
+        Returns:
+            Whether the evaluations were admitted. If not, they were counted as
+            dropped or deferred according to the overflow policy and are not
+            to be submitted.
+        """
+
+        if n == 0:
+            return True
+
+        with self._cond:
+            stats = self.stats
+
+            if not self._fits(n):
+                if self.overflow == mod_feedback_schema.FeedbackOverflow.BLOCK:
+                    start = time.perf_counter()
+                    fit = self._cond.wait_for(
+                        lambda: self._fits(n), timeout=timeout
+                    )
+                    wait = time.perf_counter() - start
+
+                    stats.n_waited += 1
+                    stats.total_wait += wait
+                    stats.max_wait = max(stats.max_wait, wait)
+
+                else:
+                    fit = False
+
+                if not fit:
+                    if self.overflow == mod_feedback_schema.FeedbackOverflow.DEFER:
+                        stats.n_deferred += n
+                    else:
+                        stats.n_dropped += n
+
+                    logger.debug(
+                        "%s feedback evaluation(s) not admitted with %s in flight.",
+                        n, stats.in_flight
+                    )
+
+                    return False
+
+            stats.n_admitted += n
+            stats.in_flight += n
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+
+            return True
+
+    def release(self, n: int = 1) -> None:
+        """Mark `n` admitted feedback evaluations as done."""
+
+        with self._cond:
+            self.stats.in_flight -= n
+            self._cond.notify_all()
@@ -8,6 +8,7 @@ typical use cases.
 
 from __future__ import annotations
 
+import contextvars
 import dataclasses
 from datetime import datetime
 import functools
@@ -19,7 +20,7 @@ import os
 from pprint import pformat
 import threading as th
 import traceback
-from typing import (Any, Awaitable, Callable, Dict, Iterable, Optional,
+from typing import (Any, Awaitable, Callable, Dict, Iterable, List, Optional,
                     Sequence, Set, Tuple, Type, Union)
 import weakref
 
@@ -37,7 +38,6 @@ from trulens_eval.utils.pyschema import clean_attributes
 from trulens_eval.utils.pyschema import Method
 from trulens_eval.utils.pyschema import safe_getattr
 from trulens_eval.utils.python import callable_name
-from trulens_eval.utils.python import caller_frame
 from trulens_eval.utils.python import class_name
 from trulens_eval.utils.python import get_first_local_in_call_stack
 from trulens_eval.utils.python import id_str
@@ -45,11 +45,43 @@ from trulens_eval.utils.python import is_really_coroutinefunction
 from trulens_eval.utils.python import safe_hasattr
 from trulens_eval.utils.python import safe_signature
 from trulens_eval.utils.python import wrap_awaitable
+from trulens_eval.utils.serial import JSON
 from trulens_eval.utils.serial import Lens
 from trulens_eval.utils.text import retab
 
 logger = logging.getLogger(__name__)
 
+CallContext = Tuple[Set['RecordingContext'],
+                    Dict['RecordingContext',
+                         Tuple[mod_record_schema.RecordAppCallMethod, ...]]]
+"""Recording contexts and the call stack for each of them as seen by an
+instrumented method."""
+
+_call_context: contextvars.ContextVar[CallContext] = contextvars.ContextVar(
+    "call_context"
+)
+"""The call context of the innermost instrumented method executing in the
+current context.
+
+Instrumented methods look this up to find the contexts and stacks of the
+instrumented methods above them instead of walking the python call stack. It
+is propagated into threads and asyncio tasks along with all other context
+variables.
+"""
+
+
+async def _await_in_call_context(
+    awaitable: Awaitable, call_context: CallContext
+) -> Any:
+    """Await the given awaitable with the given call context set so that
+    instrumented methods invoked while awaiting see it."""
+
+    token = _call_context.set(call_context)
+    try:
+        return await awaitable
+    finally:
+        _call_context.reset(token)
+
 
 class WithInstrumentCallbacks:
     """Abstract definition of callbacks invoked by Instrument during
@@ -119,6 +151,78 @@ class WithInstrumentCallbacks:
 
         raise NotImplementedError
 
+    # Called during invocation.
+    def capture_value(self, value: Any) -> JSON:
+        """
+        Called by instrumented methods to jsonify their arguments and results
+        for recording.
+
+        Args:
+            value: An argument or the result of an instrumented method.
+        """
+
+        return jsonify(value)
+
+    # Called during invocation.
+    def sample_record(
+        self, ctx: 'RecordingContext', func: Callable, path: Lens
+    ) -> bool:
+        """
+        Called by instrumented methods that are root calls for the given
+        context to decide whether to record them. Calls that are not sampled
+        run without recording and are reported to
+        [on_unsampled_record][trulens_eval.instruments.WithInstrumentCallbacks.on_unsampled_record]
+        instead of
+        [on_add_record][trulens_eval.instruments.WithInstrumentCallbacks.on_add_record].
+
+        Args:
+            ctx: The context of the recording.
+
+            func: The function being called.
+
+            path: The path of the owner of `func` in the app hierarchy.
+        """
+
+        return True
+
+    # Called during invocation.
+    def on_unsampled_record(
+        self,
+        ctx: 'RecordingContext',
+        func: Callable,
+        sig: Signature,
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+        frame: Callable[[], mod_record_schema.RecordAppCallMethod],
+        ret: Any,
+        error: Any,
+        perf: mod_base_schema.Perf
+    ) -> None:
+        """
+        Called by instrumented methods that are root calls which were not
+        sampled once they finish.
+
+        Args:
+            ctx: The context of the recording.
+
+            func: The function that was called.
+
+            sig: The signature of the function.
+
+            args: The positional arguments of the call.
+
+            kwargs: The keyword arguments of the call.
+
+            frame: Produces the stack frame of the call if it is to be recorded
+                after all.
+
+            ret: The return value of the function.
+
+            error: The error raised by the function if any.
+
+            perf: The performance of the function.
+        """
+
     # Called during invocation.
     def on_add_record(
         self,
@@ -385,16 +489,41 @@ class Instrument(object):
             # If not within a root method, call the wrapped function without
             # any recording.
 
-            # Get any contexts already known from higher in the call stack.
-            contexts = get_first_local_in_call_stack(
-                key="contexts",
-                func=find_instrumented,
-                offset=1,
-                skip=python.caller_frame()
-            )
-            # Note: are empty sets false?
-            if contexts is None:
+            # Get any contexts and stacks already known from higher in the call
+            # stack. These are propagated via a context variable and only
+            # looked up in the call stack if that fallback is enabled.
+            call_context: Optional[CallContext] = _call_context.get(None)
+
+            if call_context is None and python.FRAME_WALK_FALLBACK:
+                # Context variables were not propagated here, i.e. due to a
+                # thread not started by our threading utilities. Look for the
+                # locals of instrumented methods in the call stack instead.
+                this_frame = inspect.currentframe()
+                parent_contexts = get_first_local_in_call_stack(
+                    key="contexts",
+                    func=find_instrumented,
+                    offset=1,
+                    skip=this_frame
+                )
+                if parent_contexts is not None:
+                    call_context = (
+                        parent_contexts,
+                        get_first_local_in_call_stack(
+                            key="stacks",
+                            func=find_instrumented,
+                            offset=1,
+                            skip=this_frame
+                        ) or {}
+                    )
+
+            if call_context is None:
                 contexts = set([])
+                ctx_stacks = {}
+            else:
+                # Copying the contexts so that the additions below do not
+                # affect the caller's set.
+                contexts = set(call_context[0])
+                ctx_stacks = call_context[1]
 
             # And add any new contexts from all apps wishing to record this
             # function. This may produce some of the same contexts that were
@@ -415,20 +544,12 @@ class Instrument(object):
 
                 return func(*args, **kwargs)
 
-            # If a wrapped method was called in this call stack, get the prior
-            # calls from this variable. Otherwise create a new chain stack. As
-            # another wrinke, the addresses of methods in the stack may vary
-            # from app to app that are watching this method. Hence we index the
-            # stacks by id of the call record list which is unique to each app.
-            ctx_stacks = get_first_local_in_call_stack(
-                key="stacks",
-                func=find_instrumented,
-                offset=1,
-                skip=caller_frame()
-            )
-            # Note: Empty dicts are false.
-            if ctx_stacks is None:
-                ctx_stacks = {}
+            # If a wrapped method was called in this call stack, the prior calls
+            # are in `ctx_stacks` retrieved above. Otherwise we create a new
+            # chain stack. As another wrinke, the addresses of methods in the
+            # stack may vary from app to app that are watching this method.
+            # Hence we index the stacks by id of the call record list which is
+            # unique to each app.
 
             error = None
             rets = None
@@ -453,8 +574,17 @@ class Instrument(object):
             # to use a different stack for the same reason. We index the stack
             # in `stacks` via id of the (unique) list `record`.
 
+            # Root calls that their app decided not to record. These get the
+            # stack `None` in `stacks` so that calls under them are not
+            # recorded for their contexts either.
+            unsampled: List[Tuple[RecordingContext, Callable[[], mod_record_schema.RecordAppCallMethod]]] = []
+
             # First prepare the stacks for each context.
             for ctx in contexts:
+                if ctx in ctx_stacks and ctx_stacks[ctx] is None:
+                    # Under a root call that was not sampled.
+                    continue
+
                 # Get app that has instrumented this method.
                 app = ctx.app
 
@@ -477,6 +607,22 @@ class Instrument(object):
                     # stack, make a new stack tuple for subsequent deeper calls
                     # (if any) to look up.
                     stack = ()
+
+                    if not app.sample_record(ctx=ctx, func=func, path=path):
+                        stacks[ctx] = None
+                        unsampled.append(
+                            (
+                                ctx, lambda path=path: mod_record_schema.
+                                RecordAppCallMethod(
+                                    path=path,
+                                    method=Method.of_method(
+                                        func, obj=obj, cls=cls
+                                    )
+                                )
+                            )
+                        )
+                        continue
+
                 else:
                     stack = ctx_stacks[ctx]
 
@@ -488,6 +634,96 @@ class Instrument(object):
 
                 stacks[ctx] = stack  # for deeper calls to get
 
+            # Only record to the contexts for which a stack was prepared.
+            contexts = set(
+                ctx for ctx in contexts
+                if ctx in stacks and stacks[ctx] is not None
+            )
+
+            def handle_unsampled(rets, error, start_time, end_time):
+                perf = mod_base_schema.Perf(
+                    start_time=start_time, end_time=end_time
+                )
+                for ctx, frame in unsampled:
+                    ctx.app.on_unsampled_record(
+                        ctx=ctx,
+                        func=func,
+                        sig=sig,
+                        args=args,
+                        kwargs=kwargs,
+                        frame=frame,
+                        ret=rets,
+                        error=error,
+                        perf=perf
+                    )
+
+            if len(contexts) == 0:
+                if len(unsampled) == 0:
+                    # Only under root calls that were not sampled.
+                    return func(*args, **kwargs)
+
+                # A root call that is not sampled for any context. Run without
+                # tracking costs or jsonizing arguments and results. Calls under
+                # it look up the `None` stacks to know not to record.
+                call_context = (contexts, stacks)
+                token = _call_context.set(call_context)
+
+                start_time = datetime.now()
+
+                try:
+                    rets = func(*args, **kwargs)
+
+                except BaseException as e:
+                    handle_unsampled(
+                        rets=None,
+                        error=e,
+                        start_time=start_time,
+                        end_time=datetime.now()
+                    )
+                    raise e
+
+                finally:
+                    _call_context.reset(token)
+
+                if isinstance(rets, Awaitable):
+
+                    async def await_unsampled(awaitable):
+                        # Not using wrap_awaitable as errors need to be
+                        # handled too.
+                        try:
+                            val = await _await_in_call_context(
+                                awaitable, call_context
+                            )
+
+                        except BaseException as e:
+                            handle_unsampled(
+                                rets=None,
+                                error=e,
+                                start_time=start_time,
+                                end_time=datetime.now()
+                            )
+                            raise e
+
+                        handle_unsampled(
+                            rets=val,
+                            error=None,
+                            start_time=start_time,
+                            end_time=datetime.now()
+                        )
+
+                        return val
+
+                    return await_unsampled(rets)
+
+                handle_unsampled(
+                    rets=rets,
+                    error=None,
+                    start_time=start_time,
+                    end_time=datetime.now()
+                )
+
+                return rets
+
             # Now we will call the wrapped method. We only do so once.
 
             # Start of run wrapped block.
@@ -495,6 +731,11 @@ class Instrument(object):
 
             error_str = None
 
+            # Make contexts and stacks visible to instrumented methods called by
+            # the wrapped one.
+            call_context = (contexts, stacks)
+            token = _call_context.set(call_context)
+
             try:
                 # Using sig bind here so we can produce a list of key-value
                 # pairs even if positional arguments were provided.
@@ -513,38 +754,75 @@ class Instrument(object):
                 )
                 logger.error(traceback.format_exc())
 
+            finally:
+                _call_context.reset(token)
+
             end_time = datetime.now()
 
             # Done running the wrapped function. Lets collect the results.
             # Create common information across all records.
 
-            # Don't include self in the recorded arguments.
-            nonself = {
-                k: jsonify(v)
-                for k, v in
-                (bindings.arguments.items() if bindings is not None else {})
-                if k != "self"
-            }
+            # Arguments and results are captured once per app as apps may
+            # capture them differently.
+            nonselfs: Dict[int, Dict[str, JSON]] = {}
+
+            def nonself_of(app: WithInstrumentCallbacks):
+                # Don't include self in the recorded arguments.
+                if id(app) not in nonselfs:
+                    nonselfs[id(app)] = {
+                        k: app.capture_value(v)
+                        for k, v in (
+                            bindings.arguments.items()
+                            if bindings is not None else {}
+                        )
+                        if k != "self"
+                    }
+
+                return nonselfs[id(app)]
 
             records = {}
 
-            def handle_done(rets):
+            def handle_done(rets, placeholder: bool = False):
                 record_app_args = dict(
-                    args=nonself,
                     perf=mod_base_schema.Perf(start_time=start_time, end_time=end_time),
                     pid=os.getpid(),
                     tid=th.get_native_id(),
-                    rets=jsonify(rets),
                     error=error_str if error is not None else None
                 )
                 # End of run wrapped block.
 
+                if not placeholder:
+                    # Before the contexts below as adding a record re-raises
+                    # the error of the call.
+                    handle_unsampled(
+                        rets=rets,
+                        error=error,
+                        start_time=start_time,
+                        end_time=end_time
+                    )
+
+                rets_of: Dict[int, JSON] = {}
+
                 # Now record calls to each context.
                 for ctx in contexts:
                     stack = stacks[ctx]
 
-                    # Note that only the stack differs between each of the records in this loop.
+                    if placeholder and len(stack) > 1:
+                        # Only root calls need a placeholder record. Non-root
+                        # calls are recorded once the awaitable is done as
+                        # their root will be awaiting it.
+                        continue
+
+                    app = ctx.app
+                    if id(app) not in rets_of:
+                        rets_of[id(app)] = app.capture_value(rets)
+
+                    # Note that only the stack, and the args and rets for
+                    # different apps, differ between each of the records in
+                    # this loop.
                     record_app_args['stack'] = stack
+                    record_app_args['args'] = nonself_of(app)
+                    record_app_args['rets'] = rets_of[id(app)]
                     call = mod_record_schema.RecordAppCall(**record_app_args)
                     ctx.add_call(call)
 
@@ -591,12 +869,16 @@ results. Additional information about this call:
 ```
     """
                     ),
+                    placeholder=True
                 )
 
                 # TODO(piotrm): need to track costs of awaiting the ret in the
                 # below.
 
-                return wrap_awaitable(rets, on_done=handle_done)
+                return wrap_awaitable(
+                    _await_in_call_context(rets, call_context),
+                    on_done=handle_done
+                )
 
             handle_done(rets=rets)
             return rets
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+from enum import Enum
 from typing import Optional
 
 import pydantic
@@ -13,6 +14,30 @@ MAX_DILL_SIZE: int = 1024 * 1024  # 1MB
 """Max size in bytes of pickled objects."""
 
 
+class IDMode(str, Enum):
+    """How identifiers of records, feedback results, and feedback definitions
+    are created when not given.
+
+    Set with the `ID_MODE` class attribute of
+    [Record][trulens_eval.schema.record.Record],
+    [FeedbackResult][trulens_eval.schema.feedback.FeedbackResult], and
+    [FeedbackDefinition][trulens_eval.schema.feedback.FeedbackDefinition].
+    """
+
+    TIME_ORDERED = "time_ordered"
+    """Unique identifier ordered by creation time (a UUIDv7).
+
+    Cheap to create and appends to the end of database primary key indices.
+    """
+
+    CONTENT_HASH = "content_hash"
+    """Hash of the serialized object.
+
+    Objects with the same content get the same identifier but the whole
+    object needs to be serialized to create it.
+    """
+
+
 class Cost(serial.SerialModel, pydantic.BaseModel):
     """Costs associated with some call or set of calls."""
 
@@ -37,6 +62,12 @@ class Cost(serial.SerialModel, pydantic.BaseModel):
     n_completion_tokens: int = 0
     """Number of completion tokens generated."""
 
+    n_cache_hits: int = 0
+    """Number of requests answered from a response cache."""
+
+    n_cache_misses: int = 0
+    """Number of cacheable requests not found in a response cache."""
+
     cost: float = 0.0
     """Cost in USD."""
 
@@ -17,6 +17,7 @@ from trulens_eval.schema import types as mod_types_schema
 from trulens_eval.utils import pyschema
 from trulens_eval.utils import serial
 from trulens_eval.utils.json import obj_id_of_obj
+from trulens_eval.utils.json import obj_id_of_time
 from trulens_eval.utils.text import retab
 
 T = TypeVar("T")
@@ -182,6 +183,29 @@ class FeedbackMode(str, Enum):
     `tru.start_deferred_feedback_evaluator`."""
 
 
+class FeedbackOverflow(str, Enum):
+    """What to do with feedback evaluations of a record when the maximum number
+    of feedback evaluations in flight is reached in
+    [WITH_APP_THREAD][trulens_eval.schema.feedback.FeedbackMode.WITH_APP_THREAD]
+    mode.
+
+    Specify this using the `feedback_overflow` to [App][trulens_eval.app.App]
+    constructors.
+    """
+
+    BLOCK = "block"
+    """Wait in the app for evaluations to finish before recording returns."""
+
+    DROP = "drop"
+    """Do not evaluate the feedback functions on the record. The record is still
+    stored."""
+
+    DEFER = "defer"
+    """Store the feedback evaluations as pending in the database to be
+    evaluated later as in
+    [DEFERRED][trulens_eval.schema.feedback.FeedbackMode.DEFERRED] mode."""
+
+
 class FeedbackResultStatus(Enum):
     """For deferred feedback evaluation, these values indicate status of evaluation."""
 
@@ -333,15 +357,21 @@ class FeedbackResult(serial.SerialModel):
     # TODO: doc
     multi_result: Optional[str] = None
 
+    ID_MODE: ClassVar[mod_base_schema.IDMode] = mod_base_schema.IDMode.TIME_ORDERED
+    """How feedback result ids are created when not given."""
+
     def __init__(
         self, feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None, **kwargs
     ):
         super().__init__(feedback_result_id="temporary", **kwargs)
 
         if feedback_result_id is None:
-            feedback_result_id = obj_id_of_obj(
-                self.model_dump(), prefix="feedback_result"
-            )
+            if self.ID_MODE == mod_base_schema.IDMode.CONTENT_HASH:
+                feedback_result_id = obj_id_of_obj(
+                    self.model_dump(), prefix="feedback_result"
+                )
+            else:
+                feedback_result_id = obj_id_of_time(prefix="feedback_result")
 
         self.feedback_result_id = feedback_result_id
 
@@ -429,7 +459,8 @@ class FeedbackDefinition(pyschema.WithClassInfo, serial.SerialModel, Hashable):
     function call."""
 
     feedback_definition_id: mod_types_schema.FeedbackDefinitionID
-    """Id, if not given, uniquely determined from content."""
+    """Id, if not given, created according to
+    [ID_MODE][trulens_eval.schema.feedback.FeedbackDefinition.ID_MODE]."""
 
     if_exists: Optional[serial.Lens] = None
     """Only execute the feedback function if the following selector names
@@ -453,6 +484,14 @@ class FeedbackDefinition(pyschema.WithClassInfo, serial.SerialModel, Hashable):
     higher_is_better: Optional[bool] = None
     """Feedback result magnitude interpretation."""
 
+    ID_MODE: ClassVar[mod_base_schema.IDMode] = mod_base_schema.IDMode.CONTENT_HASH
+    """How feedback definition ids are created when not given.
+
+    Defaults to content hashes so that the same definition gets the same id
+    across runs and is stored in the database only once. Definitions are
+    created once per app, not per record, so hashing them is cheap overall.
+    """
+
     def __init__(
         self,
         feedback_definition_id: Optional[mod_types_schema.FeedbackDefinitionID] = None,
@@ -490,9 +529,14 @@ class FeedbackDefinition(pyschema.WithClassInfo, serial.SerialModel, Hashable):
 
         if feedback_definition_id is None:
             if implementation is not None:
-                feedback_definition_id = obj_id_of_obj(
-                    self.model_dump(), prefix="feedback_definition"
-                )
+                if self.ID_MODE == mod_base_schema.IDMode.CONTENT_HASH:
+                    feedback_definition_id = obj_id_of_obj(
+                        self.model_dump(), prefix="feedback_definition"
+                    )
+                else:
+                    feedback_definition_id = obj_id_of_time(
+                        prefix="feedback_definition"
+                    )
             else:
                 feedback_definition_id = "anonymous_feedback_definition"
 
@@ -16,6 +16,7 @@ from trulens_eval.utils import pyschema
 from trulens_eval.utils import serial
 from trulens_eval.utils.json import jsonify
 from trulens_eval.utils.json import obj_id_of_obj
+from trulens_eval.utils.json import obj_id_of_time
 from trulens_eval.utils.python import Future
 
 T = TypeVar("T")
@@ -140,11 +141,20 @@ class Record(serial.SerialModel, Hashable):
         pydantic.Field(None, exclude=True)
     """Only the futures part of the above for backwards compatibility."""
 
+    ID_MODE: ClassVar[mod_base_schema.IDMode] = mod_base_schema.IDMode.TIME_ORDERED
+    """How record ids are created when not given.
+
+    Content hash ids require jsonifying the whole record.
+    """
+
     def __init__(self, record_id: Optional[mod_types_schema.RecordID] = None, **kwargs):
         super().__init__(record_id="temporary", **kwargs)
 
         if record_id is None:
-            record_id = obj_id_of_obj(jsonify(self), prefix="record")
+            if self.ID_MODE == mod_base_schema.IDMode.CONTENT_HASH:
+                record_id = obj_id_of_obj(jsonify(self), prefix="record")
+            else:
+                record_id = obj_id_of_time(prefix="record")
 
         self.record_id = record_id
 
@@ -192,6 +202,11 @@ class Record(serial.SerialModel, Hashable):
 
         ret = Bunch(**self.model_dump())
 
+        # Group the calls by path first so that each path is set once. Setting
+        # each call individually copies the growing list of calls at its path
+        # every time.
+        calls_by_path: Dict[serial.Lens, List[RecordAppCall]] = {}
+
         for call in self.calls:
             # Info about the method call is at the top of the stack
             frame_info = call.top()
@@ -203,7 +218,11 @@ class Record(serial.SerialModel, Hashable):
                 )
             )
 
-            ret = path.set_or_append(obj=ret, val=call)
+            calls_by_path.setdefault(path, []).append(call)
+
+        # The layout is freshly built here so can be updated in place.
+        for path, calls in calls_by_path.items():
+            ret = path.set_or_extend(obj=ret, vals=calls, in_place=True)
 
         return ret
 
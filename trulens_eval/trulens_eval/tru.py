@@ -5,6 +5,7 @@ from concurrent import futures
 from datetime import datetime
 from datetime import timedelta
 import logging
+import multiprocessing
 from multiprocessing import Process
 import os
 from pathlib import Path
@@ -14,8 +15,8 @@ import sys
 import threading
 from threading import Thread
 from time import sleep
-from typing import (Any, Callable, Dict, Generic, Iterable, List, Optional,
-                    Sequence, Tuple, TypeVar, Union)
+from typing import (Any, Callable, Dict, Generic, Iterable, Iterator, List,
+                    Optional, Sequence, Tuple, TypeVar, Union)
 
 import humanize
 import pandas
@@ -26,6 +27,7 @@ from typing_extensions import Doc
 from trulens_eval.database import sqlalchemy
 from trulens_eval.database.base import DB
 from trulens_eval.database.exceptions import DatabaseVersionException
+from trulens_eval.database.utils import is_memory_sqlite
 from trulens_eval.feedback import feedback
 from trulens_eval.schema import app as mod_app_schema
 from trulens_eval.schema import feedback as mod_feedback_schema
@@ -111,9 +113,19 @@ class Tru(python.SingletonPerName):
 
     RETRY_RUNNING_SECONDS: float = 60.0
     """How long to wait (in seconds) before restarting a feedback function that has already started
-    
-    A feedback function execution that has started may have stalled or failed in a bad way that did not record the
-    failure.
+
+    **Deprecated**: Not used by the deferred evaluator anymore. Running feedback
+    functions are restarted when their lease expires instead. See
+    [DEFERRED_LEASE_SECONDS][trulens_eval.tru.Tru.DEFERRED_LEASE_SECONDS].
+    """
+
+    DEFERRED_LEASE_SECONDS: float = 60.0
+    """How long (in seconds) a deferred evaluator's claim on a feedback function
+    run lasts unless renewed.
+
+    Evaluators renew the claims of the runs they are still executing several
+    times per this period. A run whose claim expired is assumed to belong to an
+    evaluator that stalled or died and is restarted by another evaluator.
 
     See also:
         [start_evaluator][trulens_eval.tru.Tru.start_evaluator]
@@ -124,9 +136,35 @@ class Tru(python.SingletonPerName):
     RETRY_FAILED_SECONDS: float = 5 * 60.0
     """How long to wait (in seconds) to retry a failed feedback function run."""
 
+    DEFERRED_POLL_SECONDS: float = 10.0
+    """Longest time (in seconds) the deferred evaluator goes without looking
+    for feedback functions to run.
+
+    The evaluator is otherwise woken up by
+    [wait_for_feedback][trulens_eval.database.base.DB.wait_for_feedback] when
+    feedback functions to run are added. Polling picks up failed runs due for a
+    retry, expired leases, and additions the database could not notify of.
+    """
+
+    DEFERRED_STATUS_REFRESH_SECONDS: float = 60.0
+    """How often (in seconds) the deferred evaluator recounts feedback results
+    by status in the database for its progress bars.
+
+    In between, the counts are updated with the status changes made by the
+    evaluator itself.
+    """
+
     DEFERRED_NUM_RUNS: int = 32
     """Number of futures to wait for when evaluating deferred feedback functions."""
 
+    DEFERRED_NUM_ASYNC_RUNS: int = 1024
+    """Number of deferred feedback functions to keep running when evaluating
+    them asynchronously.
+
+    These share a single event loop thread so this is usually bounded by
+    provider rate limits instead of threads or memory.
+    """
+
     db: Union[DB, OpaqueWrapper[DB]]
     """Database supporting this workspace.
     
@@ -150,6 +188,10 @@ class Tru(python.SingletonPerName):
     _evaluator_stop: Optional[threading.Event] = None
     """Event for stopping the deferred evaluator which runs in another thread."""
 
+    _evaluator_workers: List[multiprocessing.process.BaseProcess] = []
+    """Worker [processes][multiprocessing.Process] of the deferred feedback
+    evaluator if started with `fork`."""
+
     def __init__(
         self,
         database: Optional[DB] = None,
@@ -422,11 +464,17 @@ class Tru(python.SingletonPerName):
 
         tp: tru_threading.TP = tru_threading.TP()
 
+        # Jsonize the app and lay out the record once for all of the feedback
+        # functions.
+        prepared_source = feedback.PreparedSource(app=app, record=record)
+
         for ffunc in feedback_functions:
             # Run feedback function and the on_done callback. This makes sure
             # that Future.result() returns only after on_done has finished.
             def run_and_call_callback(ffunc, app, record):
-                temp = ffunc.run(app=app, record=record)
+                temp = ffunc.run(
+                    app=app, record=record, prepared_source=prepared_source
+                )
                 if on_done is not None:
                     try:
                         on_done(temp)
@@ -671,7 +719,8 @@ class Tru(python.SingletonPerName):
 
     def get_records_and_feedback(
         self,
-        app_ids: Optional[List[mod_types_schema.AppID]] = None
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        **kwargs: Dict[str, Any]
     ) -> Tuple[pandas.DataFrame, List[str]]:
         """Get records, their feeback results, and feedback names.
         
@@ -679,6 +728,10 @@ class Tru(python.SingletonPerName):
             app_ids: A list of app ids to filter records by. If empty or not given, all
                 apps' records will be returned.
 
+            **kwargs: Time range, pagination and column projection arguments.
+                See
+                [DB.get_records_and_feedback][trulens_eval.database.base.DB.get_records_and_feedback].
+
         Returns:
             Dataframe of records with their feedback results.
             
@@ -688,10 +741,56 @@ class Tru(python.SingletonPerName):
         if app_ids is None:
             app_ids = []
 
-        df, feedback_columns = self.db.get_records_and_feedback(app_ids)
+        df, feedback_columns = self.db.get_records_and_feedback(
+            app_ids, **kwargs
+        )
 
         return df, feedback_columns
 
+    def iter_records(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        **kwargs: Dict[str, Any]
+    ) -> Iterator[pandas.DataFrame]:
+        """Iterate over records and their feedback results in chunks.
+
+        Unlike
+        [get_records_and_feedback][trulens_eval.tru.Tru.get_records_and_feedback],
+        memory use is bounded by the chunk size instead of the number of
+        records.
+
+        Args:
+            app_ids: A list of app ids to filter records by. If empty or not given, all
+                apps' records will be returned.
+
+            **kwargs: Time range, chunk size, column projection and output
+                format arguments. See
+                [DB.iter_records][trulens_eval.database.base.DB.iter_records].
+
+        Returns:
+            Iterator of dataframes (or Arrow record batches) of records with
+                their feedback results.
+        """
+
+        if app_ids is None:
+            app_ids = []
+
+        return self.db.iter_records(app_ids, **kwargs)
+
+    def iter_feedback(self, **kwargs: Dict[str, Any]) -> Iterator[pandas.DataFrame]:
+        """Iterate over feedback results in chunks.
+
+        Args:
+            **kwargs: Filters, chunk size and output format arguments. See
+                [DB.iter_feedback][trulens_eval.database.base.DB.iter_feedback].
+
+        Returns:
+            Iterator of dataframes (or Arrow record batches) of feedback
+                results.
+        """
+
+        return self.db.iter_feedback(**kwargs)
+
     def get_leaderboard(
         self, app_ids: Optional[List[mod_types_schema.AppID]] = None
     ) -> pandas.DataFrame:
@@ -708,7 +807,9 @@ class Tru(python.SingletonPerName):
         if app_ids is None:
             app_ids = []
 
-        df, feedback_cols = self.db.get_records_and_feedback(app_ids)
+        df, feedback_cols = self.db.get_records_and_feedback(
+            app_ids, columns=["app_id", "latency", "total_cost"]
+        )
 
         col_agg_list = feedback_cols + ['latency', 'total_cost']
 
@@ -718,35 +819,56 @@ class Tru(python.SingletonPerName):
 
         return leaderboard
 
-    def start_evaluator(self,
-                        restart: bool = False,
-                        fork: bool = False) -> Union[Process, Thread]:
+    def start_evaluator(
+        self,
+        restart: bool = False,
+        fork: bool = False,
+        workers: int = 1,
+        asynchronous: bool = False
+    ) -> Union[Process, Thread]:
         """
-        Start a deferred feedback function evaluation thread or process.
+        Start a deferred feedback function evaluation thread or processes.
+
+        Feedback results to evaluate are leased from the database with
+        [claim_feedback][trulens_eval.database.base.DB.claim_feedback] so any
+        number of evaluators, in this process, in worker processes, or on other
+        hosts sharing the database, can run at the same time without evaluating
+        the same feedback twice.
 
         Args:
             restart: If set, will stop the existing evaluator before starting a
                 new one.
-            
-            fork: If set, will start the evaluator in a new process instead of a
-                thread. NOT CURRENTLY SUPPORTED.
+
+            fork: If set, will start the evaluator in `workers` new processes
+                instead of a thread. Processes are started with the `spawn`
+                method so scripts that start them must guard their entry point
+                with `if __name__ == "__main__":`. Requires a database that
+                other processes can connect to (not in-memory sqlite).
+
+            workers: Number of worker processes to start if `fork` is set.
+
+            asynchronous: If set, feedback functions are run with
+                [arun][trulens_eval.feedback.feedback.Feedback.arun] on an event
+                loop instead of on threads. Implementations with async versions,
+                like those of the LLM providers, then do not occupy a thread
+                while waiting for responses so many more can be running.
 
         Returns:
-            The started process or thread that is executing the deferred feedback
-                evaluator.
+            The started thread or the first of the started processes that are
+                executing the deferred feedback evaluator.
 
         Relevant constants:
-            [RETRY_RUNNING_SECONDS][trulens_eval.tru.Tru.RETRY_RUNNING_SECONDS]
+            [DEFERRED_LEASE_SECONDS][trulens_eval.tru.Tru.DEFERRED_LEASE_SECONDS]
 
             [RETRY_FAILED_SECONDS][trulens_eval.tru.Tru.RETRY_FAILED_SECONDS]
 
             [DEFERRED_NUM_RUNS][trulens_eval.tru.Tru.DEFERRED_NUM_RUNS]
 
+            [DEFERRED_NUM_ASYNC_RUNS][trulens_eval.tru.Tru.DEFERRED_NUM_ASYNC_RUNS]
+
             [MAX_THREADS][trulens_eval.utils.threading.TP.MAX_THREADS]
         """
 
-        assert not fork, "Fork mode not yet implemented."
-
         if self._evaluator_proc is not None:
             if restart:
                 self.stop_evaluator()
@@ -755,197 +877,289 @@ class Tru(python.SingletonPerName):
                     "Evaluator is already running in this process."
                 )
 
-        if not fork:
-            self._evaluator_stop = threading.Event()
+        if fork:
+            if not isinstance(self.db, sqlalchemy.SQLAlchemyDB) or \
+                    is_memory_sqlite(self.db.engine):
+                raise ValueError(
+                    "Evaluator processes require a database they can connect "
+                    "to separately. Use a sqlalchemy database that is not "
+                    "in-memory sqlite."
+                )
+
+            db_args = dict(
+                redact_keys=self.db.redact_keys,
+                table_prefix=self.db.table_prefix,
+                engine_params=self.db.engine_params,
+                session_params=self.db.session_params,
+                background_writes=self.db.background_writes
+            )
+
+            context = multiprocessing.get_context("spawn")
+            self._evaluator_workers = [
+                context.Process(
+                    target=_run_evaluator_worker,
+                    args=(db_args, asynchronous),
+                    name=f"trulens_evaluator_{i}",
+                    daemon=True
+                ) for i in range(workers)
+            ]
+            for proc in self._evaluator_workers:
+                proc.start()
 
-        def runloop():
-            assert self._evaluator_stop is not None
+            self._evaluator_proc = self._evaluator_workers[0]
 
+            return self._evaluator_proc
+
+        self._evaluator_stop = threading.Event()
+
+        proc = Thread(
+            target=self._evaluator_loop,
+            args=(self._evaluator_stop,),
+            kwargs=dict(asynchronous=asynchronous)
+        )
+        proc.daemon = True
+
+        # Start a persistent thread that evaluates feedback functions.
+
+        self._evaluator_proc = proc
+        proc.start()
+
+        return proc
+
+    def _evaluator_loop(
+        self,
+        stop: Optional[threading.Event] = None,
+        progress: bool = True,
+        asynchronous: bool = False
+    ) -> None:
+        """Run the deferred feedback evaluator until `stop` is set.
+
+        Args:
+            stop: Event to stop the evaluator. If not given, runs forever.
+
+            progress: Whether to print the configuration and show progress
+                bars.
+
+            asynchronous: Whether to run feedback functions on an event loop
+                instead of threads.
+        """
+
+        if stop is None:
+            stop = threading.Event()
+
+        num_runs = self.DEFERRED_NUM_ASYNC_RUNS \
+            if asynchronous else self.DEFERRED_NUM_RUNS
+
+        if progress:
             print(
                 f"Will keep max of "
-                f"{self.DEFERRED_NUM_RUNS} feedback(s) running."
-            )
-            print(
-                f"Tasks are spread among max of "
-                f"{tru_threading.TP.MAX_THREADS} thread(s)."
+                f"{num_runs} feedback(s) running."
             )
+            if asynchronous:
+                print("Tasks are run on an event loop.")
+            else:
+                print(
+                    f"Tasks are spread among max of "
+                    f"{tru_threading.TP.MAX_THREADS} thread(s)."
+                )
             print(
-                f"Will rerun running feedbacks after "
-                f"{humanize_seconds(self.RETRY_RUNNING_SECONDS)}."
+                f"Will rerun running feedbacks not renewed for "
+                f"{humanize_seconds(self.DEFERRED_LEASE_SECONDS)}."
             )
             print(
                 f"Will rerun failed feedbacks after "
                 f"{humanize_seconds(self.RETRY_FAILED_SECONDS)}."
             )
 
-            total = 0
-
-            # Getting total counts from the database to start off the tqdm
-            # progress bar initial values so that they offer accurate
-            # predictions initially after restarting the process.
-            queue_stats = self.db.get_feedback_count_by_status()
-            queue_done = queue_stats.get(mod_feedback_schema.FeedbackResultStatus.DONE) or 0
-            queue_total = sum(queue_stats.values())
-
-            # Show the overall counts from the database, not just what has been
-            # looked at so far.
-            tqdm_status = tqdm(
-                desc="Feedback Status",
-                initial=queue_done,
-                unit="feedbacks",
-                total=queue_total,
-                postfix={
-                    status.name: count for status, count in queue_stats.items()
-                }
-            )
-
-            # Show the status of the results so far.
-            tqdm_total = tqdm(desc="Done Runs", initial=0, unit="runs")
-
-            # Show what is being waited for right now.
-            tqdm_waiting = tqdm(desc="Waiting for Runs", initial=0, unit="runs")
+        total = 0
+
+        FeedbackResultStatus = mod_feedback_schema.FeedbackResultStatus
+
+        # Getting total counts from the database to start off the tqdm
+        # progress bar initial values so that they offer accurate
+        # predictions initially after restarting the process. The counts are
+        # then kept up to date with the status changes made by this evaluator
+        # and only refreshed from the database once in a while.
+        queue_stats: Dict[FeedbackResultStatus, int] = defaultdict(int)
+        if progress:
+            queue_stats.update(self.db.get_feedback_count_by_status())
+        last_refresh = datetime.now().timestamp()
+
+        # Show the overall counts from the database, not just what has been
+        # looked at so far.
+        tqdm_status = tqdm(
+            desc="Feedback Status",
+            initial=queue_stats[FeedbackResultStatus.DONE],
+            unit="feedbacks",
+            total=sum(queue_stats.values()),
+            postfix={
+                status.name: count for status, count in queue_stats.items()
+            },
+            disable=not progress
+        )
 
-            runs_stats = defaultdict(int)
+        # Show the status of the results so far.
+        tqdm_total = tqdm(
+            desc="Done Runs", initial=0, unit="runs", disable=not progress
+        )
 
-            futures_map: Dict[Future[mod_feedback_schema.FeedbackResult],
-                              pandas.Series] = dict()
+        # Show what is being waited for right now.
+        tqdm_waiting = tqdm(
+            desc="Waiting for Runs",
+            initial=0,
+            unit="runs",
+            disable=not progress
+        )
 
-            while fork or not self._evaluator_stop.is_set():
+        runs_stats = defaultdict(int)
 
-                if len(futures_map) < self.DEFERRED_NUM_RUNS:
-                    # Get some new evals to run if some already completed by now.
-                    new_futures: List[Tuple[pandas.Series, Future[mod_feedback_schema.FeedbackResult]]] = \
-                        feedback.Feedback.evaluate_deferred(
-                            tru=self,
-                            limit=self.DEFERRED_NUM_RUNS-len(futures_map),
-                            shuffle=True
-                        )
+        futures_map: Dict[Future[mod_feedback_schema.FeedbackResult],
+                          pandas.Series] = dict()
 
-                    # Will likely get some of the same ones that already have running.
-                    for row, fut in new_futures:
+        # Leases are renewed a few times per lease period so that a late
+        # renewal does not let them expire.
+        renew_interval = self.DEFERRED_LEASE_SECONDS / 3
+        last_renewal = datetime.now().timestamp()
 
-                        if fut in futures_map:
-                            # If the future is already in our set, check whether
-                            # its status has changed and if so, note it in the
-                            # runs_stats.
-                            if futures_map[fut].status != row.status:
-                                runs_stats[row.status.name] += 1
+        # Longest time to block before checking `stop` and renewing leases.
+        wake_interval = min(1.0, renew_interval)
 
-                        futures_map[fut] = row
-                        total += 1
+        # Whether to look for feedback to run in this iteration. This is done
+        # when notified of new feedback, when runs completed while more
+        # feedback than could be claimed was waiting, and at least every
+        # DEFERRED_POLL_SECONDS for feedback that becomes runnable without
+        # notification (failed retries, expired leases).
+        look = True
+        backlog = False
+        last_look = datetime.now().timestamp()
 
-                    tqdm_total.total = total
-                    tqdm_total.refresh()
+        while not stop.is_set():
 
-                tqdm_waiting.total = self.DEFERRED_NUM_RUNS
-                tqdm_waiting.n = len(futures_map)
-                tqdm_waiting.refresh()
+            if look and len(futures_map) < num_runs:
+                requested = num_runs - len(futures_map)
 
-                # Note whether we have waited for some futures in this
-                # iteration. Will control some extra wait time if there is no
-                # work.
-                did_wait = False
+                # Claim some new evals to run if some already completed by now.
+                new_futures: List[Tuple[pandas.Series, Future[mod_feedback_schema.FeedbackResult]]] = \
+                    feedback.Feedback.evaluate_deferred(
+                        tru=self,
+                        limit=requested,
+                        shuffle=True,
+                        asynchronous=asynchronous
+                    )
 
-                if len(futures_map) > 0:
-                    did_wait = True
+                for row, fut in new_futures:
+                    futures_map[fut] = row
+                    total += 1
 
-                    futures_copy = list(futures_map.keys())
+                    # Rows report the status they were claimed from. Ones not
+                    # counted yet were added since the last refresh.
+                    if queue_stats[row.status] > 0:
+                        queue_stats[row.status] -= 1
+                    queue_stats[FeedbackResultStatus.RUNNING] += 1
 
-                    try:
-                        for fut in futures.as_completed(futures_copy,
-                                                        timeout=10):
-                            del futures_map[fut]
+                backlog = len(new_futures) == requested
+                last_look = datetime.now().timestamp()
 
-                            tqdm_waiting.update(-1)
-                            tqdm_total.update(1)
+                tqdm_total.total = total
+                tqdm_total.refresh()
 
-                            feedback_result = fut.result()
-                            runs_stats[feedback_result.status.name] += 1
+            tqdm_waiting.total = num_runs
+            tqdm_waiting.n = len(futures_map)
+            tqdm_waiting.refresh()
 
-                    except futures.TimeoutError:
-                        pass
+            completed = False
 
-                tqdm_total.set_postfix(
-                    {
-                        name: count for name, count in runs_stats.items()
-                    }
+            if len(futures_map) > 0:
+                done, _ = futures.wait(
+                    list(futures_map.keys()),
+                    timeout=wake_interval,
+                    return_when=futures.FIRST_COMPLETED
                 )
 
-                queue_stats = self.db.get_feedback_count_by_status()
-                queue_done = queue_stats.get(
-                    mod_feedback_schema.FeedbackResultStatus.DONE
-                ) or 0
-                queue_total = sum(queue_stats.values())
+                for fut in done:
+                    del futures_map[fut]
+                    completed = True
 
-                tqdm_status.n = queue_done
-                tqdm_status.total = queue_total
-                tqdm_status.set_postfix(
-                    {
-                        status.name: count
-                        for status, count in queue_stats.items()
-                    }
-                )
+                    tqdm_waiting.update(-1)
+                    tqdm_total.update(1)
 
-                # Check if any of the running futures should be stopped.
-                futures_copy = list(futures_map.keys())
-                for fut in futures_copy:
-                    row = futures_map[fut]
+                    feedback_result = fut.result()
+                    # Runs that could not record their result marked
+                    # themselves failed.
+                    status = FeedbackResultStatus.FAILED \
+                        if feedback_result is None else feedback_result.status
 
-                    if fut.running():
-                        # Not checking status here as this will be not yet be set
-                        # correctly. The computation in the future updates the
-                        # database but this object is outdated.
+                    runs_stats[status.name] += 1
+                    if queue_stats[FeedbackResultStatus.RUNNING] > 0:
+                        queue_stats[FeedbackResultStatus.RUNNING] -= 1
+                    queue_stats[status] += 1
 
-                        elapsed = datetime.now().timestamp() - row.last_ts
-                        if elapsed > self.RETRY_RUNNING_SECONDS:
-                            fut.cancel()
+                notified = self.db.wait_for_feedback(timeout=0)
 
-                            # Not an actual status, but would be nice to
-                            # indicate cancellations in run stats:
-                            runs_stats["CANCELLED"] += 1
+            else:
+                notified = self.db.wait_for_feedback(timeout=wake_interval)
 
-                            del futures_map[fut]
+            now = datetime.now().timestamp()
 
-                if not did_wait:
-                    # Nothing to run/is running, wait a bit.
-                    if fork:
-                        sleep(10)
-                    else:
-                        self._evaluator_stop.wait(10)
+            look = notified or (backlog and completed) or \
+                now - last_look >= self.DEFERRED_POLL_SECONDS
 
-            print("Evaluator stopped.")
+            # Keep the leases of the feedback results still running so that
+            # other evaluators do not claim them.
+            if now - last_renewal >= renew_interval:
+                self.db.renew_feedback_leases(
+                    [row.feedback_result_id for row in futures_map.values()]
+                )
+                last_renewal = now
 
-        if fork:
-            proc = Process(target=runloop)
-        else:
-            proc = Thread(target=runloop)
-            proc.daemon = True
+            tqdm_total.set_postfix(
+                {
+                    name: count for name, count in runs_stats.items()
+                }
+            )
 
-        # Start a persistent thread or process that evaluates feedback functions.
+            if progress:
+                if now - last_refresh >= self.DEFERRED_STATUS_REFRESH_SECONDS:
+                    queue_stats = defaultdict(int)
+                    queue_stats.update(self.db.get_feedback_count_by_status())
+                    last_refresh = now
 
-        self._evaluator_proc = proc
-        proc.start()
+                tqdm_status.n = queue_stats[FeedbackResultStatus.DONE]
+                tqdm_status.total = sum(queue_stats.values())
+                tqdm_status.set_postfix(
+                    {
+                        status.name: count
+                        for status, count in queue_stats.items()
+                    }
+                )
 
-        return proc
+        if progress:
+            print("Evaluator stopped.")
 
     run_evaluator = start_evaluator
 
     def stop_evaluator(self):
         """
-        Stop the deferred feedback evaluation thread.
+        Stop the deferred feedback evaluation thread or processes.
         """
 
         if self._evaluator_proc is None:
             raise RuntimeError("Evaluator not running this process.")
 
-        if isinstance(self._evaluator_proc, Process):
-            self._evaluator_proc.terminate()
-
-        elif isinstance(self._evaluator_proc, Thread):
+        if isinstance(self._evaluator_proc, Thread):
             self._evaluator_stop.set()
             self._evaluator_proc.join()
             self._evaluator_stop = None
 
+        else:
+            # Feedback results leased by the workers are claimed again by
+            # other evaluators once their leases expire.
+            for proc in self._evaluator_workers:
+                proc.terminate()
+            for proc in self._evaluator_workers:
+                proc.join()
+            self._evaluator_workers = []
+
         self._evaluator_proc = None
 
     def run_dashboard(
@@ -1215,3 +1429,24 @@ class Tru(python.SingletonPerName):
         else:
             Tru._dashboard_proc.kill()
             Tru._dashboard_proc = None
+
+
+def _run_evaluator_worker(
+    db_args: Dict[str, Any], asynchronous: bool = False
+) -> None:
+    """Entry point of a deferred evaluator worker process.
+
+    Args:
+        db_args: Arguments to
+            [SQLAlchemyDB][trulens_eval.database.sqlalchemy.SQLAlchemyDB] for
+            connecting to the database of the starting process.
+
+        asynchronous: Whether to run feedback functions on an event loop
+            instead of threads.
+    """
+
+    tru = Tru(
+        database=sqlalchemy.SQLAlchemyDB(**db_args),
+        database_check_revision=False
+    )
+    tru._evaluator_loop(progress=False, asynchronous=asynchronous)
@@ -28,10 +28,13 @@ provide a synced version.
 """
 
 import asyncio
+from concurrent.futures import Future
 import inspect
 import logging
 from threading import current_thread
-from typing import Awaitable, Callable, TypeVar, Union
+from threading import Lock
+from threading import Thread
+from typing import Awaitable, Callable, Optional, TypeVar, Union
 
 import nest_asyncio
 
@@ -168,3 +171,48 @@ def sync(func: CallableMaybeAwaitable[A, T], *args, **kwargs) -> T:
         # in desync but not here.
 
         return func(*args, **kwargs)
+
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+"""Event loop run by a daemon thread for
+[run_in_background][trulens_eval.utils.asynchro.run_in_background]."""
+
+_background_loop_lock = Lock()
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop that runs forever in a background daemon thread,
+    starting it if needed.
+    """
+
+    global _background_loop
+
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+
+            # Not a tracking thread so that the loop does not inherit the
+            # context of whoever happened to start it.
+            thread = Thread(
+                target=loop.run_forever,
+                name="trulens_background_loop",
+                daemon=True
+            )
+            thread.start()
+
+            _background_loop = loop
+
+    return _background_loop
+
+
+def run_in_background(awaitable: Awaitable[T]) -> Future[T]:
+    """
+    Run the given awaitable in the
+    [background_loop][trulens_eval.utils.asynchro.background_loop].
+
+    Returns a [Future][concurrent.futures.Future] that can be waited for from
+    any thread. Any number of awaitables can be running at a time.
+    """
+
+    return asyncio.run_coroutine_threadsafe(awaitable, background_loop())
@@ -374,6 +374,10 @@ REQUIREMENT_NOTEBOOK = format_import_errors(
     ["ipython", "ipywidgets"], purpose="using TruLens-Eval in a notebook"
 )
 
+REQUIREMENT_PYARROW = format_import_errors(
+    "pyarrow", purpose="reading records as Arrow record batches"
+)
+
 
 # Try to pretend to be a type as well as an instance.
 class Dummy(type, object):
@@ -4,11 +4,20 @@ from __future__ import annotations
 
 import dataclasses
 from enum import Enum
+import functools
+import inspect
+import itertools
 import json
 import logging
+import os
 from pathlib import Path
 from pprint import PrettyPrinter
-from typing import Any, Dict, Optional, Sequence, Set, TypeVar
+import threading
+import time
+from typing import (Any, Callable, Dict, ItemsView, Iterable, Iterator,
+                    KeysView, Optional, Sequence, Set, Tuple, TypeVar,
+                    ValuesView)
+import uuid
 
 from merkle_json import MerkleJson
 import pydantic
@@ -24,6 +33,8 @@ from trulens_eval.utils.pyschema import ERROR
 from trulens_eval.utils.pyschema import NOSERIO
 from trulens_eval.utils.pyschema import noserio
 from trulens_eval.utils.pyschema import safe_getattr
+from trulens_eval.utils.pyschema import TRUNCATED
+from trulens_eval.utils.pyschema import truncated
 from trulens_eval.utils.pyschema import WithClassInfo
 from trulens_eval.utils.python import safe_hasattr
 from trulens_eval.utils.serial import JSON
@@ -67,6 +78,58 @@ def obj_id_of_obj(obj: dict, prefix="obj"):
     return f"{prefix}_hash_{mj.hash(obj)}"
 
 
+_UUID7_LOCK = threading.Lock()
+_UUID7_LAST: Tuple[int, int] = (0, 0)
+"""Timestamp (ms) and counter of the last generated UUIDv7."""
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Create a version 7 (time-ordered) UUID as per RFC 9562.
+
+    The top 48 bits are the unix time in milliseconds followed by a 12 bit
+    counter and 62 random bits. The counter is incremented for UUIDs created
+    in the same millisecond (or if the clock goes back) so UUIDs created by
+    this process are strictly increasing.
+    """
+
+    global _UUID7_LAST
+
+    with _UUID7_LOCK:
+        ms = time.time_ns() // 1_000_000
+        last_ms, counter = _UUID7_LAST
+
+        if ms > last_ms:
+            # Start the counter randomly in its lower half to leave room for
+            # increments.
+            counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            ms = last_ms
+            counter += 1
+            if counter > 0xFFF:
+                ms += 1
+                counter = 0
+
+        _UUID7_LAST = (ms, counter)
+
+    rand = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+
+    return uuid.UUID(
+        int=(ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | counter << 64 |
+        0b10 << 62 | rand
+    )
+
+
+def obj_id_of_time(prefix="obj"):
+    """
+    Create a new unique id that sorts by creation time. Unlike
+    [obj_id_of_obj][trulens_eval.utils.json.obj_id_of_obj], this does not
+    require serializing anything.
+    """
+
+    return f"{prefix}_{uuid7().hex}"
+
+
 def json_str_of_obj(
     obj: Any, *args, redact_keys: bool = False, **kwargs
 ) -> str:
@@ -95,7 +158,97 @@ def json_default(obj: Any) -> str:
         return noserio(obj)
 
 
-ALL_SPECIAL_KEYS = set([CIRCLE, ERROR, CLASS_INFO, NOSERIO])
+ALL_SPECIAL_KEYS = set([CIRCLE, ERROR, CLASS_INFO, NOSERIO, TRUNCATED])
+
+_UNDECODED = object()
+
+
+class LazyJSON:
+    """JSON text that is only decoded when its content is first accessed.
+
+    Used for JSON columns of dataframes read from the database so that callers
+    that do not look at a column never pay for decoding it. The decoded value
+    is available as [value][trulens_eval.utils.json.LazyJSON.value] and is
+    memoized so sharing one instance among rows (e.g. all rows of the same app)
+    decodes it at most once. Item access, iteration and `get`/`keys`/`items`/
+    `values` are forwarded to the decoded value for convenience. Code that
+    needs an actual [dict][] or [list][] (e.g. for pydantic validation) should
+    use `value`.
+
+    Args:
+        raw: The JSON text.
+
+        key: If given, the decoded value is the content of this key of the
+            decoded JSON object.
+    """
+
+    __slots__ = ("raw", "key", "_value")
+
+    def __init__(self, raw: str, key: Optional[str] = None):
+        self.raw = raw
+        self.key = key
+        self._value = _UNDECODED
+
+    @property
+    def value(self) -> JSON:
+        """The decoded JSON."""
+
+        if self._value is _UNDECODED:
+            value = json.loads(self.raw)
+            if self.key is not None:
+                value = value[self.key]
+            self._value = value
+
+        return self._value
+
+    def __getitem__(self, item: Any) -> JSON:
+        return self.value[item]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyJSON):
+            other = other.value
+        return self.value == other
+
+    __hash__ = None
+
+    def get(self, key: str, default: Any = None) -> JSON:
+        return self.value.get(key, default)
+
+    def keys(self) -> KeysView:
+        return self.value.keys()
+
+    def items(self) -> ItemsView:
+        return self.value.items()
+
+    def values(self) -> ValuesView:
+        return self.value.values()
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def __repr__(self) -> str:
+        if self._value is _UNDECODED:
+            return f"LazyJSON(<{len(self.raw)} chars undecoded>)"
+        return f"LazyJSON({self._value!r})"
+
+    @staticmethod
+    def decode(obj: Any) -> Any:
+        """Return the decoded value of `obj` if it is a `LazyJSON`, otherwise
+        `obj` itself."""
+
+        if isinstance(obj, LazyJSON):
+            return obj.value
+
+        return obj
 
 
 def jsonify_for_ui(*args, **kwargs):
@@ -107,21 +260,224 @@ def jsonify_for_ui(*args, **kwargs):
     return jsonify(*args, **kwargs, redact_keys=True, skip_specials=True)
 
 
+class _JsonifyKind(Enum):
+    """How [jsonify][trulens_eval.utils.json.jsonify] handles objects of a
+    type. Determined once per type."""
+
+    LAZY = 1
+    BASE = 2
+    SERIAL_BYTES = 3
+    PATH = 4
+    ENUM = 5
+    DICT = 6
+    SEQUENCE = 7
+    SET = 8
+    LENS = 9
+    PYDANTIC = 10
+    PYDANTIC_V1 = 11
+    DATACLASS = 12
+    OTHER = 13
+    """Instrumented object or not serializable, depending on the
+    instrumentation settings of the jsonify call."""
+
+
+_JSONIFY_KINDS: Dict[type, _JsonifyKind] = {}
+"""Cache of the kinds of types seen by jsonify."""
+
+_JSONIFY_EXTRA: Dict[type, bool] = {}
+"""Cache of whether types seen by jsonify have a `jsonify_extra` method."""
+
+
+def _jsonify_kind(cls: type) -> _JsonifyKind:
+    """Determine how jsonify handles objects of type `cls`, checking in the
+    same order as the isinstance checks this replaces."""
+
+    kind = _JSONIFY_KINDS.get(cls)
+    if kind is not None:
+        return kind
+
+    if issubclass(cls, LazyJSON):
+        kind = _JsonifyKind.LAZY
+    elif issubclass(cls, JSON_BASES):
+        kind = _JsonifyKind.BASE
+    elif issubclass(cls, SerialBytes):
+        kind = _JsonifyKind.SERIAL_BYTES
+    elif issubclass(cls, Path):
+        kind = _JsonifyKind.PATH
+    elif issubclass(cls, Enum):
+        kind = _JsonifyKind.ENUM
+    elif issubclass(cls, Dict):
+        kind = _JsonifyKind.DICT
+    elif issubclass(cls, Sequence):
+        kind = _JsonifyKind.SEQUENCE
+    elif issubclass(cls, Set):
+        kind = _JsonifyKind.SET
+    elif issubclass(cls, Lens):
+        kind = _JsonifyKind.LENS
+    elif issubclass(cls, pydantic.BaseModel):
+        kind = _JsonifyKind.PYDANTIC
+    elif issubclass(cls, pydantic.v1.BaseModel):
+        kind = _JsonifyKind.PYDANTIC_V1
+    elif dataclasses.is_dataclass(cls):
+        kind = _JsonifyKind.DATACLASS
+    else:
+        kind = _JsonifyKind.OTHER
+
+    _JSONIFY_KINDS[cls] = kind
+
+    return kind
+
+
+_DIRECT_FIELDS: Dict[Tuple[type, str], bool] = {}
+"""Cache of whether fields of types seen by jsonify can be read from instance
+dicts."""
+
+
+def _safe_field(obj: Any, cls: type, k: str) -> Any:
+    """Same as [safe_getattr][trulens_eval.utils.pyschema.safe_getattr] for a
+    field `k` of `obj` of type `cls` but reads the instance dict directly if
+    no data descriptor (e.g. property) of the class takes precedence over it.
+    """
+
+    direct = _DIRECT_FIELDS.get((cls, k))
+    if direct is None:
+        try:
+            direct = not inspect.isdatadescriptor(inspect.getattr_static(cls, k))
+        except AttributeError:
+            direct = True
+
+        _DIRECT_FIELDS[(cls, k)] = direct
+
+    if direct:
+        attrs = getattr(obj, "__dict__", None)
+        if attrs is not None and k in attrs:
+            return attrs[k]
+
+    return safe_getattr(obj, k)
+
+
+@functools.lru_cache(maxsize=None)
+def _class_info(cls: type) -> Class:
+    """Class information with bases of components. Memoized per class."""
+
+    return Class.of_class(cls=cls, with_bases=True)
+
+
+class CaptureLimits(SerialModel):
+    """Limits on how much of an object
+    [jsonify][trulens_eval.utils.json.jsonify] captures.
+
+    Content left out is replaced by markers made by
+    [truncated][trulens_eval.utils.pyschema.truncated] except for strings which
+    are cut short with a suffix noting how many characters were left out.
+
+    Example:
+        ```python
+        limits = CaptureLimits(
+            max_str_len=1024,
+            max_items=16,
+            max_depth=8,
+            drop_arrays=True,
+            serializers={Document: lambda doc: doc.page_content}
+        )
+        ```
+    """
+
+    max_str_len: Optional[int] = None
+    """Maximum number of characters of strings kept."""
+
+    max_items: Optional[int] = None
+    """Maximum number of elements of sequences and sets and entries of dicts
+    kept."""
+
+    max_depth: Optional[int] = None
+    """Maximum nesting of containers and objects. Deeper content is left
+    out."""
+
+    drop_arrays: bool = False
+    """Leave out numeric arrays like numpy arrays, tensors and lists of numbers
+    (e.g. embeddings), keeping only their shape and type."""
+
+    serializers: Dict[type, Callable[[Any], Any]] = pydantic.Field(
+        default_factory=dict, exclude=True
+    )
+    """Functions to jsonify objects of the given classes (and their subclasses)
+    with instead. Their results are jsonified in turn subject to the same
+    limits."""
+
+    _serializer_cache: Dict[type, Optional[Callable[[Any], Any]]] = \
+        pydantic.PrivateAttr(default_factory=dict)
+
+    def serializer_of(self, cls: type) -> Optional[Callable[[Any], Any]]:
+        """The serializer for objects of class `cls` if any."""
+
+        if len(self.serializers) == 0:
+            return None
+
+        if cls not in self._serializer_cache:
+            self._serializer_cache[cls] = next(
+                (
+                    self.serializers[base]
+                    for base in cls.__mro__
+                    if base in self.serializers
+                ), None
+            )
+
+        return self._serializer_cache[cls]
+
+
+def _is_numeric(obj: Any) -> bool:
+    return isinstance(obj, (int, float)) and not isinstance(obj, bool)
+
+
+def _array_info(obj: Any, cls: type) -> Optional[Dict[str, Any]]:
+    """Shape and type of `obj` if it is a numeric array or None otherwise."""
+
+    if isinstance(obj, (list, tuple)):
+        # Short lists of numbers like coordinates are kept.
+        if len(obj) >= 16 and all(_is_numeric(v) for v in obj):
+            return dict(cls=cls.__name__, shape=[len(obj)])
+
+        return None
+
+    # Numpy arrays, torch and tensorflow tensors.
+    shape = safe_getattr(obj, "shape") if safe_hasattr(obj, "shape") else None
+    dtype = safe_getattr(obj, "dtype") if safe_hasattr(obj, "dtype") else None
+    if shape is None or dtype is None:
+        return None
+
+    try:
+        shape = [int(d) if d is not None else None for d in shape]
+    except Exception:
+        return None
+
+    if len(shape) == 0:
+        # Scalars.
+        return None
+
+    return dict(cls=cls.__name__, shape=shape, dtype=str(dtype))
+
+
 def jsonify(
     obj: Any,
     dicted: Optional[Dict[int, JSON]] = None,
     instrument: Optional['Instrument'] = None,
     skip_specials: bool = False,
     redact_keys: bool = False,
-    include_excluded: bool = True
+    include_excluded: bool = True,
+    limits: Optional[CaptureLimits] = None
 ) -> JSON:
     """Convert the given object into types that can be serialized in json.
 
+    Objects that contain themselves are jsonified with a circular reference
+    marker in place of the repeated object. Objects that merely appear more
+    than once are jsonified each time.
+
     Args:
         obj: the object to jsonify.
 
-        dicted: the mapping from addresses of already jsonifed objects (via id)
-            to their json.
+        dicted: the mapping from addresses of objects (via id) being jsonified
+            by callers to their json. These are treated as circular references.
 
         instrument: instrumentation functions for checking whether to recur into
             components of `obj`.
@@ -134,24 +490,34 @@ def jsonify(
 
         include_excluded: include fields that are annotated to be excluded by pydantic.
 
+        limits: limits on how much of `obj` to capture.
+
     Returns:
         The jsonified version of the given object. Jsonified means that the the
         object is either a JSON base type, a list, or a dict with the containing
         elements of the same.
     """
-    skip_excluded = not include_excluded
-    # Hack so that our models do not get exludes dumped which causes many
-    # problems. Another variable set here so we can recurse with the original
-    # include_excluded .
-    if isinstance(obj, SerialModel):
-        skip_excluded = True
 
-    from trulens_eval.instruments import Instrument
+    # Ids of the objects being jsonified on the path from `obj` to the current
+    # object. Shared by the whole walk instead of copied at each level.
+    on_path = set(dicted.keys()) if dicted else set()
+
+    # Whether objects of each type are components to be instrumented. Depends
+    # on the instrumentation settings so only cached for this call.
+    instrumented: Dict[type, bool] = {}
 
-    if instrument is None:
-        instrument = Instrument()
+    def to_instrument(o: Any) -> bool:
+        nonlocal instrument
 
-    dicted = dicted or {}
+        cls = type(o)
+        if cls not in instrumented:
+            if instrument is None:
+                from trulens_eval.instruments import Instrument
+                instrument = Instrument()
+
+            instrumented[cls] = instrument.to_instrument_object(o)
+
+        return instrumented[cls]
 
     if skip_specials:
 
@@ -162,183 +528,209 @@ def jsonify(
         def recur_key(k):
             return isinstance(k, JSON_BASES)
 
-    if id(obj) in dicted:
-        if skip_specials:
-            return None
-
-        return {CIRCLE: id(obj)}
+    if limits is not None:
+        max_str_len = limits.max_str_len
+        max_items = limits.max_items
+        max_depth = limits.max_depth
+        drop_arrays = limits.drop_arrays
+        serializer_of = limits.serializer_of
+    else:
+        max_str_len = max_items = max_depth = None
+        drop_arrays = False
+        serializer_of = None
 
-    if isinstance(obj, JSON_BASES):
-        if redact_keys and isinstance(obj, str):
-            return redact_value(obj)
+    # Number of containers and objects being jsonified on the path from `obj`
+    # to the current object. Only tracked if depth is limited.
+    depth = 0
 
-        return obj
+    def limit_items(obj: Any) -> Tuple[Iterable, int]:
+        # Elements of the given container to keep and the number left out.
+        if max_items is None or len(obj) <= max_items:
+            return obj, 0
 
-    # TODO: remove eventually
-    if isinstance(obj, SerialBytes):
-        return obj.model_dump()
+        return itertools.islice(obj, max_items), len(obj) - max_items
 
-    if isinstance(obj, Path):
-        return str(obj)
+    def redact(temp: Dict[str, JSON]) -> None:
+        # Redact possible secrets based on key name and value.
+        for k, v in temp.items():
+            temp[k] = redact_value(v=v, k=k)
+
+    def recur(obj: Any) -> JSON:
+        nonlocal depth
+
+        cls = type(obj)
+        kind = _jsonify_kind(cls)
+
+        if kind is _JsonifyKind.LAZY:
+            obj = obj.value
+            cls = type(obj)
+            kind = _jsonify_kind(cls)
+
+        if kind is _JsonifyKind.BASE:
+            if redact_keys and isinstance(obj, str):
+                obj = redact_value(obj)
+
+            if max_str_len is not None and isinstance(
+                    obj, str) and len(obj) > max_str_len:
+                return f"{obj[:max_str_len]}... ({len(obj) - max_str_len} more characters)"
+
+            return obj
+
+        obj_id = id(obj)
+        if obj_id in on_path:
+            if skip_specials:
+                return None
+
+            return {CIRCLE: obj_id}
+
+        if limits is not None:
+            serializer = serializer_of(cls)
+            if serializer is not None:
+                content = serializer(obj)
+                if type(content) is cls:
+                    return content
+
+                on_path.add(obj_id)
+                try:
+                    return recur(content)
+                finally:
+                    on_path.discard(obj_id)
+
+            if drop_arrays and kind in (_JsonifyKind.SEQUENCE,
+                                        _JsonifyKind.OTHER):
+                info = _array_info(obj, cls)
+                if info is not None:
+                    return truncated("array", **info)
+
+            if max_depth is not None and depth >= max_depth and kind not in (
+                    _JsonifyKind.SERIAL_BYTES, _JsonifyKind.PATH,
+                    _JsonifyKind.ENUM, _JsonifyKind.LENS):
+                return truncated("depth", cls=cls.__name__)
+
+        # TODO: remove eventually
+        if kind is _JsonifyKind.SERIAL_BYTES:
+            return obj.model_dump()
 
-    if type(obj) in pydantic.v1.json.ENCODERS_BY_TYPE:
-        return pydantic.v1.json.ENCODERS_BY_TYPE[type(obj)](obj)
+        if kind is _JsonifyKind.PATH:
+            return str(obj)
 
-    # TODO: should we include duplicates? If so, dicted needs to be adjusted.
-    new_dicted = dict(dicted)
+        if cls in pydantic.v1.json.ENCODERS_BY_TYPE:
+            return pydantic.v1.json.ENCODERS_BY_TYPE[cls](obj)
 
-    def recur(o):
-        return jsonify(
-            obj=o,
-            dicted=new_dicted,
-            instrument=instrument,
-            skip_specials=skip_specials,
-            redact_keys=redact_keys,
-            include_excluded=include_excluded
-        )
+        if kind is _JsonifyKind.LENS:  # special handling of paths
+            return obj.model_dump()
 
-    content = None
+        on_path.add(obj_id)
+        depth += 1
+        try:
+            content = recur_content(obj, cls, kind)
+        finally:
+            depth -= 1
+            on_path.discard(obj_id)
 
-    if isinstance(obj, Enum):
-        content = obj.name
+        # Add class information for objects that are to be instrumented, known
+        # as "components".
+        if not skip_specials and isinstance(content, dict) and not isinstance(
+                obj, dict) and (to_instrument(obj) or
+                                isinstance(obj, WithClassInfo)):
 
-    elif isinstance(obj, Dict):
-        temp = {}
-        new_dicted[id(obj)] = temp
-        temp.update({k: recur(v) for k, v in obj.items() if recur_key(k)})
+            content[CLASS_INFO] = _class_info(cls).model_dump()
 
-        # Redact possible secrets based on key name and value.
-        if redact_keys:
-            for k, v in temp.items():
-                temp[k] = redact_value(v=v, k=k)
+        has_extra = _JSONIFY_EXTRA.get(cls)
+        if has_extra is None:
+            has_extra = _JSONIFY_EXTRA[cls] = safe_hasattr(
+                obj, "jsonify_extra"
+            )
+        if has_extra:
+            content = obj.jsonify_extra(content)
 
-        content = temp
+        return content
 
-    elif isinstance(obj, Sequence):
-        temp = []
-        new_dicted[id(obj)] = temp
-        for x in (recur(v) for v in obj):
-            temp.append(x)
+    def recur_content(obj: Any, cls: type, kind: _JsonifyKind) -> JSON:
+        """Jsonify the content of `obj` which is on the path."""
 
-        content = temp
+        # Hack so that our models do not get exludes dumped which causes many
+        # problems.
+        skip_excluded = not include_excluded or isinstance(obj, SerialModel)
 
-    elif isinstance(obj, Set):
-        temp = []
-        new_dicted[id(obj)] = temp
-        for x in (recur(v) for v in obj):
-            temp.append(x)
+        if kind is _JsonifyKind.ENUM:
+            return obj.name
 
-        content = temp
+        if kind is _JsonifyKind.DICT:
+            items, omitted = limit_items(obj.items())
+            temp = {k: recur(v) for k, v in items if recur_key(k)}
+            if redact_keys:
+                redact(temp)
 
-    elif isinstance(obj, pydantic.BaseModel):
-        # Not even trying to use pydantic.dict here.
+            if omitted > 0:
+                temp.update(truncated("items", omitted=omitted))
 
-        if isinstance(obj, Lens):  # special handling of paths
-            return obj.model_dump()
+            return temp
 
-        temp = {}
-        new_dicted[id(obj)] = temp
-        temp.update(
-            {
-                k: recur(safe_getattr(obj, k))
-                for k, v in obj.model_fields.items()
-                if (not skip_excluded or not v.exclude) and recur_key(k)
-            }
-        )
+        if kind is _JsonifyKind.SEQUENCE or kind is _JsonifyKind.SET:
+            items, omitted = limit_items(obj)
+            temp = [recur(v) for v in items]
 
-        # Redact possible secrets based on key name and value.
-        if redact_keys:
-            for k, v in temp.items():
-                temp[k] = redact_value(v=v, k=k)
+            if omitted > 0:
+                temp.append(truncated("items", omitted=omitted))
 
-        content = temp
+            return temp
 
-    elif isinstance(obj, pydantic.v1.BaseModel):
-        # TODO: DEDUP with pydantic.BaseModel case
+        if kind is _JsonifyKind.PYDANTIC:
+            # Not even trying to use pydantic.dict here.
+            temp = {
+                k: recur(_safe_field(obj, cls, k))
+                for k, v in cls.model_fields.items()
+                if (not skip_excluded or not v.exclude) and recur_key(k)
+            }
+            if redact_keys:
+                redact(temp)
 
-        # Not even trying to use pydantic.dict here.
+            return temp
 
-        temp = {}
-        new_dicted[id(obj)] = temp
-        temp.update(
-            {
-                k: recur(safe_getattr(obj, k))
+        if kind is _JsonifyKind.PYDANTIC_V1:
+            temp = {
+                k: recur(_safe_field(obj, cls, k))
                 for k, v in obj.__fields__.items()
                 if (not skip_excluded or not v.field_info.exclude) and
                 recur_key(k)
             }
-        )
+            if redact_keys:
+                redact(temp)
 
-        # Redact possible secrets based on key name and value.
-        if redact_keys:
-            for k, v in temp.items():
-                temp[k] = redact_value(v=v, k=k)
+            return temp
 
-        content = temp
-
-    elif dataclasses.is_dataclass(type(obj)):
-        # NOTE: cannot use dataclasses.asdict as that may fail due to its use of
-        # copy.deepcopy.
-
-        temp = {}
-        new_dicted[id(obj)] = temp
-
-        temp.update(
-            {
-                f.name: recur(safe_getattr(obj, f.name))
+        if kind is _JsonifyKind.DATACLASS:
+            # NOTE: cannot use dataclasses.asdict as that may fail due to its
+            # use of copy.deepcopy.
+            temp = {
+                f.name: recur(_safe_field(obj, cls, f.name))
                 for f in dataclasses.fields(obj)
                 if recur_key(f.name)
             }
-        )
-
-        # Redact possible secrets based on key name and value.
-        if redact_keys:
-            for k, v in temp.items():
-                temp[k] = redact_value(v=v, k=k)
-
-        content = temp
-
-    elif instrument.to_instrument_object(obj):
+            if redact_keys:
+                redact(temp)
 
-        temp = {}
-        new_dicted[id(obj)] = temp
+            return temp
 
-        kvs = clean_attributes(obj, include_props=True)
+        if to_instrument(obj):
+            kvs = clean_attributes(obj, include_props=True)
 
-        # TODO(piotrm): object walks redo
-        temp.update(
-            {
+            # TODO(piotrm): object walks redo
+            return {
                 k: recur(v) for k, v in kvs.items() if recur_key(k) and (
-                    isinstance(v, JSON_BASES) or isinstance(v, Dict) or
-                    isinstance(v, Sequence) or
-                    instrument.to_instrument_object(v)
+                    _jsonify_kind(type(v)) in (
+                        _JsonifyKind.BASE, _JsonifyKind.DICT,
+                        _JsonifyKind.SEQUENCE
+                    ) or to_instrument(v)
                 )
             }
-        )
-
-        content = temp
 
-    else:
         logger.debug(
             "Do not know how to jsonify an object '%s' of type '%s'.",
-            str(obj)[0:32], type(obj)
+            str(obj)[0:32], cls
         )
 
-        content = noserio(obj)
-
-    # Add class information for objects that are to be instrumented, known as
-    # "components".
-    if not skip_specials and isinstance(content, dict) and not isinstance(
-            obj, dict) and (instrument.to_instrument_object(obj) or
-                            isinstance(obj, WithClassInfo)):
-
-        content[CLASS_INFO] = Class.of_class(
-            cls=obj.__class__, with_bases=True
-        ).model_dump()
-
-    if not isinstance(obj, Lens) and safe_hasattr(obj, "jsonify_extra"):
-        # Problem with Lens and similar objects: they always say they have every attribute.
-
-        content = obj.jsonify_extra(content)
+        return noserio(obj)
 
-    return content
+    return recur(obj)
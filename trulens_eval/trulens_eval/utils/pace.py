@@ -1,11 +1,15 @@
+from __future__ import annotations
+
 from _thread import LockType
+import asyncio
 from collections import deque
 from datetime import datetime
 from datetime import timedelta
 import logging
+import random
 from threading import Lock
 import time
-from typing import ClassVar, Deque, Optional
+from typing import ClassVar, Deque, Dict, Hashable, Optional, Tuple
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -92,18 +96,26 @@ class Pace(BaseModel):
             **kwargs
         )
 
-    def mark(self) -> float:
+    def _reserve(self) -> Tuple[float, float]:
         """
-        Return in appropriate pace. Blocks until return can happen in the
-        appropriate pace. Returns time in seconds since last mark returned.
+        Reserve the next mark in pace. Returns the time in seconds to wait
+        before the reserved mark can return and the time in seconds between the
+        prior mark and the reserved one.
+        
+        Marks are reserved in order of calls and the lock is only held while
+        reserving so that waiting can be done by either threads or coroutines.
         """
 
         with self.lock:
+            now = datetime.now()
+            at = now
 
-            while len(self.mark_expirations) >= self.max_marks:
-                delay = (self.mark_expirations[0] -
-                         datetime.now()).total_seconds()
+            if len(self.mark_expirations) >= self.max_marks:
+                # The oldest mark in the period needs to expire before the
+                # reserved one can return.
+                at = max(now, self.mark_expirations.popleft())
 
+                delay = (at - now).total_seconds()
                 if delay >= self.seconds_per_period * 0.5:
                     logger.warning(
                         f"""
@@ -116,19 +128,376 @@ per second in that period.
 """
                     )
 
-                if delay > 0.0:
-                    time.sleep(delay)
-
-                self.mark_expirations.popleft()
-
             prior_last_mark = self.last_mark
-            now = datetime.now()
-            self.last_mark = now
+            self.last_mark = at
 
             # Add to marks the point at which the mark can be removed (after
             # `period` seconds).
-            self.mark_expirations.append(
-                now + self.seconds_per_period_timedelta
+            self.mark_expirations.append(at + self.seconds_per_period_timedelta)
+
+            return (at - now).total_seconds(), (at - prior_last_mark).total_seconds()
+
+    def mark(self) -> float:
+        """
+        Return in appropriate pace. Blocks until return can happen in the
+        appropriate pace. Returns time in seconds since last mark returned.
+        """
+
+        delay, since_last_mark = self._reserve()
+        if delay > 0.0:
+            time.sleep(delay)
+
+        return since_last_mark
+
+    async def amark(self) -> float:
+        """
+        Async version of [mark][trulens_eval.utils.pace.Pace.mark]. Waits
+        without blocking the event loop so any number of coroutines can wait
+        for their turn.
+        """
+
+        delay, since_last_mark = self._reserve()
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+
+        return since_last_mark
+
+
+class TokenBucket(BaseModel):
+    """A token bucket holding up to `capacity` tokens refilled continuously at
+    `per_second` tokens per second.
+
+    The level of the bucket may go negative. Tokens taken beyond what is
+    available are debt that later takers have to wait out in addition to their
+    own share. This makes takers that reserve in order also wait in order.
+    """
+
+    capacity: float
+    """Most tokens the bucket can hold. Also the largest allowed burst."""
+
+    per_second: float
+    """Refill rate in tokens per second."""
+
+    level: float
+    """Tokens currently available. Negative if tokens are owed."""
+
+    updated: float = Field(default_factory=time.monotonic)
+    """Monotonic time at which `level` was last refilled."""
+
+    def __init__(self, capacity: float, per_second: float, **kwargs):
+        if capacity <= 0.0 or per_second <= 0.0:
+            raise ValueError(
+                "Token bucket needs a positive `capacity` and `per_second`."
+            )
+
+        kwargs['level'] = kwargs.get('level', capacity)
+
+        super().__init__(capacity=capacity, per_second=per_second, **kwargs)
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill up to `now`."""
+
+        if now > self.updated:
+            self.level = min(
+                self.capacity,
+                self.level + (now - self.updated) * self.per_second
+            )
+            self.updated = now
+
+    def wait_for(self, tokens: float, now: float) -> float:
+        """Seconds from `now` until `tokens` tokens will be available.
+        
+        Requests for more than `capacity` tokens only wait for a full bucket as
+        they could never be satisfied otherwise.
+        """
+
+        needed = min(tokens, self.capacity) - self.level
+        if needed <= 0.0:
+            return 0.0
+
+        # Refill may be paused until a later time.
+        return max(0.0, self.updated - now) + needed / self.per_second
+
+    def take(self, tokens: float) -> None:
+        """Take `tokens` tokens, possibly putting the bucket into debt."""
+
+        self.level -= tokens
+
+    def give(self, tokens: float) -> None:
+        """Return `tokens` tokens, up to the bucket's capacity."""
+
+        self.level = min(self.capacity, self.level + tokens)
+
+
+class RateLimiter(BaseModel):
+    """Keep requests to an API within its requests per minute (RPM) and tokens
+    per minute (TPM) budgets.
+
+    Each request takes one token from a requests bucket and its estimated
+    number of tokens from a tokens bucket (if a TPM budget is given). Estimates
+    are corrected once actual usage is known via
+    [settle][trulens_eval.utils.pace.RateLimiter.settle]. Rate limit responses
+    from the API are reported via
+    [rate_limited][trulens_eval.utils.pace.RateLimiter.rate_limited] and block
+    all users of the limiter until the API is expected to accept requests
+    again.
+
+    Users of the same API key should share a limiter as the API budgets are per
+    key. See [shared][trulens_eval.utils.pace.RateLimiter.shared].
+    """
+
+    BASE_BACKOFF_SECONDS: ClassVar[float] = 1.0
+    """Backoff after the first rate limit response without a retry delay."""
+
+    MAX_BACKOFF_SECONDS: ClassVar[float] = 60.0
+    """Largest backoff after repeated rate limit responses."""
+
+    _shared: ClassVar[Dict[str, RateLimiter]] = {}
+    """Limiters created by
+    [shared][trulens_eval.utils.pace.RateLimiter.shared], by key."""
+
+    _shared_lock: ClassVar[LockType] = Lock()
+    """Lock for the above."""
+
+    rpm: float
+    """Requests per minute."""
+
+    tpm: Optional[float] = None
+    """Tokens per minute. Tokens are not limited if None."""
+
+    requests: TokenBucket
+    """Bucket of requests, refilled at `rpm`."""
+
+    tokens: Optional[TokenBucket] = None
+    """Bucket of tokens, refilled at `tpm`."""
+
+    blocked_until: float = 0.0
+    """Monotonic time before which no request should be made due to a rate
+    limit response."""
+
+    failures: int = 0
+    """Number of rate limit responses since the last successful request.
+    Backoff grows exponentially with this."""
+
+    observed: Dict[Hashable, int] = Field(default_factory=dict)
+    """Last total token count reported to
+    [settle][trulens_eval.utils.pace.RateLimiter.settle] per source."""
+
+    pending: Dict[Hashable, float] = Field(default_factory=dict)
+    """Estimated tokens taken per source not yet matched with observed usage."""
+
+    lock: LockType = Field(default_factory=Lock)
+    """Thread Lock to ensure the buckets are updated one caller at a time."""
+
+    model_config: ClassVar[dict] = dict(arbitrary_types_allowed=True)
+
+    def __init__(self, rpm: float, tpm: Optional[float] = None, **kwargs):
+        kwargs['requests'] = TokenBucket(capacity=rpm, per_second=rpm / 60.0)
+        if tpm is not None:
+            kwargs['tokens'] = TokenBucket(capacity=tpm, per_second=tpm / 60.0)
+
+        super().__init__(rpm=rpm, tpm=tpm, **kwargs)
+
+    @classmethod
+    def shared(
+        cls, key: str, rpm: float, tpm: Optional[float] = None
+    ) -> RateLimiter:
+        """Get the limiter for the given `key`, creating it if needed.
+        
+        If the limiter already exists, its budgets are lowered to the given
+        ones if those are tighter.
+        """
+
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+
+            if limiter is None:
+                limiter = cls(rpm=rpm, tpm=tpm)
+                cls._shared[key] = limiter
+
+            else:
+                limiter.restrict(rpm=rpm, tpm=tpm)
+
+            return limiter
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Forget all shared limiters."""
+
+        with cls._shared_lock:
+            cls._shared.clear()
+
+    def restrict(self, rpm: float, tpm: Optional[float] = None) -> None:
+        """Lower the budgets of this limiter to the given ones if tighter."""
+
+        with self.lock:
+            if rpm < self.rpm:
+                self.rpm = rpm
+                self.requests.capacity = rpm
+                self.requests.per_second = rpm / 60.0
+                self.requests.level = min(self.requests.level, rpm)
+
+            if tpm is not None and (self.tpm is None or tpm < self.tpm):
+                self.tpm = tpm
+                if self.tokens is None:
+                    self.tokens = TokenBucket(
+                        capacity=tpm, per_second=tpm / 60.0
+                    )
+                else:
+                    self.tokens.capacity = tpm
+                    self.tokens.per_second = tpm / 60.0
+                    self.tokens.level = min(self.tokens.level, tpm)
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Reserve a request of `tokens` tokens. Returns the time in seconds to
+        wait before the request can be made.
+
+        As in [Pace][trulens_eval.utils.pace.Pace], the lock is only held while
+        reserving so that waiting can be done by either threads or coroutines.
+        """
+
+        with self.lock:
+            now = time.monotonic()
+
+            self.requests.refill(now)
+            delay = max(
+                self.blocked_until - now, self.requests.wait_for(1.0, now)
             )
+            self.requests.take(1.0)
+
+            if self.tokens is not None and tokens > 0.0:
+                self.tokens.refill(now)
+                delay = max(delay, self.tokens.wait_for(tokens, now))
+                self.tokens.take(tokens)
+
+            return delay
+
+    def acquire(self, tokens: float = 0.0) -> float:
+        """
+        Block until a request of `tokens` tokens can be made within budget.
+        Returns the time in seconds waited.
+        """
+
+        delay = self._reserve(tokens)
+        if delay > 0.0:
+            time.sleep(delay)
+
+        return delay
+
+    async def aacquire(self, tokens: float = 0.0) -> float:
+        """
+        Async version of [acquire][trulens_eval.utils.pace.RateLimiter.acquire].
+        Waits without blocking the event loop.
+        """
+
+        delay = self._reserve(tokens)
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+
+        return delay
+
+    def settle(self, source: Hashable, observed: int, estimated: float) -> None:
+        """
+        Correct the tokens taken for requests with their actual usage.
+
+        Args:
+            source: Identifies the counter of `observed`.
+
+            observed: Total tokens used as counted by `source` so far. Usage
+                tracking is typically cumulative and cannot be attributed to a
+                single request when requests are concurrent so estimates are
+                matched against any increase in this total instead.
+
+            estimated: Tokens estimated and taken for the request being
+                settled.
+        """
+
+        with self.lock:
+            pending = self.pending.get(source, 0.0) + estimated
+            delta = observed - self.observed.get(source, observed)
+            self.observed[source] = observed
+
+            if delta <= 0 or self.tokens is None:
+                # Usage is not counted yet (or at all). Keep the estimates.
+                self.pending[source] = pending
+                return
+
+            self.pending[source] = 0.0
+
+            # Usage beyond the estimates puts the bucket (further) into debt.
+            self.tokens.refill(time.monotonic())
+            self.tokens.level = min(
+                self.tokens.capacity, self.tokens.level + pending - delta
+            )
+
+    def observe(self, source: Hashable, observed: int) -> None:
+        """Start counting usage of `source` from its current total `observed`."""
+
+        with self.lock:
+            self.observed.setdefault(source, observed)
+
+    def refund(self, tokens: float) -> None:
+        """Give back `tokens` tokens taken for a request that failed.
+        
+        The request itself is not given back as APIs count failed requests
+        towards their limits too.
+        """
+
+        if self.tokens is None:
+            return
+
+        with self.lock:
+            self.tokens.give(tokens)
+
+    def succeeded(self) -> None:
+        """Note a request made without being rate limited."""
+
+        if self.failures > 0:
+            with self.lock:
+                self.failures = 0
+
+    def rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """
+        Note a rate limit response and block requests until the API is expected
+        to accept them again. Returns the seconds from now until then.
+
+        Args:
+            retry_after: Seconds to wait as given by the API response (i.e. its
+                `Retry-After` header). If not given, backoff exponentially in
+                the number of rate limit responses since the last successful
+                request.
+        """
+
+        with self.lock:
+            now = time.monotonic()
+
+            if retry_after is None and now < self.blocked_until:
+                # Already backing off. Other requests made before the block
+                # are being turned away too and should not grow the backoff.
+                return self.blocked_until - now
+
+            self.failures += 1
+
+            if retry_after is None:
+                delay = min(
+                    self.MAX_BACKOFF_SECONDS,
+                    self.BASE_BACKOFF_SECONDS * 2**(self.failures - 1)
+                )
+                # Full jitter so that blocked callers do not come back at once.
+                delay = random.uniform(delay / 2.0, delay)
+            else:
+                # Small jitter past the given time.
+                delay = retry_after + random.uniform(
+                    0.0, 0.1 * max(retry_after, self.BASE_BACKOFF_SECONDS)
+                )
+
+            self.blocked_until = max(self.blocked_until, now + delay)
+
+            # No requests are accepted during the block so its time cannot
+            # also be spent as budget afterwards.
+            self.requests.refill(now)
+            self.requests.level = min(self.requests.level, 0.0)
+            self.requests.updated = self.blocked_until
 
-            return (now - prior_last_mark).total_seconds()
+            return self.blocked_until - now
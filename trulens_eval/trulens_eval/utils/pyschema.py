@@ -44,6 +44,9 @@ ERROR = "__tru_property_error"
 # Key for indicating non-serialized objects in json dumps.
 NOSERIO = "__tru_non_serialized_object"
 
+# Key for indicating content left out of json dumps due to capture limits.
+TRUNCATED = "__tru_truncated"
+
 
 def is_noserio(obj):
     """
@@ -68,6 +71,23 @@ def noserio(obj, **extra: Dict) -> dict:
     return {NOSERIO: inner}
 
 
+def is_truncated(obj):
+    """
+    Determines whether the given json object represents content left out due to
+    capture limits. See `truncated`.
+    """
+    return isinstance(obj, dict) and TRUNCATED in obj
+
+
+def truncated(reason: str, **extra: Dict) -> dict:
+    """
+    Create a json structure to represent content left out due to capture limits
+    for the given reason. Any additional keyword arguments are included.
+    """
+
+    return {TRUNCATED: dict(reason=reason, **extra)}
+
+
 # TODO: rename as functionality optionally produces JSONLike .
 def safe_getattr(obj: Any, k: str, get_prop: bool = True) -> Any:
     """
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 from concurrent import futures
+import contextvars
 import dataclasses
 import inspect
 import logging
@@ -327,6 +328,22 @@ def run_before(callback: Callable):
 # Attribute name for storing a callstack in asyncio tasks.
 STACK = "__tru_stack"
 
+FRAME_WALK_FALLBACK: bool = False
+"""Whether to look up call information by walking the python call stack when it
+was not found in context variables.
+
+Instrumented methods propagate their call information (recording contexts,
+call stacks, cost-tracking endpoints) through [context
+variables][contextvars.ContextVar] which are carried across threads started by
+[Thread][trulens_eval.utils.threading.Thread],
+[ThreadPoolExecutor][trulens_eval.utils.threading.ThreadPoolExecutor],
+[TP][trulens_eval.utils.threading.TP], and across asyncio tasks. Enable this to
+additionally walk the call stack (see
+[get_first_local_in_call_stack][trulens_eval.utils.python.get_first_local_in_call_stack])
+when nothing was propagated. This requires capturing the stack whenever threads
+or tasks are started and is significantly more expensive.
+"""
+
 
 def caller_frame(offset=0) -> 'frame':
     """
@@ -372,6 +389,11 @@ def task_factory_with_stack(loop, coro, *args, **kwargs) -> Sequence['frame']:
     parent_task = asyncio.current_task(loop=loop)
     task = asyncio.tasks.Task(coro=coro, loop=loop, *args, **kwargs)
 
+    if not FRAME_WALK_FALLBACK:
+        # Context variables are copied into tasks by asyncio itself so there is
+        # no need to capture the (expensive) stack.
+        return task
+
     stack = [fi.frame for fi in inspect.stack()[2:]]
 
     if parent_task is not None:
@@ -455,12 +477,19 @@ def stack_with_tasks() -> Sequence['frame']:
         return ret
 
 
-def _future_target_wrapper(stack, context, func, *args, **kwargs):
+def _future_target_wrapper(
+    stack, context: contextvars.Context, func, *args, **kwargs
+):
     """
     Wrapper for a function that is started by threads. This is needed to
-    record the call stack prior to thread creation as in python threads do
-    not inherit the stack. Our instrumentation, however, relies on walking
-    the stack and need to do this to the frames prior to thread starts.
+    carry the context variables and (if
+    [FRAME_WALK_FALLBACK][trulens_eval.utils.python.FRAME_WALK_FALLBACK] is
+    enabled) the call stack prior to thread creation as in python threads do
+    not inherit either.
+    
+    The function is run inside the given `context` instead of setting its
+    variables in the thread's own context. Threads of a pool are reused so the
+    latter would leak values from one task into subsequent ones.
     """
 
     # TODO: See if threading.stack_size([size]) can be used instead.
@@ -468,10 +497,7 @@ def _future_target_wrapper(stack, context, func, *args, **kwargs):
     # Keep this for looking up via get_first_local_in_call_stack .
     pre_start_stack = stack
 
-    for var, value in context.items():
-        var.set(value)
-
-    return func(*args, **kwargs)
+    return context.run(func, *args, **kwargs)
 
 
 def get_all_local_in_call_stack(
@@ -584,6 +610,47 @@ def get_first_local_in_call_stack(
         return None
 
 
+def get_first_local_in_call_context(
+    var: contextvars.ContextVar[T],
+    key: str,
+    func: Callable[[Callable], bool],
+    offset: Optional[int] = 1,
+    skip: Optional[Any] = None  # actually frame
+) -> Optional[T]:
+    """Get the value of the context variable `var` if it is set in the current
+    context.
+
+    Otherwise, if
+    [FRAME_WALK_FALLBACK][trulens_eval.utils.python.FRAME_WALK_FALLBACK] is
+    enabled, look for the local variable named `key` in the call stack as per
+    [get_first_local_in_call_stack][trulens_eval.utils.python.get_first_local_in_call_stack].
+    Returns None if neither is found.
+
+    Args:
+        var: The context variable to read.
+
+        key: The name of the local variable to look for in the fallback.
+
+        func: Recognizer of the function to find in the call stack.
+
+        offset: The number of top frames to skip in the fallback, not counting
+            this method itself.
+
+        skip: A frame to skip as well in the fallback.
+    """
+
+    val = var.get(None)
+    if val is not None or not FRAME_WALK_FALLBACK:
+        return val
+
+    return get_first_local_in_call_stack(
+        key=key,
+        func=func,
+        offset=offset + 1,
+        skip=skip
+    )
+
+
 # Wrapping utilities
 
 
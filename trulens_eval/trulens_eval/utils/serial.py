@@ -12,6 +12,8 @@ from ast import dump
 from ast import parse
 from contextvars import ContextVar
 from copy import copy
+import functools
+import itertools
 import logging
 from typing import (
     Any, Callable, ClassVar, Dict, Generic, Hashable, Iterable, List, Optional,
@@ -243,12 +245,24 @@ class Step(pydantic.BaseModel, Hashable):
         raise NotImplementedError()
 
     # @abc.abstractmethod # NOTE1
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         """
         Set the value(s) indicated by self in `obj` to value `val`.
+
+        `obj` is copied unless `in_place` is set in which case it is modified
+        if it is mutable.
         """
         raise NotImplementedError()
 
+    def _getter(self) -> Callable[[Any], Iterable[Any]]:
+        """
+        Function getting the elements of an object indexed by `self`. Used by
+        [CompiledLens][trulens_eval.utils.serial.CompiledLens]. Steps override
+        this with faster versions of
+        [get][trulens_eval.utils.serial.Step.get] for common cases.
+        """
+        return self.get
+
 
 class Collect(Step):
     # Need something for `Step.validate` to tell that it is looking at Collect.
@@ -264,7 +278,7 @@ class Collect(Step):
         raise NotImplementedError()
 
     # Step requirement
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         raise NotImplementedError()
 
     def __repr__(self):
@@ -298,12 +312,13 @@ class GetAttribute(StepItemOrAttribute):
             )
 
     # Step requirement
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         if obj is None:
             obj = Bunch()
 
-        # might cause isses
-        obj = copy(obj)
+        elif not in_place:
+            # might cause isses
+            obj = copy(obj)
 
         if hasattr(obj, self.attribute):
             setattr(obj, self.attribute, val)
@@ -335,14 +350,15 @@ class GetIndex(Step):
             raise ValueError(f"Object {obj} is not a sequence.")
 
     # Step requirement
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         if obj is None:
             obj = []
 
         assert isinstance(obj, Sequence), "Sequence expected."
 
-        # copy
-        obj = list(obj)
+        if not in_place or not isinstance(obj, list):
+            # copy
+            obj = list(obj)
 
         if self.index >= 0:
             while len(obj) <= self.index:
@@ -351,6 +367,17 @@ class GetIndex(Step):
         obj[self.index] = val
         return obj
 
+    def _getter(self) -> Callable[[Any], Iterable[Any]]:
+        index = self.index
+        get = self.get
+
+        def getter(obj: Any) -> Iterable[Any]:
+            if type(obj) is list and -len(obj) <= index < len(obj):
+                return (obj[index],)
+            return get(obj)
+
+        return getter
+
     def __repr__(self):
         return f"[{self.index}]"
 
@@ -377,18 +404,30 @@ class GetItem(StepItemOrAttribute):
             raise ValueError(f"Object {obj} is not a dictionary.")
 
     # Step requirement
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         if obj is None:
             obj = dict()
 
         assert isinstance(obj, Dict), "Dictionary expected."
 
-        # copy
-        obj = {k: v for k, v in obj.items()}
+        if not in_place:
+            # copy
+            obj = {k: v for k, v in obj.items()}
 
         obj[self.item] = val
         return obj
 
+    def _getter(self) -> Callable[[Any], Iterable[Any]]:
+        item = self.item
+        get = self.get
+
+        def getter(obj: Any) -> Iterable[Any]:
+            if (type(obj) is dict or type(obj) is Bunch) and item in obj:
+                return (obj[item],)
+            return get(obj)
+
+        return getter
+
     def __repr__(self):
         return f"[{repr(self.item)}]"
 
@@ -447,21 +486,37 @@ class GetItemOrAttribute(StepItemOrAttribute):
                 )
 
     # Step requirement
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         if obj is None:
             obj = dict()
 
         if isinstance(obj, Dict) and not isinstance(obj, Bunch):
             # Bunch claims to be a Dict.
-            # copy
-            obj = {k: v for k, v in obj.items()}
+            if not in_place:
+                # copy
+                obj = {k: v for k, v in obj.items()}
             obj[self.item_or_attribute] = val
         else:
-            obj = copy(obj)  # might cause issues
+            if not in_place:
+                obj = copy(obj)  # might cause issues
             setattr(obj, self.item_or_attribute, val)
 
         return obj
 
+    def _getter(self) -> Callable[[Any], Iterable[Any]]:
+        item_or_attribute = self.item_or_attribute
+        get = self.get
+
+        def getter(obj: Any) -> Iterable[Any]:
+            # Bunch is the type of record layouts. Other types go through the
+            # general case.
+            if (type(obj) is dict or
+                    type(obj) is Bunch) and item_or_attribute in obj:
+                return (obj[item_or_attribute],)
+            return get(obj)
+
+        return getter
+
     def __repr__(self):
         return f".{self.item_or_attribute}"
 
@@ -486,7 +541,7 @@ class GetSlice(Step):
             raise ValueError("Object is not a sequence.")
 
     # Step requirement
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         if obj is None:
             obj = []
 
@@ -495,8 +550,9 @@ class GetSlice(Step):
         lower, upper, step = slice(self.start, self.stop,
                                    self.step).indices(len(obj))
 
-        # copy
-        obj = list(obj)
+        if not in_place or not isinstance(obj, list):
+            # copy
+            obj = list(obj)
 
         for i in range(lower, upper, step):
             obj[i] = val
@@ -535,14 +591,15 @@ class GetIndices(Step):
             raise ValueError("Object is not a sequence.")
 
     # Step requirement
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         if obj is None:
             obj = []
 
         assert isinstance(obj, Sequence), "Sequence expected."
 
-        # copy
-        obj = list(obj)
+        if not in_place or not isinstance(obj, list):
+            # copy
+            obj = list(obj)
 
         for i in self.indices:
             if i >= 0:
@@ -576,14 +633,15 @@ class GetItems(Step):
             raise ValueError("Object is not a dictionary.")
 
     # Step requirement
-    def set(self, obj: Any, val: Any) -> Any:
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
         if obj is None:
             obj = dict()
 
         assert isinstance(obj, Dict), "Dictionary expected."
 
-        # copy
-        obj = {k: v for k, v in obj.items()}
+        if not in_place:
+            # copy
+            obj = {k: v for k, v in obj.items()}
 
         for i in self.items:
             obj[i] = val
@@ -607,6 +665,80 @@ class ParseException(Exception):
         )
 
 
+class CompiledLens:
+    """
+    A [Lens][trulens_eval.utils.serial.Lens] compiled into a flat sequence of
+    step functions.
+
+    Getting and setting with a lens recursed over its path, creating and
+    validating a new `Lens` for every step. The compiled form iterates over the
+    steps instead. Get one with
+    [Lens.compiled][trulens_eval.utils.serial.Lens.compiled] which caches them.
+    """
+
+    def __init__(self, path: Tuple[Step, ...]):
+        self.path = path
+
+        self._getters: Tuple[Callable[[Any], Iterable[Any]], ...] = tuple(
+            step._getter() for step in path
+        )
+        self._collects: Tuple[bool, ...] = tuple(
+            isinstance(step, Collect) for step in path
+        )
+
+    def get(self, obj: Any) -> Iterable[Any]:
+        """Get the values at the path in `obj`. See
+        [Lens.get][trulens_eval.utils.serial.Lens.get]."""
+
+        items: Iterable[Any] = (obj,)
+
+        for getter, collect in zip(self._getters, self._collects):
+            if collect:
+                items = (list(items),)
+            else:
+                items = itertools.chain.from_iterable(map(getter, items))
+
+        yield from items
+
+    def set(self, obj: Any, val: Any, in_place: bool = False) -> Any:
+        """Set the values at the path in `obj` to `val`. See
+        [Lens.set][trulens_eval.utils.serial.Lens.set]."""
+
+        return self._set(obj, 0, val, in_place)
+
+    def _set(self, obj: Any, i: int, val: Any, in_place: bool) -> Any:
+        if i == len(self.path):
+            return val
+
+        step = self.path[i]
+        getter = self._getters[i]
+
+        try:
+            first_obj, firsts = iterable_peek(getter(obj))
+
+        except (ValueError, IndexError, KeyError, AttributeError):
+
+            # `step` points to an element that does not exist, use `set` to create a spot for it.
+            obj = step.set(obj, None, in_place=in_place)
+            firsts = getter(obj)
+
+        for first_obj in firsts:
+            obj = step.set(
+                obj,
+                self._set(first_obj, i + 1, val, in_place),
+                in_place=in_place
+            )
+
+        return obj
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_path(path: Tuple[Step, ...]) -> CompiledLens:
+    """Compiled lens for `path`, cached so that each path is compiled once."""
+
+    return CompiledLens(path)
+
+
 class Lens(pydantic.BaseModel, Sized, Hashable):
     # Not using SerialModel as we have special handling of serialization to/from
     # strings for this class which interferes with SerialModel mechanisms.
@@ -935,13 +1067,27 @@ class Lens(pydantic.BaseModel, Sized, Hashable):
         appends `val` to that sequence as a list. If it is set but not a sequence,
         error is thrown.
         
+        """
+        return self.set_or_extend(obj=obj, vals=[val])
+
+    def set_or_extend(
+        self, obj: Any, vals: Sequence[Any], in_place: bool = False
+    ) -> Any:
+        """
+        Like [set_or_append][trulens_eval.utils.serial.Lens.set_or_append] but
+        for several values at once. Setting all the values destined for the
+        same path with one call avoids copying the list and the objects along
+        the path once per value. See [set][trulens_eval.utils.serial.Lens.set]
+        regarding `in_place`.
         """
         try:
             existing = self.get_sole_item(obj)
             if isinstance(existing, Sequence):
-                return self.set(obj, list(existing) + [val])
+                return self.set(
+                    obj, list(existing) + list(vals), in_place=in_place
+                )
             elif existing is None:
-                return self.set(obj, [val])
+                return self.set(obj, list(vals), in_place=in_place)
             else:
                 raise ValueError(
                     f"Trying to append to object which is not a list; "
@@ -949,34 +1095,28 @@ class Lens(pydantic.BaseModel, Sized, Hashable):
                 )
 
         except Exception:
-            return self.set(obj, [val])
+            return self.set(obj, list(vals), in_place=in_place)
 
-    def set(self, obj: T, val: Union[Any, T]) -> T:
+    def compiled(self) -> CompiledLens:
         """
-        In `obj` at path `self` exists, change it to `val`. Otherwise create a
-        spot for it with Munch objects and then set it.
+        The compiled form of this lens which
+        [get][trulens_eval.utils.serial.Lens.get] and
+        [set][trulens_eval.utils.serial.Lens.set] use.
         """
 
-        if len(self.path) == 0:
-            return val
-
-        first = self.path[0]
-        rest = Lens(path=self.path[1:])
-
-        try:
-            firsts = first.get(obj)
-            first_obj, firsts = iterable_peek(firsts)
-
-        except (ValueError, IndexError, KeyError, AttributeError):
+        return _compile_path(self.path)
 
-            # `first` points to an element that does not exist, use `set` to create a spot for it.
-            obj = first.set(obj, None)  # will create a spot for `first`
-            firsts = first.get(obj)
+    def set(self, obj: T, val: Union[Any, T], in_place: bool = False) -> T:
+        """
+        In `obj` at path `self` exists, change it to `val`. Otherwise create a
+        spot for it with Munch objects and then set it.
 
-        for first_obj in firsts:
-            obj = first.set(obj, rest.set(first_obj, val))
+        The objects along the path are copied unless `in_place` is set in which
+        case mutable ones are modified instead. Only use `in_place` on
+        structures that nothing else refers to, such as freshly built ones.
+        """
 
-        return obj
+        return self.compiled().set(obj, val, in_place=in_place)
 
     def get_sole_item(self, obj: Any) -> Any:
         all_objects = list(self.get(obj))
@@ -1005,27 +1145,9 @@ class Lens(pydantic.BaseModel, Sized, Hashable):
             raise TypeError(error_msg)
 
     def get(self, obj: Any) -> Iterable[Any]:
-        if len(self.path) == 0:
-            yield obj
-            return
+        """Get the values at the path in `obj`."""
 
-        # Need to do the recursion by breaking down steps from the end in order
-        # to support `Collect`.
-        last_step = self.path[-1]
-        if len(self.path) == 1:
-            start = Lens(path=())
-        else:
-            start = Lens(path=self.path[0:-1])
-
-        start_items = start.get(obj)
-
-        if isinstance(last_step, Collect):
-            yield list(start_items)
-
-        else:
-            for start_selection in start_items:
-                for last_selection in last_step.get(start_selection):
-                    yield last_selection
+        return self.compiled().get(obj)
 
     def _append(self, step: Step) -> Lens:
         return Lens(path=self.path + (step,))
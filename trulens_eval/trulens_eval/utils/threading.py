@@ -11,8 +11,9 @@ from inspect import stack
 import logging
 import threading
 from threading import Thread as fThread
-from typing import Callable, Optional, TypeVar
+from typing import Callable, List, Optional, TypeVar
 
+from trulens_eval.utils import python as mod_python_utils
 from trulens_eval.utils.python import _future_target_wrapper
 from trulens_eval.utils.python import code_line
 from trulens_eval.utils.python import Future
@@ -27,6 +28,20 @@ DEFAULT_NETWORK_TIMEOUT: float = 10.0  # seconds
 A = TypeVar("A")
 
 
+def _present_stack() -> List:
+    """Stack to carry over to new threads.
+    
+    Only captured if
+    [FRAME_WALK_FALLBACK][trulens_eval.utils.python.FRAME_WALK_FALLBACK] is
+    enabled as context variables are otherwise sufficient.
+    """
+
+    if mod_python_utils.FRAME_WALK_FALLBACK:
+        return stack()[1:]  # skip this method
+
+    return []
+
+
 class Thread(fThread):
     """Thread that wraps target with stack/context tracking.
     
@@ -42,7 +57,7 @@ class Thread(fThread):
         kwargs={},
         daemon=None
     ):
-        present_stack = stack()
+        present_stack = _present_stack()
         present_context = contextvars.copy_context()
 
         fThread.__init__(
@@ -73,7 +88,7 @@ class ThreadPoolExecutor(fThreadPoolExecutor):
         super().__init__(*args, **kwargs)
 
     def submit(self, fn, /, *args, **kwargs):
-        present_stack = stack()
+        present_stack = _present_stack()
         present_context = contextvars.copy_context()
         return super().submit(
             _future_target_wrapper, present_stack, present_context, fn, *args,
@@ -153,7 +168,14 @@ class TP(SingletonPerName):  # "thread processing"
         if timeout is None:
             timeout = TP.DEBUG_TIMEOUT
 
-        fut: Future[T] = self.thread_pool.submit(func, *args, **kwargs)
+        # Run in a copy of this thread's context which was itself copied from
+        # the submitter of the task by thread_pool_debug_tasks. This keeps
+        # context variables (i.e. recording contexts) propagated to `func`.
+        present_context = contextvars.copy_context()
+
+        fut: Future[T] = self.thread_pool.submit(
+            present_context.run, func, *args, **kwargs
+        )
 
         try:
             res: T = fut.result(timeout=timeout)
@@ -6,10 +6,13 @@ from unittest import main
 from unittest import TestCase
 
 from tests.unit.attribution_axioms_test_base import AxiomsTestBase
+import torch
 from torch import Tensor
+from torch.nn import Embedding
 from torch.nn import Linear
 from torch.nn import Module
 from torch.nn import ReLU
+from torch.nn import Sequential
 from trulens.nn.backend import get_backend
 from trulens.nn.models import get_model_wrapper
 
@@ -65,6 +68,50 @@ class AxiomsTest(AxiomsTestBase, TestCase):
         self.layer2 = 'l1_relu'
         self.layer3 = 'l2'
 
+        # Make a sequence model with position embeddings evaluated before the
+        # DoI cut. Their input and output are not batched.
+        class M_pos(Module):
+
+            def __init__(this):
+                super(M_pos, this).__init__()
+                this.pos = Embedding(2, self.input_size)
+                this.l1 = Linear(self.input_size, self.internal1_size)
+                this.l1_relu = ReLU()
+                this.l2 = Linear(self.internal1_size, self.output_size)
+
+            def forward(this, x):
+                positions = torch.arange(x.shape[1], device=x.device)
+                x = x + this.pos(positions)
+                x = this.l1(x)
+                x = this.l1_relu(x)
+                return this.l2(x).sum(dim=1)
+
+        self.model_pos = get_model_wrapper(M_pos())
+
+        self.layer_pos = 'l1_relu'
+
+        # Make a model with a module that is the child of two parents, called
+        # both before and after the DoI cut.
+        class M_shared(Module):
+
+            def __init__(this):
+                super(M_shared, this).__init__()
+                this.l1 = Linear(self.input_size, self.internal1_size)
+                this.relu = ReLU()
+                this.block = Sequential(
+                    Linear(self.internal1_size, self.internal1_size), this.relu
+                )
+                this.l2 = Linear(self.internal1_size, self.output_size)
+
+            def forward(this, x):
+                x = this.relu(this.l1(x))
+                x = this.block(x)
+                return this.l2(x)
+
+        self.model_shared = get_model_wrapper(M_shared())
+
+        self.layer_shared = 'block_0'
+
 
 if __name__ == '__main__':
     main()
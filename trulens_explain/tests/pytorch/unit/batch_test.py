@@ -6,12 +6,30 @@ from unittest import main
 from unittest import TestCase
 
 from tests.unit.batch_test_base import BatchTestBase
+import torch
 from torch import Tensor
 from torch.nn import Linear
 from torch.nn import Module
 from torch.nn import ReLU
+from torch.nn import Sequential
+from trulens.nn.attribution import InternalInfluence
 from trulens.nn.backend import get_backend
+from trulens.nn.distributions import LinearDoi
 from trulens.nn.models import get_model_wrapper
+from trulens.nn.quantities import MaxClassQoI
+from trulens.nn.slices import InputCut
+
+
+def make_runner_method():
+    """Attribution method for the runner tests. Defined at the top level so
+    that worker processes of the runner can make it."""
+
+    torch.manual_seed(2020)
+    model = Sequential(Linear(5, 10), ReLU(), Linear(10, 3))
+
+    return InternalInfluence(
+        get_model_wrapper(model), InputCut(), MaxClassQoI(), LinearDoi()
+    )
 
 
 class BatchTest(BatchTestBase, TestCase):
@@ -62,6 +80,8 @@ class BatchTest(BatchTestBase, TestCase):
 
         self.model_deep = get_model_wrapper(M_deep())
 
+        self.make_runner_method = make_runner_method
+
 
 if __name__ == '__main__':
     main()
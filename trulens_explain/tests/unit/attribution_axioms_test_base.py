@@ -12,6 +12,7 @@ These axioms should hold on arbitrary networks.
 '''
 
 from functools import partial
+from unittest.mock import patch
 
 import numpy as np
 from trulens.nn.attribution import InternalInfluence
@@ -407,3 +408,135 @@ class AxiomsTestBase(object):
         self.assertTrue(
             np.allclose(res.sum(axis=1), out_x - out_baseline, atol=5e-2)
         )
+
+    def test_streaming(self):
+        for cut, rebatch_size in [(InputCut(), 6), (Cut(self.layer2), None)]:
+            infls = [
+                InternalInfluence(
+                    self.model_deep,
+                    cut,
+                    ClassQoI(2),
+                    LinearDoi(resolution=100, cut=cut),
+                    multiply_activation=True,
+                    rebatch_size=rebatch_size,
+                    streaming=streaming
+                ) for streaming in [False, True]
+            ]
+
+            res, res_streaming = (infl.attributions(self.x) for infl in infls)
+
+            self.assertEqual(res.shape, res_streaming.shape)
+            self.assertTrue(np.allclose(res, res_streaming, atol=self.atol))
+
+    def test_prefix_cache(self):
+        cut = Cut(self.layer2)
+
+        # Rebatches of 5 rows start at instances that wrap around the batch.
+        for rebatch_size, streaming in [(None, False), (5, False), (5, True)]:
+            infl = InternalInfluence(
+                self.model_deep,
+                cut,
+                ClassQoI(2),
+                LinearDoi(resolution=10, cut=cut),
+                multiply_activation=True,
+                rebatch_size=rebatch_size,
+                streaming=streaming
+            )
+
+            res = infl.attributions(self.x)
+
+            with patch.object(self.model_deep, '_prefix_cache',
+                              return_value=None):
+                res_uncached = infl.attributions(self.x)
+
+            self.assertEqual(res.shape, res_uncached.shape)
+            self.assertTrue(np.allclose(res, res_uncached, atol=self.atol))
+
+    def test_prefix_cache_shared_module(self):
+        """Test that a module that is the child of two parents, and so is
+        listed under two names, is replayed once and restored afterwards. It is
+        called both before and after the DoI cut."""
+
+        if not hasattr(self, 'model_shared'):
+            # TODO: implement these tests for other backends
+            return
+
+        cut = Cut(self.layer_shared)
+        x = np.random.normal(size=(3, self.input_size))
+
+        B = get_backend()
+        out = B.as_array(self.model_shared.fprop((x,))[0])
+
+        for rebatch_size in [None, 5]:
+            infl = InternalInfluence(
+                self.model_shared,
+                cut,
+                ClassQoI(2),
+                LinearDoi(resolution=10, cut=cut),
+                multiply_activation=True,
+                rebatch_size=rebatch_size
+            )
+
+            res = infl.attributions(x)
+
+            with patch.object(self.model_shared, '_prefix_cache',
+                              return_value=None):
+                res_uncached = infl.attributions(x)
+
+            self.assertEqual(res.shape, res_uncached.shape)
+            self.assertTrue(np.allclose(res, res_uncached, atol=self.atol))
+
+            # Later evaluations of the model are unaffected.
+            self.assertTrue(
+                np.allclose(
+                    B.as_array(self.model_shared.fprop((x,))[0]), out,
+                    atol=self.atol
+                )
+            )
+
+    def test_prefix_cache_not_batch_major(self):
+        """Test that outputs of layers before the DoI cut that are not batched
+        along their first dimension are not replayed, here position embeddings
+        of as many positions as there are instances."""
+
+        if not hasattr(self, 'model_pos'):
+            # TODO: implement these tests for other backends
+            return
+
+        cut = Cut(self.layer_pos)
+        x = np.random.normal(size=(2, 2, self.input_size))
+
+        for rebatch_size in [None, 5]:
+            infl = InternalInfluence(
+                self.model_pos,
+                cut,
+                ClassQoI(2),
+                LinearDoi(resolution=10, cut=cut),
+                multiply_activation=True,
+                rebatch_size=rebatch_size
+            )
+
+            res = infl.attributions(x)
+
+            with patch.object(self.model_pos, '_prefix_cache',
+                              return_value=None):
+                res_uncached = infl.attributions(x)
+
+            self.assertEqual(res.shape, res_uncached.shape)
+            self.assertTrue(np.allclose(res, res_uncached, atol=self.atol))
+
+        # The cache can be disabled.
+        infl = InternalInfluence(
+            self.model_pos,
+            cut,
+            ClassQoI(2),
+            LinearDoi(resolution=10, cut=cut),
+            multiply_activation=True,
+            cache_prefix=False
+        )
+
+        with patch.object(self.model_pos, '_prefix_cache') as prefix_cache:
+            res_disabled = infl.attributions(x)
+
+        prefix_cache.assert_not_called()
+        self.assertTrue(np.allclose(res, res_disabled, atol=self.atol))
@@ -1,7 +1,13 @@
+import os
 from unittest import TestCase
+from unittest.mock import patch
 
 import numpy as np
+from trulens.nn.backend import AdaptiveRebatcher
 from trulens.nn.backend import get_backend
+from trulens.nn.backend import MemoryInfo
+from trulens.nn.backend import OutOfMemory
+from trulens.utils.typing import TensorArgs
 
 
 class BackendTestBase(TestCase):
@@ -53,3 +59,80 @@ class BackendTestBase(TestCase):
         tcatted = B.concat([self.tzeros, self.tones, self.ttwos], axis=-1)
 
         self.assertTrue(np.allclose(catted, B.as_array(tcatted)))
+
+    def test_adaptive_rebatcher(self):
+        B = get_backend()
+
+        vals = TensorArgs(args=[B.as_tensor(np.arange(20.0))])
+
+        def take(offset, batch):
+            # Pretend that batches larger than 6 run out of memory.
+            if batch.args[0].shape[0] > 6:
+                raise OutOfMemory(settings=[])
+            return offset, B.as_array(batch.args[0])
+
+        rebatcher = AdaptiveRebatcher(probe_size=4)
+        results = rebatcher.map(take, vals)
+
+        offsets = [offset for offset, _ in results]
+        rows = np.concatenate([batch for _, batch in results])
+
+        self.assertEqual(offsets[:2], [0, 4])
+        self.assertTrue(np.allclose(rows, np.arange(20.0)))
+        self.assertGreater(rebatcher.n_retries, 0)
+        self.assertLessEqual(rebatcher.batch_size, 6)
+
+        def fail(offset, batch):
+            raise OutOfMemory(settings=[])
+
+        with self.assertRaises(OutOfMemory):
+            AdaptiveRebatcher(probe_size=4).map(fail, vals)
+
+    def test_adaptive_rebatcher_memory(self):
+        B = get_backend()
+
+        vals = TensorArgs(args=[B.as_tensor(np.arange(40.0))])
+
+        def take(offset, batch):
+            return B.as_array(batch.args[0])
+
+        # Each instance of the probe takes 100 bytes of the 1000 available.
+        memory = MemoryInfo(free=1000, current=0, peak=400)
+
+        rebatcher = AdaptiveRebatcher(probe_size=4, memory_fraction=0.8)
+        with patch.object(B, 'memory_info', return_value=memory), \
+                patch.object(B, 'reset_peak_memory'):
+            results = rebatcher.map(take, vals)
+
+        self.assertEqual([len(batch) for batch in results], [4] + [8] * 4 + [4])
+        self.assertEqual(rebatcher.instance_memory, 100)
+        self.assertEqual(rebatcher.batch_size, 8)
+
+    def test_adaptive_rebatcher_host_memory(self):
+        if not os.path.exists('/proc/self/status'):
+            # Resident memory of the process is not reported on this platform.
+            return
+
+        B = get_backend()
+
+        vals = TensorArgs(args=[B.as_tensor(np.ones((64, 1000)))])
+
+        def take(offset, batch):
+            # Some memory proportional to the batch size.
+            return float(np.sum(np.tile(B.as_array(batch.args[0]), (1, 8))))
+
+        info = B.memory_info()
+        if info.free is None or info.peak is None:
+            # Not on the host, as with cuda devices.
+            return
+
+        rebatcher = AdaptiveRebatcher(probe_size=4, memory_fraction=0.5)
+        rebatcher.map(take, vals)
+
+        # Sizing does not grow without bound when allocations are tracked on
+        # the host.
+        self.assertIsNotNone(rebatcher.instance_memory)
+        self.assertLessEqual(
+            rebatcher.batch_size * rebatcher.instance_memory,
+            0.5 * info.free * 1.1
+        )
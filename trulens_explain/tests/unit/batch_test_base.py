@@ -1,7 +1,13 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+
 import numpy as np
 from trulens.nn.attribution import InternalInfluence
 from trulens.nn.distributions import LinearDoi
 from trulens.nn.quantities import MaxClassQoI
+from trulens.nn.runner import AttributionRunner
+from trulens.nn.runner import CHECKPOINT_FILE
 from trulens.nn.slices import InputCut
 
 
@@ -71,3 +77,80 @@ class BatchTestBase(object):
         r2 = infl.attributions(self.batch_x)
 
         self.assertTrue(np.allclose(r1, r2))
+
+    def test_adaptive_rebatch(self):
+        infls = [
+            InternalInfluence(
+                self.model_deep,
+                InputCut(),
+                MaxClassQoI(),
+                LinearDoi(),
+                rebatch_size=rebatch_size
+            ) for rebatch_size in [None, 'auto']
+        ]
+
+        r1, r2 = (infl.attributions(self.batch_x) for infl in infls)
+
+        self.assertTrue(np.allclose(r1, r2))
+        self.assertIsNotNone(infls[1]._rebatcher.batch_size)
+
+    def test_runner_resume(self):
+
+        def make_method():
+            return InternalInfluence(
+                self.model_deep, InputCut(), MaxClassQoI(), LinearDoi()
+            )
+
+        expected = make_method().attributions(self.batch_x)
+
+        batches = [self.batch_x[i:i + 2] for i in range(0, 5, 2)]
+
+        def interrupted():
+            yield batches[0]
+            raise KeyboardInterrupt
+
+        with TemporaryDirectory() as out_dir:
+            with self.assertRaises(KeyboardInterrupt):
+                AttributionRunner(make_method,
+                                  out_dir).run(interrupted(), n_instances=5)
+
+            with open(os.path.join(out_dir, CHECKPOINT_FILE)) as f:
+                self.assertEqual(json.load(f)['done'], [0])
+
+            attrs = AttributionRunner(make_method,
+                                      out_dir).run(batches, n_instances=5)
+
+            self.assertTrue(np.allclose(attrs, expected))
+
+    def test_runner_workers(self):
+        if not hasattr(self, 'make_runner_method'):
+            # TODO: implement these tests for other backends
+            return
+
+        expected = self.make_runner_method().attributions(self.batch_x)
+
+        batches = [self.batch_x[i:i + 2] for i in range(0, 5, 2)]
+
+        with TemporaryDirectory() as out_dir:
+            attrs = AttributionRunner(
+                self.make_runner_method, out_dir, n_workers=2
+            ).run(batches, n_instances=5)
+
+            self.assertTrue(np.allclose(attrs, expected))
+
+    def test_runner_shape_mismatch(self):
+
+        class Identity(object):
+            # Attributions with the shape of the batch.
+
+            def attributions(self, x):
+                return np.asarray(x)
+
+        batches = [np.ones((2, 3)), np.ones((2, 4))]
+
+        with TemporaryDirectory() as out_dir:
+            with self.assertRaisesRegex(ValueError, "fixed shape"):
+                AttributionRunner(Identity, out_dir).run(batches, n_instances=4)
+
+            with open(os.path.join(out_dir, CHECKPOINT_FILE)) as f:
+                self.assertEqual(json.load(f)['done'], [0])
@@ -114,10 +114,27 @@ class MultiQoiTestBase(TestCase):
             model_wrapper, cuts, PerTimestepQoI(), RNNLinearDoi()
         )
 
-        input_attrs = infl.attributions(
-            np.ones((batch_size, num_timesteps, num_features)
-                   ).astype('float32')
-        )
+        x = np.ones((batch_size, num_timesteps, num_features)).astype('float32')
+
+        input_attrs = infl.attributions(x)
+
+        if hasattr(model_wrapper, 'vectorize_grads'):
+            # Gradients of all QoI outputs were computed at once rather than
+            # falling back to one per output.
+            self.assertTrue(model_wrapper.vectorize_grads)
+
+            # Same attributions from one gradient per QoI output.
+            model_wrapper.vectorize_grads = False
+            try:
+                loop_attrs = infl.attributions(x)
+            finally:
+                model_wrapper.vectorize_grads = True
+
+            self.assertTrue(
+                np.allclose(
+                    np.stack(input_attrs), np.stack(loop_attrs), atol=1e-5
+                )
+            )
 
         original_output_shape = (
             num_classes * num_timesteps, batch_size, num_timesteps, num_features
@@ -13,9 +13,10 @@ package.
 from abc import ABC as AbstractBaseClass
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Callable, get_type_hints, List, Tuple, Union
+from typing import Callable, get_type_hints, List, Optional, Tuple, Union
 
 import numpy as np
+from trulens.nn.backend import AdaptiveRebatcher
 from trulens.nn.backend import get_backend
 from trulens.nn.backend import memory_suggestions
 from trulens.nn.backend import rebatch
@@ -24,6 +25,7 @@ from trulens.nn.distributions import DoI
 from trulens.nn.distributions import LinearDoi
 from trulens.nn.distributions import PointDoi
 from trulens.nn.models._model_base import ModelWrapper
+from trulens.nn.models._model_base import PrefixCache
 from trulens.nn.quantities import ComparativeQoI
 from trulens.nn.quantities import InternalChannelQoI
 from trulens.nn.quantities import LambdaQoI
@@ -90,7 +92,11 @@ class AttributionMethod(AbstractBaseClass):
 
     @abstractmethod
     def __init__(
-        self, model: ModelWrapper, rebatch_size: int = None, *args, **kwargs
+        self,
+        model: ModelWrapper,
+        rebatch_size: Union[int, str] = None,
+        *args,
+        **kwargs
     ):
         """
         Abstract constructor.
@@ -99,18 +105,28 @@ class AttributionMethod(AbstractBaseClass):
             model: ModelWrapper
                 Model for which attributions are calculated.
 
-            rebatch_size: int (optional)
+            rebatch_size: int or "auto" (optional)
                 Will rebatch instances to this size if given. This may be
                 required for GPU usage if using a DoI which produces multiple
                 instances per user-provided instance. Many valued DoIs will
                 expand the tensors sent to each layer to original_batch_size *
                 doi_size. The rebatch size will break up original_batch_size *
                 doi_size into rebatch_size chunks to send to model.
+
+                If "auto", rebatches are sized from the memory available and
+                retried at half the size if memory runs out. See
+                `backend.AdaptiveRebatcher`.
         """
         self._model = model
 
         self.rebatch_size = rebatch_size
 
+        self._rebatcher: Optional[AdaptiveRebatcher] = None
+        if rebatch_size == 'auto':
+            self._rebatcher = AdaptiveRebatcher(
+                device=getattr(model, 'device', None)
+            )
+
     @property
     def model(self) -> ModelWrapper:
         """
@@ -118,6 +134,39 @@ class AttributionMethod(AbstractBaseClass):
         """
         return self._model
 
+    def _map_rebatches(
+        self,
+        fn: Callable,
+        vals: TensorArgs,
+        *extra_vals: TensorArgs,
+        batch_size: Optional[int] = None
+    ) -> List:
+        """
+        Apply `fn` to consecutive rebatches of `vals` and `extra_vals` in order
+        and return the results. It is called with the offset of the first
+        instance of the rebatch followed by the rebatch of each given set of
+        values. Rebatches have `rebatch_size` instances, or `batch_size` if that
+        is not given, or are sized adaptively if `rebatch_size` is "auto".
+        """
+
+        if self._rebatcher is not None:
+            return self._rebatcher.map(fn, vals, *extra_vals)
+
+        B = get_backend()
+
+        rebatch_size = self.rebatch_size
+        if rebatch_size is None:
+            rebatch_size = batch_size
+
+        results = []
+        offset = 0
+
+        for batch in rebatch(vals, *extra_vals, batch_size=rebatch_size):
+            results.append(fn(offset, *batch))
+            offset += batch[0].first_batchable(B).shape[0]
+
+        return results
+
     @abstractmethod
     def _attributions(self, model_inputs: ModelInputs) -> AttributionResult:
         """
@@ -260,7 +309,9 @@ class InternalInfluence(AttributionMethod):
         multiply_activation: bool = True,
         return_grads: bool = False,
         return_doi: bool = False,
+        streaming: bool = False,
         *args,
+        cache_prefix: bool = True,
         **kwargs
     ):
         """
@@ -344,15 +395,39 @@ class InternalInfluence(AttributionMethod):
                 Whether to multiply the gradient result by its corresponding
                 activation, thus converting from "*influence space*" to 
                 "*attribution space*."
+
+            streaming:
+                Whether to produce the points of the distribution of interest a
+                rebatch at a time and keep running sums of their gradients
+                instead of materializing all points and gradients at once. Peak
+                memory then depends on `rebatch_size` (or the batch size if not
+                given) instead of the size of the distribution of interest.
+                Cannot be used with `return_grads` or `return_doi`.
+
+            cache_prefix:
+                Whether to record the outputs of layers evaluated before the DoI
+                cut once and replay them for every point of the distribution of
+                interest instead of recomputing them, if the model wrapper
+                supports it. Disable for models with layers before the DoI cut
+                whose outputs are not batched along their first dimension even
+                though their inputs are.
         """
         super().__init__(model, *args, **kwargs)
 
+        if streaming and (return_grads or return_doi):
+            raise ValueError(
+                'Gradients and distribution of interest points are not kept '
+                'when `streaming` so cannot be returned.'
+            )
+
         self.slice = InternalInfluence.__get_slice(cuts)
         self.qoi = InternalInfluence.__get_qoi(qoi)
         self.doi = InternalInfluence.__get_doi(doi, cut=self.slice.from_cut)
         self._do_multiply = multiply_activation
         self._return_grads = return_grads
         self._return_doi = return_doi
+        self._streaming = streaming
+        self._cache_prefix = cache_prefix
 
     def _attributions(self, model_inputs: ModelInputs) -> AttributionResult:
         # NOTE: not symbolic
@@ -374,16 +449,52 @@ class InternalInfluence(AttributionMethod):
 
         doi_cut = self.doi.cut() if self.doi.cut() else InputCut()
 
+        # Outputs of layers before the DoI cut are recorded while computing the
+        # DoI cut values and replayed for every point of the DoI, if supported
+        # by the model wrapper.
+        prefix_cache = None
+        if self._cache_prefix:
+            prefix_cache = self.model._prefix_cache(doi_cut)
+
         with memory_suggestions(*param_msgs):  # Handles out-of-memory messages.
-            doi_val: List[B.Tensor] = self.model._fprop(
+            doi_tensors: List[B.Tensor] = self.model._fprop(
                 model_inputs=model_inputs,
                 to_cut=doi_cut,
                 doi_cut=InputCut(),
                 attribution_cut=None,  # InputCut(),
-                intervention=model_inputs
+                intervention=model_inputs,
+                **InternalInfluence.__prefix_kwargs(prefix_cache)
             )[0]
 
-        doi_val = nested_map(doi_val, B.as_array)
+        doi_val = nested_map(doi_tensors, B.as_array)
+
+        # The activations to multiply by are those at the DoI cut when the
+        # attributions are for the same cut, no need to compute them again.
+        z_val = doi_tensors if InternalInfluence.__same_cut(
+            doi_cut, self.slice.from_cut
+        ) else None
+
+        if self._streaming:
+            attrs = self.__streaming_mean_grads(
+                doi_val,
+                model_inputs=model_inputs,
+                doi_cut=doi_cut,
+                batch_size=batch_size,
+                param_msgs=param_msgs,
+                prefix_cache=prefix_cache
+            )
+
+            if self._do_multiply:
+                attrs = self.__multiply_activation(
+                    attrs,
+                    model_inputs=model_inputs,
+                    param_msgs=param_msgs,
+                    z_val=z_val
+                )
+
+            results.attributions = attrs  # : Outputs[Inputs[TensorLike]]
+
+            return results
 
         D = self.doi._wrap_public_call(doi_val, model_inputs=model_inputs)
 
@@ -417,26 +528,13 @@ class InternalInfluence(AttributionMethod):
                 param_msgs +
             [doi_size_msg, combined_batch_msg, rebatch_size_msg]
         ):  # Handles out-of-memory messages.
-            qoi_grads_expanded: List[Outputs[Inputs[TensorLike]]] = []
-
-            for inputs_batch, intervention_batch in rebatch(
-                    model_inputs_expanded, intervention,
-                    batch_size=rebatch_size):
-
-                qoi_grads_expanded_batch: Outputs[
-                    Inputs[TensorLike]] = self.model._qoi_bprop(
-                        qoi=self.qoi,
-                        model_inputs=inputs_batch,
-                        attribution_cut=self.slice.from_cut,
-                        to_cut=self.slice.to_cut,
-                        intervention=intervention_batch,
-                        doi_cut=doi_cut
-                    )
-
-                # important to cast to numpy inside loop:
-                qoi_grads_expanded.append(
-                    nested_map(qoi_grads_expanded_batch, B.as_array)
-                )
+            qoi_grads_expanded: List[Outputs[Inputs[np.ndarray]]
+                                    ] = self.__rebatched_qoi_grads(
+                                        model_inputs_expanded,
+                                        intervention,
+                                        doi_cut=doi_cut,
+                                        prefix_cache=prefix_cache
+                                    )
 
         num_outputs = len(qoi_grads_expanded[0])
         num_inputs = len(qoi_grads_expanded[0][0])
@@ -483,6 +581,49 @@ class InternalInfluence(AttributionMethod):
 
         # Multiply by the activation multiplier if specified.
         if self._do_multiply:
+            attrs = self.__multiply_activation(
+                attrs,
+                model_inputs=model_inputs,
+                param_msgs=param_msgs,
+                z_val=z_val
+            )
+        results.attributions = attrs  # : Outputs[Inputs[TensorLike]]
+
+        return results
+
+    @staticmethod
+    def __same_cut(cut1: Cut, cut2: Cut) -> bool:
+        """Whether the two cuts refer to the same values."""
+        return type(cut1) is type(cut2) and cut1.name == cut2.name and \
+            cut1.anchor == cut2.anchor and cut1.accessor is cut2.accessor
+
+    @staticmethod
+    def __prefix_kwargs(prefix_cache: Optional[PrefixCache], offset: int = 0):
+        """Extra arguments for model wrapper calls replaying `prefix_cache`
+        from the tiled row `offset`, if any. Wrappers that do not support
+        prefix caches do not accept them."""
+
+        if prefix_cache is None:
+            return {}
+
+        return dict(prefix_cache=prefix_cache, prefix_offset=offset)
+
+    def __multiply_activation(
+        self,
+        attrs: Outputs[Inputs[np.ndarray]],
+        *,
+        model_inputs: ModelInputs,
+        param_msgs: List[str],
+        z_val: Optional[Inputs[TensorLike]] = None
+    ) -> Outputs[Inputs[np.ndarray]]:
+        """Multiply the given attributions by the activation multiplier of the
+        DoI, converting from "*influence space*" to "*attribution space*". The
+        activations at the `from_cut` of the slice are computed unless given as
+        `z_val`."""
+
+        B = get_backend()
+
+        if z_val is None:
             with memory_suggestions(param_msgs):
                 z_val = self.model._fprop(
                     model_inputs=model_inputs,
@@ -492,31 +633,161 @@ class InternalInfluence(AttributionMethod):
                     intervention=model_inputs  # intentional
                 )[0]
 
-            mults: Inputs[TensorLike
-                         ] = self.doi._wrap_public_get_activation_multiplier(
-                             z_val, model_inputs=model_inputs
-                         )
-            mults: Inputs[np.ndarray] = nested_cast(
-                backend=B, args=mults, astype=np.ndarray
+        mults: Inputs[TensorLike
+                     ] = self.doi._wrap_public_get_activation_multiplier(
+                         z_val, model_inputs=model_inputs
+                     )
+        mults: Inputs[np.ndarray] = nested_cast(
+            backend=B, args=mults, astype=np.ndarray
+        )
+        mult_attrs = []
+        for attr in attrs:  # Outputs
+
+            zipped = nested_zip(attr, mults)
+
+            def zip_mult(zipped_attr_mults):
+                attr = zipped_attr_mults[0]
+                mults = zipped_attr_mults[1]
+                return attr * mults
+
+            attr = nested_map(zipped, zip_mult, check_accessor=lambda x: x[0])
+            mult_attrs.append(attr)
+
+        return mult_attrs
+
+    def __rebatched_qoi_grads(
+        self,
+        model_inputs_expanded: ModelInputs,
+        intervention: TensorArgs,
+        *,
+        doi_cut: Cut,
+        prefix_cache: Optional[PrefixCache],
+        batch_size: Optional[int] = None
+    ) -> List[Outputs[Inputs[np.ndarray]]]:
+        """Gradients of the QoI for each rebatch of the tiled model inputs and
+        the given intervention."""
+
+        B = get_backend()
+
+        def qoi_grads(offset, inputs_batch, intervention_batch):
+            qoi_grads_batch: Outputs[Inputs[TensorLike]] = self.model._qoi_bprop(
+                qoi=self.qoi,
+                model_inputs=inputs_batch,
+                attribution_cut=self.slice.from_cut,
+                to_cut=self.slice.to_cut,
+                intervention=intervention_batch,
+                doi_cut=doi_cut,
+                **InternalInfluence.__prefix_kwargs(prefix_cache, offset)
             )
-            mult_attrs = []
-            for attr in attrs:  # Outputs
 
-                zipped = nested_zip(attr, mults)
+            # important to cast to numpy inside loop:
+            return nested_map(qoi_grads_batch, B.as_array)
 
-                def zip_mult(zipped_attr_mults):
-                    attr = zipped_attr_mults[0]
-                    mults = zipped_attr_mults[1]
-                    return attr * mults
+        return self._map_rebatches(
+            qoi_grads,
+            model_inputs_expanded,
+            intervention,
+            batch_size=batch_size
+        )
+
+    def __streaming_mean_grads(
+        self, doi_val: Inputs[np.ndarray], *, model_inputs: ModelInputs,
+        doi_cut: Cut, batch_size: int, param_msgs: List[str],
+        prefix_cache: Optional[PrefixCache]
+    ) -> Outputs[Inputs[np.ndarray]]:
+        """Mean gradients of the QoI over the points of the DoI, computed a
+        chunk of points at a time.
+
+        Each chunk has as many points as fit in one rebatch (at least one).
+        With adaptive rebatching, that is the rebatch size learned so far or
+        the size of its first probe. The gradients of a chunk are summed over
+        its points into float64 accumulators before the next chunk is produced.
+        """
 
-                attr = nested_map(
-                    zipped, zip_mult, check_accessor=lambda x: x[0]
+        B = get_backend()
+
+        rebatch_size = self.rebatch_size
+        if rebatch_size is None:
+            rebatch_size = batch_size
+        elif self._rebatcher is not None:
+            rebatch_size = self._rebatcher.batch_size or self._rebatcher.probe_size
+
+        points_per_chunk = max(1, rebatch_size // batch_size)
+
+        rebatch_size_msg = f"rebatch_size = {rebatch_size}; consider reducing this AttributionMethod constructor parameter (default is the batch size when streaming)."
+
+        def map_leaves(fn, x, *ys):
+            # Gradients for an input may be a map of tensors.
+            if isinstance(x, MAP_CONTAINER_TYPE):
+                return {k: map_leaves(fn, x[k], *(y[k] for y in ys)) for k in x}
+            return fn(x, *ys)
+
+        def sum_points(*parts: np.ndarray) -> np.ndarray:
+            # Rows of the gradients are ordered by point, then by instance.
+            grads = np.concatenate(parts)
+            grads = np.reshape(grads, (-1, batch_size) + grads.shape[1:])
+            return np.sum(grads, axis=0, dtype=np.float64)
+
+        sums: Outputs[Inputs[np.ndarray]] = None
+        dtypes: Outputs[Inputs[np.dtype]] = None
+        n_doi = 0
+
+        with memory_suggestions(param_msgs + [rebatch_size_msg]):
+            for D in self.doi._wrap_public_call_chunks(
+                    doi_val, model_inputs=model_inputs,
+                    chunk_size=points_per_chunk):
+                D = self.__concatenate_doi(D)
+
+                intervention = TensorArgs(args=D)
+                model_inputs_expanded = tile(
+                    what=model_inputs, onto=intervention
                 )
-                mult_attrs.append(attr)
-            attrs = mult_attrs
-        results.attributions = attrs  # : Outputs[Inputs[TensorLike]]
 
-        return results
+                # Each chunk is tiled from the first instance.
+                chunk_grads: List[Outputs[Inputs[np.ndarray]]
+                                 ] = self.__rebatched_qoi_grads(
+                                     model_inputs_expanded,
+                                     intervention,
+                                     doi_cut=doi_cut,
+                                     prefix_cache=prefix_cache,
+                                     batch_size=batch_size
+                                 )
+
+                n_doi += intervention.first_batchable(B).shape[0] // batch_size
+
+                num_outputs = len(chunk_grads[0])
+                num_inputs = len(chunk_grads[0][0])
+
+                chunk_sums = [
+                    [
+                        map_leaves(
+                            sum_points, *(grads[o][i] for grads in chunk_grads)
+                        ) for i in range(num_inputs)
+                    ] for o in range(num_outputs)
+                ]
+
+                if sums is None:
+                    sums = chunk_sums
+                    dtypes = nested_map(
+                        chunk_grads[0], lambda grad: grad.dtype, nest=2
+                    )
+                else:
+                    sums = [
+                        [
+                            map_leaves(np.add, sums[o][i], chunk_sums[o][i])
+                            for i in range(num_inputs)
+                        ]
+                        for o in range(num_outputs)
+                    ]
+
+        return [
+            [
+                map_leaves(
+                    lambda s, dtype: (s / n_doi).astype(dtype), sums[o][i],
+                    dtypes[o][i]
+                ) for i in range(len(sums[o]))
+            ] for o in range(len(sums))
+        ]
 
     @staticmethod
     def __get_qoi(qoi_arg):
@@ -3,7 +3,7 @@ from enum import Enum
 import importlib
 import os
 import traceback
-from typing import Iterable, Tuple
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 from trulens.utils import tru_logger
@@ -39,6 +39,84 @@ class OutOfMemory(RuntimeError):
         return message
 
 
+def is_out_of_memory(e: BaseException) -> bool:
+    """Whether the given exception indicates that memory ran out."""
+
+    if isinstance(e, (OutOfMemory, MemoryError)):
+        return True
+
+    if isinstance(e, RuntimeError) and "out of memory" in str(e):
+        return True
+
+    # tensorflow.errors.ResourceExhaustedError
+    return type(e).__name__ == "ResourceExhaustedError"
+
+
+class MemoryInfo(NamedTuple):
+    """Memory usage as reported by a backend, in bytes. Each value is None if
+    the backend cannot report it."""
+
+    free: Optional[int]
+    """Memory available for new allocations."""
+
+    current: Optional[int]
+    """Memory currently allocated by the backend."""
+
+    peak: Optional[int]
+    """Most memory allocated by the backend since peak tracking was reset."""
+
+
+def _process_status_bytes() -> Tuple[Optional[int], Optional[int]]:
+    """Resident memory of this process and its peak, from `/proc` where
+    available."""
+
+    current = peak = None
+
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                # Values are given in kB.
+                if line.startswith('VmRSS:'):
+                    current = int(line.split()[1]) * 1024
+                elif line.startswith('VmHWM:'):
+                    peak = int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        # Not available on this platform.
+        return None, None
+
+    return current, peak
+
+
+def host_memory_info() -> MemoryInfo:
+    """
+    Memory available on the host. The memory allocated is the resident memory
+    of this process and its peak is the most since `reset_host_peak_memory`,
+    or since the process started if the peak cannot be reset, which only
+    overestimates what later allocations need.
+    """
+
+    try:
+        free = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        # Not available on this platform.
+        free = None
+
+    current, peak = _process_status_bytes()
+
+    return MemoryInfo(free=free, current=current, peak=peak)
+
+
+def reset_host_peak_memory() -> None:
+    """Reset the peak resident memory of this process where the platform
+    allows it."""
+
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
 @contextmanager
 def memory_suggestions(*settings, call_before=None, call_after=None, **kwargs):
     """
@@ -86,6 +164,19 @@ def memory_suggestions(*settings, call_before=None, call_after=None, **kwargs):
             call_after(state)
 
 
+def _take(start: int, stop: int, original_batch_size: int):
+    """Function taking rows `start` to `stop` of values batched along their
+    first dimension and leaving other values unchanged."""
+
+    def f(val):
+        if val.shape[0] != original_batch_size:
+            return val
+        else:
+            return val[start:stop]
+
+    return f
+
+
 def rebatch(vals: Tensors,
             *extra_vals: Tuple[Tensors, ...],
             batch_size=None) -> Iterable[Tuple[Tensors, ...]]:
@@ -99,14 +190,10 @@ def rebatch(vals: Tensors,
         batch_size = original_batch_size
 
     def take(batch_idx):
-
-        def f(val):
-            if val.shape[0] != original_batch_size:
-                return val
-            else:
-                return val[batch_idx * batch_size:(batch_idx + 1) * batch_size]
-
-        return f
+        return _take(
+            batch_idx * batch_size, (batch_idx + 1) * batch_size,
+            original_batch_size
+        )
 
     all_vals: Tuple[ModelInputs, ...] = (vals,) + extra_vals
 
@@ -117,6 +204,153 @@ def rebatch(vals: Tensors,
         yield tuple(map(lambda v: v.map(take(batch_idx)), all_vals))
 
 
+class AdaptiveRebatcher(object):
+    """
+    Rebatches values like `rebatch` but picks the batch size from the memory
+    available and shrinks it when memory runs out.
+
+    The first batch has `probe_size` instances. If the backend reports both the
+    memory available and the peak memory allocated while processing a batch,
+    the memory needed per instance is estimated from it and later batches are
+    the largest estimated to fit in `memory_fraction` of the available memory.
+    On the host, the peak resident memory of the process is used. Otherwise,
+    as for tensorflow GPUs which do not report the memory available, the batch
+    size doubles after each batch that fits. A batch that runs out of memory is
+    retried with half as many instances and later batches are kept smaller than
+    it. What is learned carries over to later calls of `map`.
+
+    Usage:
+
+        rebatcher = AdaptiveRebatcher()
+        grads = rebatcher.map(
+            lambda offset, inputs, intervention: ...,
+            model_inputs_expanded, intervention
+        )
+    """
+
+    def __init__(
+        self,
+        *,
+        max_batch_size: Optional[int] = None,
+        probe_size: int = 8,
+        memory_fraction: float = 0.8,
+        device=None
+    ):
+        """
+        Parameters:
+            max_batch_size: Largest batch size to use.
+
+            probe_size: Batch size used before anything is learned.
+
+            memory_fraction: Fraction of the available memory that batches are
+                sized to use.
+
+            device: Device whose memory is probed, for backends that support
+                more than one.
+        """
+        self.max_batch_size = max_batch_size
+        self.probe_size = probe_size
+        self.memory_fraction = memory_fraction
+        self.device = device
+
+        # Batch size to use next.
+        self.batch_size: Optional[int] = None
+
+        # Most memory per instance seen, in bytes.
+        self.instance_memory: Optional[float] = None
+
+        # Number of batches retried after running out of memory.
+        self.n_retries = 0
+
+        # Largest batch size not known to run out of memory.
+        self._ceiling: Optional[int] = max_batch_size
+
+    def _next_size(self) -> int:
+        size = self.probe_size if self.batch_size is None else self.batch_size
+
+        if self._ceiling is not None:
+            size = min(size, self._ceiling)
+
+        return max(1, size)
+
+    def _fit(self, size: int, before: MemoryInfo, after: MemoryInfo) -> None:
+        """Pick the next batch size after a batch of `size` instances fit."""
+
+        if before.current is not None and after.peak is not None:
+            instance_memory = max(1, after.peak - before.current) / size
+            if self.instance_memory is None or instance_memory > self.instance_memory:
+                self.instance_memory = instance_memory
+
+        if before.free is not None and self.instance_memory is not None:
+            self.batch_size = int(
+                self.memory_fraction * before.free // self.instance_memory
+            )
+
+        else:
+            # A last batch may be smaller than the batch size used.
+            self.batch_size = max(2 * size, self.batch_size or 0)
+
+        if self._ceiling is not None:
+            self.batch_size = min(self.batch_size, self._ceiling)
+
+    def _shrink(self, size: int) -> None:
+        """Pick the next batch size after a batch of `size` instances ran out
+        of memory."""
+
+        self._ceiling = max(1, size - 1)
+        self.batch_size = max(1, size // 2)
+        self.n_retries += 1
+
+        tru_logger.warning(
+            f"Ran out of memory with a rebatch of {size} instances. "
+            f"Retrying with {self.batch_size}."
+        )
+
+    def map(self, fn: Callable[..., Any], vals: Tensors,
+            *extra_vals: Tuple[Tensors, ...]) -> List[Any]:
+        """
+        Apply `fn` to consecutive batches of `vals` and `extra_vals` in order.
+        It is called with the offset of the first instance of the batch followed
+        by the batch of each given set of values.
+
+        Returns the results of `fn` for each batch. Raises the error of a batch
+        of one instance that runs out of memory.
+        """
+        B = get_backend()
+        original_batch_size = vals.first_batchable(B).shape[0]
+
+        all_vals: Tuple[ModelInputs, ...] = (vals,) + extra_vals
+
+        results = []
+        offset = 0
+
+        while offset < original_batch_size:
+            size = min(self._next_size(), original_batch_size - offset)
+
+            take = _take(offset, offset + size, original_batch_size)
+            batch = tuple(v.map(take) for v in all_vals)
+
+            B.reset_peak_memory(self.device)
+            before = B.memory_info(self.device)
+
+            try:
+                result = fn(offset, *batch)
+
+            except Exception as e:
+                if size == 1 or not is_out_of_memory(e):
+                    raise
+
+                self._shrink(size)
+                continue
+
+            self._fit(size, before, B.memory_info(self.device))
+
+            results.append(result)
+            offset += size
+
+        return results
+
+
 def tile(what: TensorAKs, onto: TensorAKs) -> TensorAKs:
     """Tiles elements of `what` some number of times so they have the same first
     dimension size as `onto`. Picks the number of tiles from the first of each
@@ -268,4 +502,6 @@ _ALL_BACKEND_API_FUNCTIONS = [
     'softmax',
     'maximum',
     'minimum',
+    'memory_info',
+    'reset_peak_memory',
 ]
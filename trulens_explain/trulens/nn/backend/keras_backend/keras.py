@@ -9,6 +9,9 @@ from typing import Sequence
 import numpy as np
 from trulens.nn.backend import _ALL_BACKEND_API_FUNCTIONS
 from trulens.nn.backend import Backend
+from trulens.nn.backend import host_memory_info
+from trulens.nn.backend import MemoryInfo
+from trulens.nn.backend import reset_host_peak_memory
 from trulens.utils.typing import float_size
 
 __all__ = _ALL_BACKEND_API_FUNCTIONS
@@ -42,6 +45,16 @@ def is_deterministic() -> bool:
     return True
 
 
+def memory_info(device=None) -> MemoryInfo:
+    """Memory usage of the host."""
+    return host_memory_info()
+
+
+def reset_peak_memory(device=None) -> None:
+    """Reset the peak memory of the host."""
+    reset_host_peak_memory()
+
+
 def gradient(scalar, wrt):
     """
     gradient Gradient of a function with respect to a tensor.
@@ -76,6 +76,40 @@ def memory_suggestions(*settings, device=None):
     )
 
 
+def memory_info(device: DeviceLike = None) -> base_backend.MemoryInfo:
+    """
+    Memory usage of the given device, or the default device if not given.
+    Allocations on other than cuda devices are those of the host.
+    """
+    device = torch.device(get_default_device(device))
+
+    if device.type != 'cuda':
+        return base_backend.host_memory_info()
+
+    free, _ = torch.cuda.mem_get_info(device)
+    current = torch.cuda.memory_allocated(device)
+
+    # Memory reserved by the caching allocator but not allocated is reusable.
+    free += torch.cuda.memory_reserved(device) - current
+
+    return base_backend.MemoryInfo(
+        free=free,
+        current=current,
+        peak=torch.cuda.max_memory_allocated(device)
+    )
+
+
+def reset_peak_memory(device: DeviceLike = None) -> None:
+    """Reset peak memory tracking of the given device, or the default device
+    if not given."""
+    device = torch.device(get_default_device(device))
+
+    if device.type == 'cuda':
+        torch.cuda.reset_peak_memory_stats(device)
+    else:
+        base_backend.reset_host_peak_memory()
+
+
 def gradient(scalar: Tensor, wrt: Tensor):
     """
     gradient Gradient of a function with respect to a tensor.
@@ -9,6 +9,9 @@ import numpy as np
 import tensorflow as tf
 from trulens.nn.backend import _ALL_BACKEND_API_FUNCTIONS
 from trulens.nn.backend import Backend
+from trulens.nn.backend import host_memory_info
+from trulens.nn.backend import MemoryInfo
+from trulens.nn.backend import reset_host_peak_memory
 from trulens.utils.typing import float_size
 
 __all__ = _ALL_BACKEND_API_FUNCTIONS + ['tf1']
@@ -33,6 +36,40 @@ def is_deterministic() -> bool:
     return True
 
 
+def memory_info(device=None) -> MemoryInfo:
+    """
+    Memory usage of the given device, or the first GPU if not given. The memory
+    available is not reported for GPUs.
+    """
+    if device is None:
+        if not tf.config.list_logical_devices('GPU'):
+            return host_memory_info()
+        device = 'GPU:0'
+
+    try:
+        info = tf.config.experimental.get_memory_info(device)
+    except (AttributeError, ValueError):
+        # Not supported by this version or device.
+        return MemoryInfo(free=None, current=None, peak=None)
+
+    return MemoryInfo(free=None, current=info['current'], peak=info['peak'])
+
+
+def reset_peak_memory(device=None) -> None:
+    """Reset peak memory tracking of the given device, or the first GPU if not
+    given."""
+    if device is None:
+        if not tf.config.list_logical_devices('GPU'):
+            reset_host_peak_memory()
+            return
+        device = 'GPU:0'
+
+    try:
+        tf.config.experimental.reset_memory_stats(device)
+    except (AttributeError, ValueError):
+        pass
+
+
 def gradient(scalar, wrt):
     """
     gradient Gradient of a function with respect to a tensor.
@@ -8,7 +8,7 @@ interested in a more general behavior over a distribution of samples.
 
 from abc import ABC as AbstractBaseClass
 from abc import abstractmethod
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 import numpy as np
 from trulens.nn.backend import get_backend
@@ -74,7 +74,47 @@ class DoI(AbstractBaseClass):
             ret = self.__call__(z, model_inputs=model_inputs)
         else:
             ret = self.__call__(z)
-        # Wrap the public doi generator with appropriate type aliases.
+
+        return DoI._format_points(ret)
+
+    def _wrap_public_call_chunks(
+        self, z: Inputs[TensorLike], *, model_inputs: ModelInputs,
+        chunk_size: int
+    ) -> Iterator[Inputs[Uniform[TensorLike]]]:
+        """Same as `_wrap_public_call` but produces the points of the
+        distribution in chunks of at most `chunk_size` points each.
+        
+        DoIs that can compute some of their points without computing all of
+        them override this so that only one chunk needs to be in memory at a
+        time. By default, all points are computed first."""
+
+        D = self._wrap_public_call(z, model_inputs=model_inputs)
+
+        n_doi = len(DoI._first_points(D))
+
+        for start in range(0, n_doi, chunk_size):
+            yield nested_map(
+                D,
+                lambda points: Uniform(points[start:start + chunk_size]),
+                nest=1
+            )
+
+    @staticmethod
+    def _first_points(D: Inputs[Uniform[TensorLike]]) -> Uniform[TensorLike]:
+        """The points of the first tensor of the distribution."""
+
+        points = D[0]
+        if isinstance(points, MAP_CONTAINER_TYPE):
+            points = next(iter(points.values()))
+
+        return points
+
+    @staticmethod
+    def _format_points(ret: OM[Inputs, Uniform[TensorLike]]
+                      ) -> Inputs[Uniform[TensorLike]]:
+        """Wrap the points returned by `__call__` with appropriate type
+        aliases."""
+
         if isinstance(ret, DATA_CONTAINER_TYPE):
             if isinstance(ret[0], DATA_CONTAINER_TYPE):
                 ret = Inputs(Uniform(x) for x in ret)
@@ -303,6 +343,41 @@ class LinearDoi(DoI):
 
         baseline = self._compute_baseline(z, model_inputs=model_inputs)
 
+        return self._interpolate(z, baseline, range(self._resolution))
+
+    def _wrap_public_call_chunks(
+        self, z: Inputs[TensorLike], *, model_inputs: ModelInputs,
+        chunk_size: int
+    ) -> Iterator[Inputs[Uniform[TensorLike]]]:
+
+        if type(self).__call__ is not LinearDoi.__call__:
+            # Subclasses may compute their points differently.
+            yield from super()._wrap_public_call_chunks(
+                z, model_inputs=model_inputs, chunk_size=chunk_size
+            )
+            return
+
+        z = om_of_many(z)
+        self._assert_cut_contains_only_one_tensor(z)
+
+        z: Inputs[TensorLike] = many_of_om(z)
+
+        baseline = self._compute_baseline(z, model_inputs=model_inputs)
+
+        for start in range(0, self._resolution, chunk_size):
+            yield DoI._format_points(
+                self._interpolate(
+                    z, baseline,
+                    range(start, min(start + chunk_size, self._resolution))
+                )
+            )
+
+    def _interpolate(
+        self, z: Inputs[TensorLike], baseline: Inputs[TensorLike],
+        indices: Iterable[int]
+    ) -> OM[Inputs, Uniform[TensorLike]]:
+        """The points of the distribution with the given indices."""
+
         r = 1. if self._resolution == 1 else self._resolution - 1.
         zipped = nested_zip(z, baseline)
 
@@ -319,7 +394,7 @@ class LinearDoi(DoI):
             b_ = zipped_z_baseline[1]
             return [ # Uniform
                 (1. - i / r) * z_ + i / r * b_
-                for i in range(self._resolution)
+                for i in indices
             ]
 
         ret = om_of_many(
@@ -447,9 +522,42 @@ class GaussianDoi(DoI):
                              TensorLike]) -> OM[Inputs, Uniform[TensorLike]]:
         # Public interface.
 
-        B = get_backend()
         self._assert_cut_contains_only_one_tensor(z)
 
+        z: Inputs[TensorLike] = many_of_om(z)
+
+        return self._sample(z, self._resolution)
+
+    def _wrap_public_call_chunks(
+        self, z: Inputs[TensorLike], *, model_inputs: ModelInputs,
+        chunk_size: int
+    ) -> Iterator[Inputs[Uniform[TensorLike]]]:
+
+        if type(self).__call__ is not GaussianDoi.__call__:
+            # Subclasses may compute their points differently.
+            yield from super()._wrap_public_call_chunks(
+                z, model_inputs=model_inputs, chunk_size=chunk_size
+            )
+            return
+
+        z = om_of_many(z)
+        self._assert_cut_contains_only_one_tensor(z)
+
+        z: Inputs[TensorLike] = many_of_om(z)
+
+        for start in range(0, self._resolution, chunk_size):
+            yield DoI._format_points(
+                self._sample(
+                    z, min(chunk_size, self._resolution - start)
+                )
+            )
+
+    def _sample(self, z: Inputs[TensorLike],
+                n: int) -> OM[Inputs, Uniform[TensorLike]]:
+        """Sample `n` points of the distribution."""
+
+        B = get_backend()
+
         def gauss_of_input(z: TensorLike) -> Uniform[TensorLike]:
             # TODO: make a pytorch backend with the same interface to use in places like these.
 
@@ -457,16 +565,14 @@ class GaussianDoi(DoI):
                 # Tensor implementation.
                 return [
                     z + B.random_normal_like(z, var=self._var)
-                    for _ in range(self._resolution)
+                    for _ in range(n)
                 ]  # Uniform
 
             else:
                 # Array implementation.
                 return [
                     z + np.random.normal(0., np.sqrt(self._var), z.shape)
-                    for _ in range(self._resolution)
+                    for _ in range(n)
                 ]  # Uniform
 
-        z: Inputs[TensorLike] = many_of_om(z)
-
         return om_of_many(nested_map(z, gauss_of_input))
@@ -9,7 +9,7 @@ it should be wrapped as a `ModelWrapper` instance.
 """
 from abc import ABC as AbstractBaseClass
 from abc import abstractmethod
-from typing import List, Optional, Tuple, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 import numpy as np
 from trulens.nn.backend import get_backend
@@ -35,6 +35,94 @@ from trulens.utils.typing import TensorLike
 from trulens.utils.typing import Tensors
 
 
+class PrefixCache(object):
+    """
+    Outputs of the layers of a model that finish evaluating before the layer of
+    a DoI cut is reached.
+
+    Attribution methods evaluate the model on tiled copies of a batch of
+    instances with an intervention at the DoI cut. Layers evaluated before the
+    cut do not depend on the intervention so their outputs are recorded once on
+    the untiled batch and replayed for every point of the distribution instead
+    of being recomputed. Row `offset + j` of a tiled batch is a copy of instance
+    `(offset + j) % batch_size`.
+
+    Only outputs that are single tensors of layers whose first tensor input and
+    output both have the batch size as their first dimension are recorded.
+    Outputs are only replayed to calls whose first tensor input has as many
+    rows as the tiled batch. Other layers and calls, such as position
+    embeddings of as many positions as instances or sequence-first layers, are
+    evaluated as usual.
+    """
+
+    def __init__(self, doi_cut: Cut):
+        self.doi_cut = doi_cut
+        self.batch_size: Optional[int] = None
+        self.recorded = False
+
+        # Layer name to outputs of its calls before the cut, in call order.
+        self.outputs: Dict[str, List[Any]] = {}
+
+        self._reached = False
+        self._uncached: Set[str] = set()
+
+    def begin(self, batch_size: int) -> None:
+        """Start recording outputs for a batch of `batch_size` instances."""
+        self.batch_size = batch_size
+
+    def reach(self) -> None:
+        """Mark that evaluation has reached the layer of the DoI cut."""
+        self._reached = True
+
+    @staticmethod
+    def leading_rows(values: Any) -> Optional[int]:
+        """Size of the first dimension of the first tensor in `values`, or None
+        if there is none."""
+
+        B = get_backend()
+
+        if B.is_tensor(values):
+            return values.shape[0] if len(values.shape) > 0 else None
+
+        if isinstance(values, DATA_CONTAINER_TYPE):
+            for value in values:
+                rows = PrefixCache.leading_rows(value)
+                if rows is not None:
+                    return rows
+
+        return None
+
+    def record(self, name: str, inputs: Any, output: Any) -> None:
+        """Record the output of a call to the layer named `name` with the given
+        `inputs`, unless the DoI cut was already reached."""
+
+        if self._reached or name in self._uncached:
+            return
+
+        B = get_backend()
+
+        if B.is_tensor(output) and \
+                PrefixCache.leading_rows(output) == self.batch_size and \
+                PrefixCache.leading_rows(inputs) == self.batch_size:
+            self.outputs.setdefault(name, []).append(output)
+        else:
+            self._uncached.add(name)
+            self.outputs.pop(name, None)
+
+    def end(self) -> None:
+        """Finish recording. Nothing is replayed if the DoI cut was never
+        reached."""
+
+        if not self._reached:
+            self.outputs = {}
+
+        self.recorded = True
+
+    def rows(self, offset: int, n: int) -> np.ndarray:
+        """Instances of the `n` tiled rows starting at `offset`."""
+        return (offset + np.arange(n)) % self.batch_size
+
+
 class ModelWrapper(AbstractBaseClass):
     """
     A wrapper interface for models that exposes the components needed for 
@@ -436,6 +524,18 @@ class ModelWrapper(AbstractBaseClass):
             backend=get_backend(), astype=return_type, args=attrs
         )
 
+    def _prefix_cache(self, doi_cut: Cut) -> Optional[PrefixCache]:
+        """
+        A new cache of the outputs of the layers evaluated before `doi_cut`, or
+        None if this wrapper cannot replay them.
+
+        A wrapper that returns a cache records it when `_fprop` is given the
+        unrecorded cache on untiled model inputs and replays it when `_fprop` or
+        `_qoi_bprop` are given the recorded cache along with the `prefix_offset`
+        of the tiled rows being evaluated.
+        """
+        return None
+
     @abstractmethod
     def _qoi_bprop(
         self, *, qoi: QoI, model_inputs: ModelInputs, doi_cut: Cut, to_cut: Cut,
@@ -138,6 +138,9 @@ class KerasModelWrapper(ModelWrapper):
         }
         # Index of input node used in model (in case layer is shared between models)
         self._innode_index = trace_input_indices(model, self.keras)
+        # Models from the doi tensors to the attribution tensors and from there
+        # to the output tensors, built once per combination of cuts.
+        self._bprop_models = {}
 
     def print_layer_names(self):
         for name, layer in self._layers.items():
@@ -510,6 +513,33 @@ class KerasModelWrapper(ModelWrapper):
         # internal _fprop returns two things in general
         return (out_vals, None)
 
+    def _get_bprop_models(
+        self, *, doi_tensors, attribution_tensors, input_tensors, to_tensors
+    ):
+        """
+        _get_bprop_models Return the models evaluating the attribution tensors
+        from the doi tensors and the to tensors from the attribution tensors.
+        These are built on first use and reused for later calls with the same
+        tensors.
+        """
+        key = tuple(
+            tuple(id(t)
+                  for t in tensors)
+            for tensors in
+            (doi_tensors, attribution_tensors, input_tensors, to_tensors)
+        )
+
+        if key not in self._bprop_models:
+            pre_model = self.keras.Model(
+                inputs=doi_tensors, outputs=attribution_tensors
+            )
+            post_model = self.keras.Model(
+                inputs=attribution_tensors + input_tensors, outputs=to_tensors
+            )
+            self._bprop_models[key] = (pre_model, post_model)
+
+        return self._bprop_models[key]
+
     def _qoi_bprop(
         self, *, qoi: QoI, model_inputs: ModelInputs, doi_cut: Cut, to_cut: Cut,
         attribution_cut: Cut, intervention: TensorArgs
@@ -525,15 +555,14 @@ class KerasModelWrapper(ModelWrapper):
 
         if (B.backend == Backend.TF_KERAS or B.backend
                 == Backend.TENSORFLOW) and self.tf.executing_eagerly():
-            with self.tf.GradientTape(persistent=True) as tape:
-                pre_model = self.keras.Model(
-                    inputs=doi_tensors, outputs=attribution_tensors
-                )
-                post_model = self.keras.Model(
-                    inputs=attribution_tensors + input_tensors,
-                    outputs=to_tensors
-                )
+            pre_model, post_model = self._get_bprop_models(
+                doi_tensors=doi_tensors,
+                attribution_tensors=attribution_tensors,
+                input_tensors=input_tensors,
+                to_tensors=to_tensors
+            )
 
+            with self.tf.GradientTape(persistent=True) as tape:
                 attr_input = pre_model(intervention.args)
                 attr_input = many_of_om(attr_input)
                 tape.watch(attr_input)
@@ -1,15 +1,17 @@
 from collections import Counter
 from collections import OrderedDict
 from functools import partial
-from typing import Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 import torch
 from trulens.nn.backend import get_backend
+from trulens.nn.backend import OutOfMemory
 from trulens.nn.backend.pytorch_backend import pytorch
 from trulens.nn.backend.pytorch_backend.pytorch import memory_suggestions
 from trulens.nn.backend.pytorch_backend.pytorch import Tensor
 from trulens.nn.models._model_base import ModelWrapper
+from trulens.nn.models._model_base import PrefixCache
 from trulens.nn.quantities import QoI
 from trulens.nn.slices import Cut
 from trulens.nn.slices import InputCut
@@ -40,6 +42,7 @@ class PytorchModelWrapper(ModelWrapper):
         logit_layer=None,
         device=None,
         force_eval=True,
+        vectorize_grads=True,
         **kwargs
     ):
         """
@@ -56,6 +59,11 @@ class PytorchModelWrapper(ModelWrapper):
             device on which to run model, by default None
         force_eval : bool, optional
             If True, will call model.eval() to ensure determinism. Otherwise, keeps current model state, by default True
+        vectorize_grads : bool, optional
+            If True, gradients of QoIs with multiple outputs are computed in
+            one batched backward pass instead of one pass per output, falling
+            back to the latter for models that do not support it. Uses more
+            memory. By default True
             
         """
 
@@ -76,6 +84,8 @@ class PytorchModelWrapper(ModelWrapper):
         if self.force_eval:
             model.eval()
 
+        self.vectorize_grads = vectorize_grads
+
         if device is None:
             try:
                 device_counter = Counter(
@@ -251,6 +261,123 @@ class PytorchModelWrapper(ModelWrapper):
 
         return x
 
+    def _prefix_cache(self, doi_cut: Cut) -> Optional[PrefixCache]:
+        """
+        See ModelWrapper._prefix_cache .
+
+        Outputs of leaf modules are replayed by substituting their `forward`.
+        Only cuts at a single named layer are supported and the model must be
+        deterministic.
+        """
+
+        if isinstance(doi_cut, (InputCut, OutputCut, LogitCut)) or \
+                not isinstance(doi_cut.name, (str, int)):
+            return None
+
+        if not self.force_eval and self._model.training:
+            # Layers such as dropout would not give the same outputs for each
+            # point.
+            return None
+
+        return PrefixCache(doi_cut)
+
+    def _distinct_layers(self) -> OrderedDict:
+        """Layers under their first name only. A module that is the child of
+        more than one parent is listed under each of their names in
+        `_layers`."""
+
+        layers = OrderedDict()
+        seen = set()
+
+        for name, layer in self._layers.items():
+            if id(layer) not in seen:
+                seen.add(id(layer))
+                layers[name] = layer
+
+        return layers
+
+    def _record_prefix(self, prefix_cache: PrefixCache) -> List:
+        """Register hooks that record the outputs of layers evaluated before
+        the cut of `prefix_cache`. Returns their handles."""
+
+        doi_layer = self._get_layer(prefix_cache.doi_cut.name)
+
+        def reach_hookfn(module, inpt):
+            prefix_cache.reach()
+
+        def get_record_hookfn(layer_name):
+
+            def hookfn(module, inpt, outpt):
+                if torch.is_tensor(outpt):
+                    # Later layers may modify the output in place.
+                    outpt = outpt.detach().clone()
+                prefix_cache.record(layer_name, inpt, outpt)
+
+            return hookfn
+
+        handles = [doi_layer.register_forward_pre_hook(reach_hookfn)]
+        handles += [
+            layer.register_forward_hook(get_record_hookfn(name))
+            for name, layer in self._distinct_layers().items()
+            if layer is not doi_layer
+        ]
+
+        return handles
+
+    def _replay_prefix(
+        self, prefix_cache: PrefixCache, prefix_offset: int, n: int
+    ) -> List[Callable[[], None]]:
+        """Substitute the `forward` of layers recorded in `prefix_cache` with
+        ones giving the recorded outputs for `n` tiled rows starting at
+        `prefix_offset`. Calls whose input is not batched with `n` rows are
+        evaluated as usual. Returns functions that restore the original
+        `forward`s, to be called in reverse order."""
+
+        rows = torch.as_tensor(
+            prefix_cache.rows(prefix_offset, n), device=self.device
+        )
+
+        def get_replay_forward(outputs, forward):
+            calls = 0
+
+            def replay_forward(*args, **kwargs):
+                nonlocal calls
+
+                call = calls
+                calls += 1
+
+                if call < len(outputs) and PrefixCache.leading_rows(
+                        list(args) + list(kwargs.values())) == n:
+                    output = outputs[call]
+                    return output.index_select(0, rows.to(output.device))
+
+                return forward(*args, **kwargs)
+
+            return replay_forward
+
+        def get_restore(layer, instance_forward):
+
+            def restore():
+                if instance_forward is None:
+                    del layer.forward
+                else:
+                    layer.forward = instance_forward
+
+            return restore
+
+        layers = self._distinct_layers()
+
+        restores = []
+        for name, outputs in prefix_cache.outputs.items():
+            if name not in layers:
+                continue
+
+            layer = layers[name]
+            restores.append(get_restore(layer, layer.__dict__.get('forward')))
+            layer.forward = get_replay_forward(outputs, layer.forward)
+
+        return restores
+
     def _fprop(
         self,
         model_inputs: ModelInputs,
@@ -258,7 +385,9 @@ class PytorchModelWrapper(ModelWrapper):
         to_cut: Cut,
         attribution_cut: Cut,
         intervention: TensorArgs,
-        input_timestep: Optional[int] = None
+        input_timestep: Optional[int] = None,
+        prefix_cache: Optional[PrefixCache] = None,
+        prefix_offset: int = 0
     ) -> Tuple[Outputs[TensorLike], Outputs[TensorLike]]:
         """
         See ModelWrapper.fprop .
@@ -267,10 +396,20 @@ class PytorchModelWrapper(ModelWrapper):
         ----------
         input_timestep: int, optional
             Timestep to apply to the DoI if using an RNN
+        prefix_cache: PrefixCache, optional
+            Cache of layer outputs before the DoI cut to record or replay. See
+            ModelWrapper._prefix_cache .
+        prefix_offset: int, optional
+            Offset of the first row of `model_inputs` in the tiled inputs when
+            replaying `prefix_cache`.
         """
 
         B = get_backend()
 
+        if input_timestep is not None:
+            # Recorded calls are not matched to timesteps.
+            prefix_cache = None
+
         # This method operates on backend tensors.
         intervention = intervention.map(B.as_tensor)
 
@@ -387,6 +526,18 @@ class PytorchModelWrapper(ModelWrapper):
             ) for name, anchor in names_and_anchors if name is not None
         ]
 
+        # Record or replay the outputs of layers before the DoI cut.
+        restores = []
+        if prefix_cache is not None:
+            if not prefix_cache.recorded:
+                prefix_cache.begin(model_inputs.first_batchable(B).shape[0])
+                handles += self._record_prefix(prefix_cache)
+            else:
+                restores = self._replay_prefix(
+                    prefix_cache, prefix_offset,
+                    model_inputs.first_batchable(B).shape[0]
+                )
+
         with memory_suggestions(device=self.device):
             # Run the network.
             try:
@@ -408,6 +559,12 @@ class PytorchModelWrapper(ModelWrapper):
                 for handle in handles:
                     handle.remove()
 
+                for restore in reversed(restores):
+                    restore()
+
+        if prefix_cache is not None and not prefix_cache.recorded:
+            prefix_cache.end()
+
         extract_args = dict(
             hooks=hooks, output=output, model_inputs=model_inputs
         )
@@ -426,8 +583,15 @@ class PytorchModelWrapper(ModelWrapper):
             )
 
     def _qoi_bprop(
-        self, qoi: QoI, model_inputs: ModelInputs, doi_cut: Cut, to_cut: Cut,
-        attribution_cut: Cut, intervention: TensorArgs
+        self,
+        qoi: QoI,
+        model_inputs: ModelInputs,
+        doi_cut: Cut,
+        to_cut: Cut,
+        attribution_cut: Cut,
+        intervention: TensorArgs,
+        prefix_cache: Optional[PrefixCache] = None,
+        prefix_offset: int = 0
     ) -> Outputs[
             Inputs[TensorLike]
     ]:  # one outer element per QoI, one inner element per attribution_cut input
@@ -439,7 +603,9 @@ class PytorchModelWrapper(ModelWrapper):
             doi_cut=doi_cut,
             to_cut=to_cut,
             attribution_cut=attribution_cut,
-            intervention=intervention
+            intervention=intervention,
+            prefix_cache=prefix_cache,
+            prefix_offset=prefix_offset
         )
 
         def scalarize(t: torch.Tensor) -> torch.tensor:
@@ -458,31 +624,84 @@ class PytorchModelWrapper(ModelWrapper):
         zs = doi_cut.access_layer(zs)
 
         qois_out: Outputs[Tensor] = qoi._wrap_public_call(y)
-        grads_list = [[] for _ in qois_out]
-
-        for qoi_index, qoi_out in enumerate(qois_out):
-            qoi_out: TensorLike = scalarize(qoi_out)
-
-            try:
-                with memory_suggestions(device=self.device):
-                    grads_for_qoi = B.gradient(qoi_out, zs)
-
-            except RuntimeError as e:
-                if "cudnn RNN backward can only be called in training mode" in str(
-                        e):
-                    raise RuntimeError(
-                        "Cannot get deterministic gradients from RNN's with cudnn. See more about this issue here: https://github.com/pytorch/captum/issues/564 .\n"
-                        "Consider setting 'torch.backends.cudnn.enabled = False' for now."
-                    )
-                raise e
+        qois_out: Outputs[Tensor] = [scalarize(q) for q in qois_out]
+
+        grads_list = None
+        if self.vectorize_grads and len(qois_out) > 1:
+            grads_list = self._batched_gradients(qois_out, zs)
+
+        if grads_list is None:
+            grads_list = [[] for _ in qois_out]
+
+            for qoi_index, qoi_out in enumerate(qois_out):
+                try:
+                    with memory_suggestions(device=self.device):
+                        grads_for_qoi = B.gradient(qoi_out, zs)
+
+                except RuntimeError as e:
+                    if "cudnn RNN backward can only be called in training mode" in str(
+                            e):
+                        raise RuntimeError(
+                            "Cannot get deterministic gradients from RNN's with cudnn. See more about this issue here: https://github.com/pytorch/captum/issues/564 .\n"
+                            "Consider setting 'torch.backends.cudnn.enabled = False' for now."
+                        )
+                    raise e
 
-            for grad_for_qoi in grads_for_qoi:
-                grads_list[qoi_index].append(grad_for_qoi)
+                for grad_for_qoi in grads_for_qoi:
+                    grads_list[qoi_index].append(grad_for_qoi)
 
         del y  # TODO: garbage collection
 
         return grads_list
 
+    def _batched_gradients(
+        self, qois_out: Outputs[Tensor], zs: Inputs[Tensor]
+    ) -> Optional[Outputs[Inputs[Tensor]]]:
+        """
+        Gradients of each scalar QoI output with respect to each of `zs`
+        computed in one backward pass vectorized over the outputs. Returns None
+        if the model does not support it, in which case `vectorize_grads` is
+        turned off, or if it runs out of memory.
+        """
+
+        qoi_vec = torch.stack(qois_out)
+        basis = torch.eye(
+            len(qois_out), dtype=qoi_vec.dtype, device=qoi_vec.device
+        )
+
+        try:
+            with memory_suggestions(device=self.device):
+                batched_grads = torch.autograd.grad(
+                    qoi_vec,
+                    zs,
+                    grad_outputs=basis,
+                    retain_graph=True,
+                    allow_unused=True,
+                    create_graph=True,
+                    is_grads_batched=True
+                )
+
+        except OutOfMemory:
+            # One pass per output needs less memory.
+            return None
+
+        except (TypeError, RuntimeError) as e:
+            # Older versions of pytorch do not take `is_grads_batched` and some
+            # operations cannot be vectorized.
+            tru_logger.warning(
+                f"Could not compute gradients of QoI outputs in one batched "
+                f"pass ({e}). Falling back to one pass per output."
+            )
+            self.vectorize_grads = False
+            return None
+
+        return [
+            [
+                None if grads is None else grads[qoi_index]
+                for grads in batched_grads
+            ] for qoi_index in range(len(qois_out))
+        ]
+
     def probits(self, x):
         """
         probits Return probability outputs of the model
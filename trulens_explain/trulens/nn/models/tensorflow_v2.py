@@ -1,7 +1,8 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import tensorflow as tf
 from trulens.nn.backend import get_backend
+from trulens.nn.models._model_base import PrefixCache
 from trulens.nn.models.keras import \
     KerasModelWrapper  # dangerous to have this here if tf-less keras gets imported
 from trulens.nn.quantities import QoI
@@ -39,6 +40,7 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
         replace_softmax=False,
         softmax_layer=-1,
         custom_objects=None,
+        vectorize_grads=True,
         **kwargs
     ):
         """
@@ -50,6 +52,11 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
             tf.keras.Model or a subclass
         eager: bool, optional:
             whether or not model is in eager mode.
+        vectorize_grads: bool, optional:
+            If True, gradients of QoIs with multiple outputs are computed as
+            one jacobian vectorized over the outputs in eager mode instead of
+            one gradient per output, falling back to the latter for models
+            that do not support it. Uses more memory. By default True
         """
         super().__init__(
             model,
@@ -61,6 +68,7 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
         )
 
         self._eager = tf.executing_eagerly()
+        self.vectorize_grads = vectorize_grads
 
         # In eager mode, we have to use hook functions to get intermediate
         # outputs and internal gradients.
@@ -75,7 +83,12 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
                     if layer.input_intervention:
                         inputs = [layer.input_intervention(inputs)]
 
-                    output = old_call_fn(*inputs, **kwargs)
+                    if layer.replay_function:
+                        output = layer.replay_function(
+                            old_call_fn, inputs, kwargs
+                        )
+                    else:
+                        output = old_call_fn(*inputs, **kwargs)
 
                     if layer.output_intervention:
                         output = layer.output_intervention(output)
@@ -113,6 +126,7 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
             layer.input_intervention = None
             layer.output_intervention = None
             layer.retrieve_functions = []
+            layer.replay_function = None
 
     def _get_output_layer(self):
         output_layers = []
@@ -157,12 +171,97 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
             raise Exception("Output Layers must be a list of layers")
         self._model.outputs = output_layers
 
+    def _prefix_cache(self, doi_cut: Cut) -> Optional[PrefixCache]:
+        """
+        See ModelWrapper._prefix_cache .
+
+        Only supported in eager mode for cuts at a single named layer. Outside
+        of eager mode, evaluation already starts from the tensors of the DoI
+        cut.
+        """
+
+        if not self._eager or isinstance(
+                doi_cut, (InputCut, OutputCut, LogitCut)) or not isinstance(
+                    doi_cut.name, (str, int)):
+            return None
+
+        return PrefixCache(doi_cut)
+
+    def _record_prefix(self, prefix_cache: PrefixCache) -> None:
+        """Add retrieve functions that record the outputs of layers evaluated
+        before the cut of `prefix_cache`."""
+
+        doi_layer, = self._get_layers_by_name(prefix_cache.doi_cut.name)
+
+        def reach(inputs, output):
+            prefix_cache.reach()
+
+        def get_record(layer_name):
+
+            def record(inputs, output):
+                prefix_cache.record(layer_name, inputs, output)
+
+            return record
+
+        for name, layer in self._layers.items():
+            if layer is doi_layer:
+                # Layers are evaluated one at a time so the retrieve functions
+                # of the DoI layer run before those of any later layer.
+                layer.retrieve_functions.append(reach)
+            else:
+                layer.retrieve_functions.append(get_record(name))
+
+    def _replay_prefix(
+        self, prefix_cache: PrefixCache, prefix_offset: int, n: int
+    ) -> None:
+        """Set replay functions that give the outputs recorded in
+        `prefix_cache` for `n` tiled rows starting at `prefix_offset`. Calls
+        whose inputs are not batched with `n` rows are evaluated as usual."""
+
+        rows = tf.constant(prefix_cache.rows(prefix_offset, n))
+
+        def get_replay(outputs):
+            calls = 0
+
+            def replay(call_fn, inputs, kwargs):
+                nonlocal calls
+
+                call = calls
+                calls += 1
+
+                if call < len(outputs) and PrefixCache.leading_rows(
+                        inputs) == n:
+                    return tf.gather(outputs[call], rows)
+
+                return call_fn(*inputs, **kwargs)
+
+            return replay
+
+        for name, outputs in prefix_cache.outputs.items():
+            self._layers[name].replay_function = get_replay(outputs)
+
     def _fprop(
-        self, *, model_inputs: ModelInputs, doi_cut: Cut, to_cut: Cut,
-        attribution_cut: Cut, intervention: TensorArgs
+        self,
+        *,
+        model_inputs: ModelInputs,
+        doi_cut: Cut,
+        to_cut: Cut,
+        attribution_cut: Cut,
+        intervention: TensorArgs,
+        prefix_cache: Optional[PrefixCache] = None,
+        prefix_offset: int = 0
     ) -> Tuple[Outputs[TensorLike], Outputs[TensorLike]]:
         """
         See ModelWrapper.fprop .
+
+        Backend-Specific Parameters
+        ----------
+        prefix_cache: PrefixCache, optional
+            Cache of layer outputs before the DoI cut to record or replay in
+            eager mode. See ModelWrapper._prefix_cache .
+        prefix_offset: int, optional
+            Offset of the first row of `model_inputs` in the tiled inputs when
+            replaying `prefix_cache`.
         """
 
         B = get_backend()
@@ -286,10 +385,24 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
                                 )
                             )
 
+            # Record or replay the outputs of layers before the DoI cut.
+            if prefix_cache is not None:
+                if not prefix_cache.recorded:
+                    prefix_cache.begin(model_inputs.first_batchable(B).shape[0])
+                    self._record_prefix(prefix_cache)
+                else:
+                    self._replay_prefix(
+                        prefix_cache, prefix_offset,
+                        model_inputs.first_batchable(B).shape[0]
+                    )
+
             # Run a point.
             # keras.Layer have similar argument handling to our public interfaces
             self._model(om_of_many(model_inputs.args))
 
+            if prefix_cache is not None and not prefix_cache.recorded:
+                prefix_cache.end()
+
         finally:
             # Clear the hooks after running the model so that `fprop` doesn't
             # leave the model in an altered state.
@@ -303,8 +416,16 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
         return (results, attribution_results)
 
     def _qoi_bprop(
-        self, *, qoi: QoI, model_inputs: ModelInputs, doi_cut: Cut, to_cut: Cut,
-        attribution_cut: Cut, intervention: TensorArgs
+        self,
+        *,
+        qoi: QoI,
+        model_inputs: ModelInputs,
+        doi_cut: Cut,
+        to_cut: Cut,
+        attribution_cut: Cut,
+        intervention: TensorArgs,
+        prefix_cache: Optional[PrefixCache] = None,
+        prefix_offset: int = 0
     ) -> Outputs[Inputs[TensorLike]]:
         """
         See ModelWrapper.qoi_bprop .
@@ -330,20 +451,33 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
                 doi_cut=doi_cut,
                 to_cut=to_cut,
                 attribution_cut=attribution_cut,
-                intervention=intervention
+                intervention=intervention,
+                prefix_cache=prefix_cache,
+                prefix_offset=prefix_offset
             )
             outputs: Outputs[TensorLike]
             attribution_features: Outputs[TensorLike]
 
             Q = qoi._wrap_public_call(outputs)
 
+            # Gradients of non-scalar outputs are of their sums, like for
+            # `tape.gradient`.
+            q_vec = None
+            if self.vectorize_grads and len(Q) > 1:
+                q_vec = tf.stack([tf.reduce_sum(q) for q in Q])
+
         grads: Outputs[Inputs[TensorLike]] = []
 
         for z in attribution_features:
-            zq: Inputs[TensorLike] = []
-            for q in Q:
-                grad_zq = tape.gradient(q, z)
-                zq.append(grad_zq)
+            zq: Inputs[TensorLike] = None
+            if q_vec is not None and self.vectorize_grads:
+                zq = self._batched_gradients(tape, q_vec, z)
+
+            if zq is None:
+                zq = []
+                for q in Q:
+                    grad_zq = tape.gradient(q, z)
+                    zq.append(grad_zq)
 
             grads.append(zq)
 
@@ -354,3 +488,33 @@ class Tensorflow2ModelWrapper(KerasModelWrapper
         grads = list(zip(*grads))  # transpose
 
         return grads
+
+    def _batched_gradients(self, tape: tf.GradientTape, q_vec: tf.Tensor,
+                           z: TensorLike) -> Optional[Outputs[TensorLike]]:
+        """
+        Gradients of each element of `q_vec` with respect to `z` computed as
+        one jacobian vectorized over the elements. Returns None if the model
+        does not support it, in which case `vectorize_grads` is turned off, or
+        if it runs out of memory.
+        """
+
+        try:
+            jacobian = tape.jacobian(q_vec, z, experimental_use_pfor=True)
+
+        except tf.errors.ResourceExhaustedError:
+            # One gradient per output needs less memory.
+            return None
+
+        except (ValueError, NotImplementedError, tf.errors.OpError) as e:
+            # Some operations cannot be vectorized.
+            tru_logger.warning(
+                f"Could not compute gradients of QoI outputs as one jacobian "
+                f"({e}). Falling back to one gradient per output."
+            )
+            self.vectorize_grads = False
+            return None
+
+        return [
+            nested_map(jacobian, lambda j: None if j is None else j[q_index])
+            for q_index in range(q_vec.shape[0])
+        ]
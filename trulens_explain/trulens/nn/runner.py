@@ -0,0 +1,359 @@
+"""
+Attributions for datasets too large to attribute in a single call.
+
+An `AttributionRunner` feeds the batches of a dataset to an attribution method,
+optionally spread over worker processes that each build the model and the
+attribution method once, and writes the attributions of each batch to
+memory-mapped `.npy` files as they are computed. A checkpoint of the batches
+done is kept next to the files so an interrupted run picks up where it left
+off when run again.
+
+Usage:
+
+```python
+def make_method():
+    # Called once in each worker process.
+    model = get_model_wrapper(load_model())
+    return IntegratedGradients(model, rebatch_size="auto")
+
+runner = AttributionRunner(make_method, "attributions/", n_workers=4)
+attrs = runner.run(data_loader)  # np.memmap of all attributions
+```
+"""
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+import json
+import multiprocessing
+import os
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+)
+
+import numpy as np
+from trulens.nn.attribution import AttributionMethod
+from trulens.utils import tru_logger
+from trulens.utils.typing import DATA_CONTAINER_TYPE
+from trulens.utils.typing import many_of_om
+from trulens.utils.typing import MAP_CONTAINER_TYPE
+from trulens.utils.typing import om_of_many
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+# Attribution method of a worker process, made once by its initializer.
+_WORKER_METHOD: Optional[AttributionMethod] = None
+
+
+def _init_worker(make_method: Callable[[], AttributionMethod]) -> None:
+    global _WORKER_METHOD
+
+    _WORKER_METHOD = make_method()
+
+
+def _as_numpy(x: Any) -> Any:
+    # Tensors on the host (e.g. from a DataLoader) pickle more cheaply as
+    # arrays; anything else is given to the method as is.
+    return np.asarray(x) if hasattr(x, '__array__') else x
+
+
+def _attribute(method: AttributionMethod, batch: Any) -> List[np.ndarray]:
+    """Attributions of a batch as a flat list, one per output and input."""
+
+    if isinstance(batch, MAP_CONTAINER_TYPE):
+        attrs = method.attributions(**batch)
+    elif isinstance(batch, DATA_CONTAINER_TYPE):
+        attrs = method.attributions(*batch)
+    else:
+        attrs = method.attributions(batch)
+
+    return [
+        np.asarray(attr)
+        for attrs_for_output in many_of_om(attrs)
+        for attr in many_of_om(attrs_for_output)
+    ]
+
+
+def _attribute_in_worker(batch_index: int,
+                         batch: Any) -> Tuple[int, List[np.ndarray]]:
+    return batch_index, _attribute(_WORKER_METHOD, batch)
+
+
+def _batch_size(batch: Any) -> int:
+    if isinstance(batch, MAP_CONTAINER_TYPE):
+        first = next(iter(batch.values()))
+    elif isinstance(batch, DATA_CONTAINER_TYPE):
+        first = batch[0]
+    else:
+        first = batch
+
+    return len(first)
+
+
+class AttributionRunner(object):
+    """
+    Runs an attribution method over a dataset, writing attributions to
+    memory-mapped `.npy` files in `out_dir` and checkpointing progress.
+
+    Each batch of the dataset is given to `attributions` of the method: tuples
+    and lists as positional arguments, dicts as keyword arguments and anything
+    else as the only argument. The attributions of each output and input of the
+    model are written to `attributions_<k>.npy`, numbered in the order that
+    `attributions` returns them, or to `attributions.npy` if there is only one.
+
+    The stores are created from the shapes of the first batch done, so the
+    attributions of every batch must have the same shape apart from the number
+    of instances, e.g. by padding sequences to a fixed length. Batches must be
+    produced in the same order when resuming.
+    """
+
+    def __init__(
+        self,
+        make_method: Callable[[], AttributionMethod],
+        out_dir: str,
+        *,
+        n_workers: int = 0,
+        mp_context: Union[str, Any] = 'spawn',
+        max_pending: Optional[int] = None
+    ):
+        """
+        Parameters:
+            make_method:
+                Makes the attribution method, including loading its model. It is
+                called once in each worker process so it must be picklable, for
+                example a function defined at the top level of a module.
+
+            out_dir:
+                Directory for the attributions and the checkpoint. Created if
+                it does not exist.
+
+            n_workers:
+                Number of worker processes. If 0, batches are attributed in this
+                process.
+
+            mp_context:
+                Multiprocessing start method or context for the workers.
+                `'spawn'` avoids copying an already loaded model or backend
+                state into the workers.
+
+            max_pending:
+                Most batches read from the dataset but not yet attributed.
+                Defaults to twice the number of workers.
+        """
+
+        self.make_method = make_method
+        self.out_dir = out_dir
+        self.n_workers = n_workers
+
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.mp_context = mp_context
+
+        self.max_pending = max_pending or 2 * max(1, n_workers)
+
+        self._stores: Optional[List[np.memmap]] = None
+        self._checkpoint: Dict[str, Any] = None
+        self._done: Set[int] = set()
+        self._offsets: Dict[int, Tuple[int, int]] = {}
+
+    @property
+    def checkpoint_path(self) -> str:
+        return os.path.join(self.out_dir, CHECKPOINT_FILE)
+
+    def _store_path(self, k: int, n_stores: int) -> str:
+        name = "attributions.npy" if n_stores == 1 else f"attributions_{k}.npy"
+        return os.path.join(self.out_dir, name)
+
+    def _load_checkpoint(self, n_instances: int) -> None:
+        self._stores = None
+        self._done = set()
+        self._checkpoint = dict(n_instances=n_instances, stores=None, done=[])
+
+        if not os.path.exists(self.checkpoint_path):
+            return
+
+        with open(self.checkpoint_path) as f:
+            checkpoint = json.load(f)
+
+        if checkpoint['n_instances'] != n_instances:
+            raise ValueError(
+                f"Checkpoint in {self.out_dir} is for {checkpoint['n_instances']} "
+                f"instances but the dataset has {n_instances}. Use another "
+                f"`out_dir` or remove the checkpoint to start over."
+            )
+
+        self._checkpoint = checkpoint
+        self._done = set(checkpoint['done'])
+
+        if checkpoint['stores'] is not None:
+            n_stores = len(checkpoint['stores'])
+            self._stores = [
+                np.lib.format.open_memmap(
+                    self._store_path(k, n_stores), mode='r+'
+                ) for k in range(n_stores)
+            ]
+
+        tru_logger.info(
+            f"Resuming from checkpoint with {len(self._done)} batches done."
+        )
+
+    def _save_checkpoint(self) -> None:
+        self._checkpoint['done'] = sorted(self._done)
+
+        # Written to a temporary file first so an interruption never leaves a
+        # partial checkpoint.
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _create_stores(self, attrs: List[np.ndarray], n_instances: int) -> None:
+        """Create the stores with the shapes and types of the attributions of
+        the first batch done."""
+
+        self._stores = []
+        stores_info = []
+
+        for k, attr in enumerate(attrs):
+            shape = (n_instances,) + attr.shape[1:]
+            self._stores.append(
+                np.lib.format.open_memmap(
+                    self._store_path(k, len(attrs)),
+                    mode='w+',
+                    dtype=attr.dtype,
+                    shape=shape
+                )
+            )
+            stores_info.append(dict(shape=shape, dtype=attr.dtype.str))
+
+        self._checkpoint['stores'] = stores_info
+
+    def _write(
+        self, batch_index: int, attrs: List[np.ndarray], n_instances: int
+    ) -> None:
+        offset, size = self._offsets.pop(batch_index)
+
+        for k, attr in enumerate(attrs):
+            if attr.shape[0] != size:
+                raise ValueError(
+                    f"Attributions {k} of batch {batch_index} have "
+                    f"{attr.shape[0]} rows but the batch has {size} instances."
+                )
+
+        if self._stores is None:
+            self._create_stores(attrs, n_instances)
+
+        if len(attrs) != len(self._stores):
+            raise ValueError(
+                f"Batch {batch_index} has {len(attrs)} attributions but earlier "
+                f"batches had {len(self._stores)}."
+            )
+
+        for k, (store, attr) in enumerate(zip(self._stores, attrs)):
+            if attr.shape[1:] != store.shape[1:]:
+                raise ValueError(
+                    f"Attributions {k} of batch {batch_index} have shape "
+                    f"{attr.shape[1:]} per instance but earlier batches had "
+                    f"{store.shape[1:]}. Batches must have a fixed shape apart "
+                    f"from the number of instances, e.g. by padding sequences "
+                    f"to a fixed length."
+                )
+
+        for store, attr in zip(self._stores, attrs):
+            store[offset:offset + attr.shape[0]] = attr
+            store.flush()
+
+        self._done.add(batch_index)
+        self._save_checkpoint()
+
+    def _pending_batches(self, data: Iterable) -> Iterable[Tuple[int, Any]]:
+        """Batches of `data` not yet done, with their index. Records the
+        offset of the first instance and the size of each."""
+
+        offset = 0
+
+        for batch_index, batch in enumerate(data):
+            size = _batch_size(batch)
+
+            if batch_index not in self._done:
+                self._offsets[batch_index] = (offset, size)
+
+                if isinstance(batch, MAP_CONTAINER_TYPE):
+                    batch = {k: _as_numpy(v) for k, v in batch.items()}
+                elif isinstance(batch, DATA_CONTAINER_TYPE):
+                    batch = [_as_numpy(v) for v in batch]
+                else:
+                    batch = _as_numpy(batch)
+
+                yield batch_index, batch
+
+            offset += size
+
+    def run(self,
+            data: Iterable,
+            n_instances: Optional[int] = None) -> Union[np.memmap, List]:
+        """
+        Attribute every batch of `data` not done in a previous run.
+
+        Parameters:
+            data:
+                Iterable of batches, e.g. a pytorch `DataLoader`.
+
+            n_instances:
+                Total number of instances in `data`. Taken from the dataset of a
+                `DataLoader` if not given.
+
+        Returns:
+            The memory-mapped attributions of all instances, or a list of them
+            for each output and input if there are more than one.
+        """
+
+        if n_instances is None:
+            if not hasattr(data, 'dataset'):
+                raise ValueError(
+                    "`n_instances` must be given unless `data` is a "
+                    "`DataLoader`."
+                )
+            n_instances = len(data.dataset)
+
+        os.makedirs(self.out_dir, exist_ok=True)
+
+        self._load_checkpoint(n_instances)
+        self._offsets = {}
+
+        batches = self._pending_batches(data)
+
+        if self.n_workers == 0:
+            method = self.make_method()
+
+            for batch_index, batch in batches:
+                self._write(batch_index, _attribute(method, batch), n_instances)
+
+        else:
+            with ProcessPoolExecutor(max_workers=self.n_workers,
+                                     mp_context=self.mp_context,
+                                     initializer=_init_worker,
+                                     initargs=(self.make_method,)) as pool:
+
+                pending = set()
+
+                for batch_index, batch in batches:
+                    pending.add(
+                        pool.submit(_attribute_in_worker, batch_index, batch)
+                    )
+
+                    # Bound the batches held in memory.
+                    if len(pending) >= self.max_pending:
+                        done, pending = wait(
+                            pending, return_when=FIRST_COMPLETED
+                        )
+                        for fut in done:
+                            self._write(*fut.result(), n_instances)
+
+                for fut in wait(pending).done:
+                    self._write(*fut.result(), n_instances)
+
+        if self._stores is None:
+            raise ValueError("No batches were attributed.")
+
+        return om_of_many(self._stores)